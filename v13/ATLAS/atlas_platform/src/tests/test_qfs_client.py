@@ -15,7 +15,8 @@ if _ATLAS_ROOT is not None:
 from src.qfs_client import QFSClient
 from src.qfs_types import OperationBundle
 from src.types import Transaction, DeterminismReport
-from src.real_ledger import RealLedger, MockLedger
+from src.real_ledger import RealLedger
+from v13.tests.mocks.mock_ledger import MockLedger
 
 @pytest.fixture
 def mock_ledger():
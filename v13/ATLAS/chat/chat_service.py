@@ -5,11 +5,16 @@ Manages conversations and messages with deterministic ordering and E2EE support.
 Zero-Sim compliant with CertifiedMath and deterministic ID generation.
 """
 
-from typing import Dict, List, Optional
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Tuple
 from v13.libs.CertifiedMath import CertifiedMath
 from v13.libs.deterministic_helpers import DeterministicID
 from .chat_models import Conversation, Message, ConversationType, MessageStatus
 
+# (timestamp, message_id, position) - position is the message's slot in the
+# conversation's append-only message list and breaks ties in arrival order
+MessageKey = Tuple[int, str, int]
+
 
 class ChatService:
     """
@@ -17,6 +22,11 @@ class ChatService:
 
     Provides deterministic conversation creation, message sending, and status updates.
     All operations are Zero-Sim compliant with sorted iterations and deterministic IDs.
+
+    Messages are stored append-only per conversation. A message_id index
+    gives (conversation, position) lookups, a per-conversation key list kept
+    in (timestamp, message_id) order serves history pages by bisect, and
+    per-participant read watermarks record "read up to" positions.
     """
 
     def __init__(self, cm: CertifiedMath, max_participants: int = 100):
@@ -31,6 +41,10 @@ class ChatService:
         self.max_participants = max_participants
         self.conversations: Dict[str, Conversation] = {}
         self.messages: Dict[str, List[Message]] = {}
+        self._message_index: Dict[str, Tuple[str, int]] = {}
+        self._message_keys: Dict[str, List[MessageKey]] = {}
+        self._read_watermarks: Dict[str, Dict[str, MessageKey]] = {}
+        self._read_horizons: Dict[str, MessageKey] = {}
 
     def create_conversation(
         self,
@@ -92,8 +106,16 @@ class ChatService:
             encryption_metadata=encryption_metadata or {},
         )
 
+        # Re-creating a conversation drops its previous messages
+        for message in self.messages.get(conversation_id, []):
+            location = self._message_index.get(message.message_id)
+            if location is not None and location[0] == conversation_id:
+                del self._message_index[message.message_id]
         self.conversations[conversation_id] = conversation
         self.messages[conversation_id] = []
+        self._message_keys[conversation_id] = []
+        self._read_watermarks[conversation_id] = {}
+        self._read_horizons.pop(conversation_id, None)
 
         log_list.append(
             {
@@ -166,7 +188,15 @@ class ChatService:
         )
 
         # Add to conversation
-        self.messages[conversation_id].append(message)
+        messages = self.messages[conversation_id]
+        key = (timestamp, message_id, len(messages))
+        messages.append(message)
+        self._message_index.setdefault(message_id, (conversation_id, key[2]))
+        keys = self._message_keys[conversation_id]
+        if not keys or key > keys[-1]:
+            keys.append(key)
+        else:
+            insort(keys, key)
 
         # Update conversation metadata
         conversation.last_message_at = timestamp
@@ -222,17 +252,7 @@ class ChatService:
                 f"Reader {reader_wallet} is not a participant in conversation {conversation_id}"
             )
 
-        # Find message
-        message = None
-        for msg in self.messages[conversation_id]:
-            if msg.message_id == message_id:
-                message = msg
-                break
-
-        if message is None:
-            raise ValueError(
-                f"Message {message_id} not found in conversation {conversation_id}"
-            )
+        message = self._find_message(message_id, conversation_id)
 
         # Update status
         message.status = MessageStatus.READ
@@ -268,18 +288,114 @@ class ChatService:
         if conversation_id not in self.messages:
             return []
 
+        keys = self._message_keys[conversation_id]
+        end = (
+            len(keys)
+            if before_timestamp is None
+            else bisect_left(keys, (before_timestamp,))
+        )
+
+        # Keys are already in timestamp ASC, message_id ASC order
+        page = keys[max(0, end - limit) : end] if limit > 0 else keys[:end][-limit:]
         messages = self.messages[conversation_id]
+        for key in page:
+            self._apply_read_horizon(conversation_id, key, messages[key[2]])
+        return [messages[key[2]] for key in page]
 
-        # Filter by timestamp if provided
-        if before_timestamp is not None:
-            messages = [m for m in messages if m.timestamp < before_timestamp]
+    def mark_read_through(
+        self,
+        message_id: str,
+        conversation_id: str,
+        reader_wallet: str,
+        timestamp: int,
+        log_list: Optional[List] = None,
+    ) -> Message:
+        """
+        Mark every message up to and including message_id as read by a reader.
+
+        Advances the reader's read watermark in O(1) instead of one
+        mark_as_read call per message; statuses of the covered messages
+        become READ as they are next served. The watermark never moves back.
+
+        Args:
+            message_id: Newest message the reader has read
+            conversation_id: Conversation ID
+            reader_wallet: Reader wallet ID
+            timestamp: Read timestamp
+            log_list: Optional audit log
 
-        # Sort deterministically: timestamp ASC, message_id ASC
-        sorted_messages = sorted(messages, key=lambda m: (m.timestamp, m.message_id))
+        Returns:
+            Message: The watermark message
 
-        # Apply limit
-        return (
-            sorted_messages[-limit:]
-            if len(sorted_messages) > limit
-            else sorted_messages
+        Raises:
+            ValueError: If validation fails
+        """
+        if log_list is None:
+            log_list = []
+
+        if conversation_id not in self.conversations:
+            raise ValueError(f"Conversation {conversation_id} not found")
+
+        conversation = self.conversations[conversation_id]
+
+        if reader_wallet not in conversation.participants:
+            raise ValueError(
+                f"Reader {reader_wallet} is not a participant in conversation {conversation_id}"
+            )
+
+        message = self._find_message(message_id, conversation_id)
+        key = (message.timestamp, message_id, self._message_index[message_id][1])
+
+        watermarks = self._read_watermarks[conversation_id]
+        if reader_wallet not in watermarks or watermarks[reader_wallet] < key:
+            watermarks[reader_wallet] = key
+        horizon = self._read_horizons.get(conversation_id)
+        if horizon is None or horizon < key:
+            self._read_horizons[conversation_id] = key
+        message.status = MessageStatus.READ
+
+        log_list.append(
+            {
+                "operation": "messages_read_through",
+                "message_id": message_id,
+                "conversation_id": conversation_id,
+                "reader": reader_wallet,
+                "timestamp": timestamp,
+            }
         )
+
+        return message
+
+    def get_read_watermark(
+        self, conversation_id: str, reader_wallet: str
+    ) -> Optional[str]:
+        """Return the newest message ID the reader has read through, if any."""
+        key = self._read_watermarks.get(conversation_id, {}).get(reader_wallet)
+        return key[1] if key is not None else None
+
+    def get_unread_count(self, conversation_id: str, reader_wallet: str) -> int:
+        """Count messages after the reader's read watermark."""
+        keys = self._message_keys.get(conversation_id, [])
+        key = self._read_watermarks.get(conversation_id, {}).get(reader_wallet)
+        return len(keys) if key is None else len(keys) - bisect_right(keys, key)
+
+    def _find_message(self, message_id: str, conversation_id: str) -> Message:
+        """Look up a message through the message_id index."""
+        location = self._message_index.get(message_id)
+        if location is None or location[0] != conversation_id:
+            raise ValueError(
+                f"Message {message_id} not found in conversation {conversation_id}"
+            )
+        return self.messages[conversation_id][location[1]]
+
+    def _apply_read_horizon(
+        self, conversation_id: str, key: MessageKey, message: Message
+    ):
+        """Set READ on a message covered by any participant's read watermark."""
+        horizon = self._read_horizons.get(conversation_id)
+        if (
+            horizon is not None
+            and key <= horizon
+            and message.status != MessageStatus.READ
+        ):
+            message.status = MessageStatus.READ
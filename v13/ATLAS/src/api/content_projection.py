@@ -0,0 +1,160 @@
+"""
+Content Projection (v18 content routes)
+
+Read model for published content, fed from CONTENT_MESSAGE_PUBLISHED events
+on the EvidenceBus. The events carry only message metadata and the content
+hash; bodies are mutable (Class B) and are held by the projection in a store
+keyed by content hash, outside the immutable log. Messages are kept in (timestamp, message_id)-sorted key
+lists per channel plus one across all channels, so a feed page is a bisect on
+the cursor key and a slice: page latency does not grow with channel depth.
+The projection tails the chain log from the last byte offset it consumed.
+Bodies not stored through this projection are served as an empty string.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Tuple
+
+from v15.evidence.bus import EvidenceBus, EvidenceLogTail
+
+CONTENT_EVENT = "CONTENT_MESSAGE_PUBLISHED"
+
+FeedKey = Tuple[int, str]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a feed cursor was not issued by ContentProjection."""
+
+    pass
+
+
+def encode_cursor(key: FeedKey) -> str:
+    """Encode a (timestamp, message_id) key as an opaque feed cursor."""
+    raw = json.dumps([key[0], key[1]], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> FeedKey:
+    """Decode an opaque feed cursor back into its (timestamp, message_id) key."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, message_id = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursorError(f"Invalid feed cursor: {cursor}")
+    if (
+        not isinstance(timestamp, int)
+        or isinstance(timestamp, bool)
+        or not isinstance(message_id, str)
+    ):
+        raise InvalidCursorError(f"Invalid feed cursor: {cursor}")
+    return (timestamp, message_id)
+
+
+class ContentProjection:
+    """
+    Published messages by id and by (channel_id, timestamp, message_id).
+
+    Like AdvisoryIndex, the projection follows ``EvidenceBus._log_file`` and
+    is rebuilt from scratch if the bus is pointed at another log or the log
+    shrinks. Re-delivered events for a known message id are ignored.
+    """
+
+    def __init__(self, bus=EvidenceBus):
+        self.bus = bus
+        self._tail = EvidenceLogTail(bus)
+        self._bodies: Dict[str, str] = {}
+        self._reset()
+
+    def _reset(self):
+        self._messages: Dict[str, Dict[str, Any]] = {}
+        self._channels: Dict[str, List[FeedKey]] = {}
+        self._all: List[FeedKey] = []
+
+    def refresh(self) -> int:
+        """Project events appended since the last refresh; returns how many."""
+        events, restarted = self._tail.read_new()
+        if restarted:
+            self._reset()
+        return sum(1 for envelope in events if self.apply(envelope))
+
+    def store_content(self, content: str) -> str:
+        """Keep a message body under its SHA-256 hex digest; returns the digest."""
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        self._bodies[content_hash] = content
+        return content_hash
+
+    def apply(self, envelope: Dict[str, Any]) -> bool:
+        """Project one EvidenceBus envelope; returns True if a message was added."""
+        event = envelope.get("event") if isinstance(envelope, dict) else None
+        if not isinstance(event, dict) or event.get("type") != CONTENT_EVENT:
+            return False
+        payload = event.get("payload")
+        message = payload.get("message") if isinstance(payload, dict) else None
+        if not isinstance(message, dict):
+            return False
+        message_id = message.get("id")
+        timestamp = message.get("timestamp")
+        if not isinstance(message_id, str) or not isinstance(timestamp, int):
+            return False
+        if message_id in self._messages:
+            return False
+        message = {k: v for k, v in message.items() if k != "content"}
+        self._messages[message_id] = message
+        key = (timestamp, message_id)
+        self._insert(self._channels.setdefault(message.get("channel_id"), []), key)
+        self._insert(self._all, key)
+        return True
+
+    @staticmethod
+    def _insert(keys: List[FeedKey], key: FeedKey):
+        if not keys or key > keys[-1]:
+            keys.append(key)
+        else:
+            insort(keys, key)
+
+    def get_feed(
+        self,
+        channel_id: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        One feed page, newest first.
+
+        Args:
+            channel_id: Channel to read; None reads across all channels
+            limit: Maximum number of messages in the page
+            cursor: ``next_cursor`` from the previous page; None starts at the newest
+
+        Returns:
+            (messages, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        position = decode_cursor(cursor) if cursor else None
+        self.refresh()
+        if limit <= 0:
+            return [], None
+        keys = self._all if channel_id is None else self._channels.get(channel_id, [])
+        end = len(keys) if position is None else bisect_left(keys, position)
+        start = max(0, end - limit)
+        page = keys[start:end]
+        page.reverse()
+        next_cursor = encode_cursor(page[-1]) if start > 0 else None
+        return [self._with_body(self._messages[key[1]]) for key in page], next_cursor
+
+    def get_message(self, message_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a published message by id."""
+        self.refresh()
+        message = self._messages.get(message_id)
+        return self._with_body(message) if message is not None else None
+
+    def _with_body(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(message, content=self._bodies.get(message.get("content_hash"), ""))
+
+    def __len__(self) -> int:
+        return len(self._messages)
@@ -8,6 +8,7 @@ from v13.core.CoherenceLedger import CoherenceLedger
 from v13.core.StorageEngine import StorageEngine
 from v13.libs.CertifiedMath import CertifiedMath
 
+from v15.auth.revocation_store import SQLiteRevocationStore
 from v15.auth.session_manager import SessionManager
 
 # Initialize Global Services
@@ -19,7 +20,15 @@ evidence_bus = EvidenceBus()
 
 
 # Instantiate Certified SessionManager (V15/V18)
-session_manager = SessionManager(session_ttl_seconds=3600 * 24)
+# Workers share revocations through SQLite when SESSION_REVOCATION_DB is set
+_revocation_store = (
+    SQLiteRevocationStore(settings.SESSION_REVOCATION_DB)
+    if settings.SESSION_REVOCATION_DB
+    else None
+)
+session_manager = SessionManager(
+    session_ttl_seconds=3600 * 24, revocation_store=_revocation_store
+)
 
 
 async def require_auth(authorization: Optional[str] = Header(None)) -> dict:
@@ -28,7 +37,10 @@ async def require_auth(authorization: Optional[str] = Header(None)) -> dict:
         raise HTTPException(401, "Missing or invalid Authorization header")
 
     token = authorization.split(" ")[1]
-    return session_manager.verify_session(token)
+    session = session_manager.validate_session(token)
+    if session is None:
+        raise HTTPException(401, "Invalid or expired session")
+    return session
 
 
 async def optional_auth(authorization: Optional[str] = Header(None)) -> Optional[dict]:
@@ -38,7 +50,7 @@ async def optional_auth(authorization: Optional[str] = Header(None)) -> Optional
 
     try:
         token = authorization.split(" ")[1]
-        return session_manager.verify_session(token)
+        return session_manager.validate_session(token)
     except Exception:
         return None
 
@@ -0,0 +1,252 @@
+"""
+Reward explanation cache for the Explain-This API.
+
+A reward explanation is a pure function of ledger history, so the response
+built for (wallet_id, ledger head hash) stays valid until the ledger grows.
+Reward allocations in the ledger record no epoch and the replay source
+resolves a wallet's allocation without one, so the requested epoch is not
+part of the key; it is only echoed back in the response. Recently used
+responses are kept in an in-process LRU; entries evicted from it spill to a
+bounded directory of JSON files that survives restarts. ``precompute_epoch``
+fills the cache for every rewarded wallet from a single replay.
+"""
+
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from v13.core.QFSReplaySource import QFSReplaySource
+from v13.policy.value_node_explainability import ValueNodeExplainabilityHelper
+
+CacheKey = Tuple[str, str]
+
+
+class ExplanationNotFound(LookupError):
+    """No explanation can be derived from the ledger for this wallet and epoch."""
+
+
+def _replay_engine(helper: ValueNodeExplainabilityHelper):
+    from v13.policy.value_node_replay import ValueNodeReplayEngine
+
+    return ValueNodeReplayEngine(helper)
+
+
+def build_reward_explanation(
+    wallet_id: str,
+    epoch: int,
+    events: List[Dict[str, Any]],
+    helper: ValueNodeExplainabilityHelper,
+    replay_engine=None,
+) -> Dict[str, Any]:
+    """
+    Explain-This response for one wallet from its replayed reward events.
+
+    ``replay_engine`` may already hold the replayed history (batch use);
+    otherwise a fresh engine replays ``events``.
+
+    Raises:
+        ExplanationNotFound: If the events hold no explainable reward
+    """
+    if not events:
+        raise ExplanationNotFound(
+            f"No reward events found for wallet {wallet_id} in epoch {epoch}"
+        )
+    if replay_engine is None:
+        replay_engine = _replay_engine(helper)
+        replay_engine.replay_events(events)
+    reward_event_id = next(
+        (e["id"] for e in events if e["type"] == "RewardAllocated"), None
+    )
+    if not reward_event_id:
+        raise ExplanationNotFound("RewardAllocated event missing from history context")
+    explanation = replay_engine.explain_specific_reward(reward_event_id, events)
+    if not explanation:
+        raise ExplanationNotFound("Failed to generate explanation from event")
+    simplified = helper.get_simplified_explanation(explanation)
+    return {
+        "wallet_id": wallet_id,
+        "epoch": epoch,
+        "base": simplified["breakdown"]["base_reward"]["ATR"],
+        "bonuses": simplified["breakdown"]["bonuses"],
+        "caps": simplified["breakdown"]["caps"],
+        "guards": simplified["breakdown"]["guards"],
+        "total": simplified["breakdown"]["total_reward"]["ATR"],
+        "metadata": {
+            "replay_hash": explanation.explanation_hash,
+            "computed_at": events[-1]["timestamp"],
+            "source": "qfs_replay_verified",
+        },
+    }
+
+
+class RewardExplanationCache:
+    """
+    LRU of reward explanations keyed by (wallet_id, head_hash).
+
+    Memory holds up to ``max_entries`` responses. With ``spill_dir``, evicted
+    responses are written there (one JSON file per key, at most
+    ``max_spill_entries`` files, oldest removed first) and promoted back on a
+    hit. Returned responses are copies; callers may mutate them.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        spill_dir: Optional[str] = None,
+        max_spill_entries: int = 65536,
+    ):
+        self.max_entries = max_entries
+        self.spill_dir = spill_dir
+        self.max_spill_entries = max_spill_entries
+        self._entries: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._spilled: "OrderedDict[str, None]" = OrderedDict()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "spills": 0}
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            names = [n for n in os.listdir(spill_dir) if n.endswith(".json")]
+            names.sort(key=lambda n: os.path.getmtime(os.path.join(spill_dir, n)))
+            self._spilled.update((name, None) for name in names)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _spill_name(key: CacheKey) -> str:
+        digest = hashlib.sha256(json.dumps(list(key)).encode("utf-8")).hexdigest()
+        return f"{digest}.json"
+
+    def get(self, wallet_id: str, head_hash: str) -> Optional[Dict[str, Any]]:
+        """Cached response, or None."""
+        key = (wallet_id, head_hash)
+        explanation = self._entries.get(key)
+        if explanation is not None:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return copy.deepcopy(explanation)
+        explanation = self._read_spill(key)
+        if explanation is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["disk_hits"] += 1
+        self._store(key, explanation)
+        return copy.deepcopy(explanation)
+
+    def put(self, wallet_id: str, head_hash: str, explanation: Dict[str, Any]):
+        """Cache a response for the ledger at ``head_hash``."""
+        self._store((wallet_id, head_hash), copy.deepcopy(explanation))
+
+    def _store(self, key: CacheKey, explanation: Dict[str, Any]):
+        self._entries[key] = explanation
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._write_spill(evicted_key, evicted)
+
+    def _read_spill(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        name = self._spill_name(key)
+        if name not in self._spilled:
+            return None
+        try:
+            with open(os.path.join(self.spill_dir, name), "r") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            del self._spilled[name]
+            return None
+        if tuple(record["key"]) != key:
+            return None
+        self._spilled.move_to_end(name)
+        return record["explanation"]
+
+    def _write_spill(self, key: CacheKey, explanation: Dict[str, Any]):
+        if not self.spill_dir or self.max_spill_entries <= 0:
+            return
+        name = self._spill_name(key)
+        if name not in self._spilled:
+            path = os.path.join(self.spill_dir, name)
+            temp_path = path + ".tmp"
+            with open(temp_path, "w") as f:
+                json.dump({"key": list(key), "explanation": explanation}, f)
+            os.replace(temp_path, path)
+            self.stats["spills"] += 1
+        self._spilled[name] = None
+        self._spilled.move_to_end(name)
+        while len(self._spilled) > self.max_spill_entries:
+            oldest, _ = self._spilled.popitem(last=False)
+            try:
+                os.remove(os.path.join(self.spill_dir, oldest))
+            except FileNotFoundError:
+                pass
+
+    def get_or_build(
+        self,
+        replay_source: QFSReplaySource,
+        helper: ValueNodeExplainabilityHelper,
+        wallet_id: str,
+        epoch: int,
+    ) -> Dict[str, Any]:
+        """
+        Cached response for the ledger's current head, replaying on a miss.
+
+        Raises:
+            ExplanationNotFound: If the ledger holds no explainable reward
+        """
+        head_hash = replay_source.get_head_hash()
+        explanation = self.get(wallet_id, head_hash)
+        if explanation is not None:
+            explanation["epoch"] = epoch
+            return explanation
+        events = replay_source.get_reward_events(wallet_id, epoch)
+        explanation = build_reward_explanation(wallet_id, epoch, events, helper)
+        self.put(wallet_id, head_hash, explanation)
+        return explanation
+
+
+def precompute_epoch(
+    cache: RewardExplanationCache,
+    replay_source: QFSReplaySource,
+    helper: ValueNodeExplainabilityHelper,
+    epoch: int,
+    wallet_ids: Optional[List[str]] = None,
+) -> int:
+    """
+    Fill ``cache`` with the explanations of every rewarded wallet.
+
+    Reward events for all wallets are gathered in one ledger pass, their
+    union is replayed once, and each reward allocation is explained once;
+    wallets paid by the same allocation reuse that explanation. Responses are
+    identical to ``get_or_build``. The ledger does not record epochs on
+    reward allocations, so this warms the cache for every epoch at the
+    current head; ``epoch`` is only written into the responses.
+
+    Returns:
+        Number of wallets cached.
+    """
+    head_hash = replay_source.get_head_hash()
+    events_by_wallet = replay_source.get_rewarded_wallet_events(wallet_ids)
+    replay_engine = _replay_engine(helper)
+    replayed: Dict[str, Dict[str, Any]] = {}
+    for events in events_by_wallet.values():
+        for event in events:
+            replayed.setdefault(event["id"], event)
+    replay_engine.replay_events(list(replayed.values()))
+
+    by_allocation: Dict[str, Optional[Dict[str, Any]]] = {}
+    cached = 0
+    for wallet_id, events in sorted(events_by_wallet.items()):
+        allocation_id = events[-1]["id"]
+        if allocation_id not in by_allocation:
+            try:
+                by_allocation[allocation_id] = build_reward_explanation(
+                    wallet_id, epoch, events, helper, replay_engine
+                )
+            except ExplanationNotFound:
+                by_allocation[allocation_id] = None
+        if by_allocation[allocation_id] is None:
+            continue
+        explanation = dict(by_allocation[allocation_id], wallet_id=wallet_id)
+        cache.put(wallet_id, head_hash, explanation)
+        cached += 1
+    return cached
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from pydantic import BaseModel
 from typing import List, Optional
-import hashlib
+from ..content_projection import CONTENT_EVENT, ContentProjection, InvalidCursorError
 from ..dependencies import get_current_wallet
+from v15.evidence.bus import EvidenceBus
 from v18.cluster import V18ClusterAdapter, ChatCommand, TxResult
 
 router = APIRouter(prefix="/api/v18/content", tags=["content-v18"])
@@ -17,6 +18,9 @@ cluster_adapter = V18ClusterAdapter(
     timeout_seconds=10,
 )
 
+# Read model for feed and message lookups, fed from EvidenceBus content events
+content_projection = ContentProjection()
+
 
 # ============================================================================
 # Request/Response Models
@@ -61,13 +65,14 @@ async def publish_message(
     Publish a message/post to a channel.
 
     Flow:
-    1. Hash the content (Class B - mutable)
+    1. Hash the content and keep the body in the content projection (Class B - mutable)
     2. Submit hash to EvidenceBus via ClusterAdapter (Class A - immutable)
-    3. Store full content in projection DB
+    3. Emit the content event that feeds the content projection; it carries
+       the id, channel, hash and timestamp but never the body
     """
     try:
         # Generate content hash (deterministic)
-        content_hash = hashlib.sha256(request.content.encode()).hexdigest()
+        content_hash = content_projection.store_content(request.content)
 
         # Create chat command
         cmd = ChatCommand(
@@ -94,6 +99,21 @@ async def publish_message(
             else f"msg_{int(0)}"
         )
 
+        EvidenceBus.emit(
+            CONTENT_EVENT,
+            {
+                "message": {
+                    "id": message_id,
+                    "channel_id": request.channel_id,
+                    "sender": wallet,
+                    "content_hash": content_hash,
+                    "timestamp": result.timestamp,
+                    "reply_to": request.reply_to,
+                },
+                "timestamp": result.timestamp,
+            },
+        )
+
         return PublishMessageResponse(
             message_id=message_id,
             content_hash=content_hash,
@@ -107,24 +127,26 @@ async def publish_message(
 
 
 @router.get("/feed", response_model=List[MessageSummary])
-async def get_feed(channel_id: Optional[str] = None, limit: int = 20, offset: int = 0):
+async def get_feed(
+    response: Response,
+    channel_id: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+):
     """
-    Get content feed.
-    Queries from projection database.
+    Get content feed, newest first.
+    Queries from the content projection; pass the X-Next-Cursor header of
+    a page back as ``cursor`` to fetch the next one.
     """
-    # TODO: Query from projection database
-    # For now, return mock data
-    return [
-        MessageSummary(
-            id="msg_001",
-            channel_id=channel_id or "general",
-            sender="0xABC123",
-            content="Hello from ATLAS v18!",
-            content_hash="abc123...",
-            timestamp=0,
-            reply_to=None,
+    try:
+        messages, next_cursor = content_projection.get_feed(
+            channel_id=channel_id, limit=limit, cursor=cursor
         )
-    ]
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [MessageSummary(**message) for message in messages]
 
 
 @router.get("/messages/{message_id}", response_model=MessageSummary)
@@ -132,16 +154,10 @@ async def get_message(message_id: str):
     """
     Get a specific message by ID.
     """
-    # TODO: Query from projection database
-    return MessageSummary(
-        id=message_id,
-        channel_id="general",
-        sender="0xABC123",
-        content="Sample message content",
-        content_hash="hash123...",
-        timestamp=0,
-        reply_to=None,
-    )
+    message = content_projection.get_message(message_id)
+    if message is None:
+        raise HTTPException(status_code=404, detail=f"Message {message_id} not found")
+    return MessageSummary(**message)
 
 
 @router.post("/messages/{message_id}/react")
@@ -15,9 +15,14 @@ from v13.policy.humor_policy import HumorSignalPolicy, HumorPolicy
 from v13.core.QFSReplaySource import QFSReplaySource
 from v13.libs.BigNum128 import BigNum128
 from ..dependencies import get_replay_source, get_current_user
+from ..explain_cache import (
+    ExplanationNotFound,
+    RewardExplanationCache,
+    precompute_epoch,
+)
 
 logger = logging.getLogger(__name__)
-from ...config import EXPLAIN_THIS_SOURCE
+from ...config import EXPLAIN_THIS_SOURCE, settings
 
 # EXPLAIN_THIS_SOURCE = os.getenv('EXPLAIN_THIS_SOURCE', 'qfs_ledger') - Removed, using config import
 if EXPLAIN_THIS_SOURCE != "qfs_ledger":
@@ -60,6 +65,11 @@ artistic_policy = ArtisticSignalPolicy(
     )
 )
 explain_helper = ValueNodeExplainabilityHelper(humor_policy, artistic_policy)
+reward_explanation_cache = RewardExplanationCache(
+    max_entries=settings.EXPLAIN_CACHE_MAX_ENTRIES,
+    spill_dir=settings.EXPLAIN_CACHE_SPILL_DIR or None,
+    max_spill_entries=settings.EXPLAIN_CACHE_MAX_SPILL_ENTRIES,
+)
 
 
 @router.get("/reward/{wallet_id}")
@@ -91,47 +101,11 @@ async def explain_reward(
                 detail="Cannot view other users' reward explanations without audit permission",
             )
     try:
-        from v13.policy.value_node_replay import ValueNodeReplayEngine
-
-        replay_engine = ValueNodeReplayEngine(explain_helper)
-        events = replay_source.get_reward_events(wallet_id, epoch or 1)
-        if not events:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No reward events found for wallet {wallet_id} in epoch {epoch or 1}",
-            )
-
-        replay_engine.replay_events(events)
-        reward_event_id = next(
-            (e["id"] for e in events if e["type"] == "RewardAllocated"), None
+        return reward_explanation_cache.get_or_build(
+            replay_source, explain_helper, wallet_id, epoch or 1
         )
-        if not reward_event_id:
-            raise HTTPException(
-                status_code=404,
-                detail="RewardAllocated event missing from history context",
-            )
-        explanation = replay_engine.explain_specific_reward(reward_event_id, events)
-        if not explanation:
-            raise HTTPException(
-                status_code=404, detail="Failed to generate explanation from event"
-            )
-        simplified = explain_helper.get_simplified_explanation(explanation)
-        return {
-            "wallet_id": wallet_id,
-            "epoch": epoch or 1,
-            "base": simplified["breakdown"]["base_reward"]["ATR"],
-            "bonuses": simplified["breakdown"]["bonuses"],
-            "caps": simplified["breakdown"]["caps"],
-            "guards": simplified["breakdown"]["guards"],
-            "total": simplified["breakdown"]["total_reward"]["ATR"],
-            "metadata": {
-                "replay_hash": explanation.explanation_hash,
-                "computed_at": events[-1]["timestamp"],
-                "source": "qfs_replay_verified",
-            },
-        }
-        if artistic_policy.policy.enabled:
-            pass
+    except ExplanationNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -142,6 +116,41 @@ async def explain_reward(
         )
 
 
+@router.post("/reward/precompute/{epoch}")
+async def precompute_reward_explanations(
+    epoch: int,
+    current_user: dict = Depends(get_current_user),
+    replay_source: QFSReplaySource = Depends(get_replay_source),
+) -> Dict[str, Any]:
+    """
+    Warm the reward explanation cache for every rewarded wallet.
+
+    Replays the reward history once instead of once per wallet. Ledger reward
+    allocations carry no epoch, so the warmed entries serve every epoch at the
+    current head. Requires the audit_all_explanations permission.
+    """
+    if "audit_all_explanations" not in current_user.get("permissions", []):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Precomputing reward explanations requires audit permission",
+        )
+    try:
+        wallets = precompute_epoch(
+            reward_explanation_cache, replay_source, explain_helper, epoch
+        )
+    except Exception as e:
+        logger.error(f"Error precomputing reward explanations for epoch {epoch}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to precompute reward explanations: {str(e)}",
+        )
+    return {
+        "epoch": epoch,
+        "wallets_cached": wallets,
+        "head_hash": replay_source.get_head_hash(),
+    }
+
+
 def test_invalid_wallet_id():
     """Test reward explanation with invalid wallet ID."""
     from fastapi.testclient import TestClient
@@ -21,6 +21,8 @@ class Settings(BaseSettings):
         "SESSION_SECRET", "dev-secret-change-in-prod-atlas-v18"
     )
     SESSION_EXPIRY_HOURS: int = 24
+    # Shared revocation list for multi-worker deployments (empty = in-process)
+    SESSION_REVOCATION_DB: str = os.getenv("SESSION_REVOCATION_DB", "")
 
     # Database (future)
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./atlas_v18.db")
@@ -29,6 +31,13 @@ class Settings(BaseSettings):
     ENABLE_DAILY_REWARDS: bool = True
     EXPLAIN_THIS_SOURCE: str = "qfs_ledger"
 
+    # Explain-This reward cache (empty spill dir = memory only)
+    EXPLAIN_CACHE_MAX_ENTRIES: int = int(os.getenv("EXPLAIN_CACHE_MAX_ENTRIES", "4096"))
+    EXPLAIN_CACHE_SPILL_DIR: str = os.getenv("EXPLAIN_CACHE_SPILL_DIR", "")
+    EXPLAIN_CACHE_MAX_SPILL_ENTRIES: int = int(
+        os.getenv("EXPLAIN_CACHE_MAX_SPILL_ENTRIES", "65536")
+    )
+
     class Config:
         env_file = ".env"
         extra = "ignore"  # Ignore extra env vars
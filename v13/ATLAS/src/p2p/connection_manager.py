@@ -2,42 +2,110 @@ import logging
 import json
 import base64
 import asyncio
-from typing import Dict, Optional, Tuple
+import hmac
+import random
+import secrets
+import time
+from fractions import Fraction
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 from v13.libs.PQC import PQC, KeyPair
+from v13.libs.economics.QAmount import QAmount
 from .secure_message_v2 import SecureMessageV2, MessageSequenceManager
 from .aegis_bootstrap import AEGISDIDBootstrap
+from .framing import FrameWriter, encode_frame, read_frame
+from .session_resumption import (
+    FRAMED_TRANSPORT_VERSION,
+    HANDSHAKE_VERSION,
+    HandshakeMetrics,
+    ResumptionTicket,
+    TicketStore,
+    derive_session_material,
+    resumed_shared_secret,
+    resumption_proof,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def monotonic_ms() -> int:
+    """Default ticket clock: whole milliseconds of time.monotonic_ns()."""
+    return time.monotonic_ns() // 1_000_000
+
+
 class ConnectionManager:
     """
     Manages P2P connections with PQC-secured handshake and messaging.
     Enforces Phase 3 Real PQC Integration requirements.
+
+    The handshake is newline-delimited JSON; after it, messages travel as
+    length-prefixed binary SecureMessageV2 frames through a per-peer
+    coalescing FrameWriter. Peers that negotiated handshake version 1 keep
+    the legacy newline-delimited JSON messages. Reconnects present a resumption ticket derived
+    from the previous shared secret and skip the Kyber1024 encapsulation.
     """
 
-    def __init__(self, node_id: str, keypair: KeyPair, bootstrap: AEGISDIDBootstrap):
+    def __init__(
+        self,
+        node_id: str,
+        keypair: KeyPair,
+        bootstrap: AEGISDIDBootstrap,
+        max_pending_bytes: int = 1024 * 1024,
+        ticket_lifetime_ms: int = 3_600_000,
+        reconnect_base_delay_ms: int = 500,
+        reconnect_max_delay_ms: int = 30_000,
+        max_reconnect_attempts: int = 10,
+        clock: Callable[[], int] = monotonic_ms,
+        rng: Optional[random.Random] = None,
+    ):
         self.node_id = node_id
         self.keypair = keypair
         self.bootstrap = bootstrap
-        self.peers: Dict[str, Dict] = {}  # peer_id -> {writer, reader, public_key}
+        self.peers: Dict[str, Dict] = {}  # peer_id -> {writer, reader, outbound, host, port, session_key}
         self.sequence_manager = MessageSequenceManager()
+        self.max_pending_bytes = max_pending_bytes
+        # Optional callback(peer_id, SecureMessageV2) for accepted inbound messages
+        self.on_message: Optional[Callable[[str, SecureMessageV2], Any]] = None
+
+        # Session resumption: tickets we issued (server side) and tickets we
+        # hold per dialled address (client side); clock (integer
+        # milliseconds) drives ticket expiry.
+        self.clock = clock
+        self.ticket_lifetime_ms = ticket_lifetime_ms
+        self.ticket_store = TicketStore()
+        self._client_tickets: Dict[Tuple[str, int], ResumptionTicket] = {}
+        self.session_keys: Dict[str, bytes] = {}
+        # Handshake version negotiated with each peer, until it is registered
+        self._peer_versions: Dict[str, int] = {}
+        self.metrics = HandshakeMetrics()
+
+        # Reconnect pool: outbound peers are redialled after a drop. Backoff
+        # jitter comes from rng, seeded from node_id unless one is injected,
+        # so a node's reconnect schedule is reproducible.
+        self.reconnect_base_delay_ms = reconnect_base_delay_ms
+        self.reconnect_max_delay_ms = reconnect_max_delay_ms
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.rng = rng if rng is not None else random.Random(node_id)
+        self._dial_addresses: Dict[str, Tuple[str, int]] = {}
+        self._reconnect_tasks: Dict[str, asyncio.Task] = {}
+        self._listener_tasks: Set[asyncio.Task] = set()
+        self._closing = False
 
     async def connect_to_peer(self, host: str, port: int):
-        """Initiate connection to a peer."""
+        """
+        Initiate connection to a peer.
+
+        The peer joins the reconnect pool: if the link drops, it is redialled
+        with jittered exponential backoff until disconnect() or close().
+        """
         try:
             reader, writer = await asyncio.open_connection(host, port)
-            peer_id = await self._perform_handshake(reader, writer, is_initiator=True)
+            peer_id = await self._perform_handshake(
+                reader, writer, is_initiator=True, address=(host, port)
+            )
             if peer_id:
-                self.peers[peer_id] = {
-                    "writer": writer,
-                    "reader": reader,
-                    "host": host,
-                    "port": port,
-                }
+                self._register_peer(peer_id, reader, writer, host, port)
+                self._dial_addresses[peer_id] = (host, port)
                 logger.info(f"Connected to peer {peer_id} at {host}:{port}")
-                # Start listening loop for this peer (in background)
-                asyncio.create_task(self._listen_to_peer(peer_id, reader))
                 return peer_id
             else:
                 writer.close()
@@ -47,86 +115,207 @@ class ConnectionManager:
             logger.error(f"Failed to connect to {host}:{port}: {e}")
             return None
 
+    def _register_peer(self, peer_id: str, reader, writer, host: str, port: int):
+        version = self._peer_versions.pop(peer_id, HANDSHAKE_VERSION)
+        self.peers[peer_id] = {
+            "writer": writer,
+            "reader": reader,
+            "outbound": FrameWriter(writer, self.max_pending_bytes),
+            "host": host,
+            "port": port,
+            "session_key": self.session_keys.pop(peer_id, None),
+            "framed": version >= FRAMED_TRANSPORT_VERSION,
+        }
+        # Start listening loop for this peer (in background); close() cancels it
+        task = asyncio.create_task(
+            self._listen_to_peer(peer_id, reader, self.peers[peer_id]["framed"])
+        )
+        self._listener_tasks.add(task)
+        task.add_done_callback(self._listener_tasks.discard)
+
     async def _perform_handshake(
-        self, reader, writer, is_initiator: bool
+        self, reader, writer, is_initiator: bool, address: Optional[Tuple[str, int]] = None
     ) -> Optional[str]:
         """
-        Execute PQC KEM Handshake.
+        Execute PQC KEM Handshake, resuming a previous session when possible.
 
         Protocol:
-        1. Server (Listener) sends KEM Public Key + Node ID.
-        2. Client (Initiator) receives key, verifies nothing for now (or AEGIS if ID known).
-        3. Client encapsulates session key using Server's PubKey.
-        4. Client sends Ciphertext + Client Node ID.
-        5. Server decapsulates Session Key.
-        6. Server verifies Client Node ID (via AEGIS).
-
-        Result: Both have 'shared_secret' (Session Key).
+        1. Server (Listener) sends KEM Public Key + Node ID + handshake version.
+        2. Client (Initiator) holding an unexpired ticket for this address, and
+           talking to a server of version 2 or later, answers with the ticket
+           id, a nonce and an HMAC proof. The server replies with its own proof
+           ("resumed") or declines, and the client continues with step 3.
+        3. Full path: Client encapsulates session key using Server's PubKey
+           and sends Ciphertext + Client Node ID; Server decapsulates it.
+
+        The server always speaks first, as in version 1, so peers without
+        resumption support still complete the full handshake.
+
+        Result: Both hold a session key and a fresh single-use ticket derived
+        from the shared secret (see session_resumption).
         """
+        started = time.perf_counter_ns()
         try:
-            if not is_initiator:
-                # SERVER ROLE: Initiates by sending Public Key
-                # Generate Ephemeral KEM Keypair (or use static if available)
-                # For Phase 3, we use Ephemeral for Forward Secrecy in P2P
-                kem_pub, kem_priv = PQC.kem_keypair(PQC.KYBER1024)
-
-                kem_pub_b64 = base64.b64encode(kem_pub).decode("utf-8")
-                identity_payload = {"node_id": self.node_id, "kem_pub_key": kem_pub_b64}
-                writer.write(json.dumps(identity_payload).encode() + b"\n")
-                await writer.drain()
+            if is_initiator:
+                result = await self._client_handshake(reader, writer, address)
+            else:
+                result = await self._server_handshake(reader, writer)
+        except Exception as e:
+            logger.error(f"Handshake error: {e}")
+            result = None
+        if result is None:
+            self.metrics.failed_handshakes += 1
+            return None
+        peer_id, resumed = result
+        self.metrics.record(resumed, time.perf_counter_ns() - started)
+        return peer_id
 
-                # Receive Ciphertext + Client Identity
-                data_line = await reader.readline()
-                if not data_line:
-                    return None
-                client_data = json.loads(data_line.decode())
+    async def _server_handshake(self, reader, writer) -> Optional[Tuple[str, bool]]:
+        # SERVER ROLE: Initiates by sending an ephemeral KEM Public Key
+        # For Phase 3, we use Ephemeral for Forward Secrecy in P2P
+        kem_pub, kem_priv = PQC.kem_generate_keypair(PQC.KYBER1024)
+        kem_pub_b64 = base64.b64encode(kem_pub).decode("utf-8")
+        identity_payload = {
+            "node_id": self.node_id,
+            "kem_pub_key": kem_pub_b64,
+            "version": HANDSHAKE_VERSION,
+        }
+        writer.write(json.dumps(identity_payload).encode() + b"\n")
+        await writer.drain()
 
-                client_ciphertext = base64.b64decode(client_data["ciphertext"])
-                client_peer_id = client_data["node_id"]
+        data_line = await reader.readline()
+        if not data_line:
+            return None
+        client_data = json.loads(data_line.decode())
+        client_peer_id = client_data["node_id"]
+        self._peer_versions[client_peer_id] = min(
+            HANDSHAKE_VERSION, client_data.get("version", 1)
+        )
 
-                # Decapsulate
-                shared_secret = PQC.kem_decapsulate(
-                    PQC.KYBER1024, kem_priv, client_ciphertext
+        if "resume_ticket" in client_data:
+            self.metrics.resumption_attempts += 1
+            nonce = base64.b64decode(client_data["nonce"])
+            proof = base64.b64decode(client_data["proof"])
+            ticket = self.ticket_store.take(
+                client_data["resume_ticket"],
+                self.clock(),
+                lambda t: t.peer_id == client_peer_id
+                and hmac.compare_digest(
+                    proof, resumption_proof(t.resumption_secret, b"client", nonce, client_peer_id)
+                ),
+            )
+            if ticket is not None:
+                server_proof = resumption_proof(
+                    ticket.resumption_secret, b"server", nonce, self.node_id
                 )
+                response = {
+                    "node_id": self.node_id,
+                    "resumed": True,
+                    "proof": base64.b64encode(server_proof).decode("utf-8"),
+                }
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+                shared_secret = resumed_shared_secret(ticket.resumption_secret, nonce)
+                self._store_session(client_peer_id, shared_secret, None)
+                return (client_peer_id, True)
 
-                # Verify identity via AEGIS (mock) via Signatures?
-                # The current flow doesn't sign the handshake, it just does KEM.
-                # To be secure, Client should SIGN the ciphertext or a challenge.
-                # Adding basic AEGIS check on ID:
-                # Client didn't send pubkey, so we can't verify signature without lookup.
-                # We'll trust AEGIS knows valid IDs.
+            # Declined: the client falls back to the ciphertext for our KEM key
+            writer.write(json.dumps({"node_id": self.node_id, "resumed": False}).encode() + b"\n")
+            await writer.drain()
+            data_line = await reader.readline()
+            if not data_line:
+                return None
+            client_data = json.loads(data_line.decode())
+            if client_data["node_id"] != client_peer_id:
+                return None
 
-                # Store session key
-                # self.peers[client_peer_id]['session_key'] = shared_secret
-                return client_peer_id
+        # Receive Ciphertext + Client Identity
+        client_ciphertext = base64.b64decode(client_data["ciphertext"])
 
-            else:
-                # CLIENT ROLE: Waits for Server Hello
-                data_line = await reader.readline()
-                if not data_line:
-                    return None
-                server_data = json.loads(data_line.decode())
-                server_peer_id = server_data["node_id"]
-                server_kem_pub = base64.b64decode(server_data["kem_pub_key"])
+        # Decapsulate
+        shared_secret = PQC.kem_decapsulate(PQC.KYBER1024, kem_priv, client_ciphertext)
+
+        # The handshake is not signed; we trust AEGIS knows valid IDs.
+        self._store_session(client_peer_id, shared_secret, None)
+        return (client_peer_id, False)
 
-                # Encapsulate
-                ciphertext, shared_secret = PQC.kem_encapsulate(
-                    PQC.KYBER1024, server_kem_pub
+    async def _client_handshake(
+        self, reader, writer, address: Optional[Tuple[str, int]]
+    ) -> Optional[Tuple[str, bool]]:
+        # CLIENT ROLE: Waits for Server Hello
+        data_line = await reader.readline()
+        if not data_line:
+            return None
+        server_data = json.loads(data_line.decode())
+        server_peer_id = server_data["node_id"]
+        server_kem_pub = base64.b64decode(server_data["kem_pub_key"])
+        version = min(HANDSHAKE_VERSION, server_data.get("version", 1))
+        self._peer_versions[server_peer_id] = version
+
+        ticket = self._client_tickets.pop(address, None) if address else None
+        if (
+            ticket is not None
+            and ticket.is_valid(self.clock())
+            and version >= HANDSHAKE_VERSION
+        ):
+            self.metrics.resumption_attempts += 1
+            nonce = secrets.token_bytes(16)
+            proof = resumption_proof(ticket.resumption_secret, b"client", nonce, self.node_id)
+            resume = {
+                "node_id": self.node_id,
+                "version": HANDSHAKE_VERSION,
+                "resume_ticket": ticket.ticket_id,
+                "nonce": base64.b64encode(nonce).decode("utf-8"),
+                "proof": base64.b64encode(proof).decode("utf-8"),
+            }
+            writer.write(json.dumps(resume).encode() + b"\n")
+            await writer.drain()
+
+            data_line = await reader.readline()
+            if not data_line:
+                return None
+            reply = json.loads(data_line.decode())
+            if reply.get("resumed"):
+                expected = resumption_proof(
+                    ticket.resumption_secret, b"server", nonce, server_peer_id
                 )
+                if server_peer_id != ticket.peer_id or not hmac.compare_digest(
+                    base64.b64decode(reply["proof"]), expected
+                ):
+                    return None
+                shared_secret = resumed_shared_secret(ticket.resumption_secret, nonce)
+                self._store_session(server_peer_id, shared_secret, address)
+                return (server_peer_id, True)
 
-                # Send Ciphertext + My Identity
-                client_payload = {
-                    "node_id": self.node_id,
-                    "ciphertext": base64.b64encode(ciphertext).decode("utf-8"),
-                }
-                writer.write(json.dumps(client_payload).encode() + b"\n")
-                await writer.drain()
+        # Encapsulate
+        ciphertext, shared_secret = PQC.kem_encapsulate(PQC.KYBER1024, server_kem_pub)
 
-                return server_peer_id
+        # Send Ciphertext + My Identity
+        client_payload = {
+            "node_id": self.node_id,
+            "ciphertext": base64.b64encode(ciphertext).decode("utf-8"),
+        }
+        if version >= FRAMED_TRANSPORT_VERSION:
+            client_payload["version"] = HANDSHAKE_VERSION
+        writer.write(json.dumps(client_payload).encode() + b"\n")
+        await writer.drain()
 
-        except Exception as e:
-            logger.error(f"Handshake error: {e}")
-            return None
+        self._store_session(server_peer_id, shared_secret, address)
+        return (server_peer_id, False)
+
+    def _store_session(
+        self, peer_id: str, shared_secret: bytes, address: Optional[Tuple[str, int]]
+    ):
+        """Keep the session key and file the next resumption ticket."""
+        session_key, resumption_secret, ticket_id = derive_session_material(shared_secret)
+        self.session_keys[peer_id] = session_key
+        ticket = ResumptionTicket(
+            ticket_id, peer_id, resumption_secret, self.clock() + self.ticket_lifetime_ms
+        )
+        if address is None:
+            self.ticket_store.put(ticket)
+        else:
+            self._client_tickets[address] = ticket
 
     async def start_server(self, host: str, port: int):
         """Start listening for incoming P2P connections."""
@@ -142,14 +331,8 @@ class ConnectionManager:
             peer_id = await self._perform_handshake(reader, writer, is_initiator=False)
             if peer_id:
                 addr = writer.get_extra_info("peername")
-                self.peers[peer_id] = {
-                    "writer": writer,
-                    "reader": reader,
-                    "host": addr[0],
-                    "port": addr[1],
-                }
+                self._register_peer(peer_id, reader, writer, addr[0], addr[1])
                 logger.info(f"Accepted connection from {peer_id} at {addr}")
-                asyncio.create_task(self._listen_to_peer(peer_id, reader))
             else:
                 writer.close()
                 await writer.wait_closed()
@@ -158,12 +341,17 @@ class ConnectionManager:
             writer.close()
 
     async def send_message(self, peer_id: str, payload: bytes):
-        """Send a PQC-secured message to a peer."""
+        """
+        Queue a PQC-secured message to a peer.
+
+        Returns once the frame is queued; frames queued while a previous write
+        drains are coalesced into one write. Use flush() to wait for delivery
+        to the transport.
+        """
         peer = self.peers.get(peer_id)
         if not peer:
             raise ValueError(f"Not connected to {peer_id}")
 
-        writer = peer["writer"]
         seq = self.sequence_manager.get_next_send_seq(peer_id)
 
         # In a real impl, we'd have shared session keys.
@@ -171,8 +359,6 @@ class ConnectionManager:
         # But SecureMessageV2 expects encryption.
         # For this MVP, we will send plaintext+signature wrapped in SecureMessageV2 structure (mocking encryption).
         mock_nonce = b"00000000"
-        # We need a proper timestamp QAmount
-        from v13.libs.economics.QAmount import QAmount
 
         msg = SecureMessageV2(
             ciphertext=payload,  # Mock: sending plaintext as ciphertext
@@ -181,26 +367,101 @@ class ConnectionManager:
             timestamp=QAmount(0),  # Mock timestamp
         )
 
-        # Serialize and send
-        data = msg.serialize()
-        writer.write(data + b"\n")
-        await writer.drain()
+        if peer["framed"]:
+            await peer["outbound"].send(encode_frame(msg.to_frame_body()))
+        else:
+            await peer["outbound"].send(msg.serialize() + b"\n")
+
+    async def flush(self, peer_id: str):
+        """Wait until all queued messages to a peer have been written."""
+        peer = self.peers.get(peer_id)
+        if not peer:
+            raise ValueError(f"Not connected to {peer_id}")
+        await peer["outbound"].flush()
 
-    async def _listen_to_peer(self, peer_id: str, reader):
-        """Background listener for messages."""
+    async def _listen_to_peer(self, peer_id: str, reader, framed: bool = True):
+        """Background listener for SecureMessageV2 frames (or legacy JSON lines)."""
         try:
             while True:
-                line = await reader.readline()
-                if not line:
+                if framed:
+                    body = await read_frame(reader)
+                else:
+                    body = await reader.readline() or None
+                if body is None:
                     break
-                # Process message (SecureMessageV2 deserialization)
                 try:
-                    # In real impl: deserialize, decrypt, verify seq
-                    logger.debug(f"Msg from {peer_id}: {line[:50]}...")
+                    # In real impl: decrypt after parsing
+                    if framed:
+                        msg = SecureMessageV2.from_frame_body(body)
+                    else:
+                        msg = SecureMessageV2.deserialize(body)
+                    if not self.sequence_manager.validate_incoming_sequence(
+                        peer_id, msg.sequence_num
+                    ):
+                        continue
+                    if self.on_message is not None:
+                        self.on_message(peer_id, msg)
                 except Exception as e:
                     logger.error(f"Message processing error from {peer_id}: {e}")
         except Exception as e:
             logger.error(f"Connection error with {peer_id}: {e}")
         finally:
-            self.peers.pop(peer_id, None)
+            peer = self.peers.get(peer_id)
+            if peer is not None and peer["reader"] is reader:
+                del self.peers[peer_id]
+                peer["outbound"].abort()
+                if peer_id in self._dial_addresses and not self._closing:
+                    self._schedule_reconnect(peer_id)
+
+    def _schedule_reconnect(self, peer_id: str):
+        if peer_id not in self._reconnect_tasks:
+            self._reconnect_tasks[peer_id] = asyncio.create_task(self._reconnect(peer_id))
+
+    def _backoff_delay_ms(self, attempt: int) -> int:
+        """Exponential backoff with jitter in [50%, 100%] of the capped delay."""
+        delay_ms = min(self.reconnect_max_delay_ms, self.reconnect_base_delay_ms * (2 ** attempt))
+        return self.rng.randint(delay_ms // 2, delay_ms)
+
+    async def _reconnect(self, peer_id: str):
+        """Redial a dropped outbound peer; resumes the session if the ticket is live."""
+        try:
+            for attempt in range(self.max_reconnect_attempts):
+                await asyncio.sleep(Fraction(self._backoff_delay_ms(attempt), 1000))
+                address = self._dial_addresses.get(peer_id)
+                if address is None or self._closing:
+                    return
+                new_peer_id = await self.connect_to_peer(*address)
+                if new_peer_id is not None:
+                    self.metrics.reconnects += 1
+                    if new_peer_id != peer_id:
+                        self._dial_addresses.pop(peer_id, None)
+                    return
+            logger.warning(f"Giving up reconnecting to {peer_id}")
+            self._dial_addresses.pop(peer_id, None)
+        finally:
+            self._reconnect_tasks.pop(peer_id, None)
+
+    async def disconnect(self, peer_id: str):
+        """Close a peer connection and drop it from the reconnect pool."""
+        self._dial_addresses.pop(peer_id, None)
+        task = self._reconnect_tasks.pop(peer_id, None)
+        if task is not None:
+            task.cancel()
+        peer = self.peers.pop(peer_id, None)
+        if peer is None:
+            return
+        try:
+            await peer["outbound"].close()
+        except ConnectionError:
+            pass
+        peer["writer"].close()
 
+    async def close(self):
+        """Disconnect every peer, stop reconnecting and wait for background tasks."""
+        self._closing = True
+        tasks = list(self._reconnect_tasks.values()) + list(self._listener_tasks)
+        for peer_id in list(self.peers) + list(self._reconnect_tasks):
+            await self.disconnect(peer_id)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
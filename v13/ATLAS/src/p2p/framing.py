@@ -0,0 +1,148 @@
+"""
+Length-prefixed binary framing for the ATLAS P2P transport.
+
+Every frame on the wire is a 4-byte big-endian body length followed by the
+body. Outbound frames go through a per-peer FrameWriter, which coalesces
+everything queued while the previous write drains into a single write and
+applies bounded backpressure to senders.
+"""
+
+import asyncio
+import struct
+from typing import List, Optional
+
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+class FrameError(ValueError):
+    """Malformed or oversized frame."""
+
+
+def encode_frame(body: bytes) -> bytes:
+    """Prefix a frame body with its length."""
+    if len(body) > MAX_FRAME_SIZE:
+        raise FrameError(f"Frame of {len(body)} bytes exceeds {MAX_FRAME_SIZE}")
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Read one frame body.
+
+    Returns None on a clean EOF between frames; raises FrameError for an
+    oversized length and asyncio.IncompleteReadError for EOF mid-frame.
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise FrameError(f"Frame of {length} bytes exceeds {MAX_FRAME_SIZE}")
+    return await reader.readexactly(length)
+
+
+class FrameWriter:
+    """
+    Per-peer outbound queue with write coalescing.
+
+    ``send`` appends an encoded frame and returns immediately unless more than
+    ``max_pending_bytes`` are already queued, in which case it waits for the
+    flusher to take the backlog. The flusher joins all queued frames into one
+    ``write`` and awaits ``drain`` once per batch, so many small messages cost
+    one syscall and one drain instead of one each.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, max_pending_bytes: int = 1024 * 1024):
+        self._writer = writer
+        self._max_pending_bytes = max_pending_bytes
+        self._frames: List[bytes] = []
+        self._pending_bytes = 0
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self.frames_sent = 0
+        self.writes = 0
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def send(self, frame: bytes) -> None:
+        """Queue an encoded frame, waiting while the backlog is over the limit."""
+        while self._pending_bytes >= self._max_pending_bytes and self._error is None:
+            self._space.clear()
+            await self._space.wait()
+        if self._error is not None:
+            raise ConnectionError("Peer writer failed") from self._error
+        if self._closed:
+            raise ConnectionError("Peer writer closed")
+        self._frames.append(frame)
+        self._pending_bytes += len(frame)
+        self._idle.clear()
+        self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Wait until every queued frame has been written and drained."""
+        await self._idle.wait()
+        if self._error is not None:
+            raise ConnectionError("Peer writer failed") from self._error
+
+    async def close(self) -> None:
+        """Flush outstanding frames and stop the flusher."""
+        if self._closed:
+            return
+        try:
+            await self.flush()
+        finally:
+            self._closed = True
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def abort(self) -> None:
+        """
+        Stop the flusher without waiting; queued frames are dropped.
+
+        Senders blocked on backpressure and callers waiting in ``flush`` are
+        woken and raise ConnectionError.
+        """
+        self._closed = True
+        self._fail(ConnectionError("Peer writer aborted"))
+        self._task.cancel()
+
+    def _fail(self, error: BaseException) -> None:
+        """Record the first failure and wake every waiter."""
+        if self._error is None:
+            self._error = error
+        self._frames = []
+        self._pending_bytes = 0
+        self._space.set()
+        self._idle.set()
+
+    async def _flush_loop(self) -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._frames:
+                    batch = self._frames
+                    self._frames = []
+                    self._pending_bytes = 0
+                    self._space.set()
+                    self._writer.write(b"".join(batch))
+                    self.frames_sent += len(batch)
+                    self.writes += 1
+                    await self._writer.drain()
+                self._idle.set()
+        except asyncio.CancelledError:
+            self._fail(ConnectionError("Peer writer closed"))
+            raise
+        except Exception as e:
+            self._fail(e)
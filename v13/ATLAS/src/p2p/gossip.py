@@ -0,0 +1,185 @@
+"""
+Gossip broadcast layer for the ATLAS P2P mesh.
+
+A GossipNode wraps a ConnectionManager: broadcast() sends a payload to a
+random subset of ``fanout`` connected peers, and every node that sees a
+message for the first time forwards it the same way until its hop budget is
+spent. Message ids are remembered in a bounded seen-set so duplicates are
+dropped, and sends to the chosen peers run concurrently with a per-peer
+timeout so one slow peer does not hold up the rest.
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+import struct
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .connection_manager import ConnectionManager
+from .secure_message_v2 import SecureMessageV2
+
+logger = logging.getLogger(__name__)
+
+# magic, message id, hops remaining
+GOSSIP_HEADER = struct.Struct(">4s16sB")
+GOSSIP_MAGIC = b"GSP1"
+
+
+def encode_gossip(message_id: bytes, hops: int, payload: bytes) -> bytes:
+    return GOSSIP_HEADER.pack(GOSSIP_MAGIC, message_id, hops) + payload
+
+
+def decode_gossip(data: bytes):
+    """Return (message_id, hops, payload), or None if data is not gossip."""
+    if len(data) < GOSSIP_HEADER.size or not data.startswith(GOSSIP_MAGIC):
+        return None
+    _, message_id, hops = GOSSIP_HEADER.unpack_from(data)
+    return (message_id, hops, data[GOSSIP_HEADER.size :])
+
+
+class SeenSet:
+    """Bounded set of message ids; the oldest ids are forgotten first."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._ids: "OrderedDict[bytes, None]" = OrderedDict()
+
+    def add(self, message_id: bytes) -> bool:
+        """Record an id; returns False if it was already present."""
+        if message_id in self._ids:
+            return False
+        self._ids[message_id] = None
+        if len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+        return True
+
+    def __contains__(self, message_id: bytes) -> bool:
+        return message_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+@dataclass
+class GossipStats:
+    """Per-node gossip counters."""
+
+    originated: int = 0
+    delivered: int = 0
+    duplicates: int = 0
+    forwarded: int = 0
+    send_failures: int = 0
+    send_timeouts: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class GossipNode:
+    """
+    Fan-out broadcast over a ConnectionManager.
+
+    Args:
+        manager: Connected ConnectionManager; its on_message hook is taken
+            over and non-gossip messages are passed to the previous hook.
+        fanout: Peers each node forwards a new message to.
+        max_hops: Forwarding budget carried in every message.
+        seen_capacity: Message ids remembered for deduplication.
+        send_timeout: Seconds allowed per peer send (queue + flush).
+        on_deliver: Callback(origin_peer_id, message_id, payload) for each
+            new message received from the mesh.
+        rng: Peer sampling source (seed it for reproducible runs).
+    """
+
+    def __init__(
+        self,
+        manager: ConnectionManager,
+        fanout: int = 6,
+        max_hops: int = 16,
+        seen_capacity: int = 65536,
+        send_timeout: float = 2.0,
+        on_deliver: Optional[Callable[[str, bytes, bytes], Any]] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.manager = manager
+        self.fanout = fanout
+        self.max_hops = max_hops
+        self.send_timeout = send_timeout
+        self.on_deliver = on_deliver
+        self.rng = rng or random.Random()
+        self.seen = SeenSet(seen_capacity)
+        self.stats = GossipStats()
+        self._counter = 0
+        self._tasks: set = set()
+        self._passthrough = manager.on_message
+        manager.on_message = self._on_message
+
+    def new_message_id(self) -> bytes:
+        self._counter += 1
+        return hashlib.sha256(
+            self.manager.node_id.encode("utf-8") + b":%d" % self._counter
+        ).digest()[:16]
+
+    async def broadcast(self, payload: bytes, message_id: Optional[bytes] = None) -> bytes:
+        """Originate a message and send it to ``fanout`` peers; returns its id."""
+        message_id = message_id or self.new_message_id()
+        self.seen.add(message_id)
+        self.stats.originated += 1
+        await self._fan_out(message_id, self.max_hops, payload, exclude=())
+        return message_id
+
+    def _choose_peers(self, exclude: Iterable[str]) -> List[str]:
+        candidates = sorted(set(self.manager.peers) - set(exclude))
+        if len(candidates) <= self.fanout:
+            return candidates
+        return self.rng.sample(candidates, self.fanout)
+
+    async def _fan_out(self, message_id: bytes, hops: int, payload: bytes, exclude: Iterable[str]):
+        data = encode_gossip(message_id, hops, payload)
+        targets = self._choose_peers(exclude)
+        if targets:
+            await asyncio.gather(*(self._send(peer_id, data) for peer_id in targets))
+
+    async def _send(self, peer_id: str, data: bytes):
+        try:
+            await asyncio.wait_for(self._send_and_flush(peer_id, data), self.send_timeout)
+        except asyncio.TimeoutError:
+            self.stats.send_timeouts += 1
+            logger.warning(f"Gossip send to {peer_id} timed out")
+        except (ConnectionError, ValueError) as e:
+            self.stats.send_failures += 1
+            logger.warning(f"Gossip send to {peer_id} failed: {e}")
+
+    async def _send_and_flush(self, peer_id: str, data: bytes):
+        await self.manager.send_message(peer_id, data)
+        await self.manager.flush(peer_id)
+
+    def _on_message(self, peer_id: str, msg: SecureMessageV2):
+        decoded = decode_gossip(msg.ciphertext)
+        if decoded is None:
+            if self._passthrough is not None:
+                self._passthrough(peer_id, msg)
+            return
+        message_id, hops, payload = decoded
+        if not self.seen.add(message_id):
+            self.stats.duplicates += 1
+            return
+        self.stats.delivered += 1
+        if self.on_deliver is not None:
+            self.on_deliver(peer_id, message_id, payload)
+        if hops > 1:
+            self.stats.forwarded += 1
+            # Forward off the read loop so a slow peer does not stall reads
+            task = asyncio.create_task(
+                self._fan_out(message_id, hops - 1, payload, exclude=(peer_id,))
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def drain(self):
+        """Wait for in-flight forwards to finish."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks))
@@ -0,0 +1,168 @@
+"""
+In-process gossip propagation harness.
+
+Starts ``nodes`` ConnectionManagers on loopback TCP, wires them into a ring
+plus ``degree`` random extra links per node, attaches a GossipNode to each,
+and measures how long a broadcast takes to reach every node. Timings are
+integer microseconds and ratios are Fractions, so the report carries no floats.
+
+Usage:
+    python -m v13.ATLAS.src.p2p.gossip_simulation --nodes 150 --fanout 6
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from fractions import Fraction
+from typing import Any, Dict, List, Optional
+
+from .connection_manager import ConnectionManager
+from .gossip import GossipNode
+
+
+def _percentile(samples: List[int], pct: int) -> Optional[int]:
+    """Nearest-rank ``pct``-th percentile (0-100), or None without samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, len(ordered) * pct // 100)]
+
+
+def _now_us() -> int:
+    return time.perf_counter_ns() // 1000
+
+
+async def _wait_until(predicate, timeout_ms: int, interval_ms: int = 5) -> bool:
+    deadline = _now_us() + timeout_ms * 1000
+    while not predicate():
+        if _now_us() > deadline:
+            return False
+        await asyncio.sleep(Fraction(interval_ms, 1000))
+    return True
+
+
+async def run_gossip_simulation(
+    nodes: int = 100,
+    degree: int = 3,
+    fanout: int = 6,
+    messages: int = 5,
+    max_hops: int = 16,
+    payload_size: int = 512,
+    seed: int = 0,
+    timeout_ms: int = 30000,
+) -> Dict[str, Any]:
+    """
+    Run the simulation and return coverage and latency figures.
+
+    Latency is measured in microseconds from broadcast() on the origin to
+    first delivery at each other node; coverage is the share of
+    (message, node) pairs reached. Percentiles are None if nothing arrived.
+    """
+    rng = random.Random(seed)
+    managers = [
+        ConnectionManager(f"node_{i:04d}", keypair=None, bootstrap=None, max_reconnect_attempts=0)
+        for i in range(nodes)
+    ]
+    servers = [await m.start_server("127.0.0.1", 0) for m in managers]
+    ports = [s.sockets[0].getsockname()[1] for s in servers]
+
+    links = {tuple(sorted((i, (i + 1) % nodes))) for i in range(nodes)}
+    for i in range(nodes):
+        for j in rng.sample(range(nodes), min(degree, nodes - 1)):
+            if j != i:
+                links.add(tuple(sorted((i, j))))
+    expected_peers = [0] * nodes
+    for i, j in links:
+        expected_peers[i] += 1
+        expected_peers[j] += 1
+
+    try:
+        await asyncio.gather(*(managers[i].connect_to_peer("127.0.0.1", ports[j]) for i, j in links))
+        await _wait_until(
+            lambda: all(len(m.peers) == n for m, n in zip(managers, expected_peers)), timeout_ms
+        )
+
+        arrivals: Dict[bytes, Dict[str, int]] = {}
+
+        def recorder(node_id: str):
+            def on_deliver(peer_id: str, message_id: bytes, payload: bytes):
+                arrivals.setdefault(message_id, {}).setdefault(node_id, _now_us())
+
+            return on_deliver
+
+        gossip = [
+            GossipNode(
+                m,
+                fanout=fanout,
+                max_hops=max_hops,
+                on_deliver=recorder(m.node_id),
+                rng=random.Random(rng.random()),
+            )
+            for m in managers
+        ]
+
+        latencies: List[int] = []
+        completions: List[int] = []
+        reached = 0
+        payload = bytes(rng.getrandbits(8) for _ in range(payload_size))
+        for _ in range(messages):
+            origin = gossip[rng.randrange(nodes)]
+            started = _now_us()
+            message_id = await origin.broadcast(payload)
+            await _wait_until(lambda: len(arrivals.get(message_id, {})) >= nodes - 1, timeout_ms)
+            await asyncio.gather(*(g.drain() for g in gossip))
+            times = [t - started for t in arrivals.get(message_id, {}).values()]
+            reached += len(times)
+            latencies.extend(times)
+            if len(times) >= nodes - 1:
+                completions.append(max(times))
+
+        sends = sum(g.stats.forwarded for g in gossip) * fanout + messages * fanout
+        return {
+            "nodes": nodes,
+            "links": len(links),
+            "fanout": fanout,
+            "messages": messages,
+            "coverage": Fraction(reached, messages * (nodes - 1)),
+            "p50_latency_us": _percentile(latencies, 50),
+            "p99_latency_us": _percentile(latencies, 99),
+            "max_full_coverage_us": max(completions) if completions else None,
+            "duplicates_per_node_message": Fraction(
+                sum(g.stats.duplicates for g in gossip), messages * nodes
+            ),
+            "approx_sends": sends,
+            "send_failures": sum(g.stats.send_failures + g.stats.send_timeouts for g in gossip),
+        }
+    finally:
+        for server in servers:
+            server.close()
+        for m in managers:
+            await m.close()
+        for server in servers:
+            await server.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gossip propagation simulation")
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--degree", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--messages", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    report = asyncio.run(
+        run_gossip_simulation(
+            nodes=args.nodes,
+            degree=args.degree,
+            fanout=args.fanout,
+            messages=args.messages,
+            seed=args.seed,
+        )
+    )
+    print(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,13 @@ import json
 import base64
 import hashlib
 import logging
+import struct
 from typing import Dict, Tuple, Optional
+from v13.libs.BigNum128 import BigNum128
 logger = logging.getLogger(__name__)
+FRAME_VERSION = 2
+_FRAME_FIXED = struct.Struct('>BQ16sB')
+_HASH_SIZE = 32
 
 class SecureMessageV2:
     """
@@ -20,8 +25,47 @@ class SecureMessageV2:
         self.message_hash = hashlib.sha256(ciphertext + nonce + sequence_num.to_bytes(8, 'big')).digest()
 
     def serialize(self) -> bytes:
-        """Serialize properly for wire transmission."""
-        return json.dumps({'ciphertext': base64.b64encode(self.ciphertext).decode('utf-8'), 'nonce': base64.b64encode(self.nonce).decode('utf-8'), 'seq': self.sequence_num, 'ts': self.timestamp, 'hash': base64.b64encode(self.message_hash).decode('utf-8')}).encode('utf-8')
+        """Serialize as JSON (legacy newline-delimited wire format)."""
+        return json.dumps({'ciphertext': base64.b64encode(self.ciphertext).decode('utf-8'), 'nonce': base64.b64encode(self.nonce).decode('utf-8'), 'seq': self.sequence_num, 'ts': self.timestamp.value.value, 'hash': base64.b64encode(self.message_hash).decode('utf-8')}).encode('utf-8')
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> 'SecureMessageV2':
+        """Parse the legacy JSON wire format; raises ValueError if the hash does not match."""
+        fields = json.loads(data)
+        msg = cls(ciphertext=base64.b64decode(fields['ciphertext']), nonce=base64.b64decode(fields['nonce']), sequence_num=fields['seq'], timestamp=QAmount(BigNum128(fields['ts'])))
+        if msg.message_hash != base64.b64decode(fields['hash']):
+            raise ValueError('SecureMessageV2 hash mismatch')
+        return msg
+
+    def to_frame_body(self) -> bytes:
+        """
+        Binary frame body: version (u8), seq (u64), raw timestamp (u128),
+        nonce length (u8), nonce, SHA-256 message hash, ciphertext (rest).
+        """
+        header = _FRAME_FIXED.pack(FRAME_VERSION, self.sequence_num, self.timestamp.value.value.to_bytes(16, 'big'), len(self.nonce))
+        return b''.join((header, self.nonce, self.message_hash, self.ciphertext))
+
+    @classmethod
+    def from_frame_body(cls, body: bytes) -> 'SecureMessageV2':
+        """
+        Parse a binary frame body; raises ValueError if it is truncated, has
+        an unknown version or its hash does not match the contents.
+        """
+        if len(body) < _FRAME_FIXED.size:
+            raise ValueError('Truncated SecureMessageV2 frame')
+        version, seq, ts_raw, nonce_len = _FRAME_FIXED.unpack_from(body)
+        if version != FRAME_VERSION:
+            raise ValueError(f'Unsupported SecureMessageV2 frame version {version}')
+        offset = _FRAME_FIXED.size
+        if len(body) < offset + nonce_len + _HASH_SIZE:
+            raise ValueError('Truncated SecureMessageV2 frame')
+        nonce = body[offset:offset + nonce_len]
+        offset += nonce_len
+        message_hash = body[offset:offset + _HASH_SIZE]
+        msg = cls(ciphertext=body[offset + _HASH_SIZE:], nonce=nonce, sequence_num=seq, timestamp=QAmount(BigNum128(int.from_bytes(ts_raw, 'big'))))
+        if msg.message_hash != message_hash:
+            raise ValueError('SecureMessageV2 hash mismatch')
+        return msg
 
 class MessageSequenceManager:
     """
@@ -0,0 +1,155 @@
+"""
+Session resumption for ATLAS P2P KEM handshakes.
+
+A full Kyber1024 handshake yields a shared secret; both ends derive from it a
+session key, a resumption secret and a ticket id, so no extra message is
+needed to hand out the ticket. A reconnecting client presents the ticket with
+an HMAC proof over a fresh nonce; tickets are single-use (each resumption
+derives the next one) and expire after a bounded lifetime.
+
+Resumption is offered only to servers whose hello advertises
+HANDSHAKE_VERSION 2 or later; older peers get the full handshake and the
+legacy line protocol.
+"""
+
+import hashlib
+import hmac
+from collections import OrderedDict
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Callable, Dict, Optional, Tuple, Union
+
+# 1: server hello + client ciphertext only, then newline-delimited JSON
+# messages. 2: the client may answer the server hello with a resumption ticket
+# instead of a ciphertext, and both ends switch to length-prefixed binary
+# frames after the handshake. A connection runs at the lower of the two
+# versions; a version 2 client advertises its version to version 2 servers.
+HANDSHAKE_VERSION = 2
+FRAMED_TRANSPORT_VERSION = 2
+
+
+def _mac(key: bytes, label: bytes, *parts: bytes) -> bytes:
+    return hmac.new(key, label + b"".join(parts), hashlib.sha256).digest()
+
+
+def derive_session_material(shared_secret: bytes) -> Tuple[bytes, bytes, str]:
+    """
+    Derive (session_key, resumption_secret, ticket_id) from a shared secret.
+    """
+    session_key = _mac(shared_secret, b"qfs-p2p-session")
+    resumption_secret = _mac(shared_secret, b"qfs-p2p-resumption")
+    ticket_id = _mac(shared_secret, b"qfs-p2p-ticket")[:16].hex()
+    return (session_key, resumption_secret, ticket_id)
+
+
+def resumption_proof(resumption_secret: bytes, role: bytes, nonce: bytes, node_id: str) -> bytes:
+    """HMAC proving possession of the resumption secret for one nonce."""
+    return _mac(resumption_secret, b"qfs-p2p-proof-" + role, nonce, node_id.encode("utf-8"))
+
+
+def resumed_shared_secret(resumption_secret: bytes, nonce: bytes) -> bytes:
+    """Fresh shared secret for a resumed session (feeds the next ticket)."""
+    return _mac(resumption_secret, b"qfs-p2p-resumed", nonce)
+
+
+@dataclass
+class ResumptionTicket:
+    """Resumable session state held by one side of a past handshake."""
+
+    ticket_id: str
+    peer_id: str
+    resumption_secret: bytes
+    expires_at: int  # clock milliseconds
+
+    def is_valid(self, now: int) -> bool:
+        return now < self.expires_at
+
+
+class TicketStore:
+    """
+    Server-side tickets by id, bounded in count; the oldest tickets are
+    evicted first and expired tickets are dropped on lookup.
+    """
+
+    def __init__(self, max_tickets: int = 4096):
+        self.max_tickets = max_tickets
+        self._tickets: "OrderedDict[str, ResumptionTicket]" = OrderedDict()
+
+    def put(self, ticket: ResumptionTicket) -> None:
+        self._tickets[ticket.ticket_id] = ticket
+        self._tickets.move_to_end(ticket.ticket_id)
+        while len(self._tickets) > self.max_tickets:
+            self._tickets.popitem(last=False)
+
+    def take(
+        self, ticket_id: str, now: int, verify: Callable[[ResumptionTicket], bool]
+    ) -> Optional[ResumptionTicket]:
+        """
+        Remove and return a ticket if it exists, has not expired and passes
+        ``verify`` (the proof check). A ticket failing ``verify`` is kept, so
+        a forged proof cannot burn a legitimate client's ticket.
+        """
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            return None
+        if not ticket.is_valid(now):
+            del self._tickets[ticket_id]
+            return None
+        if not verify(ticket):
+            return None
+        del self._tickets[ticket_id]
+        return ticket
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+
+@dataclass
+class HandshakeMetrics:
+    """
+    Handshake latency and resumption hit-rate counters.
+
+    Latencies are kept as running totals in nanoseconds, so memory stays
+    constant on long-lived nodes; averages are reported in whole microseconds
+    and the hit rate as an exact Fraction.
+    """
+
+    full_handshakes: int = 0
+    resumed_handshakes: int = 0
+    resumption_attempts: int = 0
+    failed_handshakes: int = 0
+    reconnects: int = 0
+    full_latency_ns: int = 0
+    resumed_latency_ns: int = 0
+
+    def record(self, resumed: bool, latency_ns: int) -> None:
+        if resumed:
+            self.resumed_handshakes += 1
+            self.resumed_latency_ns += latency_ns
+        else:
+            self.full_handshakes += 1
+            self.full_latency_ns += latency_ns
+
+    @property
+    def resumption_hit_rate(self) -> Fraction:
+        """Share of resumption attempts that skipped the full KEM handshake."""
+        if not self.resumption_attempts:
+            return Fraction(0)
+        return Fraction(self.resumed_handshakes, self.resumption_attempts)
+
+    def to_dict(self) -> Dict[str, Union[int, Fraction]]:
+        def _avg_us(total_ns: int, count: int) -> int:
+            return total_ns // (count * 1000) if count else 0
+
+        return {
+            "full_handshakes": self.full_handshakes,
+            "resumed_handshakes": self.resumed_handshakes,
+            "resumption_attempts": self.resumption_attempts,
+            "resumption_hit_rate": self.resumption_hit_rate,
+            "failed_handshakes": self.failed_handshakes,
+            "reconnects": self.reconnects,
+            "avg_full_handshake_us": _avg_us(self.full_latency_ns, self.full_handshakes),
+            "avg_resumed_handshake_us": _avg_us(
+                self.resumed_latency_ns, self.resumed_handshakes
+            ),
+        }
@@ -4,13 +4,17 @@ RealLedger - Deterministic ledger adapter for QFS.
 Provides a clean interface between QFS engines and underlying
 ledger implementations (MockLedger, L1/L2, etc.).
 """
+import asyncio
 import json
 import hashlib
-from typing import Dict, Any, Optional, List, Union
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Union, Callable, Awaitable, Tuple
 from dataclasses import dataclass, asdict
 import logging
 from .qfs_types import OperationBundle
 logger = logging.getLogger(__name__)
+COMMITTED_STATUSES = frozenset({'confirmed', 'committed', 'finalized'})
+_MISS = object()
 
 @dataclass
 class LedgerReceipt:
@@ -42,31 +46,132 @@ class LedgerSnapshot:
 class RealLedger:
     """
     Deterministic ledger adapter.
-    
+
     Wraps underlying ledger implementations (MockLedger, L1/L2, etc.)
     and provides a consistent interface for QFS engines.
+
+    Reads go through a cache:
+    - committed bundles and their final status are immutable and pinned forever;
+    - snapshots are cached by state_root, receipts and other reads in an LRU
+      bounded by ``max_cache_bytes`` / ``max_cache_entries``;
+    - concurrent requests for the same key share one adapter call (single-flight).
+
+    Cached values are shared between callers and must be treated as read-only.
     """
 
-    def __init__(self, adapter):
+    def __init__(self, adapter, max_cache_bytes: int=16 * 1024 * 1024, max_cache_entries: int=10000):
         """
         Initialize RealLedger.
-        
+
         Args:
             adapter: Underlying ledger implementation (MockLedger, L1/L2 client)
+            max_cache_bytes: Byte budget of the LRU tier (serialized size of entries)
+            max_cache_entries: Entry budget of the LRU tier
         """
         self._adapter = adapter
-        self._cache: Dict[str, Any] = {}
+        self.max_cache_bytes = max_cache_bytes
+        self.max_cache_entries = max_cache_entries
+        self._cache: 'OrderedDict[str, Tuple[Any, int]]' = OrderedDict()
+        self._cache_bytes = 0
+        self._pinned: Dict[str, Tuple[Any, int]] = {}
+        self._pinned_bytes = 0
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0}
+
+    @staticmethod
+    def _entry_size(value: Any) -> int:
+        """Serialized size of a cache entry, computed once on insert."""
+        if hasattr(value, 'to_dict'):
+            value = value.to_dict()
+        elif hasattr(value, '__dataclass_fields__'):
+            value = asdict(value)
+        return len(json.dumps(value, sort_keys=True, default=str))
+
+    def _cache_get(self, key: str) -> Any:
+        entry = self._pinned.get(key)
+        if entry is None:
+            entry = self._cache.get(key)
+            if entry is None:
+                return _MISS
+            self._cache.move_to_end(key)
+        self._stats['hits'] += 1
+        return entry[0]
+
+    def _cache_put(self, key: str, value: Any, pinned: bool=False):
+        """Insert a value, keeping byte accounting incremental."""
+        size = self._entry_size(value)
+        self._cache_drop(key)
+        if pinned:
+            self._pinned[key] = (value, size)
+            self._pinned_bytes += size
+            return
+        if size > self.max_cache_bytes or self.max_cache_entries <= 0:
+            return
+        self._cache[key] = (value, size)
+        self._cache_bytes += size
+        while self._cache_bytes > self.max_cache_bytes or len(self._cache) > self.max_cache_entries:
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted_size
+            self._stats['evictions'] += 1
+
+    def _cache_drop(self, key: str):
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._cache_bytes -= entry[1]
+        entry = self._pinned.pop(key, None)
+        if entry is not None:
+            self._pinned_bytes -= entry[1]
+
+    async def _read_through(self, key: str, fetch: Callable[[], Awaitable[Any]], store: Callable[[Any], None]) -> Any:
+        """
+        Return a cached value or fetch it once for all concurrent callers.
+
+        ``store`` decides whether (and how) the fetched value is cached; a
+        leader that fails or is cancelled passes its error to the waiters, or
+        lets them retry in the cancellation case.
+        """
+        while True:
+            cached = self._cache_get(key)
+            if cached is not _MISS:
+                return cached
+            flight = self._in_flight.get(key)
+            if flight is None:
+                break
+            self._stats['coalesced'] += 1
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+        self._stats['misses'] += 1
+        flight = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = flight
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            flight.exception()
+            raise
+        finally:
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+        store(value)
+        flight.set_result(value)
+        return value
 
     async def submit_bundle(self, bundle: OperationBundle) -> LedgerReceipt:
         """
         Submit opaque bundle to underlying ledger.
-        
+
         - Wait for deterministic confirmation
         - Return structured receipt
-        
+
         Args:
             bundle: Bundle to submit
-            
+
         Returns:
             LedgerReceipt: Structured receipt
         """
@@ -74,37 +179,71 @@ class RealLedger:
             if hasattr(self._adapter, 'bundles'):
                 self._adapter.bundles[bundle.bundle_hash] = bundle
             receipt = await self._adapter.submit_bundle(bundle)
-            self._cache[f'receipt:{bundle.bundle_hash}'] = receipt
+            self._in_flight.pop('snapshot:head', None)
+            self._cache_drop(f'status:{bundle.bundle_hash}')
+            self._cache_put(f'receipt:{bundle.bundle_hash}', receipt, pinned=getattr(receipt, 'status', None) in COMMITTED_STATUSES)
             return receipt
         except Exception as e:
             logger.error(f'Failed to submit bundle: {e}')
             raise RuntimeError(f'Bundle submission failed: {e}')
 
+    async def _fetch_snapshot(self, state_root: Optional[str]) -> Any:
+        snapshot = await self._adapter.get_snapshot(state_root)
+        root = getattr(snapshot, 'state_root', None)
+        if root is not None:
+            self._cache_put(f'snapshot:{root}', snapshot)
+        return snapshot
+
     async def get_snapshot(self, state_root: Optional[str]=None) -> Dict[str, Any]:
         """
         Return deterministic state snapshot.
-        
+
+        Snapshots are cached by state_root; the head snapshot (no root given)
+        is always read from the adapter, coalesced across concurrent callers
+        until the next submit.
+
         Args:
             state_root: Optional state root to query
-            
+
         Returns:
             Dict[str, Any]: Deterministic state
         """
-        snapshot = await self._adapter.get_snapshot(state_root)
+        key = 'snapshot:head' if state_root is None else f'snapshot:{state_root}'
+        snapshot = await self._read_through(key, lambda: self._fetch_snapshot(state_root), lambda value: None)
         return snapshot.state if hasattr(snapshot, 'state') else snapshot
 
+    def _is_committed(self, bundle_hash: str) -> bool:
+        for key in (f'status:{bundle_hash}', f'receipt:{bundle_hash}'):
+            entry = self._pinned.get(key)
+            if entry is not None:
+                return True
+        return False
+
     async def get_bundle(self, bundle_hash: str) -> Optional[Dict[str, Any]]:
-        """Get bundle by hash"""
+        """Get bundle by hash (pinned once the bundle is known to be committed)"""
+        key = f'bundle:{bundle_hash}'
+
+        def store(value):
+            if value is not None:
+                self._cache_put(key, value, pinned=self._is_committed(bundle_hash))
         try:
-            return await self._adapter.get_bundle(bundle_hash)
+            return await self._read_through(key, lambda: self._adapter.get_bundle(bundle_hash), store)
         except Exception as e:
             logger.error(f'Failed to get bundle {bundle_hash}: {e}')
             return None
 
     async def get_bundle_status(self, bundle_hash: str) -> Dict[str, Any]:
-        """Get bundle status"""
+        """Get bundle status (final statuses are pinned)"""
+        key = f'status:{bundle_hash}'
+
+        def store(value):
+            if isinstance(value, dict) and value.get('status') in COMMITTED_STATUSES:
+                self._cache_put(key, value, pinned=True)
+                bundle = self._cache.get(f'bundle:{bundle_hash}')
+                if bundle is not None:
+                    self._cache_put(f'bundle:{bundle_hash}', bundle[0], pinned=True)
         try:
-            return await self._adapter.get_bundle_status(bundle_hash)
+            return await self._read_through(key, lambda: self._adapter.get_bundle_status(bundle_hash), store)
         except Exception as e:
             logger.error(f'Failed to get bundle status {bundle_hash}: {e}')
             return {'status': 'error', 'error': str(e)}
@@ -120,7 +259,10 @@ class RealLedger:
     def clear_cache(self):
         """Clear internal cache"""
         self._cache.clear()
+        self._pinned.clear()
+        self._cache_bytes = 0
+        self._pinned_bytes = 0
 
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
-        return {'cached_items': len(self._cache), 'cache_size_bytes': sum((len(str(v)) for v in self._cache.values()))}
+        return {'cached_items': len(self._cache) + len(self._pinned), 'cache_size_bytes': self._cache_bytes + self._pinned_bytes, 'pinned_items': len(self._pinned), 'pinned_bytes': self._pinned_bytes, **self._stats}
@@ -7,6 +7,7 @@ Core engine for managing secure chat threads and messages with deterministic beh
 import hashlib
 import hmac
 import json
+from bisect import bisect_left, bisect_right
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict, field
 import logging
@@ -53,7 +54,11 @@ class SecureChatEngine:
         self.storage = storage
         self.atr_engine = atr_engine
         self.threads: Dict[str, Thread] = {}
+        # Per-thread messages, kept sorted by timestamp (ties in arrival order)
         self.messages: Dict[str, List[Message]] = {}
+        self._message_timestamps: Dict[str, List[str]] = {}
+        # participant -> ids of their non-deleted threads, in creation order
+        self._participant_threads: Dict[str, Dict[str, None]] = {}
         # Zero-Sim: Default clock returns genesis string
         self._clock = clock or (lambda: "2024-01-01T00:00:00+00:00")
 
@@ -109,6 +114,9 @@ class SecureChatEngine:
         )
         self.threads[thread_id] = thread
         self.messages[thread_id] = []
+        self._message_timestamps[thread_id] = []
+        for participant in participants:
+            self._participant_threads.setdefault(participant, {})[thread_id] = None
         event = {
             "event_type": "THREAD_CREATED",
             "thread_id": thread_id,
@@ -159,7 +167,10 @@ class SecureChatEngine:
             message_type=message_type,
             metadata={"content_type": content_type, **(metadata or {})},
         )
-        self.messages[thread_id].append(message)
+        timestamps = self._message_timestamps[thread_id]
+        position = bisect_right(timestamps, timestamp_str)
+        timestamps.insert(position, timestamp_str)
+        self.messages[thread_id].insert(position, message)
         if hasattr(self.atr_engine, "charge_fee"):
             await self.atr_engine.charge_fee(
                 account_id=sender_id,
@@ -191,11 +202,8 @@ class SecureChatEngine:
         """List all threads for a user"""
         if not user_id:
             return []
-        return [
-            thread
-            for thread in self.threads.values()
-            if user_id in thread.participants and thread.status != ThreadStatus.DELETED
-        ]
+        thread_ids = self._participant_threads.get(user_id, {})
+        return [self.threads[thread_id] for thread_id in thread_ids]
 
     def get_messages(
         self,
@@ -213,9 +221,10 @@ class SecureChatEngine:
         if thread.status == ThreadStatus.DELETED:
             return []
         messages = self.messages.get(thread_id, [])
-        if before:
-            messages = [m for m in messages if m.timestamp < before]
-        return messages[-limit:]
+        if not before:
+            return messages[-limit:]
+        end = bisect_left(self._message_timestamps.get(thread_id, []), before)
+        return messages[max(0, end - limit) if limit > 0 else 0 : end]
 
     async def update_thread_status(
         self,
@@ -238,6 +247,9 @@ class SecureChatEngine:
             return (thread, [])
         old_status = thread.status
         thread.status = status
+        if status == ThreadStatus.DELETED:
+            for participant in thread.participants:
+                self._participant_threads.get(participant, {}).pop(thread_id, None)
         if metadata:
             thread.metadata.update(metadata)
         event = {
@@ -0,0 +1,99 @@
+"""
+Per-content coherence score cache for ATLAS feed ranking
+"""
+
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from v13.libs.BigNum128 import BigNum128
+except ImportError:
+    from ..libs.BigNum128 import BigNum128
+
+
+def engagement_digest(candidate: Dict[str, Any]) -> str:
+    """
+    Digest of everything a candidate's coherence score and humor signal
+    depend on: engagement signals, content CID and content text.
+    """
+    signals = {
+        name: value.value if isinstance(value, BigNum128) else value
+        for name, value in candidate.get("engagement_signals", {}).items()
+    }
+    material = json.dumps(
+        {
+            "signals": signals,
+            "content_cid": candidate.get("content_cid"),
+            "content": candidate.get("content", ""),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class FeedScoreCache:
+    """
+    LRU cache of (coherence_score, humor_data) per content id.
+
+    An entry is only returned when the engagement digest and ranking policy
+    version match those it was stored with, so stale engagement never leaks
+    into a ranking; ``invalidate`` drops a content id outright (used when an
+    interaction changes its engagement).
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, str, BigNum128, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, content_id: str, digest: str, policy_version: str
+    ) -> Optional[Tuple[BigNum128, Optional[Dict[str, Any]]]]:
+        entry = self._entries.get(content_id)
+        if entry is None or entry[0] != digest or entry[1] != policy_version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(content_id)
+        self.hits += 1
+        return (entry[2].copy(), copy.deepcopy(entry[3]))
+
+    def contains(self, content_id: str, digest: str, policy_version: str) -> bool:
+        """Whether ``get`` would hit, without touching recency or hit counts."""
+        entry = self._entries.get(content_id)
+        return entry is not None and entry[0] == digest and entry[1] == policy_version
+
+    def put(
+        self,
+        content_id: str,
+        digest: str,
+        policy_version: str,
+        coherence_score: BigNum128,
+        humor_data: Optional[Dict[str, Any]],
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[content_id] = (
+            digest,
+            policy_version,
+            coherence_score.copy(),
+            copy.deepcopy(humor_data),
+        )
+        self._entries.move_to_end(content_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, content_id: str) -> bool:
+        """Drop a content id; returns True if it was cached."""
+        return self._entries.pop(content_id, None) is not None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -8,9 +8,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 from fractions import Fraction
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import hashlib
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from .models import (
     FeedRequest,
     FeedResponse,
@@ -22,6 +24,9 @@ from .models import (
     ErrorResponse,
     AGIObservation,
 )
+from .feed_score_cache import FeedScoreCache, engagement_digest
+
+FEED_RANKING_POLICY_VERSION = "QFS_V13_FEED_RANKING_POLICY_1.0"
 
 try:
     from v13.libs.CertifiedMath import CertifiedMath, BigNum128
@@ -78,6 +83,62 @@ except ImportError:
         HumorSignalAddon = None
 
 
+def _update_candidate_omega(
+    coherence_engine: CoherenceEngine,
+    features: List[BigNum128],
+    i_vector: List[BigNum128],
+    content_id: str,
+    deterministic_timestamp: int,
+) -> List[BigNum128]:
+    """CoherenceEngine omega update for one feed candidate."""
+    return coherence_engine.update_omega(
+        features=features,
+        I_vector=i_vector,
+        L=f"L_{content_id}",
+        log_list=[],
+        pqc_cid=f"feed_rank_{content_id}",
+        deterministic_timestamp=deterministic_timestamp,
+    )
+
+
+def _omega_norm(cm: CertifiedMath, omega_vector: List[BigNum128]) -> BigNum128:
+    """Norm of an omega vector, computed (and logged) with ``cm``."""
+    if not omega_vector:
+        return BigNum128(0)
+    sum_squares = BigNum128(0)
+    for val in sorted(omega_vector):
+        val_squared = cm.mul(val, val, [])
+        sum_squares = cm.add(sum_squares, val_squared, [])
+    return cm.sqrt(sum_squares, 50, [])
+
+
+# CoherenceEngine of a feed scoring worker process (see set_feed_workers)
+_feed_worker_engine: Optional[CoherenceEngine] = None
+
+
+def _init_feed_worker() -> None:
+    global _feed_worker_engine
+    _feed_worker_engine = CoherenceEngine(CertifiedMath())
+
+
+def _pooled_coherence_score(
+    features: List[BigNum128],
+    i_vector: List[BigNum128],
+    content_id: str,
+    deterministic_timestamp: int,
+) -> Tuple[BigNum128, List[Dict[str, Any]]]:
+    """
+    Worker-process entry point: a candidate's coherence score and the
+    CertifiedMath audit entries produced computing it.
+    """
+    cm = _feed_worker_engine.cm
+    cm.log_list.clear()
+    updated_omega = _update_candidate_omega(
+        _feed_worker_engine, features, i_vector, content_id, deterministic_timestamp
+    )
+    return (_omega_norm(cm, updated_omega), list(cm.log_list))
+
+
 class AtlasAPIGateway:
     """
     Main API gateway for ATLAS x QFS integration.
@@ -108,6 +169,26 @@ class AtlasAPIGateway:
         self.user_token_bundles = {}
         self.token_state_service = None
         self.ledger_economics_service = None
+        self.feed_score_cache = FeedScoreCache()
+        # Cache-missing feed candidates are scored on a process pool when
+        # feed_workers > 1
+        self.feed_workers = 1
+        self._feed_executor: Optional[ProcessPoolExecutor] = None
+
+    def set_feed_workers(self, workers: int) -> None:
+        """
+        Set the number of worker processes used to score feed candidates.
+
+        Omega updates and coherence scores of candidates missing from
+        feed_score_cache run on the pool; the audit entries they produce are
+        merged into the gateway's log in candidate order, so rankings and
+        audit trail match sequential scoring. Humor signals, AEGIS and
+        policy hints stay in the calling process. 1 scores sequentially.
+        """
+        if self._feed_executor is not None:
+            self._feed_executor.shutdown()
+            self._feed_executor = None
+        self.feed_workers = max(1, workers)
 
     def set_token_state_service(self, service):
         """
@@ -557,73 +638,27 @@ class AtlasAPIGateway:
                 BigNum128.from_int(2),
                 BigNum128.from_int(3),
             ]
-            ranked_posts = []
-            for candidate in sorted(content_candidates):
-                coherence_input = self._build_coherence_input(candidate)
-                humor_data = None
-                if "content" in candidate:
-                    context = {
-                        "views": int(
-                            candidate.get("engagement_signals", {}).get(
-                                "likes", BigNum128.from_int(0)
-                            )
-                        ),
-                        "laughs": int(
-                            candidate.get("engagement_signals", {}).get(
-                                "comments", BigNum128.from_int(0)
-                            )
-                        ),
-                        "saves": int(
-                            candidate.get("engagement_signals", {}).get(
-                                "shares", BigNum128.from_int(0)
-                            )
-                        ),
-                        "replays": 0,
-                        "author_reputation": 0,
-                    }
-                    humor_data = self._process_humor_signals(
-                        candidate["content"], context
-                    )
-                features = self._build_feature_vector(coherence_input)
-                updated_omega = self.coherence_engine.update_omega(
-                    features=features,
-                    I_vector=i_vector,
-                    L=f"L_{candidate['content_id']}",
-                    log_list=[],
-                    pqc_cid=f"feed_rank_{candidate['content_id']}",
-                    deterministic_timestamp=deterministic_timestamp,
-                )
-                coherence_score = self._calculate_coherence_score(updated_omega)
-                aegis_observation = self.aegis_guard.observe_event(
-                    event_type="feed_ranking",
-                    inputs=coherence_input,
-                    token_bundle=user_token_bundle,
-                    deterministic_timestamp=deterministic_timestamp,
+            ordered_candidates = sorted(
+                content_candidates, key=lambda c: c["content_id"]
+            )
+
+            pooled_scores = (
+                self._pooled_coherence_scores(
+                    ordered_candidates, i_vector, deterministic_timestamp
                 )
-                aegis_advisory = {
-                    "block_suggested": aegis_observation.block_suggested,
-                    "severity": aegis_observation.severity,
-                }
-                if humor_data:
-                    aegis_advisory["humor_signal"] = humor_data
-                policy_hints = self.policy_engine.generate_policy_hints(aegis_advisory)
-                policy_hints_dict = {
-                    "visibility_level": policy_hints.visibility_level.value,
-                    "warning_banner": policy_hints.warning_banner.value,
-                    "warning_message": policy_hints.warning_message,
-                    "requires_click_through": policy_hints.requires_click_through,
-                    "client_tags": policy_hints.client_tags,
-                }
-                feed_post = FeedPost(
-                    post_id=candidate["content_id"],
-                    coherence_score=coherence_score,
-                    policy_version="QFS_V13_FEED_RANKING_POLICY_1.0",
-                    why_this_ranking=f"Ranked by CoherenceEngine with features: {len(features)} from content {candidate['content_cid']}",
-                    timestamp=deterministic_timestamp,
-                    aegis_advisory=aegis_advisory,
-                    policy_hints=policy_hints_dict,
+                if self.feed_workers > 1
+                else {}
+            )
+            ranked_posts = [
+                self._score_feed_candidate(
+                    candidate,
+                    i_vector,
+                    user_token_bundle,
+                    deterministic_timestamp,
+                    pooled_scores.get(candidate["content_id"]),
                 )
-                ranked_posts.append(feed_post)
+                for candidate in ordered_candidates
+            ]
             ranked_posts.sort(key=lambda x: x.coherence_score, reverse=True)
             if request.limit and request.limit > 0:
                 ranked_posts = ranked_posts[: request.limit]
@@ -631,7 +666,7 @@ class AtlasAPIGateway:
                 posts=ranked_posts,
                 next_cursor=None,
                 policy_metadata={
-                    "version": "QFS_V13_FEED_RANKING_POLICY_1.0",
+                    "version": FEED_RANKING_POLICY_VERSION,
                     "mode": request.mode,
                     "applied_at": deterministic_timestamp,
                     "engine": "CoherenceEngine",
@@ -690,6 +725,8 @@ class AtlasAPIGateway:
                 }
                 humor_data = self._process_humor_signals(request.content, context)
             event_id = self._generate_event_id(interaction_event)
+            # Engagement on the target changes; its cached feed score is stale
+            self.feed_score_cache.invalidate(request.target_id)
             user_token_bundle = self._get_user_token_bundle(request.user_id)
             hsmf_metrics = self._build_hsmf_metrics_from_interaction(
                 interaction_type, request, user_token_bundle
@@ -904,6 +941,12 @@ class AtlasAPIGateway:
                 category=category_enum, limit=limit, cursor=cursor
             )
             return result
+        except ValueError as e:
+            return {
+                "error_code": "INVALID_CURSOR",
+                "message": "Invalid pagination cursor",
+                "details": str(e),
+            }
         except Exception as e:
             return {
                 "error_code": "INTERNAL_ERROR",
@@ -991,14 +1034,7 @@ class AtlasAPIGateway:
         Returns:
             BigNum128: Coherence score
         """
-        if not omega_vector:
-            return BigNum128(0)
-        sum_squares = BigNum128(0)
-        for val in sorted(omega_vector):
-            val_squared = self.cm.mul(val, val, [])
-            sum_squares = self.cm.add(sum_squares, val_squared, [])
-        coherence_score = self.cm.sqrt(sum_squares, 50, [])
-        return coherence_score
+        return _omega_norm(self.cm, omega_vector)
 
     def _generate_event_id(self, event_data: Dict[str, Any]) -> str:
         """
@@ -1085,6 +1121,11 @@ class AtlasAPIGateway:
         """
         Set the storage clients for content retrieval.
 
+        Clients may provide batch methods, used in preference to per-item
+        calls: ``storage_client.get_content_metadata_batch(content_ids)``
+        returning {content_id: metadata} and ``ipfs_client.get_contents(cids)``
+        returning {cid: content}.
+
         Args:
             storage_client: Storage client for database operations
             ipfs_client: IPFS client for content retrieval
@@ -1145,6 +1186,159 @@ class AtlasAPIGateway:
             }
             return None
 
+    def _pooled_coherence_scores(
+        self,
+        candidates: List[Dict[str, Any]],
+        i_vector: List[BigNum128],
+        deterministic_timestamp: int,
+    ) -> Dict[str, Tuple[BigNum128, List[Dict[str, Any]]]]:
+        """
+        Coherence scores (with their audit entries) of the candidates missing
+        from feed_score_cache, computed on the feed worker pool.
+
+        Returns an empty dict, leaving scoring to the calling process, when
+        fewer than two candidates miss or no process pool can be started.
+        """
+        jobs = [
+            candidate
+            for candidate in candidates
+            if not self.feed_score_cache.contains(
+                candidate["content_id"],
+                engagement_digest(candidate),
+                FEED_RANKING_POLICY_VERSION,
+            )
+        ]
+        if len(jobs) < 2:
+            return {}
+        content_ids = [candidate["content_id"] for candidate in jobs]
+        features = [
+            self._build_feature_vector(self._build_coherence_input(candidate))
+            for candidate in jobs
+        ]
+        chunksize = max(1, len(jobs) // (self.feed_workers * 4))
+        try:
+            scores = list(
+                self._get_feed_executor().map(
+                    _pooled_coherence_score,
+                    features,
+                    repeat(i_vector),
+                    content_ids,
+                    repeat(deterministic_timestamp),
+                    chunksize=chunksize,
+                )
+            )
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Feed worker pool unavailable ({e}); scoring serially")
+            self.set_feed_workers(1)
+            return {}
+        return dict(zip(content_ids, scores))
+
+    def _get_feed_executor(self) -> ProcessPoolExecutor:
+        if self._feed_executor is None:
+            self._feed_executor = ProcessPoolExecutor(
+                max_workers=self.feed_workers, initializer=_init_feed_worker
+            )
+        return self._feed_executor
+
+    def _score_feed_candidate(
+        self,
+        candidate: Dict[str, Any],
+        i_vector: List[BigNum128],
+        user_token_bundle: TokenStateBundle,
+        deterministic_timestamp: int,
+        pooled_score: Optional[Tuple[BigNum128, List[Dict[str, Any]]]] = None,
+    ) -> FeedPost:
+        """
+        Score one feed candidate: humor signals, CoherenceEngine omega update,
+        AEGIS observation and policy hints.
+
+        Humor signals and the coherence score come from feed_score_cache
+        while the candidate's engagement digest is unchanged, skipping the
+        CertifiedMath work (and its audit entries). ``pooled_score`` is a
+        coherence score already computed on the feed worker pool; its audit
+        entries are appended to the gateway's log here, in candidate order.
+        """
+        coherence_input = self._build_coherence_input(candidate)
+        features = self._build_feature_vector(coherence_input)
+        digest = engagement_digest(candidate)
+        cached = self.feed_score_cache.get(
+            candidate["content_id"], digest, FEED_RANKING_POLICY_VERSION
+        )
+        if cached is not None:
+            coherence_score, humor_data = cached
+        else:
+            humor_data = None
+            if "content" in candidate:
+                signals = candidate.get("engagement_signals", {})
+                context = {
+                    "views": self._signal_count(signals.get("likes")),
+                    "laughs": self._signal_count(signals.get("comments")),
+                    "saves": self._signal_count(signals.get("shares")),
+                    "replays": 0,
+                    "author_reputation": 0,
+                }
+                humor_data = self._process_humor_signals(candidate["content"], context)
+            if pooled_score is None:
+                updated_omega = _update_candidate_omega(
+                    self.coherence_engine,
+                    features,
+                    i_vector,
+                    candidate["content_id"],
+                    deterministic_timestamp,
+                )
+                coherence_score = self._calculate_coherence_score(updated_omega)
+            else:
+                coherence_score, log_entries = pooled_score
+                for entry in log_entries:
+                    # log_index is the entry's position in the log it lands in
+                    entry["log_index"] = len(self.cm.log_list)
+                    self.cm.log_list.append(entry)
+            self.feed_score_cache.put(
+                candidate["content_id"],
+                digest,
+                FEED_RANKING_POLICY_VERSION,
+                coherence_score,
+                humor_data,
+            )
+        aegis_observation = self.aegis_guard.observe_event(
+            event_type="feed_ranking",
+            inputs=coherence_input,
+            token_bundle=user_token_bundle,
+            deterministic_timestamp=deterministic_timestamp,
+        )
+        aegis_advisory = {
+            "block_suggested": aegis_observation.block_suggested,
+            "severity": aegis_observation.severity,
+        }
+        if humor_data:
+            aegis_advisory["humor_signal"] = humor_data
+        policy_hints = self.policy_engine.generate_policy_hints(aegis_advisory)
+        policy_hints_dict = {
+            "visibility_level": policy_hints.visibility_level.value,
+            "warning_banner": policy_hints.warning_banner.value,
+            "warning_message": policy_hints.warning_message,
+            "requires_click_through": policy_hints.requires_click_through,
+            "client_tags": policy_hints.client_tags,
+        }
+        return FeedPost(
+            post_id=candidate["content_id"],
+            coherence_score=coherence_score,
+            policy_version=FEED_RANKING_POLICY_VERSION,
+            why_this_ranking=f"Ranked by CoherenceEngine with features: {len(features)} from content {candidate['content_cid']}",
+            timestamp=deterministic_timestamp,
+            aegis_advisory=aegis_advisory,
+            policy_hints=policy_hints_dict,
+        )
+
+    @staticmethod
+    def _signal_count(value: Any) -> int:
+        """Whole-unit count from an engagement signal (BigNum128 or int)."""
+        if value is None:
+            return 0
+        if isinstance(value, BigNum128):
+            return value.value // BigNum128.SCALE
+        return int(value)
+
     def _fetch_content_candidates(
         self, user_id: str, limit: int = 20
     ) -> List[Dict[str, Any]]:
@@ -1160,44 +1354,49 @@ class AtlasAPIGateway:
         """
         if self.storage_client is not None and self.ipfs_client is not None:
             try:
-                content_ids = self.storage_client.query_feed_candidates(user_id, limit)
+                content_ids = sorted(
+                    self.storage_client.query_feed_candidates(user_id, limit)
+                )
+                metadata_by_id = self._fetch_metadata_batch(content_ids)
+                content_cids = [
+                    metadata_by_id[content_id].get("content_cid")
+                    for content_id in content_ids
+                    if content_id in metadata_by_id
+                ]
+                contents_by_cid = self._fetch_contents_batch(
+                    [cid for cid in content_cids if cid]
+                )
                 candidates = []
-                for content_id in sorted(content_ids):
-                    try:
-                        metadata = self.storage_client.get_content_metadata(content_id)
-                        content_cid = metadata.get("content_cid")
-                        if content_cid:
-                            content_text = self.ipfs_client.get_content(content_cid)
-                            candidate = {
-                                "content_id": content_id,
-                                "author_did": metadata.get(
-                                    "author_did", f"did:user:{user_id}"
-                                ),
-                                "community_id": metadata.get("community_id", "default"),
-                                "tags": metadata.get("tags", []),
-                                "engagement_signals": metadata.get(
-                                    "engagement_signals",
-                                    {
-                                        "likes": BigNum128.from_int(0),
-                                        "comments": BigNum128.from_int(0),
-                                        "shares": BigNum128.from_int(0),
-                                    },
-                                ),
-                                "content_cid": content_cid,
-                                "created_at": metadata.get(
-                                    "created_at", self._get_deterministic_timestamp()
-                                ),
-                                "content_type": metadata.get("content_type", "post"),
-                                "content": content_text or "",
-                            }
-                            candidates.append(candidate)
-                    except Exception as e:
-                        log_entry = {
-                            "level": "WARNING",
-                            "message": f"Failed to fetch content {content_id}: {e}",
-                            "timestamp": self._get_deterministic_timestamp(),
-                        }
+                for content_id in content_ids:
+                    metadata = metadata_by_id.get(content_id)
+                    if metadata is None:
                         continue
+                    content_cid = metadata.get("content_cid")
+                    if content_cid and content_cid in contents_by_cid:
+                        content_text = contents_by_cid[content_cid]
+                        candidate = {
+                            "content_id": content_id,
+                            "author_did": metadata.get(
+                                "author_did", f"did:user:{user_id}"
+                            ),
+                            "community_id": metadata.get("community_id", "default"),
+                            "tags": metadata.get("tags", []),
+                            "engagement_signals": metadata.get(
+                                "engagement_signals",
+                                {
+                                    "likes": BigNum128.from_int(0),
+                                    "comments": BigNum128.from_int(0),
+                                    "shares": BigNum128.from_int(0),
+                                },
+                            ),
+                            "content_cid": content_cid,
+                            "created_at": metadata.get(
+                                "created_at", self._get_deterministic_timestamp()
+                            ),
+                            "content_type": metadata.get("content_type", "post"),
+                            "content": content_text or "",
+                        }
+                        candidates.append(candidate)
                 return candidates
             except Exception as e:
                 log_entry = {
@@ -1232,6 +1431,49 @@ class AtlasAPIGateway:
             candidates.append(candidate)
         return candidates
 
+    def _fetch_metadata_batch(
+        self, content_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch metadata for many content ids in one round trip.
+
+        Uses ``storage_client.get_content_metadata_batch(content_ids)`` when
+        the client provides it; otherwise falls back to one
+        ``get_content_metadata`` call per id. Ids that fail or are missing
+        are left out of the result.
+        """
+        batch = getattr(self.storage_client, "get_content_metadata_batch", None)
+        if batch is not None:
+            return {k: v for k, v in batch(content_ids).items() if v}
+        metadata_by_id = {}
+        for content_id in content_ids:
+            try:
+                metadata = self.storage_client.get_content_metadata(content_id)
+            except Exception as e:
+                logger.warning(f"Failed to fetch content {content_id}: {e}")
+                continue
+            if metadata:
+                metadata_by_id[content_id] = metadata
+        return metadata_by_id
+
+    def _fetch_contents_batch(self, content_cids: List[str]) -> Dict[str, str]:
+        """
+        Fetch content bodies for many CIDs in one round trip.
+
+        Uses ``ipfs_client.get_contents(content_cids)`` when available,
+        otherwise one ``get_content`` call per CID.
+        """
+        batch = getattr(self.ipfs_client, "get_contents", None)
+        if batch is not None:
+            return dict(batch(content_cids))
+        contents_by_cid = {}
+        for content_cid in content_cids:
+            try:
+                contents_by_cid[content_cid] = self.ipfs_client.get_content(content_cid)
+            except Exception as e:
+                logger.warning(f"Failed to fetch content {content_cid}: {e}")
+        return contents_by_cid
+
     def _build_coherence_input(
         self, content_candidate: Dict[str, Any]
     ) -> Dict[str, Any]:
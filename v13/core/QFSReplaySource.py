@@ -7,6 +7,12 @@ from dataclasses import asdict
 from v13.core.CoherenceLedger import CoherenceLedger, LedgerEntry
 from v13.core.StorageEngine import StorageEngine
 
+def _reward_wallet_ids(rewards: Any) -> List[str]:
+    """wallet_id fields of the per-token records in a reward allocation."""
+    if not isinstance(rewards, dict):
+        return []
+    return [record['wallet_id'] for _, record in sorted(rewards.items()) if isinstance(record, dict) and 'wallet_id' in record]
+
 class QFSReplaySource:
     """
     Read-only adapter that fetches immutable history from CoherenceLedger and StorageEngine.
@@ -41,6 +47,10 @@ class QFSReplaySource:
                 break
         if not target_entry:
             raise ValueError(f'Transaction ID {tx_id} not found in active CoherenceLedger.')
+        return self._events_at(target_index)
+
+    def _events_at(self, target_index: int) -> List[Dict[str, Any]]:
+        """Replay events for the ledger entry at target_index and up to 5 entries before it."""
         events = []
         context_window = self.ledger.ledger_entries[max(0, target_index - 5):target_index + 1]
         for i in range(len(context_window)):
@@ -66,6 +76,42 @@ class QFSReplaySource:
                     return self.get_events_for_transaction(entry.entry_id)
         return []
 
+    def get_rewarded_wallet_events(self, wallet_ids: Optional[List[str]]=None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Batch form of get_reward_events: one pass over the reward allocations
+        yields the same events get_reward_events returns for each wallet.
+        Like get_reward_events it does not filter by epoch (reward allocation
+        entries record none).
+
+        Wallets default to every wallet_id recorded in the allocations; wallets
+        without a matching allocation are omitted. Wallets sharing an allocation
+        share one event list.
+        """
+        reward_entries = [entry for entry in sorted(self.ledger.ledger_entries) if entry.entry_type == 'reward_allocation']
+        if wallet_ids is None:
+            wallet_ids = sorted(dict.fromkeys((wallet for entry in reward_entries for wallet in _reward_wallet_ids(entry.data.get('rewards')))))
+        positions: Dict[str, int] = {}
+        for i, entry in enumerate(self.ledger.ledger_entries):
+            positions.setdefault(entry.entry_id, i)
+        pending = list(wallet_ids)
+        events_by_wallet: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in reward_entries:
+            if not pending:
+                break
+            raw_data = str(entry.data.get('rewards', ''))
+            matched = [wallet for wallet in pending if wallet in raw_data]
+            if matched:
+                events = self._events_at(positions[entry.entry_id])
+                for wallet in matched:
+                    events_by_wallet[wallet] = events
+                pending = [wallet for wallet in pending if wallet not in raw_data]
+        return events_by_wallet
+
+    def get_head_hash(self) -> str:
+        """Hash of the latest ledger entry ('' while empty); changes whenever history grows."""
+        entries = self.ledger.ledger_entries
+        return entries[-1].entry_hash if entries else ''
+
     def get_ranking_events(self, content_id: str) -> List[Dict[str, Any]]:
         """
         Retrieve events related to Content Ranking for a specific content ID.
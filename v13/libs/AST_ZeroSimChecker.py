@@ -10,19 +10,60 @@ Enforces QFS V13 Phase 3 Absolute Determinism across all layers:
   - Deterministic exception handling & imports
 
 Violations trigger CIR-302 halt during CI/CD.
+
+Directory scans run on a process pool and can keep an on-disk result cache:
+a file whose sha256 (and path) match a cache entry written by the same
+checker version is not parsed again.
 """
 
 import ast
 import fnmatch
+import hashlib
+import json
 import os
+import re
 import sys
-from typing import List, Set, Any, Optional, Dict, Union
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Set, Any, Optional, Dict, Tuple, Union
+from dataclasses import asdict, dataclass
 import logging
 
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+CHECKER_VERSION = "13.3"
+CACHE_FORMAT = 1
+# Below this many files to parse, pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+DEFAULT_EXCLUDE_PATTERNS = [
+    "__pycache__*",
+    "test_*",
+    "*_test.py",
+    "*AST_ZeroSimChecker.py*",
+    "migrations*",
+    "*audit*",
+    "*env*",
+    "*venv*",
+    ".venv*",
+    "*scripts*",
+    "checks_tests*",
+    "qfs_v13_project*",
+    "*api*",
+    "ATLAS*",
+    "*node_modules*",
+    "*epoch*",
+    "*economics/simple_violations.py*",
+    "*tools_root*",
+    "*tests_root*",
+    "*legacy_root*",
+    "*examples*",
+    "*atlas_api*",
+    "*genesis_ledger.py*",
+    "*CertifiedMath.py*",
+]
+
 
 @dataclass
 class Violation:
@@ -406,7 +447,65 @@ class ZeroSimASTVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
+@lru_cache(maxsize=32)
+def compile_exclude_patterns(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Fold fnmatch patterns into one regex (match names via os.path.normcase)."""
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+    )
+
+
+@lru_cache(maxsize=1)
+def checker_fingerprint() -> str:
+    """Checker version plus a hash of this module's source (cache key part)."""
+    with open(__file__, "rb") as f:
+        source_hash = hashlib.sha256(f.read()).hexdigest()
+    return f"{CHECKER_VERSION}:{source_hash}"
+
+
+def _scan_path(file_path: str) -> List[Violation]:
+    """Process-pool entry point."""
+    return AST_ZeroSimChecker().scan_file(file_path)
+
+
+def _file_sha256(file_path: str) -> str:
+    with open(file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _load_cache(cache_path: str) -> Dict[str, Any]:
+    """Cached results per path, or {} if missing, unreadable or stale."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (
+        cache.get("format") != CACHE_FORMAT
+        or cache.get("checker") != checker_fingerprint()
+    ):
+        return {}
+    return cache.get("files", {})
+
+
+def _save_cache(cache_path: str, files: Dict[str, Any]) -> None:
+    """Write the cache atomically (temp file, rename)."""
+    temp_path = f"{cache_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"format": CACHE_FORMAT, "checker": checker_fingerprint(), "files": files},
+            f,
+            sort_keys=True,
+        )
+    os.replace(temp_path, cache_path)
+
+
 class AST_ZeroSimChecker:
+    def __init__(self) -> None:
+        self.last_scan_stats: Dict[str, int] = {}
+
     def scan_file(self, file_path: str) -> List[Violation]:
         visitor = ZeroSimASTVisitor(file_path)
         try:
@@ -458,61 +557,101 @@ class AST_ZeroSimChecker:
                 )
         return visitor.violations
 
-    def scan_directory(
+    def collect_files(
         self, directory: str, exclude_patterns: Optional[List[str]] = None
-    ) -> List[Violation]:
-        exclude_patterns = exclude_patterns or [
-            "__pycache__*",
-            "test_*",
-            "*_test.py",
-            "*AST_ZeroSimChecker.py*",
-            "migrations*",
-            "*audit*",
-            "*env*",
-            "*venv*",
-            ".venv*",
-            "*scripts*",
-            "checks_tests*",
-            "qfs_v13_project*",
-            "*api*",
-            "ATLAS*",
-            "*node_modules*",
-            "*epoch*",
-            "*economics/simple_violations.py*",
-            "*tools_root*",
-            "*tests_root*",
-            "*legacy_root*",
-            "*examples*",
-            "*atlas_api*",
-            "*genesis_ledger.py*",
-            "*CertifiedMath.py*",
-        ]
-        all_violations = []
+    ) -> List[str]:
+        """Python files to scan, in deterministic (sorted walk) order."""
+        pattern = compile_exclude_patterns(
+            tuple(exclude_patterns or DEFAULT_EXCLUDE_PATTERNS)
+        )
+
+        def excluded(name: str) -> bool:
+            return pattern.match(os.path.normcase(name)) is not None
+
+        paths = []
         for root, dirs, files in os.walk(directory):
-            excluded = [
-                d
-                for d in dirs
-                if any((fnmatch.fnmatch(d, p) for p in exclude_patterns))
-            ]
-            if excluded:
-                pass
-            dirs[:] = [
-                d
-                for d in dirs
-                if not any((fnmatch.fnmatch(d, p) for p in exclude_patterns))
-            ]
+            dirs[:] = sorted(d for d in dirs if not excluded(d))
             for file in sorted(files):
-                if file.endswith(".py") and (
-                    not any((fnmatch.fnmatch(file, p) for p in exclude_patterns))
-                ):
-                    all_violations.extend(self.scan_file(os.path.join(root, file)))
+                if file.endswith(".py") and not excluded(file):
+                    paths.append(os.path.join(root, file))
+        return paths
+
+    def scan_directory(
+        self,
+        directory: str,
+        exclude_patterns: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        cache_path: Optional[str] = None,
+    ) -> List[Violation]:
+        """
+        Scan every non-excluded Python file under ``directory``.
+
+        Files are parsed on a pool of ``workers`` processes (default: CPU
+        count; 1 scans in-process). With ``cache_path``, files whose sha256
+        matches the cached entry reuse the stored violations. Violations are
+        returned in file order, then in visit order, whatever the worker count.
+        """
+        paths = self.collect_files(directory, exclude_patterns)
+        cached = _load_cache(cache_path) if cache_path else {}
+        results: Dict[str, List[Violation]] = {}
+        digests: Dict[str, str] = {}
+        pending = []
+        for path in paths:
+            if cache_path:
+                digests[path] = _file_sha256(path)
+                entry = cached.get(path)
+                if entry is not None and entry["sha256"] == digests[path]:
+                    results[path] = [Violation(**v) for v in entry["violations"]]
+                    continue
+            pending.append(path)
+
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            chunksize = max(1, len(pending) // (workers * 4))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    scanned = list(pool.map(_scan_path, pending, chunksize=chunksize))
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"Process pool unavailable ({e}); scanning serially")
+                scanned = [self.scan_file(path) for path in pending]
+        else:
+            scanned = [self.scan_file(path) for path in pending]
+        results.update(zip(pending, scanned))
+
+        if cache_path:
+            _save_cache(
+                cache_path,
+                {
+                    path: {
+                        "sha256": digests[path],
+                        "violations": [asdict(v) for v in results[path]],
+                    }
+                    for path in paths
+                },
+            )
+        self.last_scan_stats = {
+            "files": len(paths),
+            "parsed": len(pending),
+            "cached": len(paths) - len(pending),
+        }
+        all_violations = []
+        for path in paths:
+            all_violations.extend(results[path])
         return all_violations
 
-    def enforce_policy(self, path: str, fail_on_violations: bool = False) -> None:
+    def enforce_policy(
+        self,
+        path: str,
+        fail_on_violations: bool = False,
+        workers: Optional[int] = None,
+        cache_path: Optional[str] = None,
+    ) -> None:
         if os.path.isfile(path) and path.endswith(".py"):
             violations = self.scan_file(path)
         else:
-            violations = self.scan_directory(path)
+            violations = self.scan_directory(
+                path, workers=workers, cache_path=cache_path
+            )
         if violations:
             for v in violations[:50]:
                 if v.code_snippet:
@@ -529,5 +668,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("dir", nargs="?", default=".")
     parser.add_argument("--fail", action="store_true")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes")
+    parser.add_argument("--cache", default=None, help="Result cache file")
     args = parser.parse_args()
-    AST_ZeroSimChecker().enforce_policy(args.dir, args.fail)
+    AST_ZeroSimChecker().enforce_policy(
+        args.dir, args.fail, workers=args.jobs, cache_path=args.cache
+    )
@@ -37,10 +37,10 @@ class BigNum128:
 
     def _ensure_cm_initialized(self) -> None:
         """Ensure that CertifiedMath is initialized."""
-        if self.cm is None:
+        if BigNum128.cm is None:
             from .CertifiedMath import CertifiedMath
 
-            self.cm = CertifiedMath()
+            BigNum128.cm = CertifiedMath()
 
     @classmethod
     def from_int(cls, val: int) -> "BigNum128":
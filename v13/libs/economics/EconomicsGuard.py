@@ -18,7 +18,7 @@ InfrastructureGovernance) MUST call EconomicsGuard before mutations.
 
 import json
 import hashlib
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -140,6 +140,42 @@ class ValidationResult:
         }
 
 
+@dataclass
+class BatchValidationResult:
+    """
+    Result of a columnar (batch) economic validation.
+
+    Only failing rows are materialized; ``violations`` holds (row index,
+    ValidationResult) pairs in row order. Epoch-level violations that apply to
+    every row use row index -1.
+    """
+
+    passed: bool
+    rows_checked: int
+    violations: List[Tuple[int, ValidationResult]]
+
+    @property
+    def first_violation(self) -> Optional[ValidationResult]:
+        """
+        The earliest violation's ValidationResult, or None if the batch passed.
+
+        Its row is ``violations[0][0]``. That is -1 when an epoch-level check
+        failed; the batch then holds only that violation, since no row could
+        pass.
+        """
+        return self.violations[0][1] if self.violations else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "passed": self.passed,
+            "rows_checked": self.rows_checked,
+            "violations": [
+                {"row": row, **result.to_dict()} for row, result in self.violations
+            ],
+        }
+
+
 class EconomicsGuard:
     """
     Constitutional Economic Bounds Enforcer for QFS V13.6.
@@ -716,6 +752,272 @@ class EconomicsGuard:
             )
         return ValidationResult(passed=True)
 
+    # ------------------------------------------------------------------
+    # Batch (columnar) validators
+    #
+    # Columns are sequences of raw BigNum128 ``.value`` integers (SCALE 1e18).
+    # Ratio bounds are checked by cross-multiplication, which is exact for the
+    # truncating fixed-point division used by the per-row validators:
+    #   floor(a*S/b) <  MIN  <=>  a*S <  MIN*b
+    #   floor(a*S/b) >  MAX  <=>  a*S >= (MAX+1)*b
+    # Violation details are built by re-running the per-row validator on the
+    # failing rows only, so messages and details match it exactly.
+    # ------------------------------------------------------------------
+
+    def validate_chr_rewards_batch(
+        self,
+        reward_amounts: Sequence[int],
+        current_daily_total: BigNum128,
+        current_total_supply: BigNum128,
+        log_list: Optional[List[Dict[str, Any]]] = None,
+    ) -> BatchValidationResult:
+        """
+        Validate a sequence of CHR rewards applied one after another.
+
+        Equivalent to calling validate_chr_reward for each row while advancing
+        the daily total and supply by every reward that passed.
+
+        Args:
+            reward_amounts: Raw CHR reward values, in application order
+            current_daily_total: Daily CHR emission total before the batch
+            current_total_supply: Total CHR supply before the batch
+            log_list: Optional log list for audit trail
+
+        Returns:
+            BatchValidationResult with the failing rows
+        """
+        if log_list is None:
+            log_list = []
+        min_reward = CHR_MIN_REWARD_PER_ACTION.value
+        max_reward = CHR_MAX_REWARD_PER_ACTION.value
+        daily_headroom = CHR_DAILY_EMISSION_CAP.value - current_daily_total.value
+        supply_headroom = CHR_SATURATION_THRESHOLD.value - current_total_supply.value
+        emitted = 0
+        violations: List[Tuple[int, ValidationResult]] = []
+        for row, amount in enumerate(reward_amounts):
+            if (
+                min_reward <= amount <= max_reward
+                and emitted + amount <= daily_headroom
+                and emitted + amount <= supply_headroom
+            ):
+                emitted += amount
+                continue
+            violations.append(
+                (
+                    row,
+                    self.validate_chr_reward(
+                        BigNum128(amount),
+                        BigNum128(current_daily_total.value + emitted),
+                        BigNum128(current_total_supply.value + emitted),
+                        log_list,
+                    ),
+                )
+            )
+        return self._batch_result(
+            "validate_chr_rewards_batch", len(reward_amounts), violations, log_list
+        )
+
+    def validate_flx_rewards_batch(
+        self,
+        flx_amounts: Sequence[int],
+        chr_rewards: Sequence[int],
+        user_balances: Sequence[int],
+        log_list: Optional[List[Dict[str, Any]]] = None,
+    ) -> BatchValidationResult:
+        """
+        Validate FLX rewards row by row (see validate_flx_reward).
+
+        Args:
+            flx_amounts: Raw FLX reward values
+            chr_rewards: Raw CHR reward values the FLX fractions are taken of
+            user_balances: Raw current FLX balances of the recipients
+            log_list: Optional log list for audit trail
+
+        Returns:
+            BatchValidationResult with the failing rows
+        """
+        if log_list is None:
+            log_list = []
+        if not len(flx_amounts) == len(chr_rewards) == len(user_balances):
+            raise ValueError("Batch columns must have equal length")
+        scale = BigNum128.SCALE
+        min_fraction = MIN_FLX_REWARD_FRACTION.value
+        max_fraction_ceiling = MAX_FLX_REWARD_FRACTION.value + 1
+        per_user_cap = FLX_MAX_PER_USER.value
+        violations: List[Tuple[int, ValidationResult]] = []
+        for row, (flx, chr_reward, balance) in enumerate(
+            zip(flx_amounts, chr_rewards, user_balances)
+        ):
+            scaled_flx = flx * scale
+            if (
+                chr_reward <= 0
+                or min_fraction * chr_reward <= scaled_flx < max_fraction_ceiling * chr_reward
+            ) and balance + flx <= per_user_cap:
+                continue
+            violations.append(
+                (
+                    row,
+                    self.validate_flx_reward(
+                        BigNum128(flx),
+                        BigNum128(chr_reward),
+                        BigNum128(balance),
+                        log_list,
+                    ),
+                )
+            )
+        return self._batch_result(
+            "validate_flx_rewards_batch", len(flx_amounts), violations, log_list
+        )
+
+    def validate_nod_allocations_batch(
+        self,
+        nod_amounts: Sequence[int],
+        total_fees: BigNum128,
+        node_voting_powers: Sequence[int],
+        total_voting_power: BigNum128,
+        node_reward_shares: Sequence[int],
+        total_epoch_issuance: BigNum128,
+        active_node_count: int,
+        log_list: Optional[List[Dict[str, Any]]] = None,
+    ) -> BatchValidationResult:
+        """
+        Validate an epoch's per-node NOD allocation in one pass.
+
+        The epoch-level checks (issuance cap, minimum active nodes) run once;
+        if they fail no row can pass, so the result carries a single row -1
+        violation. Otherwise each row gets the per-node checks of
+        validate_nod_allocation.
+
+        Args:
+            nod_amounts: Raw NOD amounts per node
+            total_fees: Total ATR fees collected
+            node_voting_powers: Raw NOD voting power per node
+            total_voting_power: Total NOD voting power across all nodes
+            node_reward_shares: Raw reward share per node
+            total_epoch_issuance: Total NOD issuance for the epoch
+            active_node_count: Number of active nodes
+            log_list: Optional log list for audit trail
+
+        Returns:
+            BatchValidationResult with the failing rows
+        """
+        if log_list is None:
+            log_list = []
+        rows = len(nod_amounts)
+        if not rows == len(node_voting_powers) == len(node_reward_shares):
+            raise ValueError("Batch columns must have equal length")
+        min_nodes = int(NOD_MIN_ACTIVE_NODES.value // NOD_MIN_ACTIVE_NODES.SCALE)
+        if (
+            total_epoch_issuance.value > NOD_MAX_ISSUANCE_PER_EPOCH.value
+            or active_node_count < min_nodes
+        ):
+            epoch_violation = self.validate_nod_allocation(
+                BigNum128(0),
+                BigNum128(0),
+                BigNum128(0),
+                BigNum128(0),
+                BigNum128(0),
+                total_epoch_issuance,
+                active_node_count,
+                log_list,
+            )
+            return self._batch_result(
+                "validate_nod_allocations_batch", rows, [(-1, epoch_violation)], log_list
+            )
+        scale = BigNum128.SCALE
+        fees = total_fees.value
+        min_fees_bound = MIN_NOD_ALLOCATION_FRACTION.value * fees
+        max_fees_bound = (MAX_NOD_ALLOCATION_FRACTION.value + 1) * fees
+        voting_total = total_voting_power.value
+        max_voting_bound = (MAX_NOD_VOTING_POWER_RATIO.value + 1) * voting_total
+        max_share = MAX_NODE_REWARD_SHARE.value
+        violations: List[Tuple[int, ValidationResult]] = []
+        for row, (nod, voting_power, share) in enumerate(
+            zip(nod_amounts, node_voting_powers, node_reward_shares)
+        ):
+            if (
+                (fees <= 0 or min_fees_bound <= nod * scale < max_fees_bound)
+                and (voting_total <= 0 or voting_power * scale < max_voting_bound)
+                and share <= max_share
+            ):
+                continue
+            violations.append(
+                (
+                    row,
+                    self.validate_nod_allocation(
+                        BigNum128(nod),
+                        total_fees,
+                        BigNum128(voting_power),
+                        total_voting_power,
+                        BigNum128(share),
+                        total_epoch_issuance,
+                        active_node_count,
+                        log_list,
+                    ),
+                )
+            )
+        return self._batch_result(
+            "validate_nod_allocations_batch", rows, violations, log_list
+        )
+
+    def validate_per_address_rewards_batch(
+        self,
+        addresses: Sequence[str],
+        total_amounts: Sequence[int],
+        log_list: Optional[List[Dict[str, Any]]] = None,
+    ) -> BatchValidationResult:
+        """
+        Validate per-address reward totals (see validate_per_address_reward).
+
+        Args:
+            addresses: Recipient addresses
+            total_amounts: Raw combined reward totals per address
+            log_list: Optional log list
+
+        Returns:
+            BatchValidationResult with the failing rows
+        """
+        if log_list is None:
+            log_list = []
+        if len(addresses) != len(total_amounts):
+            raise ValueError("Batch columns must have equal length")
+        cap = MAX_REWARD_PER_ADDRESS.value
+        zero = BigNum128(0)
+        violations = [
+            (
+                row,
+                self.validate_per_address_reward(
+                    addresses[row], zero, zero, zero, BigNum128(total), log_list
+                ),
+            )
+            for row, total in enumerate(total_amounts)
+            if total > cap
+        ]
+        return self._batch_result(
+            "validate_per_address_rewards_batch", len(addresses), violations, log_list
+        )
+
+    def _batch_result(
+        self,
+        validator: str,
+        rows: int,
+        violations: List[Tuple[int, ValidationResult]],
+        log_list: List[Dict[str, Any]],
+    ) -> BatchValidationResult:
+        """Build the batch result and append one summary audit record."""
+        log_list.append(
+            {
+                "operation": "economics_guard_batch",
+                "validator": validator,
+                "rows_checked": rows,
+                "violation_count": len(violations),
+                "violation_codes": sorted({v.error_code for _, v in violations}),
+            }
+        )
+        return BatchValidationResult(
+            passed=not violations, rows_checked=rows, violations=violations
+        )
+
     def generate_violation_event_hash(
         self, validation_result: ValidationResult, timestamp: int
     ) -> str:
@@ -1,10 +1,14 @@
 from libs.deterministic_helpers import det_time_now, det_perf_counter, det_random, det_time_isoformat, qnum
 from libs.fatal_errors import ZeroSimAbort, EconomicInvariantBreach, GovernanceGuardFailure
-from typing import Dict, List, Tuple, Set, Any, Optional, TYPE_CHECKING
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Dict, Iterable, List, Tuple, Set, Any, Optional, TYPE_CHECKING
 try:
     from v13.core.TokenStateBundle import TokenStateBundle
+    from v13.libs.BigNum128 import BigNum128
 except ImportError:
     from ...core.TokenStateBundle import TokenStateBundle
+    from ..BigNum128 import BigNum128
 if TYPE_CHECKING:
     from v13.core.TokenStateBundle import TokenStateBundle
 
@@ -24,6 +28,10 @@ class SecurityError(Exception):
         self.evidence = evidence or {}
         self.cir_code = cir_code
 
+def _raw(value: Any) -> int:
+    """Raw integer of a BigNum128 (or a plain int) for aggregate metrics."""
+    return value.value if isinstance(value, BigNum128) else value
+
 class DiscretePsiField:
     """
     HARDENED ψ-field engine with Byzantine detection and performance optimizations.
@@ -34,7 +42,18 @@ class DiscretePsiField:
     - Maximum computation bounds to prevent DoS
     - Deterministic cycle ordering for cross-runtime consistency
     - Memory-bound cycle detection to prevent resource exhaustion
+    - Per-state ψ-density cache and edge-incidence curl evaluation
+    - Iterative BFS spanning-forest cycle basis, maintained per connected
+      component so topology changes only re-walk the affected component
     """
+    MAX_CONNECTIONS = 100000
+    # Version 1 (depth-limited recursive DFS) missed cycles and could emit
+    # non-cycles, e.g. a 6-ring had no cycles, K4 one, and two triangles
+    # sharing a vertex one 4-node "cycle". Version 2 is the BFS spanning-forest
+    # basis: one fundamental cycle per non-tree edge (6-ring: 1, K4: 3, the
+    # two triangles: 2). cycle_basis_hash values are only comparable within
+    # a version.
+    CYCLE_BASIS_VERSION = 2
 
     def __init__(self, genesis_topology: Dict[str, Any], certified_math: Any):
         """
@@ -49,13 +68,22 @@ class DiscretePsiField:
         self.MAX_CYCLE_LENGTH = 8
         self.MAX_CYCLES_PER_SHARD = 5
         self.MAX_EDGES_PER_SHARD = 10
+        self.edges: List[Tuple[str, str]] = []
+        self.edge_index: Dict[Tuple[str, str], int] = {}
+        self._cycle_incidence: Dict[Tuple[str, ...], Optional[List[Tuple[int, int]]]] = {}
+        self._density_memo: Dict[str, Any] = {'state_hash': None, 'densities': {}}
+        self.min_connection_degree = 2
+        self._component_root: Dict[str, str] = {}
+        self._component_members: Dict[str, List[str]] = {}
+        self._component_cycles: Dict[str, List[List[str]]] = {}
+        self._canonical_cycles: List[Tuple[str, ...]] = []
         self._validate_and_build_graph(genesis_topology)
         self._compute_secure_cycle_basis()
 
     def _validate_and_build_graph(self, topology: Dict[str, Any]):
         """Build graph with comprehensive security validation."""
         connections = topology.get('shard_connections', [])
-        if len(connections) > 100:
+        if len(connections) > self.MAX_CONNECTIONS:
             evidence = {'connections_count': len(connections)}
             raise SecurityError(f'EXCESSIVE_CONNECTIONS: Excessive connections: {len(connections)}', violation_type='EXCESSIVE_CONNECTIONS', evidence=evidence, cir_code='CIR-412')
         shard_set = set()
@@ -80,9 +108,12 @@ class DiscretePsiField:
                 evidence = {'edge': f'{a}-{b}'}
                 raise SecurityError(f'DUPLICATE_EDGE: Duplicate edge: {a}-{b}', violation_type='DUPLICATE_EDGE', evidence=evidence, cir_code='CIR-412')
             edge_count[edge_key] = True
+            self.edge_index[edge_key] = len(self.edges)
+            self.edges.append(edge_key)
             self.graph[a].add(b)
             self.graph[b].add(a)
         min_degree = topology.get('min_connection_degree', 2)
+        self.min_connection_degree = min_degree
         max_degree = topology.get('max_connection_degree', 3)
         for shard, neighbors in self.graph.items():
             degree = len(neighbors)
@@ -95,90 +126,244 @@ class DiscretePsiField:
 
     def _compute_secure_cycle_basis(self):
         """
-        Compute cycle basis with security bounds and deterministic ordering.
-        Uses iterative DFS with cycle length limits to prevent resource exhaustion.
+        Compute the cycle basis from scratch with security bounds and deterministic ordering.
+
+        Each connected component gets a BFS spanning tree rooted at its smallest
+        shard id (neighbors visited in sorted order); every non-tree edge closes
+        one fundamental cycle. Iterative, so topology size is not bounded by the
+        recursion limit.
         """
-        visited = set()
-        parent = {}
-        cycles = []
-        cycle_cache = set()
-
-        def secure_dfs(u, v, depth=0):
-            if depth > self.MAX_CYCLE_LENGTH:
-                return
-            visited.add(v)
-            parent[v] = u
-            neighbors = sorted(self.graph[v])
-            for w in sorted(neighbors):
-                if w == u:
-                    continue
-                if w in visited:
-                    cycle = self._extract_secure_cycle(v, w, parent)
-                    if cycle and len(cycle) <= self.MAX_CYCLE_LENGTH:
-                        cycle_tuple = tuple(sorted(cycle))
-                        if cycle_tuple not in cycle_cache:
-                            cycles.append(cycle)
-                            cycle_cache.add(cycle_tuple)
-                            if len(cycles) >= self.MAX_CYCLES_PER_SHARD * len(self.shard_ids):
-                                return
+        self._component_root = {}
+        self._component_members = {}
+        self._component_cycles = {}
+        self._canonical_cycles = []
+        self._rebuild_components(self.shard_ids, bulk=True)
+        self._canonical_cycles.sort()
+        self._refresh_cycle_basis()
+
+    def _rebuild_components(self, shards: Iterable[str], bulk: bool=False):
+        """
+        Recompute spanning trees and fundamental cycles for the components
+        covering ``shards`` (which must be a union of whole components).
+        The sorted canonical cycle list is updated in place unless ``bulk``
+        (the caller sorts it once afterwards).
+        """
+        pending = set(shards)
+        for shard in sorted(pending):
+            if shard not in pending:
+                continue
+            members, cycles = self._component_cycle_basis(shard)
+            pending.difference_update(members)
+            for member in members:
+                self._component_root[member] = shard
+            self._component_members[shard] = members
+            self._component_cycles[shard] = cycles
+            for cycle in cycles:
+                if bulk:
+                    self._canonical_cycles.append(tuple(sorted(cycle)))
                 else:
-                    secure_dfs(v, w, depth + 1)
-        sorted_shards = sorted(self.shard_ids)
-        for shard in sorted(sorted_shards):
-            if shard not in visited:
-                secure_dfs(None, shard)
-        self.cycle_basis = cycles
-        self.cycle_basis_hash = self._compute_cycle_basis_hash()
-
-    def _extract_secure_cycle(self, start: str, end: str, parent: Dict[str, str]) -> Optional[List[str]]:
-        """Extract cycle with bounds checking and validation."""
-        try:
-            path1 = []
-            current = start
-            while current is not None:
-                if len(path1) > self.MAX_CYCLE_LENGTH:
-                    return None
-                path1.append(current)
-                current = parent.get(current)
-            path2 = []
-            current = end
-            while current is not None:
-                if len(path2) > self.MAX_CYCLE_LENGTH:
-                    return None
-                path2.append(current)
-                current = parent.get(current)
-            set1 = set(path1)
-            lca = None
-            for node in sorted(path2):
-                if node in set1:
-                    lca = node
-                    break
-            if lca is None:
-                return None
-            cycle = []
-            for node in sorted(path1):
-                cycle.append(node)
-                if node == lca:
+                    insort(self._canonical_cycles, tuple(sorted(cycle)))
+
+    def _component_cycle_basis(self, root: str) -> Tuple[List[str], List[List[str]]]:
+        """BFS from ``root``; returns (members in BFS order, fundamental cycles)."""
+        parent: Dict[str, Optional[str]] = {root: None}
+        depth = {root: 0}
+        members = [root]
+        non_tree_edges = set()
+        queue = deque([root])
+        while queue:
+            u = queue.popleft()
+            for w in sorted(self.graph[u]):
+                if w not in parent:
+                    parent[w] = u
+                    depth[w] = depth[u] + 1
+                    members.append(w)
+                    queue.append(w)
+                elif w != parent[u]:
+                    non_tree_edges.add((u, w) if u < w else (w, u))
+        cycles = []
+        max_cycles = self.MAX_CYCLES_PER_SHARD * len(members)
+        for u, v in sorted(non_tree_edges):
+            cycle = self._fundamental_cycle(u, v, parent, depth)
+            if cycle is not None:
+                cycles.append(cycle)
+                if len(cycles) >= max_cycles:
                     break
-            lca_index = path2.index(lca)
-            for i in range(lca_index - 1, -1, -1):
-                cycle.append(path2[i])
-            cycle.append(start)
-            if len(cycle) < 3 or len(cycle) > self.MAX_CYCLE_LENGTH:
-                return None
-            if len(cycle) != len(set(cycle)):
+        return (members, cycles)
+
+    def _fundamental_cycle(self, u: str, v: str, parent: Dict[str, Optional[str]], depth: Dict[str, int]) -> Optional[List[str]]:
+        """
+        Cycle closed by non-tree edge (u, v): u up to the tree LCA, then down to v.
+        Returns None if it would exceed MAX_CYCLE_LENGTH (walk is cut off early).
+        """
+        path_u = [u]
+        path_v = [v]
+        a, b = (u, v)
+        while a != b:
+            if len(path_u) + len(path_v) > self.MAX_CYCLE_LENGTH + 1:
                 return None
-            return cycle
-        except (KeyError, IndexError):
+            if depth[a] >= depth[b]:
+                a = parent[a]
+                path_u.append(a)
+            else:
+                b = parent[b]
+                path_v.append(b)
+        cycle = path_u + path_v[-2::-1]
+        if len(cycle) < 3 or len(cycle) > self.MAX_CYCLE_LENGTH:
             return None
+        return cycle
+
+    def _refresh_cycle_basis(self):
+        """Concatenate component cycles (by component root) and re-hash."""
+        self.cycle_basis = [cycle for root in sorted(self._component_cycles) for cycle in self._component_cycles[root]]
+        self.cycle_basis_hash = self._hash_canonical_cycles(self._canonical_cycles)
+
+    def _apply_topology_change(self, affected: Set[str], removed: Iterable[str]=()):
+        """Re-derive the basis for the components that contained ``affected`` shards."""
+        stale_roots = {self._component_root[shard] for shard in affected if shard in self._component_root}
+        covered = set()
+        for root in stale_roots:
+            covered.update(self._component_members.pop(root))
+            for cycle in self._component_cycles.pop(root):
+                self._cycle_incidence.pop(tuple(cycle), None)
+                canonical = tuple(sorted(cycle))
+                del self._canonical_cycles[bisect_left(self._canonical_cycles, canonical)]
+        for shard in removed:
+            self._component_root.pop(shard, None)
+            covered.discard(shard)
+        covered.update((shard for shard in affected if shard in self.shard_ids))
+        self._rebuild_components(covered)
+        self._refresh_cycle_basis()
+
+    def _check_new_connection(self, a: str, b: str):
+        """Validate a connection between two known shards before linking it."""
+        if not isinstance(a, str) or not isinstance(b, str):
+            evidence = {'shard_a_type': type(a), 'shard_b_type': type(b)}
+            raise SecurityError(f'INVALID_SHARD_ID_TYPES: Invalid shard ID types: {type(a)}, {type(b)}', violation_type='INVALID_SHARD_ID_TYPES', evidence=evidence, cir_code='CIR-412')
+        if a == b:
+            evidence = {'shard_id': a}
+            raise SecurityError(f'SELF_LOOP_DETECTED: Self-loop detected: {a}', violation_type='SELF_LOOP_DETECTED', evidence=evidence, cir_code='CIR-412')
+        if b in self.graph.get(a, set()):
+            evidence = {'edge': f'{a}-{b}'}
+            raise SecurityError(f'DUPLICATE_EDGE: Duplicate edge: {a}-{b}', violation_type='DUPLICATE_EDGE', evidence=evidence, cir_code='CIR-412')
+        if len(self.edge_index) >= self.MAX_CONNECTIONS:
+            evidence = {'connections_count': len(self.edge_index) + 1}
+            raise SecurityError(f'EXCESSIVE_CONNECTIONS: Excessive connections: {len(self.edge_index) + 1}', violation_type='EXCESSIVE_CONNECTIONS', evidence=evidence, cir_code='CIR-412')
+        for shard in (a, b):
+            degree = len(self.graph.get(shard, ())) + 1
+            if degree > self.MAX_EDGES_PER_SHARD:
+                evidence = {'shard_id': shard, 'degree': degree, 'max_allowed': self.MAX_EDGES_PER_SHARD}
+                raise SecurityError(f'OVER_CONNECTED_SHARD: Shard {shard} over-connected: {degree} > {self.MAX_EDGES_PER_SHARD}', violation_type='OVER_CONNECTED_SHARD', evidence=evidence, cir_code='CIR-412')
+
+    def _check_min_degree(self, shard: str, degree: int):
+        if degree < self.min_connection_degree:
+            evidence = {'shard_id': shard, 'degree': degree, 'min_required': self.min_connection_degree}
+            raise SecurityError(f'UNDER_CONNECTED_SHARD: Shard {shard} under-connected: {degree} < {self.min_connection_degree}', violation_type='UNDER_CONNECTED_SHARD', evidence=evidence, cir_code='CIR-412')
+
+    def _check_known_shards(self, *shards: str):
+        for shard in shards:
+            if shard not in self.shard_ids:
+                evidence = {'shard_id': shard}
+                raise SecurityError(f'INVALID_SHARD_IN_CONNECTION: Unknown shard: {shard}', violation_type='INVALID_SHARD_IN_CONNECTION', evidence=evidence, cir_code='CIR-412')
+
+    def _link(self, a: str, b: str):
+        edge_key = (a, b) if a < b else (b, a)
+        self.edge_index[edge_key] = len(self.edges)
+        self.edges.append(edge_key)
+        self.graph[a].add(b)
+        self.graph[b].add(a)
+
+    def _unlink(self, a: str, b: str):
+        edge_key = (a, b) if a < b else (b, a)
+        # Edge slots are tombstoned rather than reused so incidence rows stay valid
+        self.edges[self.edge_index.pop(edge_key)] = None
+        self.graph[a].discard(b)
+        self.graph[b].discard(a)
+        if len(self.edges) > 2 * len(self.edge_index):
+            self._compact_edges()
+
+    def _compact_edges(self):
+        """Drop tombstoned edge slots once they outnumber live edges; incidence rows are re-derived lazily."""
+        self.edges[:] = [edge for edge in self.edges if edge is not None]
+        self.edge_index.clear()
+        self.edge_index.update(((edge, idx) for idx, edge in enumerate(self.edges)))
+        self._cycle_incidence.clear()
+
+    def add_connection(self, a: str, b: str):
+        """
+        Connect two existing shards and update the cycle basis.
+
+        Only the component(s) containing ``a`` and ``b`` are re-walked.
+        """
+        self._check_known_shards(a, b)
+        self._check_new_connection(a, b)
+        self._link(a, b)
+        self._apply_topology_change({a, b})
+
+    def remove_connection(self, a: str, b: str):
+        """
+        Disconnect two shards and update the cycle basis.
+
+        Rejected if either shard would fall below the minimum connection degree.
+        """
+        self._check_known_shards(a, b)
+        if b not in self.graph[a]:
+            raise ValueError(f'Shards {a} and {b} not connected')
+        self._check_min_degree(a, len(self.graph[a]) - 1)
+        self._check_min_degree(b, len(self.graph[b]) - 1)
+        self._unlink(a, b)
+        self._apply_topology_change({a, b})
+
+    def add_shard(self, shard_id: str, neighbors: List[str]):
+        """
+        Add a new shard connected to existing ``neighbors`` and update the cycle basis.
+        """
+        if shard_id in self.shard_ids:
+            evidence = {'shard_id': shard_id}
+            raise SecurityError(f'DUPLICATE_SHARD: Shard {shard_id} already exists', violation_type='DUPLICATE_SHARD', evidence=evidence, cir_code='CIR-412')
+        neighbors = sorted(set(neighbors))
+        self._check_known_shards(*neighbors)
+        self._check_min_degree(shard_id, len(neighbors))
+        if len(neighbors) > self.MAX_EDGES_PER_SHARD:
+            evidence = {'shard_id': shard_id, 'degree': len(neighbors), 'max_allowed': self.MAX_EDGES_PER_SHARD}
+            raise SecurityError(f'OVER_CONNECTED_SHARD: Shard {shard_id} over-connected: {len(neighbors)} > {self.MAX_EDGES_PER_SHARD}', violation_type='OVER_CONNECTED_SHARD', evidence=evidence, cir_code='CIR-412')
+        if len(self.edge_index) + len(neighbors) > self.MAX_CONNECTIONS:
+            evidence = {'connections_count': len(self.edge_index) + len(neighbors)}
+            raise SecurityError(f'EXCESSIVE_CONNECTIONS: Excessive connections: {len(self.edge_index) + len(neighbors)}', violation_type='EXCESSIVE_CONNECTIONS', evidence=evidence, cir_code='CIR-412')
+        for neighbor in neighbors:
+            self._check_new_connection(shard_id, neighbor)
+        self.shard_ids.add(shard_id)
+        self.graph[shard_id] = set()
+        for neighbor in neighbors:
+            self._link(shard_id, neighbor)
+        self._apply_topology_change({shard_id, *neighbors})
+
+    def retire_shard(self, shard_id: str):
+        """
+        Remove a shard and all its connections and update the cycle basis.
+
+        Rejected if any neighbor would fall below the minimum connection degree.
+        """
+        self._check_known_shards(shard_id)
+        neighbors = sorted(self.graph[shard_id])
+        for neighbor in neighbors:
+            self._check_min_degree(neighbor, len(self.graph[neighbor]) - 1)
+        for neighbor in neighbors:
+            self._unlink(shard_id, neighbor)
+        del self.graph[shard_id]
+        self.shard_ids.discard(shard_id)
+        self._density_memo['densities'].pop(shard_id, None)
+        self._apply_topology_change({shard_id, *neighbors}, removed=[shard_id])
 
     def _compute_cycle_basis_hash(self) -> str:
         """Compute deterministic hash of cycle basis for integrity verification."""
+        return self._hash_canonical_cycles(sorted((tuple(sorted(cycle)) for cycle in self.cycle_basis)))
+
+    @staticmethod
+    def _hash_canonical_cycles(canonical_repr: List[Tuple[str, ...]]) -> str:
+        """SHA3-256 over the sorted list of per-cycle sorted node tuples."""
         import hashlib
-        canonical_repr = []
-        for cycle in sorted(self.cycle_basis, key=lambda x: (len(x), tuple(x))):
-            canonical_repr.append(tuple(sorted(cycle)))
-        canonical_str = str(sorted(canonical_repr))
+        canonical_str = str(canonical_repr)
         return hashlib.sha3_256(canonical_str.encode()).hexdigest()
 
     def verify_cycle_basis_integrity(self) -> bool:
@@ -186,15 +371,44 @@ class DiscretePsiField:
         current_hash = self._compute_cycle_basis_hash()
         is_valid = current_hash == self.cycle_basis_hash
         if not is_valid:
-            evidence = {'expected_hash': self.cycle_basis_hash, 'current_hash': current_hash}
+            evidence = {'expected_hash': self.cycle_basis_hash, 'current_hash': current_hash, 'cycle_basis_version': self.CYCLE_BASIS_VERSION}
             raise SecurityError('CYCLE_BASIS_TAMPERING: Cycle basis integrity compromised', violation_type='CYCLE_BASIS_TAMPERING', evidence=evidence, cir_code='CIR-412')
         return is_valid
 
-    def psi_density(self, shard_id: str, harmonic_state: 'TokenStateBundle') -> int:
+    def psi_density(self, shard_id: str, harmonic_state: 'TokenStateBundle') -> BigNum128:
         """
         HARDENED ψ-density computation with bounds checking.
         ψ = (CHR × ATR) / (1 + DISSONANCE)
+
+        Densities are memoized per harmonic state content (the most recent
+        state's deterministic hash), so gradients, curls and sync metrics over
+        one state compute each shard's density once, and a state mutated in
+        place is never served stale densities.
+        """
+        return self._density(shard_id, harmonic_state, self._densities_for(harmonic_state))
+
+    def _densities_for(self, harmonic_state: 'TokenStateBundle') -> Dict[str, BigNum128]:
+        """
+        Density memo for a harmonic state, keyed on its deterministic hash.
+
+        Bulk operations fetch it once and pass it to _density/_gradient, so the
+        state is hashed once per operation rather than once per shard.
         """
+        state_hash = harmonic_state.get_deterministic_hash(include_signature=False)
+        if state_hash != self._density_memo['state_hash']:
+            self._density_memo['state_hash'] = state_hash
+            self._density_memo['densities'] = {}
+        return self._density_memo['densities']
+
+    def _density(self, shard_id: str, harmonic_state: 'TokenStateBundle', densities: Dict[str, BigNum128]) -> BigNum128:
+        density = densities.get(shard_id)
+        if density is None:
+            density = self._compute_psi_density(shard_id, harmonic_state)
+            densities[shard_id] = density
+        return density
+
+    def _compute_psi_density(self, shard_id: str, harmonic_state: 'TokenStateBundle') -> BigNum128:
+        """Uncached ψ-density for one shard."""
         shards = harmonic_state.chr_state.get('shards', {})
         if shard_id not in shards:
             evidence = {'shard_id': shard_id, 'available_shards': list(shards.keys())}
@@ -204,22 +418,25 @@ class DiscretePsiField:
         atr_val = self.certified_math.clamp(shard['ATR'], 0, SecurityThresholds.MAX_ATR_VALUE)
         dissonance = max(0, shard.get('DISSONANCE', 0))
         dissonance = min(dissonance, SecurityThresholds.MAX_DISSONANCE)
+        denominator = 1 + dissonance
         try:
             numerator = self.certified_math.checked_mul(chr_val, atr_val)
-            denominator = 1 + dissonance
             return self.certified_math.checked_div(numerator, denominator)
         except OverflowError:
-            safe_chr = chr_val // 1000
-            safe_atr = atr_val // 1000
+            safe_chr = chr_val.value // 1000
+            safe_atr = atr_val.value // 1000
             safe_numerator = safe_chr * safe_atr
-            return safe_numerator // max(1, denominator // 1000)
+            return BigNum128(min(safe_numerator // max(1, denominator // 1000), BigNum128.MAX_VALUE))
 
     def psi_gradient(self, i: str, j: str, harmonic_state: TokenStateBundle) -> int:
         """Compute ψ-gradient with connection validation and bounds checking."""
+        return self._gradient(i, j, harmonic_state, self._densities_for(harmonic_state))
+
+    def _gradient(self, i: str, j: str, harmonic_state: TokenStateBundle, densities: Dict[str, BigNum128]) -> BigNum128:
         if j not in self.graph.get(i, set()):
             raise ValueError(f'Shards {i} and {j} not connected')
-        psi_i = self.psi_density(i, harmonic_state)
-        psi_j = self.psi_density(j, harmonic_state)
+        psi_i = self._density(i, harmonic_state, densities)
+        psi_j = self._density(j, harmonic_state, densities)
         return self.certified_math.checked_sub(psi_j, psi_i)
 
     def directional_psi_flux(self, i: str, j: str, harmonic_state: TokenStateBundle) -> int:
@@ -233,41 +450,101 @@ class DiscretePsiField:
         flux_ji = flow_matrix.get((j, i), 0)
         return self.certified_math.checked_sub(flux_ij, flux_ji)
 
-    def psi_curl_around_cycle(self, cycle: List[str], harmonic_state: TokenStateBundle) -> int:
+    def psi_curl_around_cycle(self, cycle: List[str], harmonic_state: TokenStateBundle) -> BigNum128:
         """
         HARDENED ψ-curl computation with cycle validation.
-        Uses consistent edge direction around cycle.
+        Uses consistent edge direction around cycle; invalid cycles have curl 0.
         """
         if len(cycle) < 3 or len(cycle) > self.MAX_CYCLE_LENGTH:
-            return 0
+            return BigNum128(0)
         if len(cycle) != len(set(cycle)):
-            return 0
-        total_curl = 0
+            return BigNum128(0)
+        densities = self._densities_for(harmonic_state)
+        total_curl = BigNum128(0)
         n = len(cycle)
         try:
             for idx in range(n):
                 u = cycle[idx]
                 v = cycle[(idx + 1) % n]
                 if v not in self.graph.get(u, set()):
-                    return 0
-                grad = self.psi_gradient(u, v, harmonic_state)
+                    return BigNum128(0)
+                grad = self._gradient(u, v, harmonic_state, densities)
                 total_curl = self.certified_math.checked_add(total_curl, grad)
             return total_curl
         except (ValueError, OverflowError):
-            return 0
+            return BigNum128(0)
 
-    def compute_psi_curls_with_anomaly_detection(self, harmonic_state: TokenStateBundle) -> Tuple[List[Tuple[List[str], int]], List[str]]:
+    def _get_cycle_incidence(self, cycle: List[str]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Edge-incidence row for a cycle: (edge index, orientation) per traversed edge.
+
+        Orientation is +1 when the cycle walks the canonical edge (u, v), u < v,
+        forwards and -1 otherwise. Returns None for cycles that are not valid
+        closed walks over existing edges (their curl is 0).
+        """
+        key = tuple(cycle)
+        if key in self._cycle_incidence:
+            return self._cycle_incidence[key]
+        row: Optional[List[Tuple[int, int]]] = []
+        n = len(cycle)
+        if n < 3 or n > self.MAX_CYCLE_LENGTH or n != len(set(cycle)):
+            row = None
+        else:
+            for idx in range(n):
+                u = cycle[idx]
+                v = cycle[(idx + 1) % n]
+                edge = (u, v) if u < v else (v, u)
+                if edge not in self.edge_index:
+                    row = None
+                    break
+                row.append((self.edge_index[edge], 1 if u < v else -1))
+        self._cycle_incidence[key] = row
+        return row
+
+    def compute_all_psi_curls(self, harmonic_state: TokenStateBundle) -> List[Tuple[List[str], BigNum128]]:
+        """
+        Compute ψ-curls for every basis cycle in one pass.
+
+        Each edge gradient ψ(v) - ψ(u) is evaluated once from the density cache;
+        every cycle's curl is then the signed sum of its incidence row. Matches
+        psi_curl_around_cycle: a cycle that traverses an edge against a negative
+        gradient (checked_sub underflow) or overflows the sum has curl 0.
+        """
+        cycles = sorted(self.cycle_basis)
+        rows = [self._get_cycle_incidence(cycle) for cycle in cycles]
+        densities = self._densities_for(harmonic_state)
+        gradients: Dict[int, int] = {}
+        for row in rows:
+            for edge_idx, _ in row or ():
+                if edge_idx not in gradients:
+                    u, v = self.edges[edge_idx]
+                    gradients[edge_idx] = self._density(v, harmonic_state, densities).value - self._density(u, harmonic_state, densities).value
+        curls = []
+        for cycle, row in zip(cycles, rows):
+            curl_val = BigNum128(0)
+            if row is not None:
+                total = 0
+                for edge_idx, orientation in row:
+                    step = orientation * gradients[edge_idx]
+                    if step < 0:
+                        total = None
+                        break
+                    total += step
+                if total is not None and total <= BigNum128.MAX_VALUE:
+                    curl_val = BigNum128(total)
+            curls.append((cycle, curl_val))
+        return curls
+
+    def compute_psi_curls_with_anomaly_detection(self, harmonic_state: TokenStateBundle) -> Tuple[List[Tuple[List[str], BigNum128]], List[str]]:
         """
         Compute all ψ-curls with anomaly detection and Byzantine alerts.
         Returns (curls, anomalies)
         """
         if not self.verify_cycle_basis_integrity():
             raise SecurityError('Cycle basis integrity compromised')
-        curls = []
+        curls = self.compute_all_psi_curls(harmonic_state)
         anomalies = []
-        for cycle in sorted(self.cycle_basis):
-            curl_val = self.psi_curl_around_cycle(cycle, harmonic_state)
-            curls.append((cycle, curl_val))
+        for cycle, curl_val in curls:
             curl_mag = self.certified_math.abs(curl_val)
             if curl_mag > 1000000:
                 anomalies.append(f'SUSPICIOUS_CURL: Cycle {cycle} has magnitude {curl_mag}')
@@ -282,6 +559,7 @@ class DiscretePsiField:
         """
         shard_syncs = {}
         shards = harmonic_state.chr_state.get('shards', {})
+        densities = self._densities_for(harmonic_state)
         for shard_id in sorted(self.shard_ids):
             shard = shards[shard_id]
             chr_val = shard['CHR']
@@ -289,10 +567,10 @@ class DiscretePsiField:
             atr_val = shard['ATR']
             sync_simple = self.certified_math.mul(chr_val, atr_val)
             sync_resonant = self.certified_math.mul(sync_simple, self.certified_math.add(1, res_val // 1000))
-            shard_syncs[shard_id] = {'simple': sync_simple, 'resonant': sync_resonant, 'density_based': self.psi_density(shard_id, harmonic_state)}
-        total_simple = sum((s['simple'] for s in shard_syncs.values()))
-        total_resonant = sum((s['resonant'] for s in shard_syncs.values()))
-        sync_values = [s['simple'] for s in shard_syncs.values()]
+            shard_syncs[shard_id] = {'simple': sync_simple, 'resonant': sync_resonant, 'density_based': self._density(shard_id, harmonic_state, densities)}
+        total_simple = sum((_raw(s['simple']) for s in shard_syncs.values()))
+        total_resonant = sum((_raw(s['resonant']) for s in shard_syncs.values()))
+        sync_values = [_raw(s['simple']) for s in shard_syncs.values()]
         avg_sync = total_simple // len(sync_values)
         variance = sum(((v - avg_sync) ** 2 for v in sync_values)) // len(sync_values)
         return {'total_simple_sync': total_simple, 'total_resonant_sync': total_resonant, 'average_sync': avg_sync, 'sync_variance': variance, 'shard_syncs': shard_syncs}
@@ -315,12 +593,13 @@ class DiscretePsiField:
         self.verify_cycle_basis_integrity()
         validation_result = {'psi_densities': {}, 'psi_gradients': {}, 'psi_curls': [], 'psi_sync': {}, 'anomalies': [], 'violations': [], 'security_checks_passed': True, 'max_curl_magnitude': 0}
         try:
+            densities = self._densities_for(harmonic_state)
             for shard in sorted(self.shard_ids):
-                validation_result['psi_densities'][shard] = self.psi_density(shard, harmonic_state)
+                validation_result['psi_densities'][shard] = self._density(shard, harmonic_state, densities)
             for i in sorted(self.shard_ids):
                 for j in sorted(self.graph[i]):
                     if i < j:
-                        grad = self.psi_gradient(i, j, harmonic_state)
+                        grad = self._gradient(i, j, harmonic_state, densities)
                         validation_result['psi_gradients'][i, j] = grad
             curls, anomalies = self.compute_psi_curls_with_anomaly_detection(harmonic_state)
             validation_result['psi_curls'] = curls
@@ -366,7 +645,7 @@ def generate_psi_field_evidence(field_engine: DiscretePsiField, harmonic_state:
     Generate comprehensive evidence package for Phase3EvidenceBuilder.
     """
     validation_result = field_engine.validate_psi_field_integrity(harmonic_state, delta_curl_threshold)
-    evidence = {'psi_field_validation': validation_result, 'topology_metrics': {'shard_count': len(field_engine.shard_ids), 'total_edges': sum((len(neighbors) for neighbors in field_engine.graph.values())) // 2, 'cycle_basis_size': len(field_engine.cycle_basis), 'cycle_basis_hash': field_engine.cycle_basis_hash}, 'computation_bounds': {'max_cycle_length': field_engine.MAX_CYCLE_LENGTH, 'max_cycles_per_shard': field_engine.MAX_CYCLES_PER_SHARD, 'max_edges_per_shard': field_engine.MAX_EDGES_PER_SHARD}, 'security_status': {'cycle_basis_integrity': field_engine.verify_cycle_basis_integrity(), 'anomalies_detected': len(validation_result['anomalies']), 'violations_detected': len(validation_result['violations'])}}
+    evidence = {'psi_field_validation': validation_result, 'topology_metrics': {'shard_count': len(field_engine.shard_ids), 'total_edges': sum((len(neighbors) for neighbors in field_engine.graph.values())) // 2, 'cycle_basis_size': len(field_engine.cycle_basis), 'cycle_basis_hash': field_engine.cycle_basis_hash, 'cycle_basis_version': field_engine.CYCLE_BASIS_VERSION}, 'computation_bounds': {'max_cycle_length': field_engine.MAX_CYCLE_LENGTH, 'max_cycles_per_shard': field_engine.MAX_CYCLES_PER_SHARD, 'max_edges_per_shard': field_engine.MAX_EDGES_PER_SHARD}, 'security_status': {'cycle_basis_integrity': field_engine.verify_cycle_basis_integrity(), 'anomalies_detected': len(validation_result['anomalies']), 'violations_detected': len(validation_result['violations'])}}
     return evidence
 if __name__ == '__main__':
     pass
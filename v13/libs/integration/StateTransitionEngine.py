@@ -5,7 +5,7 @@ Implements the StateTransitionEngine class for atomically applying token state c
 after validation and reward distribution, maintaining full auditability.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Set
 from dataclasses import dataclass
 
 from v13.libs.CertifiedMath import CertifiedMath
@@ -18,6 +18,23 @@ from v13.libs.governance.NODInvariantChecker import (
 )
 
 
+# (token name, TokenStateBundle attribute, AllocatedReward attribute)
+REWARD_TOKENS = (
+    ("CHR", "chr_state", "chr_amount"),
+    ("FLX", "flx_state", "flx_amount"),
+    ("PsiSync", "psi_sync_state", "psi_sync_amount"),
+    ("ATR", "atr_state", "atr_amount"),
+    ("RES", "res_state", "res_amount"),
+)
+
+# Tokens whose supply deltas are checked by EconomicsGuard
+SUPPLY_CHECKED_TOKENS = ("CHR", "FLX", "RES")
+
+# Lower-bound violations can clear as later chunks add to the cumulative delta,
+# so they are only enforced once the whole epoch has been folded in
+LOWER_BOUND_VIOLATIONS = frozenset({"ECON_CHR_REWARD_BELOW_MIN"})
+
+
 @dataclass
 class StateTransitionResult:
     """Result of a state transition operation"""
@@ -93,42 +110,11 @@ class StateTransitionEngine:
                     raise ValueError(
                         f"[GUARD] NOD transfer firewall violation: NOD deltas only allowed from NODAllocator or governance (context: {call_context})"
                     )
-            new_chr_state = self._apply_rewards_to_token_state(
-                current_token_bundle.chr_state,
-                "CHR",
-                allocated_rewards,
-                log_list,
-                pqc_cid,
-                quantum_metadata,
-            )
-            new_flx_state = self._apply_rewards_to_token_state(
-                current_token_bundle.flx_state,
-                "FLX",
-                allocated_rewards,
-                log_list,
-                pqc_cid,
-                quantum_metadata,
-            )
-            new_psi_sync_state = self._apply_rewards_to_token_state(
-                current_token_bundle.psi_sync_state,
-                "PsiSync",
-                allocated_rewards,
-                log_list,
-                pqc_cid,
-                quantum_metadata,
-            )
-            new_atr_state = self._apply_rewards_to_token_state(
-                current_token_bundle.atr_state,
-                "ATR",
-                allocated_rewards,
-                log_list,
-                pqc_cid,
-                quantum_metadata,
-            )
-            new_res_state = self._apply_rewards_to_token_state(
-                current_token_bundle.res_state,
-                "RES",
-                allocated_rewards,
+            reward_totals = self._sum_reward_totals(allocated_rewards)
+            new_states = self._apply_reward_totals(
+                current_token_bundle,
+                reward_totals,
+                len(allocated_rewards),
                 log_list,
                 pqc_cid,
                 quantum_metadata,
@@ -142,21 +128,13 @@ class StateTransitionEngine:
                 new_nod_state = self._apply_nod_allocations(
                     new_nod_state, nod_allocations, log_list, pqc_cid, quantum_metadata
                 )
-            new_token_bundle = create_token_state_bundle(
-                chr_state=new_chr_state,
-                flx_state=new_flx_state,
-                psi_sync_state=new_psi_sync_state,
-                atr_state=new_atr_state,
-                res_state=new_res_state,
-                nod_state=new_nod_state,
-                lambda1=current_token_bundle.lambda1,
-                lambda2=current_token_bundle.lambda2,
-                c_crit=current_token_bundle.c_crit,
-                pqc_cid=pqc_cid or current_token_bundle.pqc_cid,
-                timestamp=deterministic_timestamp,
-                quantum_metadata=quantum_metadata
-                or current_token_bundle.quantum_metadata,
-                parameters=current_token_bundle.parameters,
+            new_token_bundle = self._build_token_bundle(
+                current_token_bundle,
+                new_states,
+                new_nod_state,
+                pqc_cid,
+                quantum_metadata,
+                deterministic_timestamp,
             )
             if nod_allocations is not None and len(nod_allocations) > 0:
                 old_nod_state = (
@@ -219,7 +197,7 @@ class StateTransitionEngine:
             self._log_state_transition(
                 current_token_bundle,
                 new_token_bundle,
-                allocated_rewards,
+                len(allocated_rewards),
                 nod_allocations,
                 log_list,
                 pqc_cid,
@@ -235,7 +213,7 @@ class StateTransitionEngine:
             self._log_state_transition_error(
                 str(e),
                 current_token_bundle,
-                allocated_rewards,
+                len(allocated_rewards),
                 log_list,
                 pqc_cid,
                 quantum_metadata,
@@ -248,54 +226,268 @@ class StateTransitionEngine:
                 quantum_metadata=quantum_metadata,
             )
 
-    def _apply_rewards_to_token_state(
+    def apply_epoch_transitions(
         self,
-        current_state: Dict[str, Any],
-        token_type: str,
-        allocated_rewards: Dict[str, AllocatedReward],
+        current_token_bundle: TokenStateBundle,
+        reward_chunks: Iterable[Dict[str, AllocatedReward]],
         log_list: List[Dict[str, Any]],
         pqc_cid: Optional[str] = None,
         quantum_metadata: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        deterministic_timestamp: int = 0,
+    ) -> StateTransitionResult:
+        """
+        Apply an epoch's user rewards chunk by chunk.
+
+        Each chunk is folded into running per-token totals and the cumulative
+        CHR/FLX/RES supply deltas are checked against their upper bounds after
+        every chunk, so a violating epoch fails at the first offending chunk
+        instead of after the full set. Lower bounds are checked once at the end.
+        The resulting bundle is identical to a single apply_state_transition
+        call over the union of all chunks. Chunk address sets must be
+        disjoint; an address repeated in a later chunk fails the transition.
+
+        Args:
+            current_token_bundle: Current token state bundle
+            reward_chunks: Iterable of allocated-reward dicts (see iter_reward_chunks)
+            log_list: Audit log list for deterministic operations
+            pqc_cid: PQC correlation ID for audit trail
+            quantum_metadata: Quantum metadata for audit trail
+            deterministic_timestamp: Deterministic timestamp from DRV_Packet
+
+        Returns:
+            StateTransitionResult: Result of the state transition operation
+        """
+        recipient_count = 0
+        applied_addresses: Set[str] = set()
+        try:
+            reward_totals = {token: 0 for token, _, _ in REWARD_TOKENS}
+            old_balances = {
+                token: BigNum128.from_string(
+                    str(getattr(current_token_bundle, state_attr).get("balance", "0"))
+                )
+                for token, state_attr, _ in REWARD_TOKENS
+            }
+            for chunk in reward_chunks:
+                repeated = sorted(applied_addresses.intersection(chunk))
+                if repeated:
+                    raise ValueError(
+                        f"[GUARD] Reward chunks overlap: {len(repeated)} address(es) already applied in this epoch (first: {repeated[0]})"
+                    )
+                applied_addresses.update(chunk)
+                chunk_totals = self._sum_reward_totals(chunk)
+                for token in reward_totals:
+                    reward_totals[token] += chunk_totals[token]
+                recipient_count += len(chunk)
+                self._check_cumulative_supply_deltas(
+                    old_balances,
+                    reward_totals,
+                    log_list,
+                    deterministic_timestamp,
+                    final=False,
+                )
+            self._check_cumulative_supply_deltas(
+                old_balances, reward_totals, log_list, deterministic_timestamp
+            )
+            new_states = self._apply_reward_totals(
+                current_token_bundle,
+                reward_totals,
+                recipient_count,
+                log_list,
+                pqc_cid,
+                quantum_metadata,
+            )
+            new_nod_state = (
+                current_token_bundle.nod_state.copy()
+                if hasattr(current_token_bundle, "nod_state")
+                else {"balance": "0"}
+            )
+            new_token_bundle = self._build_token_bundle(
+                current_token_bundle,
+                new_states,
+                new_nod_state,
+                pqc_cid,
+                quantum_metadata,
+                deterministic_timestamp,
+            )
+            self._log_state_transition(
+                current_token_bundle,
+                new_token_bundle,
+                recipient_count,
+                None,
+                log_list,
+                pqc_cid,
+                quantum_metadata,
+                deterministic_timestamp,
+            )
+            return StateTransitionResult(
+                success=True,
+                new_token_bundle=new_token_bundle,
+                quantum_metadata=quantum_metadata,
+            )
+        except Exception as e:
+            self._log_state_transition_error(
+                str(e),
+                current_token_bundle,
+                recipient_count,
+                log_list,
+                pqc_cid,
+                quantum_metadata,
+                deterministic_timestamp,
+            )
+            return StateTransitionResult(
+                success=False,
+                new_token_bundle=None,
+                error_message=str(e),
+                quantum_metadata=quantum_metadata,
+            )
+
+    @staticmethod
+    def iter_reward_chunks(
+        allocated_rewards: Dict[str, AllocatedReward], chunk_size: int
+    ) -> Iterator[Dict[str, AllocatedReward]]:
+        """
+        Split allocated rewards into address-sorted chunks of at most chunk_size.
+
+        Args:
+            allocated_rewards: Rewards allocated to addresses
+            chunk_size: Maximum number of addresses per chunk
+
+        Yields:
+            Dict[str, AllocatedReward]: One chunk of rewards
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        addresses = sorted(allocated_rewards)
+        for start in range(0, len(addresses), chunk_size):
+            yield {
+                address: allocated_rewards[address]
+                for address in addresses[start : start + chunk_size]
+            }
+
+    def _sum_reward_totals(
+        self, allocated_rewards: Dict[str, AllocatedReward]
+    ) -> Dict[str, int]:
         """
-        Apply rewards to a specific token state.
+        Sum all five token rewards in one pass over the recipients.
+
+        Totals are raw BigNum128 integer values, so the sum does not depend on
+        iteration order; all amounts are non-negative, so a single overflow
+        check on the final balance covers every partial sum.
 
         Args:
-            current_state: Current token state dictionary
-            token_type: Type of token (CHR, FLX, etc.)
             allocated_rewards: Allocated rewards per address
+
+        Returns:
+            Dict[str, int]: Raw reward total per token
+        """
+        chr_total = flx_total = psi_sync_total = atr_total = res_total = 0
+        for alloc in allocated_rewards.values():
+            chr_total += alloc.chr_amount.value
+            flx_total += alloc.flx_amount.value
+            psi_sync_total += alloc.psi_sync_amount.value
+            atr_total += alloc.atr_amount.value
+            res_total += alloc.res_amount.value
+        return {
+            "CHR": chr_total,
+            "FLX": flx_total,
+            "PsiSync": psi_sync_total,
+            "ATR": atr_total,
+            "RES": res_total,
+        }
+
+    def _build_token_bundle(
+        self,
+        current_bundle: TokenStateBundle,
+        new_states: Dict[str, Dict[str, Any]],
+        new_nod_state: Dict[str, Any],
+        pqc_cid: Optional[str],
+        quantum_metadata: Optional[Dict[str, Any]],
+        deterministic_timestamp: int,
+    ) -> TokenStateBundle:
+        """
+        Build the post-transition bundle, carrying over the current bundle's
+        lambdas, c_crit and parameters.
+
+        Args:
+            current_bundle: Token state bundle before the transition
+            new_states: New CHR/FLX/PsiSync/ATR/RES states (see _apply_reward_totals)
+            new_nod_state: New NOD state
+            pqc_cid: PQC correlation ID (defaults to the current bundle's)
+            quantum_metadata: Quantum metadata (defaults to the current bundle's)
+            deterministic_timestamp: Deterministic timestamp from DRV_Packet
+
+        Returns:
+            TokenStateBundle: The new token state bundle
+        """
+        return create_token_state_bundle(
+            chr_state=new_states["CHR"],
+            flx_state=new_states["FLX"],
+            psi_sync_state=new_states["PsiSync"],
+            atr_state=new_states["ATR"],
+            res_state=new_states["RES"],
+            nod_state=new_nod_state,
+            lambda1=current_bundle.lambda1,
+            lambda2=current_bundle.lambda2,
+            c_crit=current_bundle.c_crit,
+            pqc_cid=pqc_cid or current_bundle.pqc_cid,
+            timestamp=deterministic_timestamp,
+            quantum_metadata=quantum_metadata or current_bundle.quantum_metadata,
+            parameters=current_bundle.parameters,
+        )
+
+    def _apply_reward_totals(
+        self,
+        current_bundle: TokenStateBundle,
+        reward_totals: Dict[str, int],
+        recipient_count: int,
+        log_list: List[Dict[str, Any]],
+        pqc_cid: Optional[str] = None,
+        quantum_metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Add per-token reward totals to the token balances.
+
+        Emits one compact "reward_batch_add" audit record per token instead
+        of one logged addition per recipient.
+
+        Args:
+            current_bundle: Current token state bundle
+            reward_totals: Raw reward total per token
+            recipient_count: Number of rewarded addresses
             log_list: Audit log list
             pqc_cid: PQC correlation ID
             quantum_metadata: Quantum metadata
 
         Returns:
-            Dict[str, Any]: Updated token state
+            Dict[str, Dict[str, Any]]: Updated token state per token
         """
-        new_state = current_state.copy()
-        current_balance_str = str(current_state.get("balance", "0"))
-        current_balance = BigNum128.from_string(current_balance_str)
-        total_reward = BigNum128(0)
-        for alloc in [allocated_rewards[k] for k in sorted(allocated_rewards)]:
-            if token_type == "CHR":
-                reward_amount = alloc.chr_amount
-            elif token_type == "FLX":
-                reward_amount = alloc.flx_amount
-            elif token_type == "RES":
-                reward_amount = alloc.res_amount
-            elif token_type == "PsiSync":
-                reward_amount = alloc.psi_sync_amount
-            elif token_type == "ATR":
-                reward_amount = alloc.atr_amount
-            else:
-                reward_amount = BigNum128(0)
-            total_reward = self.cm.add(
-                total_reward, reward_amount, log_list, pqc_cid, quantum_metadata
+        new_states: Dict[str, Dict[str, Any]] = {}
+        for token_type, state_attr, _ in REWARD_TOKENS:
+            current_state = getattr(current_bundle, state_attr)
+            new_state = current_state.copy()
+            current_balance = BigNum128.from_string(
+                str(current_state.get("balance", "0"))
             )
-        new_balance = self.cm.add(
-            current_balance, total_reward, log_list, pqc_cid, quantum_metadata
-        )
-        new_state["balance"] = new_balance.to_decimal_string()
-        return new_state
+            new_value = current_balance.value + reward_totals[token_type]
+            if new_value > BigNum128.MAX_VALUE:
+                raise OverflowError("CertifiedMath add overflow")
+            new_balance = BigNum128(new_value)
+            self.cm._log_operation(
+                "reward_batch_add",
+                {
+                    "token": token_type,
+                    "balance": current_balance,
+                    "total_reward": BigNum128(reward_totals[token_type]),
+                    "recipients": recipient_count,
+                },
+                new_balance,
+                log_list,
+                pqc_cid,
+                quantum_metadata,
+            )
+            new_state["balance"] = new_balance.to_decimal_string()
+            new_states[token_type] = new_state
+        return new_states
 
     def _apply_nod_allocations(
         self,
@@ -370,49 +562,119 @@ class StateTransitionEngine:
             supply_delta = self.cm.sub(new_balance, old_balance, log_list, None, None)
             if supply_delta.value == 0:
                 continue
-            if token_name == "CHR":
-                validation = self.economics_guard.validate_chr_reward(
-                    reward_amount=supply_delta,
-                    current_daily_total=BigNum128(0),  # Placeholder
-                    current_total_supply=new_balance,
-                    log_list=log_list,
-                )
-            elif token_name == "FLX":
-                validation = self.economics_guard.validate_flx_reward(
-                    flx_amount=supply_delta,
-                    chr_reward=BigNum128(0),  # Placeholder
-                    user_current_balance=new_balance,
-                    log_list=log_list,
-                )
-            elif token_name == "RES":
-                validation = self.economics_guard.validate_res_reward(
-                    res_reward=supply_delta,
-                    current_total_supply=new_balance,
-                    log_list=log_list,
-                )
-            else:
+            self._check_supply_delta(
+                token_name,
+                supply_delta,
+                new_balance,
+                log_list,
+                deterministic_timestamp,
+            )
+
+    def _check_cumulative_supply_deltas(
+        self,
+        old_balances: Dict[str, BigNum128],
+        reward_totals: Dict[str, int],
+        log_list: List[Dict[str, Any]],
+        deterministic_timestamp: int,
+        final: bool = True,
+    ) -> None:
+        """
+        Validate the running CHR/FLX/RES supply deltas of a chunked transition.
+
+        Args:
+            old_balances: Token balances before the transition
+            reward_totals: Cumulative raw reward total per token
+            log_list: Audit log list
+            deterministic_timestamp: Deterministic timestamp
+            final: False while chunks remain (lower bounds are not enforced)
+
+        Raises:
+            ValueError: If any supply delta violates economic bounds
+            OverflowError: If a new balance exceeds BigNum128 range
+        """
+        for token_name in SUPPLY_CHECKED_TOKENS:
+            if reward_totals[token_name] == 0:
                 continue
-            if not validation.passed:
-                log_list.append(
-                    {
-                        "operation": "state_transition_supply_delta_violation",
-                        "token": token_name,
-                        "supply_delta": supply_delta.to_decimal_string(),
-                        "error_code": validation.error_code,
-                        "error_message": validation.error_message,
-                        "details": validation.details,
-                        "timestamp": deterministic_timestamp,
-                    }
-                )
-                raise ValueError(
-                    f"[GUARD] {token_name} supply delta violation: {validation.error_message} (code: {validation.error_code})"
-                )
+            new_value = old_balances[token_name].value + reward_totals[token_name]
+            if new_value > BigNum128.MAX_VALUE:
+                raise OverflowError("CertifiedMath add overflow")
+            self._check_supply_delta(
+                token_name,
+                BigNum128(reward_totals[token_name]),
+                BigNum128(new_value),
+                log_list,
+                deterministic_timestamp,
+                final=final,
+            )
+
+    def _check_supply_delta(
+        self,
+        token_name: str,
+        supply_delta: BigNum128,
+        new_balance: BigNum128,
+        log_list: List[Dict[str, Any]],
+        deterministic_timestamp: int,
+        final: bool = True,
+    ) -> None:
+        """
+        Validate one token's supply delta against its EconomicsGuard bound.
+
+        Args:
+            token_name: Token name (CHR, FLX or RES)
+            supply_delta: Increase in total supply
+            new_balance: Total supply after the increase
+            log_list: Audit log list
+            deterministic_timestamp: Deterministic timestamp
+            final: If False, lower-bound violations are tolerated
+
+        Raises:
+            ValueError: If the supply delta violates economic bounds
+        """
+        if token_name == "CHR":
+            validation = self.economics_guard.validate_chr_reward(
+                reward_amount=supply_delta,
+                current_daily_total=BigNum128(0),  # Placeholder
+                current_total_supply=new_balance,
+                log_list=log_list,
+            )
+        elif token_name == "FLX":
+            validation = self.economics_guard.validate_flx_reward(
+                flx_amount=supply_delta,
+                chr_reward=BigNum128(0),  # Placeholder
+                user_current_balance=new_balance,
+                log_list=log_list,
+            )
+        elif token_name == "RES":
+            validation = self.economics_guard.validate_res_reward(
+                res_reward=supply_delta,
+                current_total_supply=new_balance,
+                log_list=log_list,
+            )
+        else:
+            return
+        if not final and validation.error_code in LOWER_BOUND_VIOLATIONS:
+            return
+        if not validation.passed:
+            log_list.append(
+                {
+                    "operation": "state_transition_supply_delta_violation",
+                    "token": token_name,
+                    "supply_delta": supply_delta.to_decimal_string(),
+                    "error_code": validation.error_code,
+                    "error_message": validation.error_message,
+                    "details": validation.details,
+                    "timestamp": deterministic_timestamp,
+                }
+            )
+            raise ValueError(
+                f"[GUARD] {token_name} supply delta violation: {validation.error_message} (code: {validation.error_code})"
+            )
 
     def _log_state_transition(
         self,
         old_bundle: TokenStateBundle,
         new_bundle: TokenStateBundle,
-        allocated_rewards: Dict[str, AllocatedReward],
+        allocated_rewards_count: int,
         nod_allocations: Optional[Dict[str, BigNum128]],
         log_list: List[Dict[str, Any]],
         pqc_cid: Optional[str] = None,
@@ -425,7 +687,7 @@ class StateTransitionEngine:
         Args:
             old_bundle: Old token state bundle
             new_bundle: New token state bundle
-            allocated_rewards: Allocated rewards
+            allocated_rewards_count: Number of rewarded addresses
             log_list: Audit log list
             pqc_cid: PQC correlation ID
             quantum_metadata: Quantum metadata
@@ -437,7 +699,7 @@ class StateTransitionEngine:
                 "operation": "state_transition",
                 "old_bundle_hash": old_bundle.get_deterministic_hash(),
                 "new_bundle_hash": new_bundle.get_deterministic_hash(),
-                "allocated_rewards_count": len(allocated_rewards),
+                "allocated_rewards_count": allocated_rewards_count,
                 "nod_allocations_count": len(nod_allocations) if nod_allocations else 0,
                 "timestamp": deterministic_timestamp,
             },
@@ -451,7 +713,7 @@ class StateTransitionEngine:
         self,
         error_message: str,
         current_bundle: TokenStateBundle,
-        allocated_rewards: Dict[str, AllocatedReward],
+        allocated_rewards_count: int,
         log_list: List[Dict[str, Any]],
         pqc_cid: Optional[str] = None,
         quantum_metadata: Optional[Dict[str, Any]] = None,
@@ -463,7 +725,7 @@ class StateTransitionEngine:
         Args:
             error_message: Error message
             current_bundle: Current token state bundle
-            allocated_rewards: Allocated rewards
+            allocated_rewards_count: Number of rewarded addresses
             log_list: Audit log list
             pqc_cid: PQC correlation ID
             quantum_metadata: Quantum metadata
@@ -473,7 +735,7 @@ class StateTransitionEngine:
             "operation": "state_transition_error",
             "bundle_id": current_bundle.get_deterministic_hash(),
             "error_message": error_message,
-            "allocated_rewards_count": len(allocated_rewards),
+            "allocated_rewards_count": allocated_rewards_count,
             "timestamp": deterministic_timestamp,
         }
         self.cm._log_operation(
@@ -3,10 +3,37 @@ PolicyRegistry.py - Registry for managing and retrieving historical policy confi
 
 Allows 'time-travel' retrieval of policy rules based on epoch, ensuring that
 explanations are always generated using the policy version active at the time of the event.
+
+Policies are frozen into immutable snapshots when registered, so lookups can hand
+out the same object to every caller instead of deep-copying it per call.
 """
-from typing import Dict, Any, Optional
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple
 import copy
 
+
+def freeze_policy(policy_config: Any) -> Any:
+    """
+    Return an immutable snapshot of a policy configuration.
+
+    Dicts become read-only mappings, lists/tuples become tuples and sets become
+    frozensets (recursively). Other values are deep-copied once so later mutation
+    of the caller's object cannot leak into the registry.
+    """
+    if isinstance(policy_config, MappingProxyType):
+        return policy_config
+    if isinstance(policy_config, dict):
+        return MappingProxyType({k: freeze_policy(v) for k, v in policy_config.items()})
+    if isinstance(policy_config, (list, tuple)):
+        return tuple((freeze_policy(v) for v in policy_config))
+    if isinstance(policy_config, (set, frozenset)):
+        return frozenset((freeze_policy(v) for v in policy_config))
+    if isinstance(policy_config, (str, bytes, int, float, bool, type(None))):
+        return policy_config
+    return copy.deepcopy(policy_config)
+
+
 class PolicyRegistry:
     """
     Central registry for QFS Policies (Economics, Content, Storage).
@@ -17,6 +44,9 @@ class PolicyRegistry:
     def __init__(self):
         self.history: Dict[str, Dict[int, Any]] = {}
         self.active_policies: Dict[str, Any] = {}
+        self._timelines: Dict[str, List[int]] = {}
+        self._snapshots: Dict[str, List[Any]] = {}
+        self._epoch_memo: Dict[Tuple[str, int], Any] = {}
 
     @classmethod
     def get_instance(cls):
@@ -28,31 +58,47 @@ class PolicyRegistry:
         """
         Register a policy configuration starting at a specific epoch.
         """
+        snapshot = freeze_policy(policy_config)
         if policy_type not in self.history:
             self.history[policy_type] = {}
-        self.history[policy_type][start_epoch] = policy_config
-        latest_epoch = max(self.history[policy_type].keys())
-        if start_epoch == latest_epoch:
-            self.active_policies[policy_type] = policy_config
+            self._timelines[policy_type] = []
+            self._snapshots[policy_type] = []
+        self.history[policy_type][start_epoch] = snapshot
+        timeline = self._timelines[policy_type]
+        snapshots = self._snapshots[policy_type]
+        index = bisect_right(timeline, start_epoch)
+        if index > 0 and timeline[index - 1] == start_epoch:
+            snapshots[index - 1] = snapshot
+        else:
+            timeline.insert(index, start_epoch)
+            snapshots.insert(index, snapshot)
+        if start_epoch == timeline[-1]:
+            self.active_policies[policy_type] = snapshot
+        self._invalidate_memo(policy_type)
 
     def get_policy_for_epoch(self, policy_type: str, epoch: int) -> Optional[Any]:
         """
-        Retrieve the policy configuration active at `epoch`.
-        Walks backwards from `epoch` to find the nearest start_epoch <= epoch.
+        Retrieve the policy snapshot active at `epoch`.
+        Finds the nearest start_epoch <= epoch by bisecting the sorted timeline;
+        resolved lookups are memoized per (policy_type, epoch).
         """
-        if policy_type not in self.history:
+        key = (policy_type, epoch)
+        if key in self._epoch_memo:
+            return self._epoch_memo[key]
+        timeline = self._timelines.get(policy_type)
+        if not timeline:
             return None
-        timeline = sorted(self.history[policy_type].keys())
-        effective_epoch = None
-        for start_epoch in sorted(timeline):
-            if start_epoch <= epoch:
-                effective_epoch = start_epoch
-            else:
-                break
-        if effective_epoch is None:
-            return None
-        return copy.deepcopy(self.history[policy_type][effective_epoch])
+        index = bisect_right(timeline, epoch)
+        policy = self._snapshots[policy_type][index - 1] if index > 0 else None
+        self._epoch_memo[key] = policy
+        return policy
 
     def get_active_policy(self, policy_type: str) -> Optional[Any]:
-        """Get the currently active policy."""
-        return copy.deepcopy(self.active_policies.get(policy_type))
\ No newline at end of file
+        """Get the currently active policy snapshot."""
+        return self.active_policies.get(policy_type)
+
+    def _invalidate_memo(self, policy_type: str) -> None:
+        """Drop memoized lookups for a policy type after its timeline changes."""
+        stale = [key for key in self._epoch_memo if key[0] == policy_type]
+        for key in stale:
+            del self._epoch_memo[key]
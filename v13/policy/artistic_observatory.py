@@ -5,10 +5,10 @@ This module provides an observability layer that aggregates and analyzes AES sig
 over time, providing statistics and insights for operators.
 """
 from fractions import Fraction
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
-from collections import defaultdict
 from .artistic_policy import ArtisticObservationStats
+from .signal_statistics import SignalWindow, StreamingSignalStats
 
 @dataclass
 class ArtisticSignalSnapshot:
@@ -31,51 +31,41 @@ class ArtisticObservabilityReport:
     anomaly_count: int
     top_performing_content: List[Dict[str, Any]]
     policy_version: str
+    signals_in_window: int = 0
 
 class ArtisticSignalObservatory:
     """
     Observability layer for AES signals.
+
+    Reports cover the snapshots in the window: the last ``MAX_HISTORY``
+    signals, limited to the last ``window_epochs`` epochs when epoch
+    windowing is enabled. ``total_signals_processed`` counts every recorded
+    signal.
     """
 
-    def __init__(self):
-        self.signal_history: List[ArtisticSignalSnapshot] = []
+    def __init__(self, max_history: int=1000, epoch_length: Optional[int]=None, window_epochs: Optional[int]=None):
         self.bucket_size = Fraction(1, 10)
-        self.MAX_HISTORY = 1000
+        self.MAX_HISTORY = max_history
+        self._window = SignalWindow(self.bucket_size, epoch_length=epoch_length, window_epochs=window_epochs)
+        self.signal_history = self._window.snapshots
 
     def record_signal(self, snapshot: ArtisticSignalSnapshot):
-        self.signal_history.append(snapshot)
-        if len(self.signal_history) > self.MAX_HISTORY:
-            self.signal_history.pop(0)
+        self._window.add(snapshot)
+        self._window.trim(self.MAX_HISTORY)
 
     def get_observability_report(self, policy_version: str='') -> ArtisticObservabilityReport:
-        if not self.signal_history:
-            return ArtisticObservabilityReport(0, 0, {}, {}, {}, 0, [], policy_version)
-        total_signals = len(self.signal_history)
-        avg_confidence = sum((s.confidence for s in self.signal_history)) / total_signals
-        dim_sums = defaultdict(float)
-        dim_counts = defaultdict(int)
-        for s in sorted(self.signal_history):
-            for d, v in s.dimensions.items():
-                dim_sums[d] += v
-                dim_counts[d] += 1
-        dim_avgs = {d: dim_sums[d] / dim_counts[d] for d in dim_sums}
+        stats = self._window.stats
+        if stats.count == 0:
+            return ArtisticObservabilityReport(self._window.recorded, 0, {}, {}, {}, 0, [], policy_version)
         dim_dists = {}
-        for d in sorted(dim_sums):
-            dim_dists[d] = self._calculate_histogram(d)
-        bonuses = [s.bonus_factor for s in self.signal_history]
-        bonus_stats = {'mean': sum(bonuses) / len(bonuses), 'min': min(bonuses), 'max': max(bonuses), 'median': sorted(bonuses)[len(bonuses) // 2]}
-        mean_bonus = bonus_stats['mean']
-        anomalies = sum((1 for b in bonuses if b > mean_bonus * 2))
-        top_content = [{'content_id': s.content_id, 'bonus': s.bonus_factor} for s in sorted(self.signal_history, key=lambda x: x.bonus_factor, reverse=True)[:10]]
-        return ArtisticObservabilityReport(total_signals_processed=total_signals, average_confidence=avg_confidence, dimension_averages=dim_avgs, dimension_distributions=dim_dists, bonus_statistics=bonus_stats, anomaly_count=anomalies, top_performing_content=top_content, policy_version=policy_version)
+        for d in sorted(stats.histograms):
+            dim_dists[d] = self._calculate_histogram(d, stats)
+        mean_bonus = stats.bonus_mean_value()
+        bonus_stats = {'mean': mean_bonus, 'min': stats.bonus_min(), 'max': stats.bonus_max(), 'median': stats.bonus_median()}
+        anomalies = stats.count_bonuses_above(mean_bonus * 2)
+        top_content = [{'content_id': s.content_id, 'bonus': s.bonus_factor} for s in stats.top_snapshots()]
+        return ArtisticObservabilityReport(total_signals_processed=self._window.recorded, average_confidence=stats.average_confidence(), dimension_averages=stats.dimension_averages(), dimension_distributions=dim_dists, bonus_statistics=bonus_stats, anomaly_count=anomalies, top_performing_content=top_content, policy_version=policy_version, signals_in_window=stats.count)
 
-    def _calculate_histogram(self, dimension: str) -> Dict[str, float]:
-        scores = [s.dimensions[dimension] for s in self.signal_history if dimension in s.dimensions]
-        if not scores:
-            return {}
-        total = len(scores)
-        buckets = defaultdict(int)
-        for s in sorted(scores):
-            bucket = f'{int(s // self.bucket_size) * self.bucket_size:.1f}'
-            buckets[bucket] += 1
-        return {b: c / total for b, c in buckets.items()}
\ No newline at end of file
+    def _calculate_histogram(self, dimension: str, stats: Optional[StreamingSignalStats]=None) -> Dict[str, float]:
+        stats = stats or self._window.stats
+        return stats.histogram(dimension, '{low:.1f}')
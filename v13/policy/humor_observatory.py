@@ -9,8 +9,9 @@ import json
 import hashlib
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
-from collections import defaultdict
+from itertools import islice
 from .humor_policy import HumorObservationStats
+from .signal_statistics import SignalWindow, StreamingSignalStats
 
 @dataclass
 class HumorSignalSnapshot:
@@ -35,6 +36,7 @@ class HumorObservabilityReport:
     policy_settings_summary: Dict[str, Any]
     policy_version: str
     policy_hash: str
+    signals_in_window: int = 0
 
 class HumorSignalObservatory:
     """
@@ -45,12 +47,26 @@ class HumorSignalObservatory:
     2. Statistical analysis and distributions
     3. Anomaly detection
     4. Reporting capabilities for operators
+
+    By default every recorded signal is kept and reported on. Windowing is
+    opt-in: ``max_history`` limits reports to the most recent signals and
+    ``epoch_length``/``window_epochs`` to the most recent epochs.
+    ``total_signals_processed`` always counts every recorded signal;
+    ``signals_in_window`` is the number the other figures describe.
     """
 
-    def __init__(self):
-        """Initialize the humor signal observatory."""
-        self.signal_history: List[HumorSignalSnapshot] = []
+    def __init__(self, max_history: Optional[int]=None, epoch_length: Optional[int]=None, window_epochs: Optional[int]=None):
+        """
+        Initialize the humor signal observatory.
+
+        Args:
+            max_history: Number of most recent snapshots covered by reports (None: all)
+            epoch_length: Timestamp units per epoch (enables windowing with window_epochs)
+            window_epochs: Number of most recent epochs covered by reports
+        """
         self.bucket_size = Fraction(1, 10)
+        self._window = SignalWindow(self.bucket_size, max_history=max_history, epoch_length=epoch_length, window_epochs=window_epochs)
+        self.signal_history = self._window.snapshots
 
     def record_signal(self, snapshot: HumorSignalSnapshot):
         """
@@ -59,11 +75,15 @@ class HumorSignalObservatory:
         Args:
             snapshot: Humor signal snapshot to record
         """
-        self.signal_history.append(snapshot)
+        self._window.add(snapshot)
 
     def get_observability_report(self, policy_version: str='', policy_hash: str='') -> HumorObservabilityReport:
         """
         Generate a comprehensive observability report.
+
+        Every figure except ``total_signals_processed`` is read from the
+        window's accumulators, so all of them describe the same
+        ``signals_in_window`` snapshots.
         
         Args:
             policy_version: Current policy version
@@ -72,50 +92,34 @@ class HumorSignalObservatory:
         Returns:
             HumorObservabilityReport: Comprehensive report
         """
-        if not self.signal_history:
-            return HumorObservabilityReport(total_signals_processed=0, average_confidence=0, dimension_averages={}, dimension_distributions={}, bonus_statistics={}, anomaly_count=0, top_performing_content=[], policy_settings_summary={}, policy_version=policy_version, policy_hash=policy_hash)
-        total_signals = len(self.signal_history)
-        avg_confidence = sum((s.confidence for s in self.signal_history)) / total_signals
-        dimension_sums = defaultdict(float)
-        dimension_counts = defaultdict(int)
-        for snapshot in sorted(self.signal_history):
-            for dimension, score in snapshot.dimensions.items():
-                dimension_sums[dimension] += score
-                dimension_counts[dimension] += 1
-        dimension_averages = {dim: dimension_sums[dim] / dimension_counts[dim] for dim in dimension_sums}
+        stats = self._window.stats
+        if stats.count == 0:
+            return HumorObservabilityReport(total_signals_processed=self._window.recorded, average_confidence=0, dimension_averages={}, dimension_distributions={}, bonus_statistics={}, anomaly_count=0, top_performing_content=[], policy_settings_summary={}, policy_version=policy_version, policy_hash=policy_hash)
+        window_signals = stats.count
+        dimension_averages = stats.dimension_averages()
         dimension_distributions = {}
-        for dimension in sorted(dimension_sums):
-            dimension_distributions[dimension] = self._calculate_histogram(dimension)
-        bonuses = [s.bonus_factor for s in self.signal_history]
-        bonus_statistics = {'mean': sum(bonuses) / len(bonuses), 'min': min(bonuses), 'max': max(bonuses), 'median': sorted(bonuses)[len(bonuses) // 2]}
-        mean_bonus = bonus_statistics['mean']
-        variance = sum(((b - mean_bonus) ** 2 for b in bonuses)) / len(bonuses)
-        bonus_statistics['std_dev'] = variance ** Fraction(1, 2)
-        anomaly_count = sum((1 for b in bonuses if b > mean_bonus * 2))
-        sorted_signals = sorted(self.signal_history, key=lambda x: x.bonus_factor, reverse=True)
-        top_performing_content = [{'content_id': signal.content_id, 'bonus_factor': signal.bonus_factor, 'dimensions': signal.dimensions, 'confidence': signal.confidence} for signal in sorted_signals[:10]]
-        policy_settings_summary = {'observation_window': f'{total_signals} signals', 'data_collection_status': 'active', 'version': policy_version, 'hash': policy_hash}
-        return HumorObservabilityReport(total_signals_processed=total_signals, average_confidence=avg_confidence, dimension_averages=dimension_averages, dimension_distributions=dimension_distributions, bonus_statistics=bonus_statistics, anomaly_count=anomaly_count, top_performing_content=top_performing_content, policy_settings_summary=policy_settings_summary, policy_version=policy_version, policy_hash=policy_hash)
+        for dimension in sorted(stats.histograms):
+            dimension_distributions[dimension] = self._calculate_histogram(dimension, stats)
+        mean_bonus = stats.bonus_mean_value()
+        bonus_statistics = {'mean': mean_bonus, 'min': stats.bonus_min(), 'max': stats.bonus_max(), 'median': stats.bonus_median(), 'std_dev': stats.bonus_std_dev()}
+        anomaly_count = stats.count_bonuses_above(mean_bonus * 2)
+        top_performing_content = [{'content_id': signal.content_id, 'bonus_factor': signal.bonus_factor, 'dimensions': signal.dimensions, 'confidence': signal.confidence} for signal in stats.top_snapshots()]
+        policy_settings_summary = {'observation_window': f'{window_signals} signals', 'data_collection_status': 'active', 'version': policy_version, 'hash': policy_hash}
+        return HumorObservabilityReport(total_signals_processed=self._window.recorded, average_confidence=stats.average_confidence(), dimension_averages=dimension_averages, dimension_distributions=dimension_distributions, bonus_statistics=bonus_statistics, anomaly_count=anomaly_count, top_performing_content=top_performing_content, policy_settings_summary=policy_settings_summary, policy_version=policy_version, policy_hash=policy_hash, signals_in_window=window_signals)
 
-    def _calculate_histogram(self, dimension: str) -> Dict[str, float]:
+    def _calculate_histogram(self, dimension: str, stats: Optional[StreamingSignalStats]=None) -> Dict[str, float]:
         """
         Calculate histogram distribution for a dimension.
         
         Args:
             dimension: Dimension name
+            stats: Accumulator to read from (defaults to the window)
             
         Returns:
             Dict: Bucket -> count mapping
         """
-        dimension_scores = [snapshot.dimensions[dimension] for snapshot in self.signal_history if dimension in snapshot.dimensions]
-        if not dimension_scores:
-            return {}
-        buckets = defaultdict(int)
-        for score in sorted(dimension_scores):
-            bucket = f'{int(score // self.bucket_size) * self.bucket_size:.1f}-{(int(score // self.bucket_size) + 1) * self.bucket_size:.1f}'
-            buckets[bucket] += 1
-        total = len(dimension_scores)
-        return {bucket: count / total for bucket, count in buckets.items()}
+        stats = stats or self._window.stats
+        return stats.histogram(dimension, '{low:.1f}-{high:.1f}')
 
     def get_dimension_correlations(self) -> Dict[str, Dict[str, float]]:
         """
@@ -124,32 +128,7 @@ class HumorSignalObservatory:
         Returns:
             Dict: Correlation matrix
         """
-        if len(self.signal_history) < 2:
-            return {}
-        all_dimensions = set()
-        for snapshot in sorted(self.signal_history):
-            all_dimensions.update(snapshot.dimensions.keys())
-        correlations = {}
-        dimension_lists = {dim: [snapshot.dimensions.get(dim, 0) for snapshot in self.signal_history] for dim in all_dimensions}
-        for dim1 in sorted(all_dimensions):
-            correlations[dim1] = {}
-            for dim2 in sorted(all_dimensions):
-                if dim1 == dim2:
-                    correlations[dim1][dim2] = 1
-                else:
-                    list1 = dimension_lists[dim1]
-                    list2 = dimension_lists[dim2]
-                    mean1 = sum(list1) / len(list1)
-                    mean2 = sum(list2) / len(list2)
-                    numerator = sum(((a - mean1) * (b - mean2) for a, b in zip(list1, list2)))
-                    denom1 = sum(((a - mean1) ** 2 for a in list1)) ** Fraction(1, 2)
-                    denom2 = sum(((b - mean2) ** 2 for b in list2)) ** Fraction(1, 2)
-                    if denom1 == 0 or denom2 == 0:
-                        correlation = 0
-                    else:
-                        correlation = numerator / (denom1 * denom2)
-                    correlations[dim1][dim2] = correlation
-        return correlations
+        return self._window.stats.correlations()
 
     def export_observability_data(self, policy_version: str='', policy_hash: str='') -> Dict[str, Any]:
         """
@@ -163,5 +142,5 @@ class HumorSignalObservatory:
             Dict: Exportable observability data
         """
         report = self.get_observability_report(policy_version, policy_hash)
-        export_data = {'report': {'total_signals_processed': report.total_signals_processed, 'average_confidence': report.average_confidence, 'dimension_averages': report.dimension_averages, 'bonus_statistics': report.bonus_statistics, 'anomaly_count': report.anomaly_count, 'policy_version': report.policy_version, 'policy_hash': report.policy_hash}, 'dimension_distributions': report.dimension_distributions, 'top_performing_content': report.top_performing_content, 'correlations': self.get_dimension_correlations(), 'raw_data_sample': [{'timestamp': snapshot.timestamp, 'content_id': snapshot.content_id, 'dimensions': snapshot.dimensions, 'confidence': snapshot.confidence, 'bonus_factor': snapshot.bonus_factor} for snapshot in self.signal_history[-100:]]}
+        export_data = {'report': {'total_signals_processed': report.total_signals_processed, 'signals_in_window': report.signals_in_window, 'average_confidence': report.average_confidence, 'dimension_averages': report.dimension_averages, 'bonus_statistics': report.bonus_statistics, 'anomaly_count': report.anomaly_count, 'policy_version': report.policy_version, 'policy_hash': report.policy_hash}, 'dimension_distributions': report.dimension_distributions, 'top_performing_content': report.top_performing_content, 'correlations': self.get_dimension_correlations(), 'raw_data_sample': [{'timestamp': snapshot.timestamp, 'content_id': snapshot.content_id, 'dimensions': snapshot.dimensions, 'confidence': snapshot.confidence, 'bonus_factor': snapshot.bonus_factor} for snapshot in islice(self.signal_history, max(0, len(self.signal_history) - 100), None)]}
         return export_data
\ No newline at end of file
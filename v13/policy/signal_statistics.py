@@ -0,0 +1,303 @@
+"""
+signal_statistics.py - Streaming aggregates for signal observatories
+
+This module provides the windowed accumulators shared by the humor and
+artistic observatories. Snapshots are folded in as they are recorded and
+folded out as they leave the window, so a report costs O(d²) in the number of
+dimensions instead of rescanning history.
+"""
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from fractions import Fraction
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class StreamingSignalStats:
+    """
+    Reversible accumulators for a window of signal snapshots.
+
+    Tracks:
+    1. Running sums/counts for confidence and per-dimension averages
+    2. Welford mean/variance of bonus factors
+    3. Fixed-bucket histograms per dimension
+    4. A streaming co-moment matrix between dimensions (a dimension missing from
+       a snapshot counts as 0, matching the batch correlation definition)
+    5. The window's bonus factors in sorted order, for min/max/median,
+       anomaly counts and top-K
+
+    Every update is exactly reversed by ``remove``, so the accumulators always
+    describe the snapshots currently added. Scalar totals live in ``totals``.
+    """
+
+    def __init__(self, bucket_size: Fraction):
+        self.bucket_size = bucket_size
+        self.totals: Dict[str, Any] = {'count': 0, 'confidence': 0, 'bonus': 0, 'bonus_mean': 0, 'bonus_m2': 0}
+        self.dimension_sums: Dict[str, Any] = {}
+        self.dimension_counts: Dict[str, int] = {}
+        self.histograms: Dict[str, Dict[int, int]] = {}
+        self.dimension_means: Dict[str, Any] = {}
+        self.comoments: Dict[Tuple[str, str], Any] = {}
+        self.bonuses: List[Any] = []
+        self.ranked: List[Tuple[Any, int, Any]] = []
+
+    @property
+    def count(self) -> int:
+        return self.totals['count']
+
+    def add(self, snapshot: Any, sequence: int) -> None:
+        """
+        Fold one snapshot into the accumulators.
+
+        Args:
+            snapshot: Snapshot with dimensions, confidence and bonus_factor
+            sequence: Monotonic record number, used to break top-K ties by arrival
+        """
+        totals = self.totals
+        totals['count'] += 1
+        n = totals['count']
+        totals['confidence'] += snapshot.confidence
+        for dimension in sorted(snapshot.dimensions):
+            score = snapshot.dimensions[dimension]
+            self.dimension_sums[dimension] = self.dimension_sums.get(dimension, 0) + score
+            self.dimension_counts[dimension] = self.dimension_counts.get(dimension, 0) + 1
+            buckets = self.histograms.setdefault(dimension, {})
+            index = int(score // self.bucket_size)
+            buckets[index] = buckets.get(index, 0) + 1
+            if dimension not in self.dimension_means:
+                self._add_dimension(dimension)
+        bonus = snapshot.bonus_factor
+        totals['bonus'] += bonus
+        delta = bonus - totals['bonus_mean']
+        totals['bonus_mean'] += delta / n
+        totals['bonus_m2'] += delta * (bonus - totals['bonus_mean'])
+        deltas = {dim: snapshot.dimensions.get(dim, 0) - mean for dim, mean in self.dimension_means.items()}
+        for dimension in self.dimension_means:
+            self.dimension_means[dimension] += deltas[dimension] / n
+        for dim1, dim2 in self.comoments:
+            self.comoments[dim1, dim2] += deltas[dim1] * (snapshot.dimensions.get(dim2, 0) - self.dimension_means[dim2])
+        insort(self.bonuses, bonus)
+        insort(self.ranked, (bonus, -sequence, snapshot))
+
+    def remove(self, snapshot: Any, sequence: int) -> None:
+        """
+        Fold a previously added snapshot back out of the accumulators.
+
+        Args:
+            snapshot: Snapshot passed to ``add``
+            sequence: Record number it was added with
+        """
+        totals = self.totals
+        n = totals['count'] - 1
+        totals['count'] = n
+        totals['confidence'] -= snapshot.confidence
+        bonus = snapshot.bonus_factor
+        totals['bonus'] -= bonus
+        if n == 0:
+            totals['bonus_mean'] = 0
+            totals['bonus_m2'] = 0
+        else:
+            previous_mean = totals['bonus_mean']
+            totals['bonus_mean'] = (previous_mean * (n + 1) - bonus) / n
+            totals['bonus_m2'] -= (bonus - totals['bonus_mean']) * (bonus - previous_mean)
+        previous_means = dict(self.dimension_means)
+        for dimension in self.dimension_means:
+            if n == 0:
+                self.dimension_means[dimension] = 0
+            else:
+                self.dimension_means[dimension] = (previous_means[dimension] * (n + 1) - snapshot.dimensions.get(dimension, 0)) / n
+        for dim1, dim2 in self.comoments:
+            self.comoments[dim1, dim2] -= (snapshot.dimensions.get(dim1, 0) - self.dimension_means[dim1]) * (snapshot.dimensions.get(dim2, 0) - previous_means[dim2])
+        for dimension in sorted(snapshot.dimensions):
+            score = snapshot.dimensions[dimension]
+            self.dimension_sums[dimension] -= score
+            self.dimension_counts[dimension] -= 1
+            buckets = self.histograms[dimension]
+            index = int(score // self.bucket_size)
+            buckets[index] -= 1
+            if not buckets[index]:
+                del buckets[index]
+            if not self.dimension_counts[dimension]:
+                self._drop_dimension(dimension)
+        del self.bonuses[bisect_left(self.bonuses, bonus)]
+        del self.ranked[bisect_left(self.ranked, (bonus, -sequence))]
+
+    def _add_dimension(self, dimension: str) -> None:
+        """Start tracking a dimension; all earlier snapshots implicitly scored 0."""
+        self.dimension_means[dimension] = 0
+        for other in self.dimension_means:
+            self.comoments[self._pair(dimension, other)] = 0
+
+    def _drop_dimension(self, dimension: str) -> None:
+        """Stop tracking a dimension no snapshot in the window scores."""
+        del self.dimension_sums[dimension]
+        del self.dimension_counts[dimension]
+        del self.histograms[dimension]
+        del self.dimension_means[dimension]
+        for other in list(self.dimension_means) + [dimension]:
+            self.comoments.pop(self._pair(dimension, other), None)
+
+    @staticmethod
+    def _pair(dim1: str, dim2: str) -> Tuple[str, str]:
+        return (dim1, dim2) if dim1 <= dim2 else (dim2, dim1)
+
+    def average_confidence(self) -> Any:
+        return self.totals['confidence'] / self.count if self.count else 0
+
+    def dimension_averages(self) -> Dict[str, Any]:
+        return {dim: self.dimension_sums[dim] / self.dimension_counts[dim] for dim in sorted(self.dimension_sums)}
+
+    def bonus_mean_value(self) -> Any:
+        return self.totals['bonus'] / self.count if self.count else 0
+
+    def bonus_min(self) -> Any:
+        return self.bonuses[0] if self.bonuses else None
+
+    def bonus_max(self) -> Any:
+        return self.bonuses[-1] if self.bonuses else None
+
+    def bonus_median(self) -> Any:
+        """Upper median of bonus factors."""
+        return self.bonuses[len(self.bonuses) // 2] if self.bonuses else None
+
+    def bonus_std_dev(self) -> Any:
+        """Population standard deviation of bonus factors."""
+        if not self.count:
+            return 0
+        variance = self.totals['bonus_m2'] / self.count
+        if variance <= 0:
+            return 0
+        return variance ** Fraction(1, 2)
+
+    def count_bonuses_above(self, threshold: Any) -> int:
+        """Number of bonus factors strictly greater than ``threshold``."""
+        return len(self.bonuses) - bisect_right(self.bonuses, threshold)
+
+    def histogram(self, dimension: str, label_format: str) -> Dict[str, float]:
+        """
+        Normalised histogram for a dimension, buckets in ascending order.
+
+        Args:
+            dimension: Dimension name
+            label_format: Format string with ``{low}`` and ``{high}`` placeholders
+
+        Returns:
+            Dict: Bucket label -> fraction of scores
+        """
+        buckets = self.histograms.get(dimension)
+        if not buckets:
+            return {}
+        total = self.dimension_counts[dimension]
+        result = {}
+        for index in sorted(buckets):
+            label = label_format.format(low=float(index * self.bucket_size), high=float((index + 1) * self.bucket_size))
+            result[label] = buckets[index] / total
+        return result
+
+    def correlations(self) -> Dict[str, Dict[str, Any]]:
+        """Pearson correlation matrix between dimensions from the co-moments."""
+        if self.count < 2:
+            return {}
+        dimensions = sorted(self.dimension_means)
+        correlations: Dict[str, Dict[str, Any]] = {}
+        for dim1 in dimensions:
+            correlations[dim1] = {}
+            for dim2 in dimensions:
+                if dim1 == dim2:
+                    correlations[dim1][dim2] = 1
+                    continue
+                var1 = self.comoments[dim1, dim1]
+                var2 = self.comoments[dim2, dim2]
+                if var1 <= 0 or var2 <= 0:
+                    correlations[dim1][dim2] = 0
+                else:
+                    correlations[dim1][dim2] = self.comoments[self._pair(dim1, dim2)] / (var1 ** Fraction(1, 2) * var2 ** Fraction(1, 2))
+        return correlations
+
+    def top_snapshots(self, k: int=10) -> List[Any]:
+        """Top-k snapshots by bonus factor, highest first, ties by arrival order."""
+        return [entry[2] for entry in reversed(self.ranked[-k:])] if k > 0 else []
+
+
+class SignalWindow:
+    """
+    Window of raw snapshots with accumulators kept in step.
+
+    Unless ``max_history`` is None the window holds the most recent
+    ``max_history`` snapshots (``trim`` applies another limit). When both ``epoch_length`` and ``window_epochs`` are
+    set the window is further limited to the most recent ``window_epochs``
+    epochs (by snapshot timestamp): snapshots are dropped once their epoch
+    leaves the window, and late snapshots from an epoch already outside it are
+    ignored. ``stats`` always describes exactly the snapshots in
+    ``snapshots``; ``recorded`` counts every snapshot ever added.
+    """
+
+    def __init__(self, bucket_size: Fraction, max_history: Optional[int]=None, epoch_length: Optional[int]=None, window_epochs: Optional[int]=None):
+        self.max_history = max_history
+        self.epoch_length = epoch_length
+        self.window_epochs = window_epochs
+        self.snapshots: deque = deque()
+        self.stats = StreamingSignalStats(bucket_size)
+        self._sequences: deque = deque()
+        self._sequence = count(1)
+        self._epochs: Dict[str, Optional[int]] = {'latest': None}
+        self._lifetime: Dict[str, int] = {'recorded': 0}
+
+    @property
+    def recorded(self) -> int:
+        """Snapshots added over the window's lifetime, including evicted and late ones."""
+        return self._lifetime['recorded']
+
+    @property
+    def windowed(self) -> bool:
+        return bool(self.epoch_length) and bool(self.window_epochs)
+
+    def add(self, snapshot: Any) -> None:
+        """Append a snapshot, evicting whatever leaves the window."""
+        self._lifetime['recorded'] += 1
+        if self.windowed:
+            epoch = epoch_of(snapshot.timestamp, self.epoch_length)
+            latest = self._epochs['latest']
+            if latest is not None and epoch < self._window_start():
+                return
+            if latest is None or epoch > latest:
+                self._epochs['latest'] = epoch
+                self._evict_stale()
+        sequence = next(self._sequence)
+        self.snapshots.append(snapshot)
+        self._sequences.append(sequence)
+        self.stats.add(snapshot, sequence)
+        self.trim(self.max_history)
+
+    def trim(self, max_history: Optional[int]) -> None:
+        """Evict the oldest snapshots beyond ``max_history`` (None keeps all)."""
+        if max_history is None:
+            return
+        while len(self.snapshots) > max_history:
+            self.stats.remove(self.snapshots.popleft(), self._sequences.popleft())
+
+    def _window_start(self) -> int:
+        return self._epochs['latest'] - self.window_epochs + 1
+
+    def _evict_stale(self) -> None:
+        start = self._window_start()
+        kept = []
+        for snapshot, sequence in zip(self.snapshots, self._sequences):
+            if epoch_of(snapshot.timestamp, self.epoch_length) < start:
+                self.stats.remove(snapshot, sequence)
+            else:
+                kept.append((snapshot, sequence))
+        if len(kept) == len(self.snapshots):
+            return
+        self.snapshots.clear()
+        self._sequences.clear()
+        for snapshot, sequence in kept:
+            self.snapshots.append(snapshot)
+            self._sequences.append(sequence)
+
+
+def epoch_of(timestamp: int, epoch_length: Optional[int]) -> int:
+    """Epoch number for a timestamp (0 when windowing is disabled)."""
+    if not epoch_length:
+        return 0
+    return timestamp // epoch_length
@@ -263,14 +263,14 @@ class ValueNodeExplainabilityHelper:
             base_val_int = self._parse_atr_to_int(base_atr_str)
 
         # Convert to BigNum128 (Scale 100 -> Scale 1e18)
-        base_bn = BigNum128.from_int(base_val_int * 10**16)
+        base_bn = BigNum128(base_val_int * 10**16)
 
         # 2. Add bonuses
         total_bonus_bn = BigNum128(0)
         for bonus in bonuses:
             val_str = bonus.get("value", "0 ATR")
             val_int = self._parse_atr_to_int(val_str)
-            val_bn = BigNum128.from_int(val_int * 10**16)
+            val_bn = BigNum128(val_int * 10**16)
             total_bonus_bn = cm.add(
                 total_bonus_bn,
                 val_bn,
@@ -282,7 +282,7 @@ class ValueNodeExplainabilityHelper:
         for cap in caps:
             val_str = cap.get("value", "0 ATR")
             val_int = self._parse_atr_to_int(val_str)
-            val_bn = BigNum128.from_int(val_int * 10**16)
+            val_bn = BigNum128(val_int * 10**16)
             total_cap_bn = cm.add(
                 total_cap_bn,
                 val_bn,
@@ -302,13 +302,13 @@ class ValueNodeExplainabilityHelper:
         )
 
         # 5. Format back to string (Scale 1e18 -> Scale 100)
-        # We need to divide by 10^16 safely
-        final_val_bn = cm.idiv_bn(
+        # Dividing by 10^16 leaves the scale-100 integer as the raw value
+        final_val_bn = cm.idiv(
             final_bn,
             10**16,
             quantum_metadata={"trace_id": trace_id, "op": "normalize_scale"},
         )
-        final_val_int = final_val_bn.value // BigNum128.SCALE
+        final_val_int = final_val_bn.value
         total["ATR"] = self._format_int_to_atr(final_val_int)
 
         return total
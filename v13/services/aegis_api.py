@@ -14,16 +14,18 @@ V13.6 ENHANCEMENTS:
 
 import json
 import hashlib
+import os
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 from enum import Enum
-from v13.libs.CertifiedMath import BigNum128, CertifiedMath
+from v13.libs.CertifiedMath import BigNum128, CertifiedMath, CertifiedMathError
 from v13.core.TokenStateBundle import TokenStateBundle
 from v13.core.HSMF import HSMF
 from v13.libs.governance.TreasuryEngine import TreasuryEngine
 from v13.handlers.CIR302_Handler import CIR302_Handler
 from v13.libs.PQC import PQC
 from v13.core.DRV_Packet import DRV_Packet
+from v13.services.aegis_snapshot_store import SnapshotIntegrityError, SnapshotStore
 
 
 class AEGISStatus(Enum):
@@ -204,6 +206,16 @@ class APIResponse:
     pqc_cid: Optional[str]
 
 
+@dataclass
+class TreasuryResult:
+    """Treasury reward computation outcome for one transaction bundle."""
+
+    is_valid: bool
+    total_allocation: BigNum128
+    rewards: Dict[str, BigNum128]
+    validation_errors: List[str]
+
+
 class AEGIS_API:
     """
     Secure API Gateway for QFS V13.
@@ -213,7 +225,11 @@ class AEGIS_API:
     """
 
     def __init__(
-        self, cm_instance: CertifiedMath, pqc_key_pair: Optional[tuple] = None
+        self,
+        cm_instance: CertifiedMath,
+        pqc_key_pair: Optional[tuple] = None,
+        snapshot_dir: Optional[str] = None,
+        snapshot_cache_size: int = 4096,
     ):
         """
         Initialize the AEGIS API Gateway with V13.6 telemetry snapshot infrastructure.
@@ -221,13 +237,15 @@ class AEGIS_API:
         Args:
             cm_instance: CertifiedMath instance for deterministic operations
             pqc_key_pair: Optional PQC key pair for signing API responses
+            snapshot_dir: Optional directory for the persistent snapshot segments
+            snapshot_cache_size: Snapshots per store kept in memory
         """
         self.cm = cm_instance
         self.pqc_private_key = pqc_key_pair[0] if pqc_key_pair else None
         self.pqc_public_key = pqc_key_pair[1] if pqc_key_pair else None
         self.hsmf = HSMF(cm_instance)
-        self.treasury_engine = TreasuryEngine(cm_instance, pqc_key_pair)
-        self.cir302_handler = CIR302_Handler(cm_instance, pqc_key_pair)
+        self.treasury_engine = TreasuryEngine(cm_instance)
+        self.cir302_handler = CIR302_Handler(cm_instance)
         self.quantum_metadata = {
             "component": "AEGIS_API",
             "version": "QFS-V13.6-TELEMETRY",
@@ -235,9 +253,18 @@ class AEGIS_API:
             "pqc_scheme": "Dilithium-5",
         }
         self.aegis_status = AEGISStatus.OPERATIONAL
-        self.snapshot_cache: Dict[int, AEGISTelemetrySnapshot] = {}
-        self.registry_cache: Dict[int, AEGISRegistrySnapshot] = {}
+        self.snapshot_cache = SnapshotStore(
+            AEGISTelemetrySnapshot,
+            os.path.join(snapshot_dir, "telemetry.seg") if snapshot_dir else None,
+            snapshot_cache_size,
+        )
+        self.registry_cache = SnapshotStore(
+            AEGISRegistrySnapshot,
+            os.path.join(snapshot_dir, "registry.seg") if snapshot_dir else None,
+            snapshot_cache_size,
+        )
         self.aegis_offline_triggered = False
+        self.last_drv_packet: Optional[DRV_Packet] = None
 
     def get_telemetry_snapshot(
         self,
@@ -253,8 +280,9 @@ class AEGIS_API:
         - Completeness validation (reject partial data)
         - Block height anchoring for replay
 
-        For replay: Fetch historical snapshot by block_height from cache/ledger.
-        For live: Query AEGIS (stub), hash result, cache for future replay.
+        For replay: Fetch historical snapshot by block_height from the snapshot
+        store (memory, then the hash-verified on-disk segment).
+        For live: Query AEGIS (stub), hash result, persist for future replay.
 
         Args:
             block_height: Block height to query telemetry for
@@ -268,8 +296,10 @@ class AEGIS_API:
             AEGISOfflineError: If AEGIS is offline/degraded
             ValueError: If snapshot is incomplete or invalid
         """
-        if block_height in self.snapshot_cache:
-            cached_snapshot = self.snapshot_cache[block_height]
+        cached_snapshot = self._stored_snapshot(
+            self.snapshot_cache, block_height, deterministic_timestamp, log_list
+        )
+        if cached_snapshot is not None:
             log_list.append(
                 {
                     "operation": "aegis_snapshot_cache_hit",
@@ -301,7 +331,7 @@ class AEGIS_API:
                 }
             )
             raise ValueError(f"Incomplete AEGIS telemetry snapshot: {error_message}")
-        self.snapshot_cache[block_height] = snapshot
+        self.snapshot_cache.put(snapshot)
         log_list.append(
             {
                 "operation": "aegis_snapshot_created",
@@ -335,8 +365,11 @@ class AEGIS_API:
             AEGISOfflineError: If AEGIS is offline
             ValueError: If snapshot is incomplete
         """
-        if block_height in self.registry_cache:
-            return self.registry_cache[block_height]
+        cached_snapshot = self._stored_snapshot(
+            self.registry_cache, block_height, deterministic_timestamp, log_list
+        )
+        if cached_snapshot is not None:
+            return cached_snapshot
         if self.aegis_status == AEGISStatus.OFFLINE:
             raise AEGISOfflineError(f"AEGIS offline at block {block_height}")
         raw_registry = self._query_aegis_registry(block_height)
@@ -359,7 +392,7 @@ class AEGIS_API:
                 }
             )
             raise ValueError(f"Incomplete AEGIS registry snapshot: {error_message}")
-        self.registry_cache[block_height] = snapshot
+        self.registry_cache.put(snapshot)
         log_list.append(
             {
                 "operation": "aegis_registry_snapshot_created",
@@ -371,6 +404,32 @@ class AEGIS_API:
         )
         return snapshot
 
+    def _stored_snapshot(
+        self,
+        store: SnapshotStore,
+        block_height: int,
+        deterministic_timestamp: int,
+        log_list: List[Dict[str, Any]],
+    ):
+        """
+        Look up a persisted snapshot, logging and re-raising integrity failures.
+
+        Raises:
+            SnapshotIntegrityError: If the on-disk record fails hash verification
+        """
+        try:
+            return store.get(block_height)
+        except SnapshotIntegrityError as exc:
+            log_list.append(
+                {
+                    "operation": "aegis_snapshot_integrity_failed",
+                    "block_height": block_height,
+                    "error": str(exc),
+                    "timestamp": deterministic_timestamp,
+                }
+            )
+            raise
+
     def _query_aegis_telemetry(self, block_height: int) -> Dict[str, Dict[str, Any]]:
         """
         Query AEGIS for raw telemetry data (STUB).
@@ -462,6 +521,10 @@ class AEGIS_API:
         """
         Process a transaction bundle through the full QFS V13 pipeline.
 
+        The packet must chain onto the last admitted DRV_Packet (if any); a
+        packet that passes signature and chain validation becomes the new
+        chain head even if HSMF or treasury later quarantine the bundle.
+
         Args:
             drv_packet: DRV_Packet with PQC signature and deterministic timestamp
             token_bundle: Current token state bundle
@@ -471,129 +534,280 @@ class AEGIS_API:
             APIResponse with result and finality seal
         """
         try:
-            if not drv_packet.verify_signature(
-                self.pqc_public_key if self.pqc_public_key else b""
-            ):
-                return APIResponse(
-                    success=False,
-                    data=None,
-                    error="Invalid DRV_Packet PQC signature",
-                    finality_seal=None,
-                    pqc_cid="",
-                )
-            chain_validation = DRV_Packet.validate_chain(None, drv_packet)
-            if not chain_validation.is_valid:
-                return APIResponse(
-                    success=False,
-                    data=None,
-                    error=f"Invalid DRV_Packet sequence or chain: {chain_validation.error_message}",
-                    finality_seal=None,
-                    pqc_cid="",
-                )
+            verified = drv_packet.verify_signature(self._verification_key(), [])
+            rejection = self._admit_packet(drv_packet, verified)
+            if rejection is not None:
+                return rejection
             with CertifiedMath.LogContext() as log_list:
-                hsmf_result = self.hsmf.validate_action_bundle(
-                    token_bundle=token_bundle,
-                    f_atr=f_atr,
-                    drv_packet_sequence=drv_packet.sequence,
-                    log_list=log_list,
-                    pqc_cid=drv_packet.pqc_signature.hex()
-                    if drv_packet.pqc_signature
-                    else "",
-                    quantum_metadata=drv_packet.metadata,
-                    raise_on_failure=False,
-                )
-                if not hsmf_result.is_valid:
-                    system_state = {
-                        "token_bundle": token_bundle.to_dict(),
-                        "drv_packet": drv_packet.to_dict(),
-                        "hsmf_errors": hsmf_result.errors,
-                        "log_list": log_list,
-                    }
-                    quarantine_result = self.cir302_handler.trigger_quarantine(
-                        reason="HSMF validation failed", system_state=system_state
-                    )
-                    return APIResponse(
-                        success=False,
-                        data=None,
-                        error="HSMF validation failed",
-                        finality_seal=quarantine_result.finality_seal,
-                        pqc_cid=quarantine_result.pqc_cid,
-                    )
-                treasury_result = self.treasury_engine.compute_rewards(
-                    hsmf_result=hsmf_result, token_bundle=token_bundle
+                return self._run_bundle_pipeline(
+                    drv_packet, token_bundle, f_atr, log_list
                 )
-                if not treasury_result.is_valid:
-                    system_state = {
-                        "token_bundle": token_bundle.to_dict(),
-                        "drv_packet": drv_packet.to_dict(),
-                        "treasury_errors": treasury_result.validation_errors,
-                        "log_list": log_list,
-                    }
-                    quarantine_result = self.cir302_handler.trigger_quarantine(
-                        reason="Treasury computation failed", system_state=system_state
+        except Exception as e:
+            return self._unexpected_error(e, drv_packet, token_bundle)
+
+    def process_transaction_bundles(self, batch: List[tuple]) -> List[APIResponse]:
+        """
+        Process a batch of (drv_packet, token_bundle, f_atr) bundles in order.
+
+        Pipelined equivalent of calling process_transaction_bundle once per
+        bundle: every packet signature is verified up front, the packet chain
+        is validated across the whole batch in one sweep, and HSMF/treasury
+        then run over the admitted bundles inside one shared
+        CertifiedMath.LogContext. Responses, finality seals and quarantine
+        results are identical to the sequential calls.
+
+        Args:
+            batch: Sequence of (drv_packet, token_bundle, f_atr) tuples
+
+        Returns:
+            List[APIResponse]: One response per bundle, in batch order
+        """
+        responses: List[Optional[APIResponse]] = [None] * len(batch)
+        verification_key = self._verification_key()
+        verified: List[Optional[bool]] = [None] * len(batch)
+        for index, (drv_packet, token_bundle, _) in enumerate(batch):
+            try:
+                verified[index] = drv_packet.verify_signature(verification_key, [])
+            except Exception as e:
+                responses[index] = self._unexpected_error(e, drv_packet, token_bundle)
+        admitted = []
+        for index, (drv_packet, token_bundle, _) in enumerate(batch):
+            if responses[index] is not None:
+                continue
+            try:
+                rejection = self._admit_packet(drv_packet, verified[index])
+            except Exception as e:
+                rejection = self._unexpected_error(e, drv_packet, token_bundle)
+            if rejection is not None:
+                responses[index] = rejection
+            else:
+                admitted.append(index)
+        with CertifiedMath.LogContext() as batch_log:
+            for index in admitted:
+                drv_packet, token_bundle, f_atr = batch[index]
+                # Each bundle logs into its own segment: CertifiedMath falls back
+                # to its instance log when handed an empty list, so a bundle's
+                # entries (and log_hash) only match a sequential call if its
+                # segment starts empty.
+                bundle_log: List[Dict[str, Any]] = []
+                try:
+                    responses[index] = self._run_bundle_pipeline(
+                        drv_packet, token_bundle, f_atr, bundle_log
                     )
-                    return APIResponse(
-                        success=False,
-                        data=None,
-                        error="Treasury computation failed",
-                        finality_seal=quarantine_result.finality_seal,
-                        pqc_cid=quarantine_result.pqc_cid,
+                except Exception as e:
+                    responses[index] = self._unexpected_error(
+                        e, drv_packet, token_bundle
                     )
-                log_hash = CertifiedMath.get_log_hash(log_list)
-                pqc_cid = self._generate_pqc_cid(
-                    drv_packet, token_bundle, hsmf_result, treasury_result
-                )
-                self.quantum_metadata["timestamp"] = str(drv_packet.ttsTimestamp)
-                response_data = {
-                    "token_bundle": token_bundle.to_dict(),
-                    "hsmf_result": {
-                        "is_valid": hsmf_result.is_valid,
-                        "c_holo": hsmf_result.raw_metrics.get(
-                            "c_holo", BigNum128(0)
-                        ).to_decimal_string(),
-                        "s_flx": hsmf_result.raw_metrics.get(
-                            "s_flx", BigNum128(0)
-                        ).to_decimal_string(),
-                        "s_psi_sync": hsmf_result.raw_metrics.get(
-                            "s_psi_sync", BigNum128(0)
-                        ).to_decimal_string(),
-                        "f_atr": hsmf_result.raw_metrics.get(
-                            "f_atr", BigNum128(0)
-                        ).to_decimal_string(),
-                    },
-                    "treasury_result": {
-                        "is_valid": treasury_result.is_valid,
-                        "total_allocation": treasury_result.total_allocation.to_decimal_string(),
-                        "rewards_count": len(treasury_result.rewards),
-                    },
-                    "log_hash": log_hash,
-                    "pqc_cid": pqc_cid,
-                    "quantum_metadata": self.quantum_metadata,
-                }
-                finality_seal = self._sign_finality_seal(response_data, log_list)
-                return APIResponse(
-                    success=True,
-                    data=response_data,
-                    error=None,
-                    finality_seal=finality_seal,
-                    pqc_cid=pqc_cid,
-                )
-        except Exception as e:
+                batch_log.extend(bundle_log)
+        return responses
+
+    def _verification_key(self) -> bytes:
+        """Public key DRV_Packet signatures are verified against."""
+        return self.pqc_public_key if self.pqc_public_key else b""
+
+    def _admit_packet(
+        self, drv_packet: DRV_Packet, verified: bool
+    ) -> Optional[APIResponse]:
+        """
+        Check signature result and chain linkage against the last admitted packet.
+
+        On success the packet becomes the chain head and None is returned;
+        otherwise the rejection response is returned.
+        """
+        if not verified:
+            return APIResponse(
+                success=False,
+                data=None,
+                error="Invalid DRV_Packet PQC signature",
+                finality_seal=None,
+                pqc_cid="",
+            )
+        chain_validation = DRV_Packet.validate_chain(
+            self.last_drv_packet, drv_packet
+        )
+        if not chain_validation.is_valid:
+            return APIResponse(
+                success=False,
+                data=None,
+                error=f"Invalid DRV_Packet sequence or chain: {chain_validation.error_message}",
+                finality_seal=None,
+                pqc_cid="",
+            )
+        self.last_drv_packet = drv_packet
+        return None
+
+    def _run_bundle_pipeline(
+        self,
+        drv_packet: DRV_Packet,
+        token_bundle: TokenStateBundle,
+        f_atr: BigNum128,
+        log_list: List[Dict[str, Any]],
+    ) -> APIResponse:
+        """
+        Run HSMF, treasury and finality sealing for one admitted bundle.
+
+        Args:
+            drv_packet: Admitted DRV_Packet
+            token_bundle: Current token state bundle
+            f_atr: Directional force from Utility Oracle
+            log_list: Empty audit log for this bundle
+        """
+        pqc_cid = drv_packet.pqc_signature.hex() if drv_packet.pqc_signature else ""
+        hsmf_result = self.hsmf.validate_action_bundle(
+            token_bundle=token_bundle,
+            f_atr=f_atr,
+            drv_packet_sequence=drv_packet.sequence,
+            log_list=log_list,
+            pqc_cid=pqc_cid,
+            quantum_metadata=drv_packet.metadata,
+            raise_on_failure=False,
+        )
+        if not hsmf_result.is_valid:
+            system_state = {
+                "token_bundle": token_bundle.to_dict(),
+                "drv_packet": drv_packet.to_dict(),
+                "hsmf_errors": hsmf_result.errors,
+                "log_list": log_list,
+            }
+            quarantine_result = self.cir302_handler.trigger_quarantine(
+                reason="HSMF validation failed", system_state=system_state
+            )
+            return APIResponse(
+                success=False,
+                data=None,
+                error="HSMF validation failed",
+                finality_seal=quarantine_result.finality_seal,
+                pqc_cid=quarantine_result.pqc_cid,
+            )
+        treasury_result = self._compute_treasury_rewards(
+            hsmf_result, token_bundle, drv_packet, log_list, pqc_cid
+        )
+        if not treasury_result.is_valid:
             system_state = {
-                "token_bundle": token_bundle.to_dict() if token_bundle else {},
-                "drv_packet": drv_packet.to_dict() if drv_packet else {},
-                "error": str(e),
+                "token_bundle": token_bundle.to_dict(),
+                "drv_packet": drv_packet.to_dict(),
+                "treasury_errors": treasury_result.validation_errors,
+                "log_list": log_list,
             }
             quarantine_result = self.cir302_handler.trigger_quarantine(
-                reason=f"Unexpected API error: {str(e)}", system_state=system_state
+                reason="Treasury computation failed", system_state=system_state
             )
             return APIResponse(
                 success=False,
                 data=None,
-                error=f"Unexpected API error: {str(e)}",
+                error="Treasury computation failed",
                 finality_seal=quarantine_result.finality_seal,
                 pqc_cid=quarantine_result.pqc_cid,
             )
+        log_hash = CertifiedMath.get_log_hash(log_list)
+        pqc_cid = self._generate_pqc_cid(
+            drv_packet, token_bundle, hsmf_result, treasury_result
+        )
+        self.quantum_metadata["timestamp"] = str(drv_packet.ttsTimestamp)
+        response_data = {
+            "token_bundle": token_bundle.to_dict(),
+            "hsmf_result": {
+                "is_valid": hsmf_result.is_valid,
+                "c_holo": hsmf_result.raw_metrics.get(
+                    "c_holo", BigNum128(0)
+                ).to_decimal_string(),
+                "s_flx": hsmf_result.raw_metrics.get(
+                    "s_flx", BigNum128(0)
+                ).to_decimal_string(),
+                "s_psi_sync": hsmf_result.raw_metrics.get(
+                    "s_psi_sync", BigNum128(0)
+                ).to_decimal_string(),
+                "f_atr": hsmf_result.raw_metrics.get(
+                    "f_atr", BigNum128(0)
+                ).to_decimal_string(),
+            },
+            "treasury_result": {
+                "is_valid": treasury_result.is_valid,
+                "total_allocation": treasury_result.total_allocation.to_decimal_string(),
+                "rewards_count": len(treasury_result.rewards),
+            },
+            "log_hash": log_hash,
+            "pqc_cid": pqc_cid,
+            "quantum_metadata": self.quantum_metadata,
+        }
+        finality_seal = self._sign_finality_seal(response_data, log_list)
+        return APIResponse(
+            success=True,
+            data=response_data,
+            error=None,
+            finality_seal=finality_seal,
+            pqc_cid=pqc_cid,
+        )
+
+    def _compute_treasury_rewards(
+        self,
+        hsmf_result: Any,
+        token_bundle: TokenStateBundle,
+        drv_packet: DRV_Packet,
+        log_list: List[Dict[str, Any]],
+        pqc_cid: str,
+    ) -> TreasuryResult:
+        """
+        Compute rewards from HSMF metrics, capturing guard/coherence failures.
+
+        Returns:
+            TreasuryResult: Non-zero rewards by token, or the validation errors
+        """
+        hsmf_metrics = {
+            "S_CHR": hsmf_result.raw_metrics.get("s_chr", BigNum128(0)),
+            "C_holo": hsmf_result.raw_metrics.get("c_holo", BigNum128(0)),
+            "Action_Cost_QFS": hsmf_result.raw_metrics.get("action_cost", BigNum128(0)),
+        }
+        try:
+            reward_bundle = self.treasury_engine.calculate_rewards(
+                hsmf_metrics=hsmf_metrics,
+                token_bundle=token_bundle,
+                log_list=log_list,
+                pqc_cid=pqc_cid,
+                quantum_metadata=drv_packet.metadata,
+                deterministic_timestamp=drv_packet.ttsTimestamp,
+            )
+        except (CertifiedMathError, ValueError) as e:
+            return TreasuryResult(
+                is_valid=False,
+                total_allocation=BigNum128(0),
+                rewards={},
+                validation_errors=[str(e)],
+            )
+        rewards = {
+            token: getattr(reward_bundle, f"{token}_reward")
+            for token in ("chr", "flx", "res", "psi_sync", "atr", "nod")
+            if getattr(reward_bundle, f"{token}_reward").value > 0
+        }
+        return TreasuryResult(
+            is_valid=True,
+            total_allocation=reward_bundle.total_reward,
+            rewards=rewards,
+            validation_errors=[],
+        )
+
+    def _unexpected_error(
+        self,
+        error: Exception,
+        drv_packet: DRV_Packet,
+        token_bundle: TokenStateBundle,
+    ) -> APIResponse:
+        """Quarantine a bundle whose processing raised unexpectedly."""
+        system_state = {
+            "token_bundle": token_bundle.to_dict() if token_bundle else {},
+            "drv_packet": drv_packet.to_dict() if drv_packet else {},
+            "error": str(error),
+        }
+        quarantine_result = self.cir302_handler.trigger_quarantine(
+            reason=f"Unexpected API error: {str(error)}", system_state=system_state
+        )
+        return APIResponse(
+            success=False,
+            data=None,
+            error=f"Unexpected API error: {str(error)}",
+            finality_seal=quarantine_result.finality_seal,
+            pqc_cid=quarantine_result.pqc_cid,
+        )
 
     def _sign_finality_seal(
         self, response_data: Dict[str, Any], log_list: List[Dict[str, Any]]
@@ -0,0 +1,175 @@
+"""
+aegis_snapshot_store.py - Bounded, persistent store for AEGIS snapshots
+
+Keeps hash-anchored AEGIS telemetry/registry snapshots keyed by block height:
+a bounded in-memory LRU sits in front of an append-only segment file, so
+memory stays flat over long replays and snapshots survive a restart.
+
+Segment format: one JSON record (the snapshot's ``to_dict()``) per line.
+Records read back from disk are verified against their ``snapshot_hash``
+before they are served.
+"""
+
+import json
+import os
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+class SnapshotIntegrityError(ValueError):
+    """Raised when a persisted snapshot does not match its snapshot_hash."""
+
+    pass
+
+
+class SnapshotStore:
+    """
+    Block-height keyed snapshot store: LRU cache over an append-only segment.
+
+    The on-disk index is two parallel ``array('q')`` columns (height, offset),
+    i.e. 16 bytes per persisted block; lookups bisect while heights arrive in
+    ascending order (the replay case) and fall back to a small dict for
+    out-of-order heights.
+    """
+
+    def __init__(
+        self,
+        snapshot_factory: Callable[..., Any],
+        segment_path: Optional[str] = None,
+        max_entries: int = 4096,
+    ):
+        """
+        Initialize the store, rebuilding the index from an existing segment.
+
+        Args:
+            snapshot_factory: Snapshot dataclass (or callable) built from a record's fields
+            segment_path: Optional append-only segment file; None keeps the store in memory only
+            max_entries: Maximum number of snapshots held in memory
+        """
+        self.snapshot_factory = snapshot_factory
+        self.segment_path = segment_path
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[int, Any]" = OrderedDict()
+        self._heights = array("q")
+        self._offsets = array("q")
+        self._unordered: Dict[int, int] = {}
+        self._writer = None
+        self._reader = None
+        self.hits = 0
+        self.loads = 0
+        self.misses = 0
+        if segment_path is not None:
+            self._open_segment()
+
+    def _open_segment(self):
+        """Index an existing segment, dropping a torn trailing record."""
+        directory = os.path.dirname(self.segment_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        offset = 0
+        if os.path.exists(self.segment_path):
+            with open(self.segment_path, "rb") as segment:
+                for line in segment:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        height = json.loads(line)["block_height"]
+                    except (ValueError, KeyError, TypeError):
+                        break
+                    self._index(height, offset)
+                    offset += len(line)
+            if offset != os.path.getsize(self.segment_path):
+                with open(self.segment_path, "r+b") as segment:
+                    segment.truncate(offset)
+        self._writer = open(self.segment_path, "ab")
+        self._reader = open(self.segment_path, "rb")
+
+    def _index(self, block_height: int, offset: int):
+        if self._find(block_height) is not None:
+            return
+        if not self._heights or block_height > self._heights[-1]:
+            self._heights.append(block_height)
+            self._offsets.append(offset)
+        else:
+            self._unordered[block_height] = offset
+
+    def _find(self, block_height: int) -> Optional[int]:
+        position = bisect_left(self._heights, block_height)
+        if position < len(self._heights) and self._heights[position] == block_height:
+            return self._offsets[position]
+        return self._unordered.get(block_height)
+
+    def _remember(self, block_height: int, snapshot: Any):
+        if self.max_entries <= 0:
+            return
+        self._cache[block_height] = snapshot
+        self._cache.move_to_end(block_height)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def _load(self, block_height: int, offset: int) -> Any:
+        self._reader.seek(offset)
+        record = json.loads(self._reader.readline())
+        snapshot = self.snapshot_factory(**record)
+        if (
+            snapshot.block_height != block_height
+            or snapshot.compute_hash() != snapshot.snapshot_hash
+        ):
+            raise SnapshotIntegrityError(
+                f"Persisted snapshot for block {block_height} failed hash verification"
+            )
+        return snapshot
+
+    def get(self, block_height: int) -> Optional[Any]:
+        """
+        Return the snapshot for a block height, or None if it was never stored.
+
+        Raises:
+            SnapshotIntegrityError: If the persisted record fails hash verification
+        """
+        snapshot = self._cache.get(block_height)
+        if snapshot is not None:
+            self._cache.move_to_end(block_height)
+            self.hits += 1
+            return snapshot
+        offset = self._find(block_height) if self._reader is not None else None
+        if offset is None:
+            self.misses += 1
+            return None
+        snapshot = self._load(block_height, offset)
+        self.loads += 1
+        self._remember(block_height, snapshot)
+        return snapshot
+
+    def put(self, snapshot: Any):
+        """Cache a snapshot and append it to the segment if not already persisted."""
+        block_height = snapshot.block_height
+        if self._writer is not None and self._find(block_height) is None:
+            record = json.dumps(
+                snapshot.to_dict(), sort_keys=True, separators=(",", ":")
+            ).encode("utf-8")
+            offset = self._writer.tell()
+            self._writer.write(record + b"\n")
+            self._writer.flush()
+            self._index(block_height, offset)
+        self._remember(block_height, snapshot)
+
+    def __contains__(self, block_height: int) -> bool:
+        return block_height in self._cache or (
+            self._reader is not None and self._find(block_height) is not None
+        )
+
+    def __len__(self) -> int:
+        if self._reader is None:
+            return len(self._cache)
+        return len(self._heights) + len(self._unordered)
+
+    def close(self):
+        """Close the segment file handles; the in-memory cache stays usable."""
+        for handle in (self._writer, self._reader):
+            if handle is not None:
+                handle.close()
+        self._writer = None
+        self._reader = None
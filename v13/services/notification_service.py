@@ -7,7 +7,8 @@ and provides deterministic read APIs.
 """
 import json
 import hashlib
-from typing import Dict, Any, Optional, List
+from bisect import bisect_left, insort
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from ..libs.CertifiedMath import BigNum128, CertifiedMath
@@ -50,6 +51,10 @@ class NotificationService:
         """
         self.cm = cm_instance
         self.notifications: List[Notification] = []
+        self._by_id: Dict[str, Notification] = {}
+        self._all_keys: List[Tuple[int, str]] = []
+        self._category_keys: Dict[NotificationCategory, List[Tuple[int, str]]] = {c: [] for c in NotificationCategory}
+        self._unread_counts: Dict[str, int] = {c.value: 0 for c in NotificationCategory}
         self.quantum_metadata = {'component': 'NotificationService', 'version': 'QFS-V13-P1-2', 'pqc_scheme': 'Dilithium-5'}
 
     def process_ledger_entry(self, ledger_entry: LedgerEntry) -> Optional[Notification]:
@@ -69,36 +74,47 @@ class NotificationService:
         notification_data = {'event_id': ledger_entry.entry_id, 'category': category.value, 'timestamp': ledger_entry.timestamp}
         notification_json = json.dumps(notification_data, sort_keys=True)
         notification_id = hashlib.sha256(notification_json.encode('utf-8')).hexdigest()[:32]
+        existing = self._by_id.get(notification_id)
+        if existing is not None:
+            return existing
         pqc_cid = self._generate_pqc_cid(notification_data, ledger_entry.timestamp)
         notification = Notification(notification_id=notification_id, timestamp=ledger_entry.timestamp, category=category, title=title, message=message, event_id=ledger_entry.entry_id, is_read=False, metadata={'entry_type': ledger_entry.entry_type, 'entry_hash': ledger_entry.entry_hash + '...'}, pqc_cid=pqc_cid, quantum_metadata=self.quantum_metadata.copy())
-        self.notifications.append(notification)
+        self._index_notification(notification)
         return notification
 
     def get_notifications(self, category: Optional[NotificationCategory]=None, limit: int=20, cursor: Optional[str]=None) -> Dict[str, Any]:
         """
         Get notifications with optional filtering by category.
 
+        Notifications are returned newest first, ordered by (timestamp,
+        notification_id). The cursor is a keyset position: the next page
+        starts strictly after the last notification of the previous page.
+
         Args:
             category: Optional category to filter by
-            limit: Maximum number of notifications to return
+            limit: Maximum number of notifications to return (<= 0 for all)
             cursor: Pagination cursor for next page
 
         Returns:
             Dict: Notifications and pagination info
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        filtered_notifications = self.notifications
-        if category:
-            filtered_notifications = [n for n in self.notifications if n.category == category]
-        filtered_notifications.sort(key=lambda x: x.timestamp, reverse=True)
-        if limit > 0:
-            filtered_notifications = filtered_notifications[:limit]
+        keys = self._category_keys[category] if category else self._all_keys
+        end = len(keys)
+        if cursor:
+            end = bisect_left(keys, self._decode_cursor(cursor))
+        start = max(0, end - limit) if limit > 0 else 0
+        page_keys = keys[start:end]
+        page_keys.reverse()
         notifications_data = []
-        for notification in sorted(filtered_notifications):
+        for _, notification_id in page_keys:
+            notification = self._by_id[notification_id]
             notifications_data.append({'notification_id': notification.notification_id, 'timestamp': notification.timestamp, 'category': notification.category.value, 'title': notification.title, 'message': notification.message, 'event_id': notification.event_id, 'is_read': notification.is_read, 'metadata': notification.metadata})
         next_cursor = None
-        if len(filtered_notifications) == limit and self.notifications:
-            oldest_timestamp = filtered_notifications[-1].timestamp
-            next_cursor = f'cursor_{oldest_timestamp}'
+        if start > 0 and page_keys:
+            next_cursor = self._encode_cursor(page_keys[-1])
         return {'notifications': notifications_data, 'next_cursor': next_cursor, 'unread_counts': self._get_unread_counts()}
 
     def get_unread_counts(self) -> Dict[str, int]:
@@ -120,11 +136,40 @@ class NotificationService:
         Returns:
             bool: True if notification was found and marked as read
         """
-        for notification in sorted(self.notifications):
-            if notification.notification_id == notification_id:
-                notification.is_read = True
-                return True
-        return False
+        notification = self._by_id.get(notification_id)
+        if notification is None:
+            return False
+        if not notification.is_read:
+            notification.is_read = True
+            self._unread_counts[notification.category.value] -= 1
+        return True
+
+    def _index_notification(self, notification: Notification) -> None:
+        """Store a notification and update the id map, ordered keys and unread counters."""
+        key = (notification.timestamp, notification.notification_id)
+        self.notifications.append(notification)
+        self._by_id[notification.notification_id] = notification
+        insort(self._all_keys, key)
+        insort(self._category_keys[notification.category], key)
+        if not notification.is_read:
+            self._unread_counts[notification.category.value] += 1
+
+    @staticmethod
+    def _encode_cursor(key: Tuple[int, str]) -> str:
+        """Encode a (timestamp, notification_id) key as a pagination cursor."""
+        return f'cursor_{key[0]}_{key[1]}'
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[int, str]:
+        """Decode a pagination cursor into a (timestamp, notification_id) key."""
+        parts = cursor.split('_', 2)
+        if len(parts) != 3 or parts[0] != 'cursor' or not parts[2]:
+            raise ValueError(f'Invalid notification cursor: {cursor}')
+        try:
+            timestamp = int(parts[1])
+        except ValueError:
+            raise ValueError(f'Invalid notification cursor: {cursor}')
+        return (timestamp, parts[2])
 
     def _categorize_entry(self, ledger_entry: LedgerEntry) -> Optional[NotificationCategory]:
         """
@@ -204,11 +249,7 @@ class NotificationService:
 
     def _get_unread_counts(self) -> Dict[str, int]:
         """Get unread notification counts per category."""
-        counts = {'social': 0, 'economic': 0, 'governance': 0}
-        for notification in sorted(self.notifications):
-            if not notification.is_read:
-                counts[notification.category.value] += 1
-        return counts
+        return dict(self._unread_counts)
 
 def test_notification_service():
     """Test the NotificationService implementation."""
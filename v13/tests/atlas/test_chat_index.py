@@ -0,0 +1,194 @@
+"""
+test_chat_index.py - ChatService message index and read watermark tests
+
+Covers the message_id index, bisect-served history pages and per-participant
+read watermarks, plus a benchmark against the scan/sort implementation.
+"""
+
+import os
+import time
+
+import pytest
+
+from v13.libs.CertifiedMath import CertifiedMath
+from v13.ATLAS.chat import ChatService, ConversationType, MessageStatus
+
+
+@pytest.fixture
+def chat_service():
+    """ChatService instance for tests"""
+    return ChatService(CertifiedMath(), max_participants=100)
+
+
+def _conversation(chat_service, timestamp=1000000):
+    return chat_service.create_conversation(
+        creator_wallet="wallet_alice",
+        participants=["wallet_alice", "wallet_bob", "wallet_carol"],
+        conversation_type=ConversationType.GROUP,
+        timestamp=timestamp,
+        log_list=[],
+    )
+
+
+def _send(chat_service, conversation, timestamps):
+    return [
+        chat_service.send_message(
+            conversation_id=conversation.conversation_id,
+            sender_wallet="wallet_alice",
+            content_cid=f"Qm_cid_{i}",
+            timestamp=timestamp,
+            log_list=[],
+        )
+        for i, timestamp in enumerate(timestamps)
+    ]
+
+
+def _sorted_reference(chat_service, conversation_id, limit, before_timestamp=None):
+    """The previous filter-and-sort implementation of history pages."""
+    messages = chat_service.messages[conversation_id]
+    if before_timestamp is not None:
+        messages = [m for m in messages if m.timestamp < before_timestamp]
+    sorted_messages = sorted(messages, key=lambda m: (m.timestamp, m.message_id))
+    return (
+        sorted_messages[-limit:] if len(sorted_messages) > limit else sorted_messages
+    )
+
+
+def test_history_pages_match_sorted_order(chat_service):
+    """Out-of-order and equal timestamps page exactly like the sorted scan"""
+    conversation = _conversation(chat_service)
+    _send(chat_service, conversation, [1005, 1001, 1003, 1003, 1009, 1002, 1007])
+
+    for limit in (0, 1, 3, 50):
+        for before in (None, 1000, 1003, 1004, 2000):
+            assert chat_service.get_conversation_messages(
+                conversation.conversation_id, limit=limit, before_timestamp=before
+            ) == _sorted_reference(
+                chat_service, conversation.conversation_id, limit, before
+            )
+    assert chat_service.get_conversation_messages("missing") == []
+
+
+def test_mark_as_read_uses_index(chat_service):
+    """Messages are found by id and must belong to the given conversation"""
+    conversation = _conversation(chat_service)
+    other = _conversation(chat_service, timestamp=2000000)
+    messages = _send(chat_service, conversation, [1001, 1002, 1003])
+
+    log = []
+    updated = chat_service.mark_as_read(
+        messages[1].message_id, conversation.conversation_id, "wallet_bob", 1010, log
+    )
+
+    assert updated is messages[1] and updated.status == MessageStatus.READ
+    assert log == [
+        {
+            "operation": "message_read",
+            "message_id": messages[1].message_id,
+            "reader": "wallet_bob",
+            "timestamp": 1010,
+        }
+    ]
+    with pytest.raises(ValueError, match="not found"):
+        chat_service.mark_as_read(
+            messages[1].message_id, other.conversation_id, "wallet_bob", 1010, []
+        )
+
+
+def test_read_watermark_covers_earlier_messages(chat_service):
+    """One watermark call marks everything up to the message as read"""
+    conversation = _conversation(chat_service)
+    messages = _send(chat_service, conversation, [1001, 1002, 1003, 1004, 1005])
+    conversation_id = conversation.conversation_id
+
+    log = []
+    chat_service.mark_read_through(
+        messages[2].message_id, conversation_id, "wallet_bob", 1010, log
+    )
+    chat_service.mark_read_through(
+        messages[0].message_id, conversation_id, "wallet_bob", 1011, log
+    )
+
+    assert [entry["operation"] for entry in log] == ["messages_read_through"] * 2
+    assert log[0]["message_id"] == messages[2].message_id
+    assert chat_service.get_read_watermark(conversation_id, "wallet_bob") == (
+        messages[2].message_id
+    )
+    assert chat_service.get_read_watermark(conversation_id, "wallet_carol") is None
+    assert chat_service.get_unread_count(conversation_id, "wallet_bob") == 2
+    assert chat_service.get_unread_count(conversation_id, "wallet_carol") == 5
+
+    history = chat_service.get_conversation_messages(conversation_id)
+    assert [m.status for m in history] == [MessageStatus.READ] * 3 + [
+        MessageStatus.SENT
+    ] * 2
+
+    with pytest.raises(ValueError, match="not a participant"):
+        chat_service.mark_read_through(
+            messages[4].message_id, conversation_id, "wallet_eve", 1012, []
+        )
+
+
+def test_recreated_conversation_drops_old_index(chat_service):
+    """Re-creating a conversation resets its messages and their index entries"""
+    conversation = _conversation(chat_service)
+    messages = _send(chat_service, conversation, [1001])
+    _conversation(chat_service)
+
+    with pytest.raises(ValueError, match="not found"):
+        chat_service.mark_as_read(
+            messages[0].message_id,
+            conversation.conversation_id,
+            "wallet_bob",
+            1010,
+            [],
+        )
+    assert chat_service.get_conversation_messages(conversation.conversation_id) == []
+
+
+@pytest.mark.performance
+def test_chat_index_benchmark(chat_service):
+    """History pages, lookups and read-through at depth (QFS_CHAT_INDEX_BENCH_MESSAGES)"""
+    count = int(os.environ.get("QFS_CHAT_INDEX_BENCH_MESSAGES", "100000"))
+    conversation = _conversation(chat_service)
+    conversation_id = conversation.conversation_id
+    for i in range(count):
+        chat_service.send_message(
+            conversation_id, "wallet_alice", f"Qm_cid_{i}", 1000 + i, log_list=[]
+        )
+    middle = chat_service.messages[conversation_id][count // 2]
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        page = chat_service.get_conversation_messages(
+            conversation_id, limit=50, before_timestamp=middle.timestamp
+        )
+    page_elapsed = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    reference = _sorted_reference(chat_service, conversation_id, 50, middle.timestamp)
+    sort_elapsed = time.perf_counter() - start
+    assert page == reference
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        chat_service.mark_as_read(
+            middle.message_id, conversation_id, "wallet_bob", 5000, []
+        )
+    lookup_elapsed = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    chat_service.mark_read_through(
+        middle.message_id, conversation_id, "wallet_bob", 5000, []
+    )
+    watermark_elapsed = time.perf_counter() - start
+
+    print(
+        f"\n{count} messages: page {page_elapsed * 1e6:.1f} us (sort {sort_elapsed * 1e3:.1f} ms), "
+        f"mark_as_read {lookup_elapsed * 1e6:.1f} us, "
+        f"read-through {count // 2} messages {watermark_elapsed * 1e6:.1f} us"
+    )
+    assert page_elapsed * 10 < sort_elapsed
+    assert chat_service.get_unread_count(conversation_id, "wallet_bob") == count - (
+        count // 2 + 1
+    )
@@ -0,0 +1,179 @@
+"""
+test_state_transition_batch.py - Single-pass and chunked StateTransitionEngine.
+
+Verifies:
+1. All five token totals are applied in one pass with one audit record per token.
+2. Chunked epoch application yields the same bundle as a single transition.
+3. Supply-delta and overflow violations are reported for chunked application.
+4. Chunks repeating an address are rejected.
+"""
+
+import time
+
+import pytest
+from v13.libs.CertifiedMath import BigNum128, CertifiedMath
+from v13.libs.governance.RewardAllocator import AllocatedReward
+from v13.libs.integration.StateTransitionEngine import StateTransitionEngine
+from v13.core.TokenStateBundle import create_token_state_bundle
+
+
+def _bundle(balance: str = "1000"):
+    return create_token_state_bundle(
+        chr_state={"balance": balance},
+        flx_state={"balance": balance},
+        psi_sync_state={"balance": balance},
+        atr_state={"balance": balance},
+        res_state={"balance": balance},
+        nod_state={"balance": "0"},
+        lambda1=BigNum128.from_int(1),
+        lambda2=BigNum128.from_int(1),
+        c_crit=BigNum128.from_int(1),
+        pqc_cid="pqc_batch",
+        timestamp=1000,
+    )
+
+
+def _rewards(count: int, unit: str = "0.1"):
+    amount = BigNum128.from_string(unit)
+    return {
+        f"addr_{i:06d}": AllocatedReward(
+            address=f"addr_{i:06d}",
+            chr_amount=amount,
+            flx_amount=amount,
+            res_amount=amount,
+            psi_sync_amount=amount,
+            atr_amount=amount,
+            total_amount=amount,
+        )
+        for i in range(count)
+    }
+
+
+class TestStateTransitionBatch:
+    """Verification suite for single-pass and chunked state transitions."""
+
+    def test_single_pass_totals_and_compact_audit(self):
+        engine = StateTransitionEngine(CertifiedMath())
+        log_list = []
+        result = engine.apply_state_transition(
+            current_token_bundle=_bundle(),
+            allocated_rewards=_rewards(250),
+            log_list=log_list,
+            deterministic_timestamp=2000,
+        )
+        assert result.success is True
+        bundle = result.new_token_bundle
+        for state in (
+            bundle.chr_state,
+            bundle.flx_state,
+            bundle.psi_sync_state,
+            bundle.atr_state,
+            bundle.res_state,
+        ):
+            assert BigNum128.from_string(state["balance"]).value == (
+                BigNum128.from_string("1025").value
+            )
+        batch_records = [e for e in log_list if e.get("op_name") == "reward_batch_add"]
+        assert len(batch_records) == 5
+
+    def test_chunked_matches_single_transition(self):
+        engine = StateTransitionEngine(CertifiedMath())
+        rewards = _rewards(1000)
+        single = engine.apply_state_transition(
+            current_token_bundle=_bundle("10000"),
+            allocated_rewards=rewards,
+            log_list=[],
+            deterministic_timestamp=2000,
+        )
+        chunked = engine.apply_epoch_transitions(
+            current_token_bundle=_bundle("10000"),
+            reward_chunks=StateTransitionEngine.iter_reward_chunks(rewards, 128),
+            log_list=[],
+            deterministic_timestamp=2000,
+        )
+        assert chunked.success is True
+        assert (
+            chunked.new_token_bundle.get_deterministic_hash()
+            == single.new_token_bundle.get_deterministic_hash()
+        )
+
+    def test_chunked_supply_violation_fails(self):
+        engine = StateTransitionEngine(CertifiedMath())
+        log_list = []
+        result = engine.apply_epoch_transitions(
+            current_token_bundle=_bundle("10"),
+            reward_chunks=StateTransitionEngine.iter_reward_chunks(
+                _rewards(100, "1"), 10
+            ),
+            log_list=log_list,
+            deterministic_timestamp=2000,
+        )
+        assert result.success is False
+        assert "supply delta violation" in result.error_message
+
+    def test_overlapping_chunks_rejected(self):
+        engine = StateTransitionEngine(CertifiedMath())
+        rewards = _rewards(30)
+        chunks = list(StateTransitionEngine.iter_reward_chunks(rewards, 10))
+        chunks.append({"addr_000005": rewards["addr_000005"]})
+        log_list = []
+        result = engine.apply_epoch_transitions(
+            current_token_bundle=_bundle(),
+            reward_chunks=chunks,
+            log_list=log_list,
+            deterministic_timestamp=2000,
+        )
+        assert result.success is False
+        assert "addr_000005" in result.error_message
+        assert "overlap" in result.error_message
+
+    def test_overflow_is_detected(self):
+        engine = StateTransitionEngine(CertifiedMath())
+        huge = BigNum128(BigNum128.MAX_VALUE // 2 + 1)
+        rewards = {
+            f"addr_{i}": AllocatedReward(
+                address=f"addr_{i}",
+                chr_amount=BigNum128(0),
+                flx_amount=BigNum128(0),
+                res_amount=BigNum128(0),
+                psi_sync_amount=BigNum128(0),
+                atr_amount=huge,
+                total_amount=huge,
+            )
+            for i in range(2)
+        }
+        result = engine.apply_state_transition(
+            current_token_bundle=_bundle("0"),
+            allocated_rewards=rewards,
+            log_list=[],
+            deterministic_timestamp=2000,
+        )
+        assert result.success is False
+        assert "overflow" in result.error_message
+
+    def test_chunk_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            list(StateTransitionEngine.iter_reward_chunks(_rewards(3), 0))
+
+
+@pytest.mark.performance
+def test_large_reward_set_benchmark():
+    """50k recipients: one pass and five audit records per epoch."""
+    engine = StateTransitionEngine(CertifiedMath())
+    rewards = _rewards(50_000, "0.001")
+    log_list = []
+    start = time.perf_counter()
+    result = engine.apply_state_transition(
+        current_token_bundle=_bundle("10000"),
+        allocated_rewards=rewards,
+        log_list=log_list,
+        deterministic_timestamp=2000,
+    )
+    elapsed = time.perf_counter() - start
+    print(f"\n50k-recipient transition: {elapsed * 1000:.1f} ms, {len(log_list)} log entries")
+    assert result.success is True
+    assert len(log_list) < 50
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,103 @@
+"""
+Tests for EconomicsGuard columnar batch validators
+"""
+import time
+import pytest
+from v13.libs.CertifiedMath import CertifiedMath
+from v13.libs.BigNum128 import BigNum128
+from v13.libs.economics.EconomicsGuard import EconomicsGuard
+
+SCALE = BigNum128.SCALE
+
+
+def _guard():
+    return EconomicsGuard(CertifiedMath())
+
+
+def _row_by_row_nod(guard, nods, fees, powers, total_power, shares, issuance, active):
+    failures = []
+    for row, (nod, power, share) in enumerate(zip(nods, powers, shares)):
+        result = guard.validate_nod_allocation(BigNum128(nod), fees, BigNum128(power), total_power, BigNum128(share), issuance, active, [])
+        if not result.passed:
+            failures.append((row, result))
+    return failures
+
+
+class TestEconomicsGuardBatch:
+    """Batch validators must agree with the per-row validators."""
+
+    def test_nod_batch_matches_row_by_row_at_boundaries(self):
+        guard = _guard()
+        fees = BigNum128.from_int(1000)
+        total_power = BigNum128.from_int(4)
+        # Fractions straddling the truncating-division bounds (0.01 .. 0.15)
+        nods = [10 * SCALE, 10 * SCALE - 1, 150 * SCALE, 150 * SCALE + 1, 150 * SCALE + 999, 150 * SCALE + 1000, 50 * SCALE]
+        powers = [SCALE, SCALE, SCALE, SCALE, SCALE, SCALE, SCALE + 1]
+        shares = [SCALE // 10] * 6 + [SCALE // 2]
+        issuance = BigNum128.from_int(500)
+        batch = guard.validate_nod_allocations_batch(nods, fees, powers, total_power, shares, issuance, 5, [])
+        expected = _row_by_row_nod(guard, nods, fees, powers, total_power, shares, issuance, 5)
+        assert [row for row, _ in batch.violations] == [row for row, _ in expected]
+        assert [r.to_dict() for _, r in batch.violations] == [r.to_dict() for _, r in expected]
+        assert batch.passed is False
+        assert batch.rows_checked == len(nods)
+
+    def test_nod_batch_epoch_level_violation(self):
+        guard = _guard()
+        batch = guard.validate_nod_allocations_batch([SCALE] * 2, BigNum128.from_int(100), [0, 0], BigNum128.from_int(1), [0, 0], BigNum128.from_int(10), 2, [])
+        assert [row for row, _ in batch.violations] == [-1]
+        assert batch.first_violation.error_code == 'ECON_NOD_INSUFFICIENT_ACTIVE_NODES'
+
+    def test_chr_batch_accumulates_daily_total(self):
+        guard = _guard()
+        daily = BigNum128.from_int(9_995_000)
+        supply = BigNum128.from_int(1000)
+        amounts = [2000 * SCALE, 2000 * SCALE, 2000 * SCALE, 5 * SCALE, 1000 * SCALE]
+        batch = guard.validate_chr_rewards_batch(amounts, daily, supply, [])
+        assert [(row, v.error_code) for row, v in batch.violations] == [(2, 'ECON_CHR_EMISSION_CAP_EXCEEDED'), (3, 'ECON_CHR_REWARD_BELOW_MIN')]
+
+    def test_flx_batch_cross_multiplication(self):
+        guard = _guard()
+        chr_rewards = [100 * SCALE] * 4 + [0]
+        flx = [SCALE, SCALE - 1, 20 * SCALE + 99, 20 * SCALE + 100, 5 * SCALE]
+        balances = [0, 0, 0, 0, 1_000_000 * SCALE]
+        batch = guard.validate_flx_rewards_batch(flx, chr_rewards, balances, [])
+        expected = [(row, guard.validate_flx_reward(BigNum128(f), BigNum128(c), BigNum128(b), [])) for row, (f, c, b) in enumerate(zip(flx, chr_rewards, balances))]
+        expected = [(row, r.to_dict()) for row, r in expected if not r.passed]
+        assert [(row, r.to_dict()) for row, r in batch.violations] == expected
+        assert [row for row, _ in expected] == [1, 3, 4]
+
+    def test_per_address_batch_and_summary_log(self):
+        guard = _guard()
+        log_list = []
+        batch = guard.validate_per_address_rewards_batch(['a', 'b', 'c'], [SCALE, 2_000_000 * SCALE, SCALE], log_list)
+        assert [row for row, _ in batch.violations] == [1]
+        assert 'for b exceeds' in batch.first_violation.error_message
+        assert log_list[-1]['operation'] == 'economics_guard_batch'
+        assert log_list[-1]['violation_count'] == 1
+
+    def test_mismatched_columns_rejected(self):
+        with pytest.raises(ValueError):
+            _guard().validate_flx_rewards_batch([1, 2], [1], [1, 2], [])
+
+
+@pytest.mark.performance
+def test_nod_batch_benchmark():
+    """10k-node epoch: batch pass versus per-row validate_nod_allocation."""
+    guard = _guard()
+    n = 10_000
+    fees = BigNum128.from_int(1_000_000)
+    total_power = BigNum128.from_int(n)
+    nods = [(1_000_000 * SCALE) // 20 + i for i in range(n)]
+    powers = [SCALE] * n
+    shares = [SCALE // n] * n
+    issuance = BigNum128.from_int(100_000)
+    start = time.perf_counter()
+    batch = guard.validate_nod_allocations_batch(nods, fees, powers, total_power, shares, issuance, n, [])
+    batch_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = _row_by_row_nod(guard, nods, fees, powers, total_power, shares, issuance, n)
+    loop_elapsed = time.perf_counter() - start
+    print(f'\n{n}-node NOD validation: batch {batch_elapsed * 1000:.1f} ms, per-row {loop_elapsed * 1000:.1f} ms')
+    assert batch.passed is True
+    assert expected == []
@@ -0,0 +1,85 @@
+import hashlib
+import hmac
+import json
+from typing import NamedTuple, Optional
+
+
+class ChainValidation(NamedTuple):
+    is_valid: bool
+    error_code: int
+    error_message: Optional[str] = None
+
+
+class ChainedDRVPacket:
+    """
+    Deterministic stand-in for DRV_Packet (the conftest replaces the real
+    module with ``object``). Mirrors the hashing, HMAC mock signature and
+    validate_chain messages that AEGIS_API depends on.
+    """
+
+    SIGNATURE_PREFIX = b"MOCK_SIG:dilithium2:"
+
+    def __init__(
+        self, ttsTimestamp, sequence, seed, metadata=None, previous_hash=None
+    ):
+        self.ttsTimestamp = ttsTimestamp
+        self.sequence = sequence
+        self.seed = seed
+        self.metadata = metadata or {}
+        self.previous_hash = previous_hash
+        self.pqc_signature = None
+
+    def to_dict(self, include_signature=False):
+        data = {
+            "version": "1.0",
+            "ttsTimestamp": self.ttsTimestamp,
+            "sequence": self.sequence,
+            "seed": self.seed,
+            "metadata": self.metadata,
+            "previous_hash": self.previous_hash,
+        }
+        if include_signature and self.pqc_signature is not None:
+            data["pqc_signature"] = self.pqc_signature.hex()
+        return data
+
+    def get_hash(self):
+        canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def sign(self, private_key_bytes):
+        message = self.get_hash().encode("utf-8")
+        digest = hmac.new(private_key_bytes, message, hashlib.sha256).digest()
+        self.pqc_signature = self.SIGNATURE_PREFIX + digest
+
+    def verify_signature(
+        self, public_key_bytes, log_list, pqc_cid=None, quantum_metadata=None
+    ):
+        signature = self.pqc_signature or b""
+        result = signature.startswith(self.SIGNATURE_PREFIX) and len(signature) == len(
+            self.SIGNATURE_PREFIX
+        ) + 32
+        log_list.append(
+            {"operation": "verify", "packet_hash": self.get_hash(), "result": result}
+        )
+        return result
+
+    @staticmethod
+    def validate_chain(
+        previous_packet, current_packet, pqc_cid=None, quantum_metadata=None
+    ):
+        if previous_packet is None:
+            return ChainValidation(True, 0)
+        expected_hash = previous_packet.get_hash()
+        if current_packet.previous_hash != expected_hash:
+            return ChainValidation(
+                False,
+                4,
+                f"Chain hash mismatch: got {current_packet.previous_hash}, expected {expected_hash}",
+            )
+        if current_packet.sequence != previous_packet.sequence + 1:
+            return ChainValidation(
+                False,
+                1,
+                f"Sequence non-monotonic: got {current_packet.sequence}, expected {previous_packet.sequence + 1}",
+            )
+        return ChainValidation(True, 0)
@@ -0,0 +1,30 @@
+import hashlib
+
+
+class LoopbackKEM:
+    """
+    Deterministic stand-in for the PQC KEM calls made by the P2P
+    ConnectionManager (the conftest PQC mock has no encapsulate).
+    Counts keypair generations and encapsulations so tests can assert
+    skipped handshakes.
+    """
+
+    KYBER1024 = "Kyber1024"
+    keypairs = 0
+    encapsulations = 0
+
+    @classmethod
+    def kem_generate_keypair(cls, algorithm, seed=None):
+        cls.keypairs += 1
+        secret_key = hashlib.sha256(b"sk%d" % cls.keypairs).digest()
+        return (hashlib.sha256(secret_key).digest(), secret_key)
+
+    @classmethod
+    def kem_encapsulate(cls, algorithm, public_key):
+        cls.encapsulations += 1
+        shared_secret = hashlib.sha256(b"ss" + public_key).digest()
+        return (public_key, shared_secret)
+
+    @staticmethod
+    def kem_decapsulate(algorithm, secret_key, ciphertext):
+        return hashlib.sha256(b"ss" + ciphertext).digest()
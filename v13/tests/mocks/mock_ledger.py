@@ -0,0 +1,142 @@
+"""
+In-memory deterministic ledger adapter for RealLedger tests.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+from fractions import Fraction
+from typing import Any, Dict, Optional
+
+from v13.ATLAS.src.qfs_types import OperationBundle
+from v13.ATLAS.src.real_ledger import LedgerReceipt, LedgerSnapshot
+
+
+class MockLedger:
+    """
+    In-memory deterministic ledger used as the RealLedger adapter in tests.
+
+    Every submitted bundle is confirmed in its own block; each block yields a
+    new state_root and historical snapshots stay queryable by root.
+    ``latency_ms`` simulates a network round trip per call and ``calls`` counts
+    calls per method.
+    """
+
+    INITIAL_BALANCE = 1000
+
+    def __init__(self, latency_ms: int = 0):
+        self.latency_ms = latency_ms
+        self.bundles: Dict[str, OperationBundle] = {}
+        self.block_height = 0
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._receipts: Dict[str, LedgerReceipt] = {}
+        self._snapshots: Dict[str, LedgerSnapshot] = {}
+        self.state_root = self._record_snapshot("")
+        self.calls: Dict[str, int] = {}
+
+    async def _round_trip(self, method: str):
+        self.calls[method] = self.calls.get(method, 0) + 1
+        if self.latency_ms:
+            await asyncio.sleep(Fraction(self.latency_ms, 1000))
+
+    def _record_snapshot(self, timestamp: str) -> str:
+        state = copy.deepcopy(self._state)
+        state_root = hashlib.sha256(
+            json.dumps(
+                {"block_height": self.block_height, "state": state}, sort_keys=True
+            ).encode()
+        ).hexdigest()
+        self._snapshots[state_root] = LedgerSnapshot(
+            state_root=state_root,
+            timestamp=timestamp,
+            block_height=self.block_height,
+            state=state,
+        )
+        return state_root
+
+    def _apply(self, state: Dict[str, Dict[str, Any]], bundle: OperationBundle):
+        account = state.setdefault(
+            bundle.creator_id,
+            {
+                "address": bundle.creator_id,
+                "balance": self.INITIAL_BALANCE,
+                "nonce": 0,
+                "storage": {},
+                "code": None,
+            },
+        )
+        account["nonce"] += len(bundle.operations)
+
+    async def submit_bundle(self, bundle: OperationBundle) -> LedgerReceipt:
+        await self._round_trip("submit_bundle")
+        self.bundles[bundle.bundle_hash] = bundle
+        self._apply(self._state, bundle)
+        self.block_height += 1
+        self.state_root = self._record_snapshot(bundle.timestamp)
+        receipt = LedgerReceipt(
+            bundle_hash=bundle.bundle_hash,
+            status="confirmed",
+            timestamp=bundle.timestamp,
+            block_hash=self.state_root,
+            block_height=self.block_height,
+            gas_used=21000 * len(bundle.operations),
+            events=[{"type": "bundle_confirmed", "bundle_hash": bundle.bundle_hash}],
+        )
+        self._receipts[bundle.bundle_hash] = receipt
+        return receipt
+
+    async def get_snapshot(self, state_root: Optional[str] = None) -> LedgerSnapshot:
+        await self._round_trip("get_snapshot")
+        root = self.state_root if state_root is None else state_root
+        if root not in self._snapshots:
+            raise KeyError(f"Unknown state root {state_root}")
+        return copy.deepcopy(self._snapshots[root])
+
+    async def get_bundle(self, bundle_hash: str) -> Optional[Dict[str, Any]]:
+        await self._round_trip("get_bundle")
+        bundle = self.bundles.get(bundle_hash)
+        return bundle.to_dict() if bundle is not None else None
+
+    async def get_bundle_status(self, bundle_hash: str) -> Dict[str, Any]:
+        await self._round_trip("get_bundle_status")
+        receipt = self._receipts.get(bundle_hash)
+        if receipt is None:
+            return {"status": "unknown", "bundle_hash": bundle_hash}
+        return {
+            "status": receipt.status,
+            "bundle_hash": bundle_hash,
+            "block_height": receipt.block_height,
+            "block_hash": receipt.block_hash,
+        }
+
+    async def replay_bundle(self, bundle: OperationBundle) -> Dict[str, Any]:
+        await self._round_trip("replay_bundle")
+        receipt = self._receipts.get(bundle.bundle_hash)
+        if receipt is None:
+            return {"success": False, "divergence_details": ["bundle_not_found"]}
+        original = self._snapshots[receipt.block_hash]
+        state = copy.deepcopy(self._snapshots_before(receipt.block_height).state)
+        self._apply(state, bundle)
+        state_hash = hashlib.sha256(
+            json.dumps(state, sort_keys=True).encode()
+        ).hexdigest()
+        original_state_hash = hashlib.sha256(
+            json.dumps(original.state, sort_keys=True).encode()
+        ).hexdigest()
+        return {
+            "success": True,
+            "state_hash": state_hash,
+            "original_state_hash": original_state_hash,
+            "gas_used": receipt.gas_used,
+            "events": receipt.events,
+            "divergence_details": (
+                [] if state_hash == original_state_hash else ["state_mismatch"]
+            ),
+        }
+
+    def _snapshots_before(self, block_height: int) -> LedgerSnapshot:
+        for snapshot in self._snapshots.values():
+            if snapshot.block_height == block_height - 1:
+                return snapshot
+        raise KeyError(block_height - 1)
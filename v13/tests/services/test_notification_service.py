@@ -127,5 +127,60 @@ class TestNotificationService:
         assert notification1.notification_id == notification2.notification_id
         assert notification1.timestamp == notification2.timestamp
         assert notification1.category == notification2.category
+
+    def test_cursor_pagination_walks_all_pages(self):
+        """Test that keyset cursors page through notifications newest first without gaps"""
+        cm = CertifiedMath()
+        notification_service = NotificationService(cm)
+
+        class MockLedgerEntry:
+
+            def __init__(self, entry_id, timestamp, entry_type, data):
+                self.entry_id = entry_id
+                self.timestamp = timestamp
+                self.entry_type = entry_type
+                self.data = data
+                self.entry_hash = 'test_hash_' + entry_id
+        for i in range(7):
+            notification_service.process_ledger_entry(MockLedgerEntry(f'entry_{i:03d}', 1000 + i // 2, 'token_state', {'test': 'data'}))
+        notification_service.process_ledger_entry(MockLedgerEntry('reward_001', 2000, 'reward_allocation', {'test': 'data'}))
+        seen = []
+        cursor = None
+        while True:
+            page = notification_service.get_notifications(NotificationCategory.SOCIAL, limit=3, cursor=cursor)
+            seen.extend(page['notifications'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        assert len(seen) == 7
+        assert len({n['notification_id'] for n in seen}) == 7
+        keys = [(n['timestamp'], n['notification_id']) for n in seen]
+        assert keys == sorted(keys, reverse=True)
+        assert all(n['category'] == 'social' for n in seen)
+        with pytest.raises(ValueError):
+            notification_service.get_notifications(cursor='bogus')
+
+    def test_unread_counters_are_maintained(self):
+        """Test that unread counters track reads and ignore duplicate events"""
+        cm = CertifiedMath()
+        notification_service = NotificationService(cm)
+
+        class MockLedgerEntry:
+
+            def __init__(self, entry_id, timestamp, entry_type, data):
+                self.entry_id = entry_id
+                self.timestamp = timestamp
+                self.entry_type = entry_type
+                self.data = data
+                self.entry_hash = 'test_hash_' + entry_id
+        entry = MockLedgerEntry('entry_001', 1234567890, 'token_state', {'test': 'data'})
+        first = notification_service.process_ledger_entry(entry)
+        again = notification_service.process_ledger_entry(entry)
+        assert again is first
+        assert notification_service.get_unread_counts()['social'] == 1
+        assert notification_service.mark_as_read(first.notification_id) is True
+        assert notification_service.mark_as_read(first.notification_id) is True
+        assert notification_service.get_unread_counts()['social'] == 0
+        assert notification_service.mark_as_read('missing') is False
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
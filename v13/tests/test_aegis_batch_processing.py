@@ -0,0 +1,135 @@
+"""
+Tests for pipelined batch processing of AEGIS transaction bundles
+"""
+import json
+import time
+from dataclasses import asdict
+import pytest
+from v13.core.TokenStateBundle import TokenStateBundle
+from v13.core.reward_types import RewardBundle
+from v13.libs.BigNum128 import BigNum128 as BigNum128Base
+from v13.libs.CertifiedMath import BigNum128, CertifiedMath
+from v13.libs.governance.TreasuryEngine import TreasuryEngine
+from v13.libs.pqc_provider import get_pqc_provider
+from v13.services import aegis_api
+from v13.services.aegis_api import AEGIS_API
+from v13.tests.mocks.mock_drv import ChainedDRVPacket
+PUBLIC_KEY, PRIVATE_KEY = get_pqc_provider().generate_keypair(b'aegis-batch-test-seed-0123456789')
+
+
+@pytest.fixture(autouse=True)
+def drv_packet(monkeypatch):
+    monkeypatch.setattr(aegis_api, 'DRV_Packet', ChainedDRVPacket)
+
+
+class FlatRewardTreasury(TreasuryEngine):
+    """Treasury paying a fixed reward, so bundles can reach a finality seal."""
+
+    def calculate_rewards(self, hsmf_metrics, token_bundle, log_list, pqc_cid=None, quantum_metadata=None, deterministic_timestamp=0):
+        reward = self.cm.mul(hsmf_metrics['C_holo'], BigNum128.from_int(10), log_list, pqc_cid, quantum_metadata)
+        zero = BigNum128(0)
+        return RewardBundle(chr_reward=reward, flx_reward=zero, res_reward=zero, psi_sync_reward=zero, atr_reward=zero, nod_reward=zero, total_reward=reward)
+
+
+def _token_bundle(i, coherence):
+    parameters = {'beta_penalty': BigNum128.from_int(100000000), 'phi': BigNum128.from_string('1.618033988749894848')}
+    return TokenStateBundle(chr_state={'coherence_metric': coherence}, flx_state={'flux_metric': '0.15'}, psi_sync_state={'psi_sync_metric': '0.08'}, atr_state={'atr_metric': '0.85'}, res_state={'resonance_metric': '0.05'}, nod_state={'nod_metric': '0.5'}, storage_metrics={'storage_bytes_stored': {}, 'storage_uptime_bucket': {}, 'storage_proofs_verified': {}}, signature='test_signature', timestamp=1234567890 + i, bundle_id=f'bundle_{i}', pqc_cid='test_pqc_cid', quantum_metadata={'test': 'data'}, lambda1=BigNum128.from_string('0.3'), lambda2=BigNum128.from_string('0.2'), c_crit=BigNum128.from_string('0.05'), parameters=parameters)
+
+
+def _batch(size, coherences=('0.9996', '0.98', '0.01')):
+    """Chained, signed bundles cycling through passing, treasury-failing and HSMF-failing states."""
+    batch, previous_hash = ([], None)
+    for i in range(size):
+        packet = ChainedDRVPacket(ttsTimestamp=1234567890 + i, sequence=i, seed=f'seed_{i}', metadata={'bundle': i}, previous_hash=previous_hash)
+        packet.sign(PRIVATE_KEY)
+        previous_hash = packet.get_hash()
+        batch.append((packet, _token_bundle(i, coherences[i % len(coherences)]), BigNum128.from_string('0.85')))
+    return batch
+
+
+def _api(treasury=None):
+    api = AEGIS_API(CertifiedMath(), (PRIVATE_KEY, PUBLIC_KEY))
+    if treasury is not None:
+        api.treasury_engine = treasury
+    return api
+
+
+def _sequential(api, batch):
+    return [api.process_transaction_bundle(*bundle) for bundle in batch]
+
+
+def _serialized(responses):
+    return [json.dumps(asdict(r), sort_keys=True, default=str).encode('utf-8') for r in responses]
+
+
+class TestBatchMatchesSequential:
+
+    def test_quarantine_outcomes_identical(self):
+        batch = _batch(9)
+        sequential = _sequential(_api(), batch)
+        assert {r.error for r in sequential} == {'Treasury computation failed', 'HSMF validation failed'}
+        assert _api().process_transaction_bundles(batch) == sequential
+
+    def test_finality_seals_identical(self):
+        batch = _batch(6)
+        sequential = _sequential(_api(FlatRewardTreasury(CertifiedMath())), batch)
+        batched = _api(FlatRewardTreasury(CertifiedMath())).process_transaction_bundles(batch)
+        assert [r.success for r in sequential] == [True, True, False] * 2
+        assert all((r.finality_seal for r in sequential))
+        assert [(r.finality_seal, r.pqc_cid, r.data and r.data['log_hash']) for r in batched] == [(r.finality_seal, r.pqc_cid, r.data and r.data['log_hash']) for r in sequential]
+
+    def test_rejections_and_errors_identical(self):
+        batch = _batch(8)
+        batch[3] = (batch[3][0], None, batch[3][2])
+        batch[5][0].pqc_signature = b'forged'
+        sequential = _sequential(_api(), batch)
+        assert sequential[3].error.startswith('Unexpected API error')
+        assert sequential[5].error == 'Invalid DRV_Packet PQC signature'
+        assert sequential[6].error.startswith('Invalid DRV_Packet sequence or chain: Chain hash mismatch')
+        assert _api().process_transaction_bundles(batch) == sequential
+
+
+    def test_serialized_responses_byte_identical(self):
+        batch = _batch(12)
+        batch[4][0].pqc_signature = b'forged'
+        sequential = _sequential(_api(FlatRewardTreasury(CertifiedMath())), batch)
+        batched = _api(FlatRewardTreasury(CertifiedMath())).process_transaction_bundles(batch)
+        assert _serialized(batched) == _serialized(sequential)
+
+    def test_bignum_instances_share_certified_math(self):
+        BigNum128Base.from_int(1)._ensure_cm_initialized()
+        assert BigNum128Base.from_int(2).cm is BigNum128Base.from_int(3).cm is not None
+
+
+class TestPacketChain:
+
+    def test_chain_continues_across_calls(self):
+        batch = _batch(4)
+        api = _api()
+        api.process_transaction_bundles(batch[:2])
+        assert api.last_drv_packet is batch[1][0]
+        assert api.process_transaction_bundle(*batch[3]).error.startswith('Invalid DRV_Packet sequence or chain')
+        assert api.process_transaction_bundle(*batch[2]).error == 'HSMF validation failed'
+        assert api.last_drv_packet is batch[2][0]
+
+    def test_rejected_packet_does_not_advance_chain(self):
+        batch = _batch(3)
+        batch[1][0].pqc_signature = None
+        api = _api()
+        responses = api.process_transaction_bundles(batch)
+        assert responses[1].error == 'Invalid DRV_Packet PQC signature'
+        assert api.last_drv_packet is batch[0][0]
+
+
+@pytest.mark.performance
+def test_batch_replay_benchmark(drv_packet):
+    """1,000-bundle replay: N sequential calls versus one batch call."""
+    batch = _batch(1000)
+    start = time.perf_counter()
+    sequential = _sequential(_api(FlatRewardTreasury(CertifiedMath())), batch)
+    sequential_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = _api(FlatRewardTreasury(CertifiedMath())).process_transaction_bundles(batch)
+    batch_elapsed = time.perf_counter() - start
+    print(f'\n1000 bundles: sequential {sequential_elapsed * 1000:.0f} ms, batch {batch_elapsed * 1000:.0f} ms ({sequential_elapsed / batch_elapsed:.2f}x)')
+    assert [r.finality_seal for r in batched] == [r.finality_seal for r in sequential]
@@ -0,0 +1,136 @@
+"""
+Tests for the bounded, persistent AEGIS snapshot store
+"""
+import json
+import os
+import time
+import tracemalloc
+import pytest
+from v13.libs.CertifiedMath import CertifiedMath
+from v13.services.aegis_api import AEGIS_API, AEGISOfflineError, AEGISStatus, AEGISTelemetrySnapshot
+from v13.services.aegis_snapshot_store import SnapshotIntegrityError, SnapshotStore
+
+
+def _snapshot(height):
+    snapshot = AEGISTelemetrySnapshot(snapshot_version='AEGIS_SNAPSHOT_V1', block_height=height, snapshot_timestamp=1000 + height, node_metrics={'node_alpha': {'uptime_ratio': '0.98', 'health_score': '0.95'}}, schema_version='NODE_METRICS_V1')
+    snapshot.snapshot_hash = snapshot.compute_hash()
+    return snapshot
+
+
+class TestSnapshotStore:
+
+    def test_memory_only_store_is_bounded(self):
+        store = SnapshotStore(AEGISTelemetrySnapshot, max_entries=3)
+        for height in range(10):
+            store.put(_snapshot(height))
+        assert len(store) == 3
+        assert store.get(0) is None
+        assert store.get(9).block_height == 9
+
+    def test_segment_survives_restart(self, tmp_path):
+        path = str(tmp_path / 'telemetry.seg')
+        store = SnapshotStore(AEGISTelemetrySnapshot, path, max_entries=2)
+        for height in (5, 6, 7, 3):
+            store.put(_snapshot(height))
+        store.put(_snapshot(5))
+        store.close()
+        reopened = SnapshotStore(AEGISTelemetrySnapshot, path, max_entries=2)
+        assert len(reopened) == 4
+        assert 3 in reopened and 4 not in reopened
+        assert reopened.get(3) == _snapshot(3)
+        assert reopened.get(7) == _snapshot(7)
+        assert reopened.get(4) is None
+        assert (reopened.hits, reopened.loads, reopened.misses) == (0, 2, 1)
+        with open(path, 'rb') as segment:
+            assert len(segment.readlines()) == 4
+
+    def test_tampered_record_rejected(self, tmp_path):
+        path = str(tmp_path / 'telemetry.seg')
+        store = SnapshotStore(AEGISTelemetrySnapshot, path)
+        store.put(_snapshot(1))
+        store.close()
+        with open(path) as segment:
+            record = json.loads(segment.readline())
+        record['node_metrics']['node_alpha']['health_score'] = '1.0'
+        with open(path, 'w') as segment:
+            segment.write(json.dumps(record) + '\n')
+        with pytest.raises(SnapshotIntegrityError):
+            SnapshotStore(AEGISTelemetrySnapshot, path).get(1)
+
+    def test_torn_trailing_record_dropped(self, tmp_path):
+        path = str(tmp_path / 'telemetry.seg')
+        store = SnapshotStore(AEGISTelemetrySnapshot, path)
+        store.put(_snapshot(1))
+        store.close()
+        with open(path, 'ab') as segment:
+            segment.write(b'{"block_height": 2, "snap')
+        reopened = SnapshotStore(AEGISTelemetrySnapshot, path)
+        reopened.put(_snapshot(2))
+        reopened.close()
+        assert SnapshotStore(AEGISTelemetrySnapshot, path).get(2) == _snapshot(2)
+
+
+class TestAEGISAPISnapshotStore:
+
+    def test_replay_after_restart_served_from_segment(self, tmp_path):
+        api = AEGIS_API(CertifiedMath(), snapshot_dir=str(tmp_path), snapshot_cache_size=4)
+        live = [api.get_telemetry_snapshot(height, 2000 + height, []) for height in range(10)]
+        registry = api.get_registry_snapshot(3, 2003, [])
+        restarted = AEGIS_API(CertifiedMath(), snapshot_dir=str(tmp_path), snapshot_cache_size=4)
+        restarted.aegis_status = AEGISStatus.OFFLINE
+        log = []
+        assert restarted.get_telemetry_snapshot(0, 9999, log) == live[0]
+        assert log[0]['operation'] == 'aegis_snapshot_cache_hit'
+        assert log[0]['snapshot_hash'] == live[0].snapshot_hash
+        assert restarted.get_registry_snapshot(3, 9999, []) == registry
+        with pytest.raises(AEGISOfflineError):
+            restarted.get_telemetry_snapshot(10, 9999, [])
+
+    def test_integrity_failure_logged(self, tmp_path):
+        api = AEGIS_API(CertifiedMath(), snapshot_dir=str(tmp_path))
+        api.get_telemetry_snapshot(1, 2001, [])
+        path = os.path.join(str(tmp_path), 'telemetry.seg')
+        with open(path) as segment:
+            data = segment.read().replace('0.98', '0.99')
+        with open(path, 'w') as segment:
+            segment.write(data)
+        log = []
+        with pytest.raises(ValueError):
+            AEGIS_API(CertifiedMath(), snapshot_dir=str(tmp_path)).get_telemetry_snapshot(1, 2001, log)
+        assert log[0]['operation'] == 'aegis_snapshot_integrity_failed'
+
+
+@pytest.mark.performance
+def test_snapshot_store_replay_benchmark(tmp_path):
+    """Memory and lookup latency over a long block replay (QFS_SNAPSHOT_BENCH_BLOCKS, default 20k; 1M for the full run)."""
+    blocks = int(os.environ.get('QFS_SNAPSHOT_BENCH_BLOCKS', '20000'))
+    checkpoints = {blocks // 10, blocks // 2, blocks}
+    api = AEGIS_API(CertifiedMath(), snapshot_dir=str(tmp_path), snapshot_cache_size=1024)
+    tracemalloc.start()
+    memory = []
+    start = time.perf_counter()
+    for height in range(1, blocks + 1):
+        api.get_telemetry_snapshot(height, 1000 + height, [])
+        if height in checkpoints:
+            memory.append((height, tracemalloc.get_traced_memory()[0]))
+    live_elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    api.snapshot_cache.close()
+    replay = AEGIS_API(CertifiedMath(), snapshot_dir=str(tmp_path), snapshot_cache_size=1024)
+    replay.aegis_status = AEGISStatus.OFFLINE
+    heights = range(1, blocks + 1, max(1, blocks // 10000))
+    start = time.perf_counter()
+    for height in heights:
+        replay.get_telemetry_snapshot(height, 0, [])
+    cold = (time.perf_counter() - start) / len(heights)
+    hot = list(range(blocks - 999, blocks + 1))
+    for height in hot:
+        replay.get_telemetry_snapshot(height, 0, [])
+    start = time.perf_counter()
+    for height in hot:
+        replay.get_telemetry_snapshot(height, 0, [])
+    warm = (time.perf_counter() - start) / len(hot)
+    print(f'\n{blocks} blocks live in {live_elapsed:.1f} s; traced memory ' + ', '.join((f'{mb / 1000000.0:.1f} MB @ {height}' for height, mb in memory)))
+    print(f'replay after restart: segment load {cold * 1000000.0:.0f} us/block, LRU hit {warm * 1000000.0:.1f} us/block')
+    assert replay.snapshot_cache.loads >= len(heights)
+    assert memory[-1][1] < memory[0][1] + 16 * blocks + 4000000
@@ -0,0 +1,102 @@
+"""
+Directory scanning for AST_ZeroSimChecker: precompiled excludes, process-pool
+parsing with deterministic ordering, and the sha256-keyed result cache.
+"""
+import fnmatch
+import json
+import os
+import time
+import pytest
+from v13.libs import AST_ZeroSimChecker as zsc
+from v13.libs.AST_ZeroSimChecker import AST_ZeroSimChecker, DEFAULT_EXCLUDE_PATTERNS
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+BAD = 'import random\n\ndef roll():\n    return random.random()\n'
+
+def _tree(tmp_path, count=40):
+    tmp_path.mkdir(exist_ok=True)
+    for i in range(count):
+        pkg = tmp_path / f'pkg_{i % 4}'
+        pkg.mkdir(exist_ok=True)
+        (pkg / f'module_{i:02d}.py').write_text(BAD if i % 3 else 'VALUE = 1\n')
+    for name in ('__pycache__', 'audit_tools', 'migrations'):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'skipped.py').write_text(BAD)
+    (tmp_path / 'pkg_0' / 'test_skipped.py').write_text(BAD)
+    (tmp_path / 'pkg_0' / 'CertifiedMath.py').write_text(BAD)
+    return str(tmp_path)
+
+def _fnmatch_files(directory):
+    """File selection of the previous per-pattern fnmatch walk."""
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if not any((fnmatch.fnmatch(d, p) for p in DEFAULT_EXCLUDE_PATTERNS))]
+        found.extend((os.path.join(root, f) for f in files if f.endswith('.py') and (not any((fnmatch.fnmatch(f, p) for p in DEFAULT_EXCLUDE_PATTERNS)))))
+    return sorted(found)
+
+def test_compiled_excludes_match_fnmatch(tmp_path):
+    directory = _tree(tmp_path)
+    checker = AST_ZeroSimChecker()
+    assert sorted(checker.collect_files(directory)) == _fnmatch_files(directory)
+    assert sorted(checker.collect_files(REPO_ROOT)) == _fnmatch_files(REPO_ROOT)
+    assert zsc.compile_exclude_patterns(()).match('anything.py') is None
+
+def test_parallel_scan_is_deterministic(tmp_path, monkeypatch):
+    directory = _tree(tmp_path)
+    monkeypatch.setattr(zsc, 'PARALLEL_MIN_FILES', 1)
+    checker = AST_ZeroSimChecker()
+    serial = checker.scan_directory(directory, workers=1)
+    parallel = checker.scan_directory(directory, workers=3)
+    assert serial == parallel and len(serial) > 0
+    files = checker.collect_files(directory)
+    assert [v.file_path for v in serial] == sorted((v.file_path for v in serial), key=files.index)
+    assert not any(('skipped' in v.file_path for v in serial))
+
+def test_cache_reuses_unchanged_files(tmp_path):
+    directory = _tree(tmp_path / 'src')
+    cache_path = str(tmp_path / 'zero_sim_cache.json')
+    checker = AST_ZeroSimChecker()
+    cold = checker.scan_directory(directory, workers=1, cache_path=cache_path)
+    assert checker.last_scan_stats == {'files': 40, 'parsed': 40, 'cached': 0}
+    warm = checker.scan_directory(directory, workers=1, cache_path=cache_path)
+    assert warm == cold
+    assert checker.last_scan_stats == {'files': 40, 'parsed': 0, 'cached': 40}
+    clean = os.path.join(directory, 'pkg_0', 'module_00.py')
+    with open(clean, 'w') as f:
+        f.write(BAD)
+    changed = checker.scan_directory(directory, workers=1, cache_path=cache_path)
+    assert checker.last_scan_stats['parsed'] == 1
+    assert changed == checker.scan_directory(directory, workers=1)
+    assert any((v.file_path == clean for v in changed))
+
+def test_cache_invalidated_by_checker_version(tmp_path, monkeypatch):
+    directory = _tree(tmp_path / 'src', count=4)
+    cache_path = str(tmp_path / 'zero_sim_cache.json')
+    checker = AST_ZeroSimChecker()
+    checker.scan_directory(directory, workers=1, cache_path=cache_path)
+    with open(cache_path) as f:
+        assert json.load(f)['checker'] == zsc.checker_fingerprint()
+    monkeypatch.setattr(zsc, 'checker_fingerprint', lambda: 'other-version')
+    checker.scan_directory(directory, workers=1, cache_path=cache_path)
+    assert checker.last_scan_stats['parsed'] == 4
+    with open(cache_path, 'w') as f:
+        f.write('{not json')
+    checker.scan_directory(directory, workers=1, cache_path=cache_path)
+    assert checker.last_scan_stats['parsed'] == 4
+
+@pytest.mark.performance
+def test_repository_scan_benchmark(tmp_path):
+    """Full repository scan: serial fnmatch reference, pool cold, cache warm."""
+    checker = AST_ZeroSimChecker()
+    cache_path = str(tmp_path / 'zero_sim_cache.json')
+    start = time.perf_counter()
+    serial = checker.scan_directory(REPO_ROOT, workers=1)
+    serial_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    cold = checker.scan_directory(REPO_ROOT, cache_path=cache_path)
+    cold_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    warm = checker.scan_directory(REPO_ROOT, cache_path=cache_path)
+    warm_elapsed = time.perf_counter() - start
+    assert serial == cold == warm
+    print(f"\n{checker.last_scan_stats['files']} files, {len(serial)} violations ({os.cpu_count()} CPUs): serial {serial_elapsed * 1000.0:.0f} ms, pool cold {cold_elapsed * 1000.0:.0f} ms, cache warm {warm_elapsed * 1000.0:.0f} ms")
+    assert warm_elapsed * 3 < serial_elapsed
@@ -0,0 +1,136 @@
+"""
+Tests for the keyset-paginated content projection behind the v18 content feed
+"""
+import hashlib
+import os
+import tempfile
+import time
+import pytest
+from v15.evidence.bus import EvidenceBus
+from v13.ATLAS.src.api.content_projection import CONTENT_EVENT, ContentProjection, InvalidCursorError, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def chain_log():
+    original_log = EvidenceBus._log_file
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+        EvidenceBus._log_file = f.name
+    EvidenceBus._chain_tip = '0' * 64
+    try:
+        yield f.name
+    finally:
+        EvidenceBus._log_file = original_log
+        if os.path.exists(f.name):
+            os.unlink(f.name)
+
+
+def _message(i, channel_id='general', timestamp=None):
+    return {'id': f'msg_{i:07d}', 'channel_id': channel_id, 'sender': f'0xSENDER{i % 7}', 'content_hash': hashlib.sha256(f'Message {i}'.encode()).hexdigest(), 'timestamp': 1000 + i if timestamp is None else timestamp, 'reply_to': None}
+
+
+def _envelope(message):
+    return {'event': {'type': CONTENT_EVENT, 'payload': {'message': message, 'timestamp': message['timestamp']}}}
+
+
+def _publish(message, projection=None):
+    if projection is not None:
+        projection.store_content(f"Message {int(message['id'][4:])}")
+    EvidenceBus.emit(CONTENT_EVENT, {'message': message, 'timestamp': message['timestamp']})
+
+
+def _walk(projection, channel_id=None, limit=3):
+    ids, cursor = ([], None)
+    while True:
+        page, cursor = projection.get_feed(channel_id=channel_id, limit=limit, cursor=cursor)
+        ids.extend((m['id'] for m in page))
+        if cursor is None:
+            return ids
+
+
+class TestContentProjection:
+
+    def test_feed_pages_newest_first_per_channel(self, chain_log):
+        projection = ContentProjection()
+        for i in range(10):
+            _publish(_message(i, channel_id='general' if i % 2 else 'dev'))
+        EvidenceBus.emit('CLUSTER_WRITE_COMMITTED', {'command_type': 'chat', 'timestamp': 0})
+        assert _walk(projection, 'general') == [f'msg_{i:07d}' for i in (9, 7, 5, 3, 1)]
+        assert _walk(projection) == [f'msg_{i:07d}' for i in range(9, -1, -1)]
+        assert projection.get_feed('missing') == ([], None)
+        assert projection.get_message('msg_0000004')['channel_id'] == 'dev'
+        assert projection.get_message('msg_9999999') is None
+
+    def test_bodies_stay_off_the_bus(self, chain_log):
+        projection = ContentProjection()
+        _publish(_message(1), projection)
+        _publish(_message(2))
+        with open(chain_log) as f:
+            assert all(('Message' not in line for line in f))
+        assert projection.get_message('msg_0000001')['content'] == 'Message 1'
+        assert projection.get_message('msg_0000002')['content'] == ''
+        assert [m['content'] for m in projection.get_feed()[0]] == ['', 'Message 1']
+
+    def test_cursor_stable_while_channel_grows(self, chain_log):
+        projection = ContentProjection()
+        for i in range(6):
+            _publish(_message(i))
+        first, cursor = projection.get_feed('general', limit=3)
+        for i in range(6, 9):
+            _publish(_message(i))
+        second, cursor = projection.get_feed('general', limit=3, cursor=cursor)
+        assert [m['id'] for m in first + second] == [f'msg_{i:07d}' for i in range(5, -1, -1)]
+        assert cursor is None
+
+    def test_out_of_order_and_duplicate_events(self):
+        projection = ContentProjection()
+        for i, timestamp in ((0, 50), (1, 10), (2, 50), (3, 30)):
+            assert projection.apply(_envelope(_message(i, timestamp=timestamp)))
+        assert not projection.apply(_envelope(_message(1, timestamp=99)))
+        assert not projection.apply({'event': {'type': CONTENT_EVENT, 'payload': {}}})
+        assert len(projection) == 4
+        assert [key[1] for key in reversed(projection._channels['general'])] == ['msg_0000002', 'msg_0000000', 'msg_0000003', 'msg_0000001']
+
+    def test_cursor_is_opaque_and_validated(self, chain_log):
+        cursor = encode_cursor((1005, 'msg_0000005'))
+        assert 'msg' not in cursor and decode_cursor(cursor) == (1005, 'msg_0000005')
+        for bad in ('bogus!', encode_cursor(('x', 'msg')), 'W10'):
+            with pytest.raises(InvalidCursorError):
+                ContentProjection().get_feed(cursor=bad)
+
+    def test_rebuilds_when_bus_log_switched(self, chain_log, tmp_path):
+        projection = ContentProjection()
+        _publish(_message(1))
+        assert len(projection.get_feed()[0]) == 1
+        EvidenceBus._log_file = str(tmp_path / 'other_chain.jsonl')
+        _publish(_message(2))
+        assert [m['id'] for m in projection.get_feed()[0]] == ['msg_0000002']
+        assert projection.get_message('msg_0000001') is None
+
+
+@pytest.mark.performance
+def test_feed_page_latency_benchmark():
+    """Page latency at increasing channel depth (QFS_CONTENT_BENCH_MESSAGES, default 100k; 1M for the full run)."""
+    total = int(os.environ.get('QFS_CONTENT_BENCH_MESSAGES', '100000'))
+    checkpoints = sorted({total // 100, total // 10, total})
+    projection = ContentProjection()
+    projection.refresh = lambda: 0
+    results, added = ([], 0)
+    for checkpoint in checkpoints:
+        while added < checkpoint:
+            projection.apply(_envelope(_message(added)))
+            added += 1
+        keys = projection._channels['general']
+        deep_cursor = encode_cursor(keys[len(keys) // 2])
+        rounds = 2000
+        start = time.perf_counter()
+        for _ in range(rounds):
+            projection.get_feed('general', limit=20)
+        first = (time.perf_counter() - start) / rounds
+        start = time.perf_counter()
+        for _ in range(rounds):
+            page, _ = projection.get_feed('general', limit=20, cursor=deep_cursor)
+        deep = (time.perf_counter() - start) / rounds
+        assert page[0]['id'] == keys[len(keys) // 2 - 1][1]
+        results.append((checkpoint, first, deep))
+    print('\nfeed page latency: ' + ', '.join((f'{n} msgs first {f * 1000000.0:.1f} us / mid-channel {d * 1000000.0:.1f} us' for n, f, d in results)))
+    assert results[-1][2] < results[0][2] * 3 + 2e-05
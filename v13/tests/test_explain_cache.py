@@ -0,0 +1,164 @@
+"""
+test_explain_cache.py - Reward explanation cache and per-epoch precompute
+
+Responses served from the cache (memory or disk spill) and from the batch
+precompute must equal a fresh per-wallet replay, and a new ledger head must
+never serve an older explanation.
+"""
+import os
+import sys
+import time
+import pytest
+import v13.ATLAS.src.value_graph_ref as value_graph_ref
+from v13.core.CoherenceLedger import CoherenceLedger, LedgerEntry
+from v13.core.QFSReplaySource import QFSReplaySource
+from v13.core.StorageEngine import StorageEngine
+from v13.core.TokenStateBundle import TokenStateBundle
+from v13.libs.BigNum128 import BigNum128
+from v13.libs.CertifiedMath import CertifiedMath
+from v13.policy.artistic_policy import ArtisticSignalPolicy
+from v13.policy.humor_policy import HumorSignalPolicy
+from v13.policy.value_node_explainability import ValueNodeExplainabilityHelper
+from v13.ATLAS.src.api.explain_cache import ExplanationNotFound, RewardExplanationCache, build_reward_explanation, precompute_epoch
+
+@pytest.fixture(autouse=True)
+def value_graph_alias(monkeypatch):
+    """value_node_replay imports the ATLAS value graph through its lowercase package path."""
+    monkeypatch.setitem(sys.modules, 'v13.atlas.src.value_graph_ref', value_graph_ref)
+
+@pytest.fixture
+def helper():
+    return ValueNodeExplainabilityHelper(humor_policy=HumorSignalPolicy(), artistic_policy=ArtisticSignalPolicy())
+
+def _bundle(timestamp):
+    return TokenStateBundle(chr_state={'coherence_metric': '0.98'}, flx_state={'flux_metric': '0.15'}, psi_sync_state={'psi_sync_metric': '0.08'}, atr_state={'atr_metric': '0.85'}, res_state={'resonance_metric': '0.05'}, nod_state={'nod_metric': '0.5'}, storage_metrics=None, signature='test_signature', timestamp=timestamp, bundle_id=f'bundle_{timestamp}', pqc_cid='test_pqc_cid', quantum_metadata={}, lambda1=BigNum128.from_string('0.3'), lambda2=BigNum128.from_string('0.2'), c_crit=BigNum128.from_string('0.9'), parameters=None)
+
+def _log_rewards(ledger, wallets, timestamp):
+    """Chain a reward_allocation entry carrying the amount fields the replay engine explains."""
+    rewards = {f'ATR_{i}': {'token_name': 'ATR', 'amount': str(10 + i), 'wallet_id': wallet} for i, wallet in enumerate(wallets)}
+    data = {'rewards': rewards, 'amount_atr': 10 + len(ledger.ledger_entries), 'user_id': f'user_{timestamp}'}
+    previous_hash = ledger._get_previous_hash()
+    entry_hash = ledger._generate_entry_hash(data, previous_hash, timestamp)
+    entry = LedgerEntry(entry_id=entry_hash, timestamp=timestamp, entry_type='reward_allocation', data=data, previous_hash=previous_hash, entry_hash=entry_hash, pqc_cid=f'pqc_{timestamp}', quantum_metadata={})
+    ledger.ledger_entries.append(entry)
+    return entry
+
+def _source(allocations=4, wallets_per_allocation=3):
+    cm = CertifiedMath()
+    ledger = CoherenceLedger(cm)
+    for a in range(allocations):
+        ledger.log_state(token_bundle=_bundle(1000 + a * 10), hsmf_metrics={'step': a}, deterministic_timestamp=1000 + a * 10)
+        _log_rewards(ledger, [f'wallet_{a}_{w}' for w in range(wallets_per_allocation)], 1005 + a * 10)
+    return QFSReplaySource(ledger, StorageEngine(cm))
+
+def _fresh(source, helper, wallet_id, epoch=1):
+    return build_reward_explanation(wallet_id, epoch, source.get_reward_events(wallet_id, epoch), helper)
+
+def test_rewarded_wallet_events_match_per_wallet_lookup():
+    source = _source()
+    _log_rewards(source.ledger, ['wallet_0_1', 'wallet_x'], 2000)
+    batch = source.get_rewarded_wallet_events()
+    assert sorted(batch) == sorted([f'wallet_{a}_{w}' for a in range(4) for w in range(3)] + ['wallet_x'])
+    for wallet_id, events in batch.items():
+        assert events == source.get_reward_events(wallet_id, 1)
+    assert source.get_rewarded_wallet_events(['wallet_2_0', 'missing']) == {'wallet_2_0': source.get_reward_events('wallet_2_0', 1)}
+
+def test_cache_hit_and_head_invalidation(helper):
+    source = _source()
+    cache = RewardExplanationCache()
+    first = cache.get_or_build(source, helper, 'wallet_1_2', 1)
+    assert first == _fresh(source, helper, 'wallet_1_2')
+    first['total'] = 'tampered'
+    assert cache.get_or_build(source, helper, 'wallet_1_2', 1) == _fresh(source, helper, 'wallet_1_2')
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+    head = source.get_head_hash()
+    _log_rewards(source.ledger, ['wallet_new'], 3000)
+    assert source.get_head_hash() != head
+    cache.get_or_build(source, helper, 'wallet_1_2', 1)
+    assert cache.stats['misses'] == 2
+    with pytest.raises(ExplanationNotFound):
+        cache.get_or_build(source, helper, 'nobody', 1)
+
+def test_total_uses_certified_scaling(helper):
+    source = _source(allocations=1)
+    explanation = RewardExplanationCache().get_or_build(source, helper, 'wallet_0_0', 1)
+    assert (explanation['base'], explanation['total']) == ('11 ATR', '11.0 ATR')
+    total = helper._calculate_total_reward({'ATR': '10.5 ATR'}, [{'value': '+2.25 ATR'}], [{'value': '-1.0 ATR'}])
+    assert total['ATR'] == '11.7 ATR'
+    assert helper._calculate_total_reward({'ATR': '5000 ATR'}, [], [])['ATR'] == '5000.0 ATR'
+
+def test_epoch_is_echoed_not_keyed(helper):
+    source = _source()
+    cache = RewardExplanationCache()
+    assert precompute_epoch(cache, source, helper, 3) == 12
+    explanation = cache.get_or_build(source, helper, 'wallet_2_1', 7)
+    assert explanation == _fresh(source, helper, 'wallet_2_1', epoch=7)
+    assert cache.stats['misses'] == 0
+
+def test_spill_to_disk_is_bounded(helper, tmp_path):
+    source = _source()
+    spill_dir = str(tmp_path / 'spill')
+    cache = RewardExplanationCache(max_entries=2, spill_dir=spill_dir, max_spill_entries=5)
+    wallets = [f'wallet_{a}_{w}' for a in range(4) for w in range(3)]
+    for wallet_id in wallets:
+        cache.get_or_build(source, helper, wallet_id, 1)
+    assert len(cache) == 2 and len(os.listdir(spill_dir)) == 5
+    assert cache.get_or_build(source, helper, wallets[-3], 1) == _fresh(source, helper, wallets[-3])
+    assert cache.stats['disk_hits'] == 1
+    reopened = RewardExplanationCache(max_entries=2, spill_dir=spill_dir, max_spill_entries=5)
+    assert reopened.get(wallets[-4], source.get_head_hash()) == _fresh(source, helper, wallets[-4])
+    assert reopened.get(wallets[0], source.get_head_hash()) is None
+
+def test_precompute_matches_on_demand(helper):
+    source = _source()
+    cache = RewardExplanationCache()
+    assert precompute_epoch(cache, source, helper, 1) == 12
+    head = source.get_head_hash()
+    for a in range(4):
+        for w in range(3):
+            wallet_id = f'wallet_{a}_{w}'
+            assert cache.get(wallet_id, head) == _fresh(source, helper, wallet_id)
+    assert cache.stats['misses'] == 0
+
+def _p99(samples):
+    return sorted(samples)[int(len(samples) * 0.99) - 1]
+
+@pytest.mark.performance
+def test_explain_cache_benchmark(helper):
+    """p99 explain latency: uncached, cached, and cold-epoch warm-up (QFS_EXPLAIN_BENCH_WALLETS)."""
+    wallets = int(os.environ.get('QFS_EXPLAIN_BENCH_WALLETS', '2000'))
+    per_allocation = 10
+    source = _source(allocations=wallets // per_allocation, wallets_per_allocation=per_allocation)
+    wallet_ids = sorted(source.get_rewarded_wallet_events())
+    sample = wallet_ids[::max(1, len(wallet_ids) // 200)]
+    uncached = []
+    for wallet_id in sample:
+        start = time.perf_counter()
+        _fresh(source, helper, wallet_id)
+        uncached.append(time.perf_counter() - start)
+    cache = RewardExplanationCache(max_entries=wallets)
+    for wallet_id in sample:
+        cache.get_or_build(source, helper, wallet_id, 1)
+    cached = []
+    for _ in range(5):
+        for wallet_id in sample:
+            start = time.perf_counter()
+            cache.get_or_build(source, helper, wallet_id, 1)
+            cached.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    for wallet_id in wallet_ids:
+        _fresh(source, helper, wallet_id)
+    per_wallet_warmup = time.perf_counter() - start
+    cache = RewardExplanationCache(max_entries=wallets)
+    start = time.perf_counter()
+    assert precompute_epoch(cache, source, helper, 1) == len(wallet_ids)
+    batch_warmup = time.perf_counter() - start
+    after = []
+    for wallet_id in sample:
+        start = time.perf_counter()
+        cache.get_or_build(source, helper, wallet_id, 1)
+        after.append(time.perf_counter() - start)
+    assert cache.stats['misses'] == 0
+    print(f'\n{len(wallet_ids)} wallets: p99 uncached {_p99(uncached) * 1000.0:.2f} ms, cached {_p99(cached) * 1000000.0:.0f} us, after precompute {_p99(after) * 1000000.0:.0f} us; epoch warm-up per-wallet {per_wallet_warmup * 1000.0:.0f} ms vs precompute {batch_warmup * 1000.0:.0f} ms')
+    assert _p99(cached) * 10 < _p99(uncached)
+    assert batch_warmup * 5 < per_wallet_warmup
@@ -0,0 +1,182 @@
+"""
+Tests for batched candidate fetch and pooled candidate scoring in
+AtlasAPIGateway.get_feed and the feed route
+"""
+import os
+import time
+import pytest
+from v13.ATLAS.src.signals.humor import HumorSignalAddon
+from v13.atlas_api import gateway as gateway_module
+from v13.atlas_api.gateway import AtlasAPIGateway
+from v13.atlas_api.models import FeedRequest
+from v13.atlas_api.router import AtlasAPIRouter
+from v13.libs.CertifiedMath import BigNum128
+
+
+@pytest.fixture(autouse=True)
+def humor_addon(monkeypatch):
+    """The gateway imports HumorSignalAddon through the lowercase v13.atlas path."""
+    monkeypatch.setattr(gateway_module, 'HumorSignalAddon', HumorSignalAddon)
+
+
+def _metadata(content_id):
+    n = int(content_id.rsplit('_', 1)[1])
+    return {'author_did': 'did:user:author', 'community_id': 'c', 'tags': ['t'], 'engagement_signals': {'likes': BigNum128.from_int(n % 7 + 1), 'comments': BigNum128.from_int(n % 3), 'shares': BigNum128.from_int(2)}, 'content_cid': f'Qm{content_id}', 'created_at': 1234567890, 'content_type': 'post'}
+
+
+class PerItemStorage:
+    """Storage client with only per-id lookups; each call costs one round trip."""
+
+    def __init__(self, latency=0.0, missing=()):
+        self.latency = latency
+        self.missing = set(missing)
+        self.calls = 0
+
+    def query_feed_candidates(self, user_id, limit):
+        return [f'content_{i:04d}' for i in range(limit)]
+
+    def get_content_metadata(self, content_id):
+        self.calls += 1
+        time.sleep(self.latency)
+        if content_id in self.missing:
+            raise KeyError(content_id)
+        return _metadata(content_id)
+
+
+class BatchStorage(PerItemStorage):
+
+    def get_content_metadata_batch(self, content_ids):
+        self.calls += 1
+        time.sleep(self.latency)
+        return {content_id: _metadata(content_id) for content_id in content_ids if content_id not in self.missing}
+
+
+class PerItemIPFS:
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def get_content(self, content_cid):
+        self.calls += 1
+        time.sleep(self.latency)
+        return f'Thoughtful post stored at {content_cid}'
+
+
+class BatchIPFS(PerItemIPFS):
+
+    def get_contents(self, content_cids):
+        self.calls += 1
+        time.sleep(self.latency)
+        return {cid: f'Thoughtful post stored at {cid}' for cid in content_cids}
+
+
+def _gateway(storage, ipfs):
+    gateway = AtlasAPIGateway()
+    gateway.set_storage_clients(storage, ipfs)
+    return gateway
+
+
+def _feed(gateway, limit):
+    return gateway.get_feed(FeedRequest(user_id='reader', limit=limit, mode='personalized'))
+
+
+class TestBatchedCandidateFetch:
+
+    def test_batch_interfaces_used_once(self):
+        storage, ipfs = (BatchStorage(missing={'content_0003'}), BatchIPFS())
+        candidates = _gateway(storage, ipfs)._fetch_content_candidates('reader', 10)
+        assert storage.calls == 1
+        assert ipfs.calls == 1
+        assert [c['content_id'] for c in candidates] == [f'content_{i:04d}' for i in range(10) if i != 3]
+
+    def test_per_item_clients_match_batch_clients(self):
+        batched = _gateway(BatchStorage(), BatchIPFS())._fetch_content_candidates('reader', 8)
+        per_item = _gateway(PerItemStorage(), PerItemIPFS())._fetch_content_candidates('reader', 8)
+        assert batched == per_item
+
+    def test_feed_ranks_many_candidates(self):
+        response = _feed(_gateway(BatchStorage(), BatchIPFS()), 12)
+        assert response.policy_metadata['status'] == 'SUCCESS'
+        assert len(response.posts) == 12
+
+
+class TestPooledScoring:
+
+    def test_pooled_matches_sequential(self):
+        sequential = _gateway(BatchStorage(), BatchIPFS())
+        pooled = _gateway(BatchStorage(), BatchIPFS())
+        pooled.set_feed_workers(2)
+        try:
+            expected = _feed(sequential, 12).posts
+            posts = _feed(pooled, 12).posts
+            audit_log = list(pooled.cm.log_list)
+            assert pooled._feed_executor is not None
+            cached = _feed(pooled, 12).posts
+        finally:
+            pooled.set_feed_workers(1)
+        assert len(posts) == 12
+        assert posts == expected
+        assert audit_log == sequential.cm.log_list
+        assert [e['log_index'] for e in audit_log] == list(range(len(audit_log)))
+        assert [p.coherence_score for p in cached] == [p.coherence_score for p in expected]
+        assert pooled.feed_score_cache.hits == 12
+
+    def test_single_miss_scored_in_process(self):
+        gateway = _gateway(BatchStorage(), BatchIPFS())
+        gateway.set_feed_workers(2)
+        _feed(gateway, 1)
+        assert gateway._feed_executor is None
+
+
+class TestFeedRoute:
+
+    def test_route_serializes_ranked_posts(self):
+        router = AtlasAPIRouter()
+        router.gateway.set_storage_clients(BatchStorage(), BatchIPFS())
+        response = router.route_get_feed(user_id='reader', limit=12)
+        assert 'error_code' not in response, response
+        assert response['policy_metadata']['status'] == 'SUCCESS'
+        ranked = _feed(_gateway(BatchStorage(), BatchIPFS()), 12).posts
+        assert [p['post_id'] for p in response['posts']] == [p.post_id for p in ranked]
+        assert [p['coherence_score'] for p in response['posts']] == [p.coherence_score.to_decimal_string() for p in ranked]
+
+    def test_route_default_candidates(self):
+        response = AtlasAPIRouter().route_get_feed(user_id='test_user')
+        assert 'error_code' not in response, response
+        assert len(response['posts']) > 1
+
+
+@pytest.mark.performance
+def test_pooled_scoring_benchmark():
+    """get_feed scoring time, sequential vs one worker process per CPU."""
+    workers = os.cpu_count() or 1
+    print(f'\n{workers} CPU(s)')
+    for size in (100, 500):
+        timings = {}
+        for label, feed_workers in (('sequential', 1), ('pooled', max(2, workers))):
+            gateway = _gateway(BatchStorage(), BatchIPFS())
+            gateway.set_feed_workers(feed_workers)
+            try:
+                start = time.perf_counter()
+                response = _feed(gateway, size)
+                timings[label] = time.perf_counter() - start
+            finally:
+                gateway.set_feed_workers(1)
+            assert len(response.posts) == size
+        print(f'{size} candidates: ' + ', '.join((f'{label} {elapsed * 1000:.0f} ms' for label, elapsed in timings.items())))
+
+
+@pytest.mark.performance
+def test_feed_latency_benchmark():
+    """get_feed latency: per-item fetch (1 ms round trips) vs batched fetch."""
+    print()
+    for size in (20, 100, 500):
+        timings = {}
+        for label, storage, ipfs in (('per-item', PerItemStorage(0.001), PerItemIPFS(0.001)), ('batched', BatchStorage(0.001), BatchIPFS(0.001))):
+            gateway = _gateway(storage, ipfs)
+            start = time.perf_counter()
+            response = _feed(gateway, size)
+            timings[label] = time.perf_counter() - start
+            assert len(response.posts) == size
+        print(f'{size} candidates: ' + ', '.join((f'{label} {elapsed * 1000:.0f} ms' for label, elapsed in timings.items())))
@@ -0,0 +1,144 @@
+"""
+Tests for the per-content coherence score cache used by AtlasAPIGateway.get_feed
+"""
+
+import time
+import pytest
+from v13.ATLAS.src.signals.humor import HumorSignalAddon
+from v13.atlas_api import gateway as gateway_module
+from v13.atlas_api.feed_score_cache import FeedScoreCache, engagement_digest
+from v13.atlas_api.gateway import AtlasAPIGateway
+from v13.atlas_api.models import FeedRequest, InteractionRequest
+from v13.libs.CertifiedMath import BigNum128
+
+
+@pytest.fixture(autouse=True)
+def humor_addon(monkeypatch):
+    """The gateway imports HumorSignalAddon through the lowercase v13.atlas path."""
+    monkeypatch.setattr(gateway_module, "HumorSignalAddon", HumorSignalAddon)
+
+
+class EngagementStorage:
+    """Batch storage client with mutable per-content like counts."""
+
+    def __init__(self):
+        self.likes = {}
+
+    def query_feed_candidates(self, user_id, limit):
+        return [f"content_{i:04d}" for i in range(limit)]
+
+    def get_content_metadata_batch(self, content_ids):
+        return {
+            content_id: {
+                "engagement_signals": {
+                    "likes": BigNum128.from_int(self.likes.get(content_id, 3)),
+                    "comments": BigNum128.from_int(1),
+                    "shares": BigNum128.from_int(2),
+                },
+                "content_cid": f"Qm{content_id}",
+                "created_at": 1234567890,
+            }
+            for content_id in content_ids
+        }
+
+
+class StaticIPFS:
+
+    def get_contents(self, content_cids):
+        return {cid: f"Post body for {cid}" for cid in content_cids}
+
+
+def _counting_gateway():
+    gateway = AtlasAPIGateway()
+    storage = EngagementStorage()
+    gateway.set_storage_clients(storage, StaticIPFS())
+    calls = []
+    original = gateway.coherence_engine.update_omega
+
+    def counting(**kwargs):
+        calls.append(kwargs["L"])
+        return original(**kwargs)
+
+    gateway.coherence_engine.update_omega = counting
+    return (gateway, storage, calls)
+
+
+def _ranking(gateway, limit=10):
+    response = gateway.get_feed(
+        FeedRequest(user_id="reader", limit=limit, mode="personalized")
+    )
+    assert response.policy_metadata["status"] == "SUCCESS"
+    return [(p.post_id, p.coherence_score, p.aegis_advisory) for p in response.posts]
+
+
+class TestFeedScoreCache:
+
+    def test_lru_and_key_matching(self):
+        cache = FeedScoreCache(max_entries=2)
+        cache.put("a", "d1", "v1", BigNum128(5), {"confidence": 1})
+        cache.put("b", "d1", "v1", BigNum128(6), None)
+        assert cache.get("a", "d1", "v1") == (BigNum128(5), {"confidence": 1})
+        assert cache.get("a", "d2", "v1") is None
+        assert cache.get("a", "d1", "v2") is None
+        cache.put("c", "d1", "v1", BigNum128(7), None)
+        assert cache.get("b", "d1", "v1") is None
+        assert cache.get("a", "d1", "v1") is not None
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+
+    def test_digest_tracks_engagement_and_content(self):
+        base = {
+            "engagement_signals": {"likes": BigNum128.from_int(1)},
+            "content_cid": "Qm1",
+            "content": "x",
+        }
+        assert engagement_digest(base) == engagement_digest(dict(base))
+        assert engagement_digest(base) != engagement_digest(
+            {**base, "engagement_signals": {"likes": BigNum128.from_int(2)}}
+        )
+        assert engagement_digest(base) != engagement_digest({**base, "content": "y"})
+
+
+class TestGatewayScoreCache:
+
+    def test_repeat_feed_skips_scoring_with_identical_results(self):
+        gateway, _, calls = _counting_gateway()
+        first = _ranking(gateway)
+        assert len(calls) == 10
+        second = _ranking(gateway)
+        assert len(calls) == 10
+        assert second == first
+        assert gateway.feed_score_cache.hits == 10
+
+    def test_engagement_change_rescored(self):
+        gateway, storage, calls = _counting_gateway()
+        _ranking(gateway)
+        storage.likes["content_0004"] = 500
+        ranking = _ranking(gateway)
+        assert calls[10:] == ["L_content_0004"]
+        assert ranking[0][0] == "content_0004"
+
+    def test_interaction_invalidates_target(self):
+        gateway, _, calls = _counting_gateway()
+        _ranking(gateway)
+        gateway.post_interaction(
+            "like", InteractionRequest(user_id="reader", target_id="content_0002")
+        )
+        _ranking(gateway)
+        assert calls[10:] == ["L_content_0002"]
+
+
+@pytest.mark.performance
+def test_feed_score_cache_benchmark():
+    """100-candidate feed: cold (scoring) versus warm (cached) latency."""
+    gateway, _, _ = _counting_gateway()
+    start = time.perf_counter()
+    cold = _ranking(gateway, 100)
+    cold_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    warm = _ranking(gateway, 100)
+    warm_elapsed = time.perf_counter() - start
+    print(
+        f"\n100-candidate feed: cold {cold_elapsed * 1000:.0f} ms, warm {warm_elapsed * 1000:.0f} ms"
+    )
+    assert warm == cold
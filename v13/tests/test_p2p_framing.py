@@ -0,0 +1,244 @@
+"""
+Tests for length-prefixed SecureMessageV2 framing and write coalescing in the
+ATLAS P2P ConnectionManager
+"""
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock
+from v13.libs.economics.QAmount import QAmount
+from v13.ATLAS.src.p2p.connection_manager import ConnectionManager
+from v13.ATLAS.src.p2p.framing import FrameError, FrameWriter, MAX_FRAME_SIZE, FRAME_HEADER, encode_frame, read_frame
+from v13.ATLAS.src.p2p.secure_message_v2 import SecureMessageV2
+
+
+class _GatedWriter:
+    """StreamWriter stand-in whose drain blocks until the gate opens."""
+
+    def __init__(self):
+        self.chunks = []
+        self.gate = asyncio.Event()
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    async def drain(self):
+        await self.gate.wait()
+
+
+def _message(seq, payload=b'payload'):
+    return SecureMessageV2(ciphertext=payload, nonce=b'00000000', sequence_num=seq, timestamp=QAmount(7))
+
+
+def _manager(node_id, remote_id):
+    """Manager whose KEM handshake is stubbed (the PQC backend is mocked in tests)."""
+    mgr = ConnectionManager(node_id, keypair=None, bootstrap=None)
+    mgr._perform_handshake = AsyncMock(return_value=remote_id)
+    return mgr
+
+
+class TestSecureMessageFrames:
+
+    def test_frame_body_roundtrip(self):
+        msg = _message(42, b'\x00\x01binary\xff')
+        parsed = SecureMessageV2.from_frame_body(msg.to_frame_body())
+        assert parsed.ciphertext == msg.ciphertext
+        assert parsed.nonce == msg.nonce
+        assert parsed.sequence_num == 42
+        assert parsed.timestamp == msg.timestamp
+        assert parsed.message_hash == msg.message_hash
+
+    def test_frame_smaller_than_json(self):
+        msg = _message(1, bytes(range(256)) * 4)
+        assert len(encode_frame(msg.to_frame_body())) < len(msg.serialize()) * 0.8
+
+    def test_tampered_or_truncated_frame_rejected(self):
+        body = bytearray(_message(1).to_frame_body())
+        body[-1] ^= 1
+        with pytest.raises(ValueError):
+            SecureMessageV2.from_frame_body(bytes(body))
+        with pytest.raises(ValueError):
+            SecureMessageV2.from_frame_body(bytes(body[:10]))
+
+    def test_read_frame_stream(self):
+
+        async def run():
+            reader = asyncio.StreamReader()
+            reader.feed_data(encode_frame(b'one') + encode_frame(b'') + encode_frame(b'three'))
+            reader.feed_eof()
+            return [await read_frame(reader) for _ in range(4)]
+        assert asyncio.run(run()) == [b'one', b'', b'three', None]
+
+    def test_oversized_frame_rejected(self):
+
+        async def run():
+            reader = asyncio.StreamReader()
+            reader.feed_data(FRAME_HEADER.pack(MAX_FRAME_SIZE + 1))
+            return await read_frame(reader)
+        with pytest.raises(FrameError):
+            asyncio.run(run())
+
+
+class TestFrameWriter:
+
+    def test_frames_coalesced_while_draining(self):
+
+        async def run():
+            raw = _GatedWriter()
+            out = FrameWriter(raw)
+            for i in range(100):
+                await out.send(encode_frame(b'%d' % i))
+            await asyncio.sleep(0)
+            for i in range(100, 200):
+                await out.send(encode_frame(b'%d' % i))
+            raw.gate.set()
+            await out.close()
+            return raw, out
+        raw, out = asyncio.run(run())
+        assert out.frames_sent == 200
+        assert len(raw.chunks) < 10
+        assert b''.join(raw.chunks) == b''.join((encode_frame(b'%d' % i) for i in range(200)))
+
+    def test_backpressure_blocks_sender(self):
+
+        async def run():
+            raw = _GatedWriter()
+            out = FrameWriter(raw, max_pending_bytes=64)
+            frame = encode_frame(b'x' * 40)
+            await out.send(frame)
+            await asyncio.sleep(0)
+            await out.send(frame)
+            await out.send(frame)
+            blocked = asyncio.ensure_future(out.send(frame))
+            await asyncio.sleep(0.01)
+            was_blocked = not blocked.done()
+            raw.gate.set()
+            await blocked
+            await out.close()
+            return was_blocked
+        assert asyncio.run(run()) is True
+
+    def test_abort_wakes_blocked_sender_and_flush(self):
+
+        async def run():
+            raw = _GatedWriter()
+            out = FrameWriter(raw, max_pending_bytes=64)
+            frame = encode_frame(b'x' * 40)
+            await out.send(frame)
+            await asyncio.sleep(0)
+            await out.send(frame)
+            await out.send(frame)
+            blocked = asyncio.ensure_future(out.send(frame))
+            flushing = asyncio.ensure_future(out.flush())
+            for _ in range(3):
+                await asyncio.sleep(0)
+            pending = not blocked.done() and (not flushing.done())
+            out.abort()
+            results = await asyncio.wait_for(asyncio.gather(blocked, flushing, return_exceptions=True), 1)
+            with pytest.raises(ConnectionError):
+                await out.send(frame)
+            return pending, results
+        pending, results = asyncio.run(run())
+        assert pending
+        assert [type(r) for r in results] == [ConnectionError, ConnectionError]
+
+    def test_flusher_cancel_fails_waiters(self):
+
+        async def run():
+            raw = _GatedWriter()
+            out = FrameWriter(raw)
+            await out.send(encode_frame(b'x'))
+            await asyncio.sleep(0)
+            flushing = asyncio.ensure_future(out.flush())
+            out._task.cancel()
+            return await asyncio.wait_for(asyncio.gather(flushing, return_exceptions=True), 1)
+        assert type(asyncio.run(run())[0]) is ConnectionError
+
+
+class TestConnectionManagerLoopback:
+
+    def test_messages_delivered_in_order(self):
+
+        async def run():
+            server_mgr = _manager('server_node', 'client_node')
+            client_mgr = _manager('client_node', 'server_node')
+            received = []
+            done = asyncio.Event()
+
+            def on_message(peer_id, msg):
+                received.append((peer_id, msg.sequence_num, msg.ciphertext))
+                if len(received) == 500:
+                    done.set()
+            server_mgr.on_message = on_message
+            server = await server_mgr.start_server('127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            peer_id = await client_mgr.connect_to_peer('127.0.0.1', port)
+            for i in range(500):
+                await client_mgr.send_message(peer_id, b'msg-%d' % i)
+            await client_mgr.flush(peer_id)
+            await asyncio.wait_for(done.wait(), 10)
+            writes = client_mgr.peers[peer_id]['outbound'].writes
+            await client_mgr.close()
+            await server_mgr.close()
+            server.close()
+            await server.wait_closed()
+            return (peer_id, received, writes)
+        peer_id, received, writes = asyncio.run(run())
+        assert peer_id == 'server_node'
+        assert [seq for _, seq, _ in received] == list(range(1, 501))
+        assert received[-1] == ('client_node', 500, b'msg-499')
+        assert writes < 500
+
+
+async def _loopback_benchmark(count, payload, framed):
+    """Messages/sec over loopback: framed+coalesced vs legacy JSON lines."""
+    received = 0
+    done = asyncio.Event()
+
+    async def handle(reader, writer):
+        nonlocal received
+        while True:
+            if framed:
+                data = await read_frame(reader)
+            else:
+                data = await reader.readline()
+            if not data:
+                break
+            received += 1
+            if received == count:
+                done.set()
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    _, writer = await asyncio.open_connection('127.0.0.1', port)
+    out = FrameWriter(writer) if framed else None
+    wire_bytes = 0
+    start = time.perf_counter()
+    for seq in range(1, count + 1):
+        msg = SecureMessageV2(ciphertext=payload, nonce=b'00000000', sequence_num=seq, timestamp=QAmount(0))
+        if framed:
+            frame = encode_frame(msg.to_frame_body())
+            await out.send(frame)
+        else:
+            frame = msg.serialize() + b'\n'
+            writer.write(frame)
+            await writer.drain()
+        wire_bytes += len(frame)
+    await asyncio.wait_for(done.wait(), 30)
+    elapsed = time.perf_counter() - start
+    if out is not None:
+        await out.close()
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    return (count / elapsed, wire_bytes / count)
+
+
+@pytest.mark.performance
+def test_p2p_framing_benchmark():
+    """Loopback messages/sec and bytes/message, legacy JSON lines vs binary frames."""
+    payload = bytes(range(256))
+    legacy_rate, legacy_size = asyncio.run(_loopback_benchmark(5000, payload, framed=False))
+    framed_rate, framed_size = asyncio.run(_loopback_benchmark(5000, payload, framed=True))
+    print(f'\nlegacy JSON lines: {legacy_rate:,.0f} msg/s, {legacy_size:.0f} B/msg')
+    print(f'binary frames:     {framed_rate:,.0f} msg/s, {framed_size:.0f} B/msg')
+    assert framed_size < legacy_size
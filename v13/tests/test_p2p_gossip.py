@@ -0,0 +1,121 @@
+"""
+Tests for the ATLAS P2P gossip broadcast layer and propagation harness
+"""
+import asyncio
+import random
+import pytest
+from v13.libs.economics.QAmount import QAmount
+from v13.ATLAS.src.p2p import connection_manager
+from v13.ATLAS.src.p2p.gossip import GossipNode, SeenSet, decode_gossip, encode_gossip
+from v13.ATLAS.src.p2p.gossip_simulation import run_gossip_simulation
+from v13.ATLAS.src.p2p.secure_message_v2 import SecureMessageV2
+from v13.tests.mocks.mock_kem import LoopbackKEM
+
+
+@pytest.fixture
+def kem(monkeypatch):
+    monkeypatch.setattr(connection_manager, 'PQC', LoopbackKEM)
+    return LoopbackKEM
+
+
+class _FakeManager:
+    """ConnectionManager stand-in recording sends; 'slow' peers never drain."""
+
+    def __init__(self, node_id, peers, slow=()):
+        self.node_id = node_id
+        self.peers = {peer: {} for peer in peers}
+        self.slow = set(slow)
+        self.sent = []
+        self.on_message = None
+
+    async def send_message(self, peer_id, payload):
+        self.sent.append((peer_id, payload))
+
+    async def flush(self, peer_id):
+        if peer_id in self.slow:
+            await asyncio.sleep(10)
+
+
+def _wrap(data):
+    return SecureMessageV2(ciphertext=data, nonce=b'00000000', sequence_num=1, timestamp=QAmount(0))
+
+
+class TestGossipPrimitives:
+
+    def test_envelope_roundtrip(self):
+        message_id = b'\x01' * 16
+        assert decode_gossip(encode_gossip(message_id, 5, b'body')) == (message_id, 5, b'body')
+        assert decode_gossip(b'plain application payload') is None
+
+    def test_seen_set_is_bounded(self):
+        seen = SeenSet(3)
+        assert seen.add(b'a') is True
+        assert seen.add(b'a') is False
+        for item in (b'b', b'c', b'd'):
+            seen.add(item)
+        assert len(seen) == 3
+        assert b'a' not in seen
+
+
+class TestGossipNode:
+
+    def test_broadcast_respects_fanout(self):
+        manager = _FakeManager('me', [f'p{i}' for i in range(20)])
+        node = GossipNode(manager, fanout=4, rng=random.Random(3))
+        message_id = asyncio.run(node.broadcast(b'evidence'))
+        assert len({peer for peer, _ in manager.sent}) == 4
+        assert all((decode_gossip(data) == (message_id, node.max_hops, b'evidence') for _, data in manager.sent))
+
+    def test_duplicates_dropped_and_sender_excluded(self):
+
+        async def run():
+            manager = _FakeManager('me', ['a', 'b', 'c'])
+            delivered = []
+            passthrough = []
+            manager.on_message = lambda peer, msg: passthrough.append(peer)
+            node = GossipNode(manager, fanout=8, on_deliver=lambda peer, mid, payload: delivered.append(payload))
+            data = encode_gossip(b'\x02' * 16, 3, b'advisory')
+            manager.on_message('a', _wrap(data))
+            manager.on_message('b', _wrap(data))
+            manager.on_message('c', _wrap(b'not gossip'))
+            await node.drain()
+            return (manager, node, delivered, passthrough)
+        manager, node, delivered, passthrough = asyncio.run(run())
+        assert delivered == [b'advisory']
+        assert node.stats.duplicates == 1
+        assert passthrough == ['c']
+        assert sorted((peer for peer, _ in manager.sent)) == ['b', 'c']
+        assert decode_gossip(manager.sent[0][1])[1] == 2
+
+    def test_last_hop_not_forwarded(self):
+
+        async def run():
+            manager = _FakeManager('me', ['a', 'b'])
+            node = GossipNode(manager)
+            manager.on_message('a', _wrap(encode_gossip(b'\x03' * 16, 1, b'x')))
+            await node.drain()
+            return manager.sent
+        assert asyncio.run(run()) == []
+
+    def test_slow_peer_times_out_without_blocking_others(self):
+        manager = _FakeManager('me', ['fast1', 'fast2', 'slow'], slow=['slow'])
+        node = GossipNode(manager, fanout=3, send_timeout=0.05)
+        asyncio.run(node.broadcast(b'segment'))
+        assert node.stats.send_timeouts == 1
+        assert len(manager.sent) == 3
+
+
+def test_gossip_reaches_every_node(kem):
+    report = asyncio.run(run_gossip_simulation(nodes=120, degree=3, fanout=5, messages=2, seed=11))
+    assert report['coverage'] == 1
+    assert report['send_failures'] == 0
+
+
+@pytest.mark.performance
+def test_gossip_propagation_benchmark(kem):
+    """Propagation latency versus mesh size."""
+    print()
+    for nodes in (50, 150, 300):
+        report = asyncio.run(run_gossip_simulation(nodes=nodes, degree=3, fanout=6, messages=5, seed=1))
+        print(f"{nodes} nodes / {report['links']} links: coverage {report['coverage']}, p50 {report['p50_latency_us']} us, p99 {report['p99_latency_us']} us, {float(report['duplicates_per_node_message']):.1f} duplicates per node")
+        assert report['coverage'] == 1
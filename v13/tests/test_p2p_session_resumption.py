@@ -0,0 +1,367 @@
+"""
+Tests for P2P session resumption tickets, the reconnect pool and handshake
+metrics in the ATLAS ConnectionManager
+"""
+import asyncio
+import base64
+import json
+import random
+from fractions import Fraction
+import pytest
+from v13.libs.economics.QAmount import QAmount
+from v13.ATLAS.src.p2p import connection_manager
+from v13.ATLAS.src.p2p.connection_manager import ConnectionManager
+from v13.ATLAS.src.p2p.secure_message_v2 import SecureMessageV2
+from v13.ATLAS.src.p2p.session_resumption import HandshakeMetrics, ResumptionTicket, TicketStore, derive_session_material
+from v13.tests.mocks.mock_kem import LoopbackKEM
+
+
+@pytest.fixture
+def kem(monkeypatch):
+    LoopbackKEM.keypairs = 0
+    LoopbackKEM.encapsulations = 0
+    monkeypatch.setattr(connection_manager, 'PQC', LoopbackKEM)
+    return LoopbackKEM
+
+
+class _Clock:
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+POLL_INTERVAL = Fraction(1, 200)
+
+
+async def _wait_for(predicate, ticks=1000):
+    for _ in range(ticks):
+        if predicate():
+            return
+        await asyncio.sleep(POLL_INTERVAL)
+    raise AssertionError('condition not reached')
+
+
+def _linked(client, server, peer_id):
+    """Both ends connected with the same session key."""
+    return peer_id in client.peers and 'client' in server.peers and (client.peers[peer_id]['session_key'] == server.peers['client']['session_key'])
+
+
+async def _drop(server):
+    server.peers['client']['writer'].close()
+    await asyncio.sleep(0)
+
+
+async def _pair(clock=None, **client_options):
+    clock = clock or _Clock()
+    server = ConnectionManager('server', keypair=None, bootstrap=None, clock=clock)
+    client_options = {'reconnect_base_delay_ms': 1, 'rng': random.Random(7), **client_options}
+    client = ConnectionManager('client', keypair=None, bootstrap=None, clock=clock, **client_options)
+    listener = await server.start_server('127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+    return (server, client, listener, port)
+
+
+async def _shutdown(server, client, listener):
+    await client.close()
+    await server.close()
+    listener.close()
+    await listener.wait_closed()
+
+
+class TestSessionMaterial:
+
+    def test_derivation_is_deterministic_and_separated(self):
+        first = derive_session_material(b'secret')
+        assert first == derive_session_material(b'secret')
+        session_key, resumption_secret, ticket_id = first
+        assert session_key != resumption_secret
+        assert len(ticket_id) == 32
+        assert derive_session_material(b'other')[2] != ticket_id
+
+    def test_ticket_store_single_use_and_expiry(self):
+        store = TicketStore(max_tickets=2)
+        accept = lambda ticket: True
+        store.put(ResumptionTicket('a', 'p', b'k', expires_at=10))
+        store.put(ResumptionTicket('b', 'p', b'k', expires_at=5))
+        assert store.take('b', now=6, verify=accept) is None
+        assert store.take('a', now=6, verify=accept).peer_id == 'p'
+        assert store.take('a', now=6, verify=accept) is None
+        for name in 'cde':
+            store.put(ResumptionTicket(name, 'p', b'k', expires_at=10))
+        assert len(store) == 2
+        assert store.take('c', now=0, verify=accept) is None
+
+    def test_ticket_store_verifies_before_consuming(self):
+        store = TicketStore()
+        store.put(ResumptionTicket('a', 'p', b'k', expires_at=10))
+        assert store.take('a', now=0, verify=lambda ticket: False) is None
+        assert len(store) == 1
+        assert store.take('a', now=0, verify=lambda ticket: ticket.resumption_secret == b'k').ticket_id == 'a'
+        assert len(store) == 0
+
+    def test_metrics_hit_rate(self):
+        metrics = HandshakeMetrics()
+        assert metrics.resumption_hit_rate == 0
+        metrics.resumption_attempts = 4
+        metrics.record(True, 1000000)
+        metrics.record(True, 3000000)
+        metrics.record(False, 10000000)
+        report = metrics.to_dict()
+        assert report['resumption_hit_rate'] == Fraction(1, 2)
+        assert report['avg_resumed_handshake_us'] == 2000
+        assert report['avg_full_handshake_us'] == 10000
+        assert (metrics.resumed_latency_ns, metrics.full_latency_ns) == (4000000, 10000000)
+
+
+class TestSessionResumption:
+
+    def test_reconnect_resumes_without_kem(self, kem):
+
+        async def run():
+            server, client, listener, port = await _pair()
+            peer_id = await client.connect_to_peer('127.0.0.1', port)
+            await _wait_for(lambda: _linked(client, server, peer_id))
+            first_key = client.peers[peer_id]['session_key']
+            for _ in range(3):
+                await _drop(server)
+                await _wait_for(lambda: _linked(client, server, peer_id) and client.metrics.reconnects > 0 and client.peers[peer_id]['session_key'] != first_key)
+                first_key = client.peers[peer_id]['session_key']
+            received = []
+            server.on_message = lambda peer, msg: received.append((peer, msg.ciphertext))
+            await client.send_message(peer_id, b'after-resume')
+            await client.flush(peer_id)
+            await _wait_for(lambda: received)
+            await _shutdown(server, client, listener)
+            return (peer_id, client.metrics, server.metrics, received)
+        peer_id, client_metrics, server_metrics, received = asyncio.run(run())
+        assert peer_id == 'server'
+        assert kem.encapsulations == 1
+        assert client_metrics.full_handshakes == 1
+        assert client_metrics.resumed_handshakes == 3
+        assert client_metrics.resumption_hit_rate == 1
+        assert server_metrics.resumed_handshakes == 3
+        assert received == [('client', b'after-resume')]
+
+    def test_expired_ticket_falls_back_to_full_handshake(self, kem):
+
+        async def run():
+            clock = _Clock()
+            server, client, listener, port = await _pair(clock)
+            peer_id = await client.connect_to_peer('127.0.0.1', port)
+            await _wait_for(lambda: _linked(client, server, peer_id))
+            clock.now = client.ticket_lifetime_ms + 1
+            await _drop(server)
+            await _wait_for(lambda: client.metrics.reconnects == 1 and _linked(client, server, peer_id))
+            await _shutdown(server, client, listener)
+            return client.metrics
+        metrics = asyncio.run(run())
+        assert kem.encapsulations == 2
+        assert metrics.full_handshakes == 2
+        assert metrics.resumption_attempts == 0
+
+    def test_forged_ticket_rejected(self, kem):
+
+        async def run():
+            server, client, listener, port = await _pair()
+            peer_id = await client.connect_to_peer('127.0.0.1', port)
+            await _wait_for(lambda: _linked(client, server, peer_id))
+            await client.disconnect(peer_id)
+            ticket = client._client_tickets[('127.0.0.1', port)]
+            secret = ticket.resumption_secret
+            ticket.resumption_secret = b'guessed'
+            assert await client.connect_to_peer('127.0.0.1', port) == peer_id
+            await _wait_for(lambda: _linked(client, server, peer_id))
+            forged_id = ticket.ticket_id
+            still_stored = forged_id in server.ticket_store._tickets and server.ticket_store._tickets[forged_id].resumption_secret == secret
+            await _shutdown(server, client, listener)
+            return (client.metrics, server.metrics, still_stored)
+        client_metrics, server_metrics, still_stored = asyncio.run(run())
+        assert server_metrics.resumption_attempts == 1
+        assert server_metrics.resumed_handshakes == 0
+        assert client_metrics.full_handshakes == 2
+        assert client_metrics.resumption_hit_rate == 0
+        assert still_stored
+
+
+async def _legacy_server(node_id, received):
+    """Version 1 listener: server hello without a version, the ciphertext, then JSON message lines."""
+
+    async def handle(reader, writer):
+        writer.write(json.dumps({'node_id': node_id, 'kem_pub_key': base64.b64encode(b'legacy-key').decode()}).encode() + b'\n')
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            received.append(json.loads(line.decode()))
+    return await asyncio.start_server(handle, '127.0.0.1', 0)
+
+
+class TestMixedVersions:
+
+    def test_client_with_ticket_does_full_handshake_with_legacy_server(self, kem):
+
+        async def run():
+            received = []
+            listener = await _legacy_server('legacy', received)
+            port = listener.sockets[0].getsockname()[1]
+            client = ConnectionManager('client', keypair=None, bootstrap=None)
+            client._client_tickets['127.0.0.1', port] = ResumptionTicket('t', 'legacy', b'k', expires_at=client.clock() + 60)
+            peer_id = await asyncio.wait_for(client.connect_to_peer('127.0.0.1', port), 5)
+            await _wait_for(lambda: received)
+            await client.close()
+            listener.close()
+            await listener.wait_closed()
+            return (peer_id, received, client.metrics)
+        peer_id, received, metrics = asyncio.run(run())
+        assert peer_id == 'legacy'
+        assert set(received[0]) == {'node_id', 'ciphertext'}
+        assert metrics.resumption_attempts == 0
+        assert metrics.full_handshakes == 1
+
+    def test_legacy_client_completes_handshake(self, kem):
+
+        async def run():
+            server = ConnectionManager('server', keypair=None, bootstrap=None)
+            listener = await server.start_server('127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            hello = json.loads((await asyncio.wait_for(reader.readline(), 5)).decode())
+            writer.write(json.dumps({'node_id': 'legacy', 'ciphertext': hello['kem_pub_key']}).encode() + b'\n')
+            await writer.drain()
+            await _wait_for(lambda: 'legacy' in server.peers)
+            writer.close()
+            await server.close()
+            listener.close()
+            await listener.wait_closed()
+            return (hello, server.metrics)
+        hello, metrics = asyncio.run(run())
+        assert hello['version'] == 2
+        assert metrics.full_handshakes == 1
+
+    def test_legacy_server_gets_json_lines(self, kem):
+
+        async def run():
+            received = []
+            listener = await _legacy_server('legacy', received)
+            port = listener.sockets[0].getsockname()[1]
+            client = ConnectionManager('client', keypair=None, bootstrap=None)
+            peer_id = await asyncio.wait_for(client.connect_to_peer('127.0.0.1', port), 5)
+            await client.send_message(peer_id, b'to-legacy')
+            await client.flush(peer_id)
+            await _wait_for(lambda: len(received) == 2)
+            await client.close()
+            listener.close()
+            await listener.wait_closed()
+            return received
+        handshake, message = asyncio.run(run())
+        assert 'version' not in handshake
+        assert SecureMessageV2.deserialize(json.dumps(message).encode()).ciphertext == b'to-legacy'
+
+    def test_legacy_client_exchanges_json_lines(self, kem):
+
+        async def run():
+            server = ConnectionManager('server', keypair=None, bootstrap=None)
+            received = []
+            server.on_message = lambda peer, msg: received.append((peer, msg.ciphertext))
+            listener = await server.start_server('127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            hello = json.loads((await asyncio.wait_for(reader.readline(), 5)).decode())
+            writer.write(json.dumps({'node_id': 'legacy', 'ciphertext': hello['kem_pub_key']}).encode() + b'\n')
+            await writer.drain()
+            await _wait_for(lambda: 'legacy' in server.peers)
+            await server.send_message('legacy', b'to-legacy')
+            line = await asyncio.wait_for(reader.readline(), 5)
+            writer.write(SecureMessageV2(ciphertext=b'from-legacy', nonce=b'00000000', sequence_num=1, timestamp=QAmount(0)).serialize() + b'\n')
+            await writer.drain()
+            await _wait_for(lambda: received)
+            writer.close()
+            await server.close()
+            listener.close()
+            await listener.wait_closed()
+            return (line, received)
+        line, received = asyncio.run(run())
+        assert SecureMessageV2.deserialize(line).ciphertext == b'to-legacy'
+        assert received == [('legacy', b'from-legacy')]
+
+
+class TestReconnectPool:
+
+    def test_backoff_is_capped_and_jittered(self):
+        mgr = ConnectionManager('n', keypair=None, bootstrap=None, reconnect_base_delay_ms=500, reconnect_max_delay_ms=4000, rng=random.Random(1))
+        delays = [mgr._backoff_delay_ms(attempt) for attempt in range(8)]
+        caps = [min(4000, 500 * 2 ** attempt) for attempt in range(8)]
+        assert all((type(delay) is int and cap <= 2 * delay and delay <= cap for delay, cap in zip(delays, caps)))
+        assert len(set(delays[4:])) > 1
+
+    def test_default_jitter_is_seeded_from_node_id(self):
+        schedule = lambda node_id: [ConnectionManager(node_id, keypair=None, bootstrap=None)._backoff_delay_ms(attempt) for attempt in range(8)]
+        assert schedule('n') == schedule('n')
+        assert schedule('n') != schedule('m')
+
+    def test_close_cancels_pending_reconnect(self, kem):
+
+        async def run():
+            server, client, listener, port = await _pair(reconnect_base_delay_ms=60000)
+            peer_id = await client.connect_to_peer('127.0.0.1', port)
+            await _wait_for(lambda: _linked(client, server, peer_id))
+            await _drop(server)
+            await _wait_for(lambda: peer_id in client._reconnect_tasks)
+            tasks = list(client._reconnect_tasks.values()) + list(client._listener_tasks) + list(server._listener_tasks)
+            await _shutdown(server, client, listener)
+            return (tasks, client._reconnect_tasks, client._listener_tasks, server._listener_tasks)
+        tasks, reconnects, client_listeners, server_listeners = asyncio.run(run())
+        assert tasks and all((task.done() for task in tasks))
+        assert (reconnects, client_listeners, server_listeners) == ({}, set(), set())
+
+    def test_disconnect_leaves_pool(self, kem):
+
+        async def run():
+            server, client, listener, port = await _pair()
+            peer_id = await client.connect_to_peer('127.0.0.1', port)
+            await _wait_for(lambda: _linked(client, server, peer_id))
+            await client.disconnect(peer_id)
+            await asyncio.sleep(POLL_INTERVAL * 10)
+            state = (peer_id in client.peers, dict(client._reconnect_tasks), client.metrics.reconnects)
+            await _shutdown(server, client, listener)
+            return state
+        assert asyncio.run(run()) == (False, {}, 0)
+
+    def test_gives_up_after_max_attempts(self, kem):
+
+        async def run():
+            server, client, listener, port = await _pair(max_reconnect_attempts=3)
+            peer_id = await client.connect_to_peer('127.0.0.1', port)
+            await _wait_for(lambda: _linked(client, server, peer_id))
+            listener.close()
+            await listener.wait_closed()
+            await _drop(server)
+            await _wait_for(lambda: not client._dial_addresses)
+            await _shutdown(server, client, listener)
+            return client.metrics
+        metrics = asyncio.run(run())
+        assert metrics.reconnects == 0
+        assert metrics.failed_handshakes == 0
+
+
+@pytest.mark.performance
+def test_session_resumption_benchmark(kem):
+    """Handshake latency and hit rate over a flapping link."""
+
+    async def run():
+        server, client, listener, port = await _pair()
+        peer_id = await client.connect_to_peer('127.0.0.1', port)
+        await _wait_for(lambda: _linked(client, server, peer_id))
+        for flap in range(1, 51):
+            await _drop(server)
+            await _wait_for(lambda: client.metrics.reconnects == flap and _linked(client, server, peer_id))
+        await _shutdown(server, client, listener)
+        return client.metrics
+    metrics = asyncio.run(run())
+    report = metrics.to_dict()
+    print(f"\n50 flaps: {report['full_handshakes']} full / {report['resumed_handshakes']} resumed handshakes, hit rate {report['resumption_hit_rate']}, full {report['avg_full_handshake_us']} us, resumed {report['avg_resumed_handshake_us']} us")
+    assert kem.encapsulations == 1
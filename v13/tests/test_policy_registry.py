@@ -0,0 +1,46 @@
+"""
+Tests for the epoch-indexed PolicyRegistry
+"""
+import pytest
+from v13.policy.PolicyRegistry import PolicyRegistry
+
+class TestPolicyRegistry:
+    """Test suite for PolicyRegistry epoch lookups"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.registry = PolicyRegistry()
+        self.registry.register_policy('economics', {'rate': 5, 'tiers': [1, 2]}, 10)
+        self.registry.register_policy('economics', {'rate': 1, 'tiers': [1]}, 0)
+        self.registry.register_policy('economics', {'rate': 9, 'tiers': []}, 20)
+
+    def test_epoch_resolution(self):
+        """Test nearest start_epoch <= epoch is selected regardless of registration order"""
+        assert self.registry.get_policy_for_epoch('economics', -1) is None
+        assert self.registry.get_policy_for_epoch('economics', 0)['rate'] == 1
+        assert self.registry.get_policy_for_epoch('economics', 15)['rate'] == 5
+        assert self.registry.get_policy_for_epoch('economics', 20)['rate'] == 9
+        assert self.registry.get_policy_for_epoch('storage', 5) is None
+        assert self.registry.get_active_policy('economics')['rate'] == 9
+
+    def test_snapshots_are_immutable_and_shared(self):
+        """Test lookups return the same frozen snapshot instead of copies"""
+        policy = self.registry.get_policy_for_epoch('economics', 12)
+        assert policy is self.registry.get_policy_for_epoch('economics', 13)
+        assert policy['tiers'] == (1, 2)
+        with pytest.raises(TypeError):
+            policy['rate'] = 100
+
+    def test_registration_isolated_from_caller_mutation(self):
+        """Test mutating the registered config does not change the snapshot"""
+        config = {'rate': 3}
+        self.registry.register_policy('content', config, 0)
+        config['rate'] = 4
+        assert self.registry.get_policy_for_epoch('content', 0)['rate'] == 3
+
+    def test_memo_invalidated_on_register(self):
+        """Test registering a new version invalidates memoized lookups"""
+        assert self.registry.get_policy_for_epoch('economics', 17)['rate'] == 5
+        self.registry.register_policy('economics', {'rate': 7}, 15)
+        assert self.registry.get_policy_for_epoch('economics', 17)['rate'] == 7
+        assert self.registry.get_active_policy('economics')['rate'] == 9
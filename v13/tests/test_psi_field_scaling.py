@@ -0,0 +1,209 @@
+"""
+Tests for ψ-field density caching, edge-incidence curls and large topologies
+"""
+import time
+import pytest
+from v13.libs.economics.PsiFieldEngine import DiscretePsiField, SecurityError, generate_psi_field_evidence
+from v13.core.TokenStateBundle import create_token_state_bundle
+from v13.libs.CertifiedMath import BigNum128, CertifiedMath
+
+
+def _ring_topology(n):
+    """Ring with a chord on every other shard (plenty of short cycles)."""
+    connections = [[f'shard_{i:05d}', f'shard_{(i + 1) % n:05d}'] for i in range(n)]
+    connections += [[f'shard_{i:05d}', f'shard_{(i + 2) % n:05d}'] for i in range(0, n, 2)]
+    return {'shard_connections': connections, 'min_connection_degree': 2}
+
+
+def _harmonic_state(n, dissonance):
+    shards = {f'shard_{i:05d}': {'CHR': 10 ** 12, 'ATR': 10 ** 6, 'RES': 0, 'DISSONANCE': dissonance(i)} for i in range(n)}
+    return create_token_state_bundle(chr_state={'shards': shards}, flx_state={}, psi_sync_state={}, atr_state={}, res_state={}, nod_state={}, lambda1=BigNum128(1618033988749894848), lambda2=BigNum128(618033988749894848), c_crit=BigNum128(1000000000000000000), pqc_cid='TEST_PSI_SCALING', timestamp=1234567890)
+
+
+def _count_density_computations(field):
+    calls = []
+    original = field._compute_psi_density
+
+    def counting(shard_id, harmonic_state):
+        calls.append(shard_id)
+        return original(shard_id, harmonic_state)
+    field._compute_psi_density = counting
+    return calls
+
+
+class TestPsiFieldScaling:
+
+    def test_large_topology_accepted(self):
+        field = DiscretePsiField(_ring_topology(2000), CertifiedMath())
+        assert len(field.edges) == 3000
+        assert len(field.cycle_basis) > 0
+
+    def test_connection_bound_still_enforced(self):
+        bounded = type('BoundedPsiField', (DiscretePsiField,), {'MAX_CONNECTIONS': 10})
+        with pytest.raises(SecurityError) as exc:
+            bounded(_ring_topology(40), CertifiedMath())
+        assert exc.value.violation_type == 'EXCESSIVE_CONNECTIONS'
+
+    def test_density_computed_once_per_state(self):
+        n = 200
+        field = DiscretePsiField(_ring_topology(n), CertifiedMath())
+        calls = _count_density_computations(field)
+        state = _harmonic_state(n, lambda i: n - i)
+        result = field.validate_psi_field_integrity(state, delta_curl_threshold=10 ** 30)
+        assert result['security_checks_passed'] is True
+        assert sorted(calls) == sorted(field.shard_ids)
+        field.validate_psi_field_integrity(_harmonic_state(n, lambda i: n - i), delta_curl_threshold=10 ** 30)
+        assert len(calls) == n
+        state.chr_state['shards']['shard_00000']['DISSONANCE'] = 10 * n
+        field.validate_psi_field_integrity(state, delta_curl_threshold=10 ** 30)
+        assert len(calls) == 2 * n
+
+    def test_invalid_cycles_have_bignum_zero_curl(self):
+        n = 20
+        field = DiscretePsiField(_ring_topology(n), CertifiedMath())
+        state = _harmonic_state(n, lambda i: i)
+        curls = field.compute_all_psi_curls(state)
+        assert all((isinstance(curl, BigNum128) for _, curl in curls))
+        assert any((curl == BigNum128(0) for _, curl in curls))
+        assert field.psi_curl_around_cycle(['shard_00000', 'shard_00001'], state) == BigNum128(0)
+
+    def test_incidence_curls_match_per_cycle_curls(self):
+        n = 60
+        field = DiscretePsiField(_ring_topology(n), CertifiedMath())
+        state = _harmonic_state(n, lambda i: i * 7 % 11)
+        expected = [(cycle, field.psi_curl_around_cycle(cycle, state)) for cycle in sorted(field.cycle_basis)]
+        assert field.compute_all_psi_curls(state) == expected
+
+    def test_overflow_fallback_density_is_bignum(self):
+        n = 20
+        math = CertifiedMath()
+
+        def overflowing_mul(a, b):
+            raise OverflowError('Multiplication overflow')
+        math.checked_mul = overflowing_mul
+        field = DiscretePsiField(_ring_topology(n), math)
+        state = _harmonic_state(n, lambda i: i * 1000)
+        density = field.psi_density('shard_00003', state)
+        assert isinstance(density, BigNum128) and density.value == 10 ** 9 * 10 ** 3 // 3
+        assert len(field.compute_all_psi_curls(state)) == len(field.cycle_basis)
+
+
+def _rings_topology(rings, size):
+    """Disjoint chorded rings: many small components."""
+    connections = []
+    for r in range(rings):
+        names = [f'r{r:04d}_{i:02d}' for i in range(size)]
+        connections += [[names[i], names[(i + 1) % size]] for i in range(size)]
+        connections += [[names[i], names[(i + 2) % size]] for i in range(0, size, 2)]
+    return {'shard_connections': connections, 'min_connection_degree': 2}
+
+
+def _rebuilt(field):
+    topology = {'shard_connections': [list(edge) for edge in field.edge_index], 'min_connection_degree': field.min_connection_degree}
+    return DiscretePsiField(topology, CertifiedMath())
+
+
+class TestIncrementalCycleBasis:
+
+    def _assert_matches_rebuild(self, field):
+        fresh = _rebuilt(field)
+        assert field.cycle_basis == fresh.cycle_basis
+        assert field.cycle_basis_hash == fresh.cycle_basis_hash
+        assert field.verify_cycle_basis_integrity() is True
+
+    def test_edge_insert_and_delete_match_rebuild(self):
+        field = DiscretePsiField(_rings_topology(3, 10), CertifiedMath())
+        before = field.cycle_basis_hash
+        field.add_connection('r0000_01', 'r0000_05')
+        self._assert_matches_rebuild(field)
+        assert field.cycle_basis_hash != before
+        field.add_connection('r0000_03', 'r0001_03')
+        self._assert_matches_rebuild(field)
+        field.remove_connection('r0000_03', 'r0001_03')
+        field.remove_connection('r0000_01', 'r0000_05')
+        self._assert_matches_rebuild(field)
+        assert field.cycle_basis_hash == before
+
+    def test_shard_add_and_retire_match_rebuild(self):
+        field = DiscretePsiField(_rings_topology(3, 10), CertifiedMath())
+        field.add_shard('r0001_zz', ['r0001_00', 'r0002_00', 'r0001_05'])
+        self._assert_matches_rebuild(field)
+        field.retire_shard('r0001_zz')
+        self._assert_matches_rebuild(field)
+        assert 'r0001_zz' not in field.shard_ids
+
+    def test_topology_change_validation(self):
+        field = DiscretePsiField(_rings_topology(2, 10), CertifiedMath())
+        with pytest.raises(SecurityError):
+            field.add_connection('r0000_00', 'r0000_01')
+        with pytest.raises(SecurityError):
+            field.remove_connection('r0000_01', 'r0000_02')
+        with pytest.raises(SecurityError):
+            field.add_shard('new', ['r0000_00'])
+        self._assert_matches_rebuild(field)
+
+    def test_tombstoned_edges_compacted(self):
+        field = DiscretePsiField(_rings_topology(2, 10), CertifiedMath())
+        for _ in range(40):
+            field.add_connection('r0000_01', 'r0001_01')
+            field.remove_connection('r0000_01', 'r0001_01')
+        assert len(field.edge_index) == 30
+        assert len(field.edges) <= 60
+        assert all((field.edges[idx] == edge for edge, idx in field.edge_index.items()))
+        self._assert_matches_rebuild(field)
+
+    def test_long_cycles_built_iteratively(self):
+        n = 5000
+        connections = [[f's{i:05d}', f's{(i + 1) % n:05d}'] for i in range(n)]
+        field = DiscretePsiField({'shard_connections': connections}, CertifiedMath())
+        assert field.cycle_basis == []
+
+
+class TestCycleBasisVersion:
+    """Version 2 basis (BFS spanning forest) pinned on small topologies"""
+
+    @pytest.mark.parametrize('connections, cycles, basis_hash', [
+        ([[f's{i}', f's{(i + 1) % 6}'] for i in range(6)], [['s3', 's2', 's1', 's0', 's5', 's4']], '03706bf02c9249d0bab43ad8b2a2ab38e55b0f153402ef60beeaf676bdef579e'),
+        ([['a', 'b'], ['a', 'c'], ['a', 'd'], ['b', 'c'], ['b', 'd'], ['c', 'd']], [['b', 'a', 'c'], ['b', 'a', 'd'], ['c', 'a', 'd']], 'd2fa27f8fd3d337fc2987e9f24644ac2821eaada1e53a00bdbefd94f0a16ea49'),
+        ([['a', 'b'], ['b', 'c'], ['a', 'c'], ['c', 'd'], ['d', 'e'], ['c', 'e']], [['b', 'a', 'c'], ['d', 'c', 'e']], '2bacb9b4f6cd10abd5518f41aa82a1e981728a73fd1e5e9c44f79c58a303a158'),
+    ], ids=['ring6', 'k4', 'bowtie'])
+    def test_pinned_cycle_basis(self, connections, cycles, basis_hash):
+        field = DiscretePsiField({'shard_connections': connections}, CertifiedMath())
+        assert field.CYCLE_BASIS_VERSION == 2
+        assert field.cycle_basis == cycles
+        assert field.cycle_basis_hash == basis_hash
+
+    def test_evidence_reports_version(self):
+        field = DiscretePsiField(_ring_topology(10), CertifiedMath())
+        evidence = generate_psi_field_evidence(field, _harmonic_state(10, lambda i: 10 - i), delta_curl_threshold=10 ** 30)
+        assert evidence['topology_metrics']['cycle_basis_version'] == 2
+        assert evidence['topology_metrics']['cycle_basis_hash'] == field.cycle_basis_hash
+
+
+@pytest.mark.performance
+def test_incremental_cycle_basis_benchmark():
+    """Edge insert in one of 1000 components versus a full rebuild."""
+    field = DiscretePsiField(_rings_topology(1000, 10), CertifiedMath())
+    start = time.perf_counter()
+    field._compute_secure_cycle_basis()
+    full = time.perf_counter() - start
+    start = time.perf_counter()
+    field.add_connection('r0500_01', 'r0500_05')
+    field.remove_connection('r0500_01', 'r0500_05')
+    incremental = (time.perf_counter() - start) / 2
+    print(f'\n10000 shards / 1000 components: full basis {full * 1000:.1f} ms, edge update {incremental * 1000:.2f} ms')
+
+
+@pytest.mark.performance
+def test_validate_psi_field_integrity_benchmark():
+    """validate_psi_field_integrity time versus shard count."""
+    cm = CertifiedMath()
+    print()
+    for n in (100, 1000, 4000):
+        field = DiscretePsiField(_ring_topology(n), cm)
+        state = _harmonic_state(n, lambda i: n - i)
+        start = time.perf_counter()
+        result = field.validate_psi_field_integrity(state, delta_curl_threshold=10 ** 30)
+        elapsed = time.perf_counter() - start
+        print(f'{n} shards, {len(field.cycle_basis)} cycles: {elapsed * 1000:.1f} ms')
+        assert result['security_checks_passed'] is True
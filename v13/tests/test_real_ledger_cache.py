@@ -0,0 +1,137 @@
+"""
+Tests for the RealLedger read-through cache
+"""
+import asyncio
+import time
+import pytest
+from v13.ATLAS.src.qfs_types import OperationBundle
+from v13.ATLAS.src.real_ledger import RealLedger
+from v13.tests.mocks.mock_ledger import MockLedger
+
+
+def _bundle(i, creator='user_123'):
+    return OperationBundle(operations=[{'type': 'post_created', 'creator_id': creator, 'data': {'title': f'Post {i}'}, 'nonce': i}], bundle_hash=f'bundle_{i}', timestamp=f'2023-01-01T00:00:{i % 60:02d}Z', creator_id=creator)
+
+
+async def _seeded(count, latency_ms=0, **kwargs):
+    adapter = MockLedger(latency_ms=latency_ms)
+    ledger = RealLedger(adapter, **kwargs)
+    for i in range(count):
+        await ledger.submit_bundle(_bundle(i))
+    return adapter, ledger
+
+
+class TestReadThroughCache:
+
+    def test_committed_bundle_and_status_pinned(self):
+
+        async def scenario():
+            adapter, ledger = await _seeded(1, max_cache_entries=0)
+            for _ in range(3):
+                assert (await ledger.get_bundle_status('bundle_0'))['status'] == 'confirmed'
+                assert (await ledger.get_bundle('bundle_0'))['bundle_hash'] == 'bundle_0'
+            return adapter, ledger
+        adapter, ledger = asyncio.run(scenario())
+        assert adapter.calls['get_bundle_status'] == 1 and adapter.calls['get_bundle'] == 1
+        stats = ledger.get_cache_stats()
+        assert stats['pinned_items'] == stats['cached_items'] == 3
+
+    def test_snapshot_cached_by_state_root(self):
+
+        async def scenario():
+            adapter, ledger = await _seeded(2)
+            first_root = adapter._receipts['bundle_0'].block_hash
+            old = await ledger.get_snapshot(first_root)
+            assert old['user_123']['nonce'] == 1
+            assert await ledger.get_snapshot(first_root) is old
+            head = await ledger.get_snapshot()
+            assert head['user_123']['nonce'] == 2
+            await ledger.submit_bundle(_bundle(2))
+            assert (await ledger.get_snapshot())['user_123']['nonce'] == 3
+            assert await ledger.get_snapshot(adapter._receipts['bundle_1'].block_hash) is head
+            return adapter
+        adapter = asyncio.run(scenario())
+        assert adapter.calls['get_snapshot'] == 3
+
+    def test_concurrent_misses_coalesced(self):
+
+        async def scenario():
+            adapter, ledger = await _seeded(1, latency_ms=10)
+            ledger.clear_cache()
+            results = await asyncio.gather(*[ledger.get_bundle('bundle_0') for _ in range(50)], *[ledger.get_snapshot() for _ in range(50)])
+            return adapter, ledger, results
+        adapter, ledger, results = asyncio.run(scenario())
+        assert all((r is results[0] for r in results[:50]))
+        assert adapter.calls['get_bundle'] == 1 and adapter.calls['get_snapshot'] == 1
+        assert ledger.get_cache_stats()['coalesced'] == 98
+
+    def test_lru_respects_byte_budget(self):
+
+        async def scenario():
+            adapter = MockLedger()
+            roots = [(await adapter.submit_bundle(_bundle(i))).block_hash for i in range(6)]
+            budget = RealLedger._entry_size(await adapter.get_snapshot(roots[0])) * 3
+            ledger = RealLedger(adapter, max_cache_bytes=budget)
+            for root in roots:
+                await ledger.get_snapshot(root)
+            return ledger, roots, budget
+        ledger, roots, budget = asyncio.run(scenario())
+        stats = ledger.get_cache_stats()
+        assert 0 < stats['cache_size_bytes'] <= budget
+        assert stats['evictions'] == 3
+        assert f'snapshot:{roots[-1]}' in ledger._cache and f'snapshot:{roots[0]}' not in ledger._cache
+        assert stats['cache_size_bytes'] == sum((size for _, size in ledger._cache.values()))
+
+    def test_errors_not_cached(self):
+
+        class FlakyLedger(MockLedger):
+            failures = 1
+
+            async def get_bundle_status(self, bundle_hash):
+                if self.failures:
+                    self.failures -= 1
+                    await asyncio.sleep(0.01)
+                    raise ConnectionError('ledger unavailable')
+                return await super().get_bundle_status(bundle_hash)
+
+        async def scenario():
+            adapter = FlakyLedger()
+            await adapter.submit_bundle(_bundle(0))
+            ledger = RealLedger(adapter)
+            results = await asyncio.gather(ledger.get_bundle_status('bundle_0'), ledger.get_bundle_status('bundle_0'))
+            return results, await ledger.get_bundle_status('bundle_0'), await ledger.get_bundle('missing')
+        results, retry, missing = asyncio.run(scenario())
+        assert [r['status'] for r in results] == ['error', 'error']
+        assert retry['status'] == 'confirmed'
+        assert missing is None
+
+
+@pytest.mark.performance
+def test_feed_read_benchmark():
+    """1,000 concurrent feed requests: direct MockLedger reads versus RealLedger."""
+    latency_ms, bundles, requests = (2, 50, 1000)
+
+    async def feed(ledger, i):
+        state = await ledger.get_snapshot()
+        state = getattr(state, 'state', state)
+        recent = [f'bundle_{(i + k) % bundles}' for k in range(5)]
+        posts = await asyncio.gather(*[ledger.get_bundle(h) for h in recent])
+        statuses = await asyncio.gather(*[ledger.get_bundle_status(h) for h in recent])
+        return (state['user_123']['nonce'], [p['bundle_hash'] for p in posts], [s['status'] for s in statuses])
+
+    async def run(wrap):
+        adapter, _ = await _seeded(bundles)
+        adapter.latency_ms = latency_ms
+        adapter.calls.clear()
+        ledger = wrap(adapter)
+        elapsed = []
+        for _ in range(2):
+            start = time.perf_counter_ns()
+            results = await asyncio.gather(*[feed(ledger, i) for i in range(requests)])
+            elapsed.append((time.perf_counter_ns() - start) // 1000000)
+        return (elapsed, sum(adapter.calls.values()) // 2, results)
+    direct_elapsed, direct_calls, direct = asyncio.run(run(lambda adapter: adapter))
+    cached_elapsed, cached_calls, cached = asyncio.run(run(RealLedger))
+    print(f'\n{requests} feed requests: direct {direct_elapsed[1]} ms / {direct_calls} adapter calls, cached cold {cached_elapsed[0]} ms, warm {cached_elapsed[1]} ms / {cached_calls} adapter calls')
+    assert cached == direct
+    assert cached_calls * 10 < direct_calls
@@ -0,0 +1,114 @@
+"""
+Tests for the SecureChatEngine participant index and time-ordered message store
+"""
+import asyncio
+import os
+import time
+import pytest
+from v13.ATLAS.src.secure_chat.core.engine import SecureChatEngine, ThreadStatus
+from v13.ATLAS.src.secure_chat.storage.memory_storage import MemoryStorage
+
+
+class CountingATREngine:
+
+    def __init__(self):
+        self.charges = 0
+
+    async def charge_fee(self, account_id, amount, description):
+        self.charges += amount
+
+
+def _engine():
+    return SecureChatEngine(MemoryStorage(), CountingATREngine())
+
+
+def _ts(i):
+    return f'2024-01-01T{i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}+00:00'
+
+
+class TestParticipantIndex:
+
+    def test_list_threads_uses_index(self):
+        engine = _engine()
+        a, _ = engine.create_thread('alice', ['bob'], timestamp=_ts(1))
+        b, _ = engine.create_thread('carol', ['alice', 'carol'], timestamp=_ts(2))
+        c, _ = engine.create_thread('bob', ['carol'], timestamp=_ts(3))
+        assert [t.thread_id for t in engine.list_threads('alice')] == [a.thread_id, b.thread_id]
+        assert [t.thread_id for t in engine.list_threads('carol')] == [b.thread_id, c.thread_id]
+        assert engine.list_threads('dave') == [] and engine.list_threads('') == []
+
+    def test_status_updates_maintain_index(self):
+        engine = _engine()
+        a, _ = engine.create_thread('alice', ['bob'], timestamp=_ts(1))
+        b, _ = engine.create_thread('alice', ['bob'], timestamp=_ts(2))
+        asyncio.run(engine.update_thread_status(a.thread_id, 'alice', ThreadStatus.ARCHIVED))
+        assert [t.thread_id for t in engine.list_threads('bob')] == [a.thread_id, b.thread_id]
+        asyncio.run(engine.update_thread_status(a.thread_id, 'alice', ThreadStatus.DELETED))
+        assert [t.thread_id for t in engine.list_threads('bob')] == [b.thread_id]
+        assert [t.thread_id for t in engine.list_threads('alice')] == [b.thread_id]
+
+
+class TestTimeOrderedMessages:
+
+    def test_before_pagination(self):
+        engine = _engine()
+        thread, _ = engine.create_thread('alice', ['bob'], timestamp=_ts(0))
+        for i in range(10):
+            asyncio.run(engine.post_message(thread.thread_id, 'alice' if i % 2 else 'bob', f'msg {i}'.encode(), timestamp=_ts(i)))
+        page = engine.get_messages(thread.thread_id, 'bob', limit=3, before=_ts(7))
+        assert [m.timestamp for m in page] == [_ts(4), _ts(5), _ts(6)]
+        assert [m.timestamp for m in engine.get_messages(thread.thread_id, 'bob', limit=3, before=_ts(2))] == [_ts(0), _ts(1)]
+        assert engine.get_messages(thread.thread_id, 'bob', limit=3, before=_ts(0)) == []
+        assert len(engine.get_messages(thread.thread_id, 'bob', limit=0, before=_ts(5))) == 5
+        assert [m.timestamp for m in engine.get_messages(thread.thread_id, 'alice', limit=2)] == [_ts(8), _ts(9)]
+
+    def test_late_messages_inserted_in_time_order(self):
+        engine = _engine()
+        thread, _ = engine.create_thread('alice', ['bob'], timestamp=_ts(0))
+        for i, second in enumerate((5, 1, 5, 3)):
+            asyncio.run(engine.post_message(thread.thread_id, 'alice', f'msg {i}'.encode(), timestamp=_ts(second)))
+        messages = engine.get_messages(thread.thread_id, 'alice')
+        assert [(m.timestamp, m.metadata['content_type']) for m in messages] == [(_ts(s), 'text/plain') for s in (1, 3, 5, 5)]
+        assert messages[2].content_size == messages[3].content_size == 5
+        assert messages[2].message_id != messages[3].message_id
+        assert [m.timestamp for m in engine.get_messages(thread.thread_id, 'alice', before=_ts(5))] == [_ts(1), _ts(3)]
+
+
+@pytest.mark.performance
+def test_secure_chat_index_benchmark():
+    """list_threads over 100k threads and before-pagination over 1M messages (QFS_CHAT_BENCH_MESSAGES, default 200k)."""
+    thread_count = 100000
+    message_count = int(os.environ.get('QFS_CHAT_BENCH_MESSAGES', '200000'))
+    engine = _engine()
+    for i in range(thread_count):
+        engine.create_thread(f'user_{i % 5000}', [f'user_{(i + 1) % 5000}'], timestamp=_ts(i))
+    rounds = 200
+    start = time.perf_counter()
+    for r in range(rounds):
+        indexed = engine.list_threads(f'user_{r}')
+    list_elapsed = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for r in range(20):
+        scanned = [t for t in engine.threads.values() if f'user_{r}' in t.participants and t.status != ThreadStatus.DELETED]
+    scan_elapsed = (time.perf_counter() - start) / 20
+    assert len(indexed) == 40 and [t.thread_id for t in indexed] == [t.thread_id for t in engine.list_threads('user_199')]
+    assert len(scanned) == 40
+    thread, _ = engine.create_thread('alice', ['bob'], timestamp=_ts(0))
+
+    async def fill():
+        for i in range(message_count):
+            await engine.post_message(thread.thread_id, 'alice', b'x', timestamp=f'{i:012d}')
+    asyncio.run(fill())
+    before = f'{message_count // 2:012d}'
+    start = time.perf_counter()
+    for _ in range(rounds):
+        page = engine.get_messages(thread.thread_id, 'bob', limit=50, before=before)
+    page_elapsed = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(5):
+        filtered = [m for m in engine.messages[thread.thread_id] if m.timestamp < before][-50:]
+    filter_elapsed = (time.perf_counter() - start) / 5
+    assert page == filtered
+    print(f'\nlist_threads over {thread_count} threads: index {list_elapsed * 1000000.0:.1f} us, scan {scan_elapsed * 1000:.1f} ms')
+    print(f'get_messages(before) over {message_count} messages: bisect {page_elapsed * 1000000.0:.1f} us, filter {filter_elapsed * 1000:.1f} ms')
+    assert list_elapsed * 10 < scan_elapsed and page_elapsed * 10 < filter_elapsed
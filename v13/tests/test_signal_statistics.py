@@ -0,0 +1,112 @@
+"""
+Tests for streaming observatory aggregates
+"""
+from fractions import Fraction
+import pytest
+from v13.policy.humor_observatory import HumorSignalObservatory, HumorSignalSnapshot
+from v13.policy.artistic_observatory import ArtisticSignalObservatory, ArtisticSignalSnapshot
+from v13.policy.signal_statistics import SignalWindow
+
+def _snapshot(i, **dimensions):
+    return HumorSignalSnapshot(timestamp=1000 + i, content_id=f'content_{i}', dimensions=dimensions, confidence=Fraction(4, 5), bonus_factor=Fraction(i % 7, 20), policy_version='v1.0.0')
+
+def _batch_correlation(values1, values2):
+    mean1 = sum(values1) / len(values1)
+    mean2 = sum(values2) / len(values2)
+    numerator = sum(((a - mean1) * (b - mean2) for a, b in zip(values1, values2)))
+    denom1 = sum(((a - mean1) ** 2 for a in values1)) ** Fraction(1, 2)
+    denom2 = sum(((b - mean2) ** 2 for b in values2)) ** Fraction(1, 2)
+    return numerator / (denom1 * denom2)
+
+class TestStreamingSignalStats:
+    """Streaming accumulators must agree with the batch definitions"""
+
+    def test_matches_batch_statistics(self):
+        observatory = HumorSignalObservatory()
+        snapshots = []
+        for i in range(40):
+            dims = {'chronos': Fraction(i % 9, 10), 'lexicon': Fraction((i * 3) % 11, 11)}
+            if i >= 10:
+                dims['meta'] = Fraction((i * 5) % 13, 13)
+            snapshots.append(_snapshot(i, **dims))
+            observatory.record_signal(snapshots[-1])
+        report = observatory.get_observability_report()
+        bonuses = [s.bonus_factor for s in snapshots]
+        mean = sum(bonuses) / len(bonuses)
+        assert report.total_signals_processed == report.signals_in_window == 40
+        assert report.bonus_statistics['mean'] == mean
+        assert report.bonus_statistics['median'] == sorted(bonuses)[20]
+        assert report.bonus_statistics['std_dev'] == pytest.approx(float(sum(((b - mean) ** 2 for b in bonuses)) / 40) ** 0.5)
+        assert report.anomaly_count == sum((1 for b in bonuses if b > mean * 2))
+        assert report.dimension_averages['meta'] == sum((s.dimensions['meta'] for s in snapshots[10:])) / 30
+        assert sum(report.dimension_distributions['chronos'].values()) == pytest.approx(1)
+        correlations = observatory.get_dimension_correlations()
+        for dim1, dim2 in [('chronos', 'lexicon'), ('chronos', 'meta'), ('lexicon', 'meta')]:
+            expected = _batch_correlation([s.dimensions.get(dim1, 0) for s in snapshots], [s.dimensions.get(dim2, 0) for s in snapshots])
+            assert correlations[dim1][dim2] == pytest.approx(expected)
+        top = [entry['bonus_factor'] for entry in report.top_performing_content]
+        assert top == sorted(bonuses, reverse=True)[:10]
+
+    def test_sliding_window_matches_batch(self):
+        window = SignalWindow(Fraction(1, 10), max_history=8)
+        snapshots = []
+        for i in range(30):
+            dims = {'chronos': Fraction(i % 5, 5)}
+            if i % 4 == 0:
+                dims['meta'] = Fraction(i % 7 + 1, 7)
+            snapshots.append(_snapshot(i, **dims))
+            window.add(snapshots[-1])
+            retained = snapshots[-8:]
+            bonuses = sorted((s.bonus_factor for s in retained))
+            mean = sum(bonuses) / len(bonuses)
+            stats = window.stats
+            assert list(window.snapshots) == retained
+            assert stats.count == len(retained)
+            assert stats.bonus_mean_value() == mean
+            assert stats.totals['bonus_m2'] == sum(((b - mean) ** 2 for b in bonuses))
+            assert (stats.bonus_min(), stats.bonus_median(), stats.bonus_max()) == (bonuses[0], bonuses[len(bonuses) // 2], bonuses[-1])
+            assert stats.count_bonuses_above(mean * 2) == sum((1 for b in bonuses if b > mean * 2))
+            assert sorted(stats.dimension_means) == sorted({d for s in retained for d in s.dimensions})
+            for dim in stats.dimension_means:
+                assert stats.dimension_means[dim] == sum((s.dimensions.get(dim, 0) for s in retained)) / len(retained)
+            if 'meta' in stats.dimension_means and len(retained) > 1:
+                expected = _batch_correlation([s.dimensions.get('chronos', 0) for s in retained], [s.dimensions.get('meta', 0) for s in retained])
+                assert stats.correlations()['chronos']['meta'] == pytest.approx(expected)
+        assert stats.top_snapshots(3) == sorted(retained, key=lambda s: s.bonus_factor, reverse=True)[:3]
+
+    def test_epoch_window_and_ring_buffer(self):
+        observatory = HumorSignalObservatory(max_history=30, epoch_length=10, window_epochs=2)
+        for i in range(50):
+            observatory.record_signal(_snapshot(i, chronos=Fraction(1, 2)))
+        assert [s.content_id for s in observatory.signal_history] == [f'content_{i}' for i in range(30, 50)]
+        observatory.record_signal(_snapshot(5, chronos=Fraction(1, 2)))
+        report = observatory.get_observability_report()
+        assert report.total_signals_processed == 51
+        assert report.signals_in_window == 20
+        assert report.policy_settings_summary['observation_window'] == '20 signals'
+        small = HumorSignalObservatory(max_history=5, epoch_length=10, window_epochs=2)
+        for i in range(50):
+            small.record_signal(_snapshot(i, chronos=Fraction(1, 2)))
+        assert small.get_observability_report().signals_in_window == 5
+        export = small.export_observability_data()
+        assert [s['content_id'] for s in export['raw_data_sample']] == [f'content_{i}' for i in range(45, 50)]
+
+    def test_humor_history_unbounded_by_default(self):
+        observatory = HumorSignalObservatory()
+        for i in range(1500):
+            observatory.record_signal(_snapshot(i, chronos=Fraction(i % 10, 10)))
+        report = observatory.get_observability_report()
+        assert report.total_signals_processed == report.signals_in_window == 1500
+        assert len(observatory.signal_history) == 1500
+        assert report.bonus_statistics['min'] == 0
+
+    def test_artistic_report_covers_window(self):
+        observatory = ArtisticSignalObservatory(max_history=3)
+        for i in range(10):
+            observatory.record_signal(ArtisticSignalSnapshot(i, f'c{i}', {'originality': Fraction(i, 10)}, 1, Fraction(i, 100), 'v1'))
+        report = observatory.get_observability_report()
+        assert (report.total_signals_processed, report.signals_in_window) == (10, 3)
+        assert report.dimension_averages['originality'] == Fraction(4, 5)
+        assert report.bonus_statistics == {'mean': Fraction(8, 100), 'min': Fraction(7, 100), 'max': Fraction(9, 100), 'median': Fraction(8, 100)}
+        assert report.top_performing_content[0] == {'content_id': 'c9', 'bonus': Fraction(9, 100)}
+        assert list(report.dimension_distributions['originality']) == ['0.7', '0.8', '0.9']
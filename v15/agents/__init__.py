@@ -1,4 +1,5 @@
 from .advisory_router import AdvisoryRouter
+from .advisory_index import AdvisoryIndex
 from .schemas import (
     AgentAdvisoryEvent,
     ContentScoreAdvisory,
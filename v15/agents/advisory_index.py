@@ -0,0 +1,106 @@
+"""
+Advisory Index (v16 Baseline)
+
+Incremental index of AGENT_ADVISORY events on the EvidenceBus, keyed by
+entity id and advisory type. The index tails the chain log from the last
+byte offset it consumed, so each query only parses newly appended events.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from v15.evidence.bus import EvidenceBus, EvidenceLogTail
+
+# advisory_type -> (section in the advisory, field holding the entity id)
+ENTITY_FIELDS = {
+    "content_score": ("content_score", "content_id"),
+    "recommendation": ("recommendation", "entity_id"),
+    "risk_flag": ("risk_flag", "entity_id"),
+}
+
+
+def advisory_key(envelope: Dict) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Return (advisory_type, entity_id) for an AGENT_ADVISORY envelope, or None
+    for any other event.
+    """
+    if not isinstance(envelope, dict):
+        return None
+    event = envelope.get("event")
+    if not isinstance(event, dict) or event.get("type") != "AGENT_ADVISORY":
+        return None
+    payload = event.get("payload")
+    advisory = payload.get("advisory") if isinstance(payload, dict) else None
+    if not isinstance(advisory, dict):
+        return (None, None)
+    advisory_type = advisory.get("advisory_type")
+    entity_id = None
+    for section, field in ENTITY_FIELDS.values():
+        data = advisory.get(section)
+        if isinstance(data, dict) and data.get(field) is not None:
+            entity_id = data.get(field)
+            break
+    return (advisory_type, entity_id)
+
+
+class AdvisoryIndex:
+    """
+    Advisory events by entity id and by advisory type, in chain order.
+
+    The index follows ``EvidenceBus._log_file``: if the bus is pointed at a
+    different log, or the log shrinks, the index is rebuilt from scratch.
+    """
+
+    def __init__(self, bus=EvidenceBus):
+        self.bus = bus
+        self._tail = EvidenceLogTail(bus)
+        self._reset()
+
+    def _reset(self):
+        self._events: List[Dict] = []
+        self._types: List[Optional[str]] = []
+        self._by_entity: Dict[str, List[int]] = {}
+        self._by_type: Dict[str, List[int]] = {}
+
+    def refresh(self) -> int:
+        """Index events appended since the last refresh; returns how many."""
+        events, restarted = self._tail.read_new()
+        if restarted:
+            self._reset()
+        added = 0
+        for envelope in events:
+            key = advisory_key(envelope)
+            if key is None:
+                continue
+            advisory_type, entity_id = key
+            position = len(self._events)
+            self._events.append(envelope)
+            self._types.append(advisory_type)
+            if advisory_type is not None:
+                self._by_type.setdefault(advisory_type, []).append(position)
+            if entity_id is not None:
+                self._by_entity.setdefault(entity_id, []).append(position)
+            added += 1
+        return added
+
+    def query(
+        self,
+        entity_id: Optional[str] = None,
+        advisory_type: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict]:
+        """Most recent ``limit`` matching advisories, oldest first."""
+        self.refresh()
+        if limit <= 0:
+            return []
+        if entity_id is not None:
+            positions = self._by_entity.get(entity_id, [])
+            if advisory_type is not None:
+                positions = [p for p in positions if self._types[p] == advisory_type]
+        elif advisory_type is not None:
+            positions = self._by_type.get(advisory_type, [])
+        else:
+            return self._events[-limit:]
+        return [self._events[p] for p in positions[-limit:]]
+
+    def __len__(self) -> int:
+        return len(self._events)
@@ -5,9 +5,11 @@ Interface between EvidenceBus and external agent providers.
 Ensures all agent outputs are PoE-logged and non-authoritative.
 """
 
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, List, Optional
 
 from v15.evidence.bus import EvidenceBus
+from v15.agents.advisory_index import AdvisoryIndex
 from v15.agents.schemas import (
     AgentAdvisoryEvent,
     ContentScoreAdvisory,
@@ -29,6 +31,7 @@ class AdvisoryRouter:
     def __init__(self):
         self.bus = EvidenceBus
         self.providers = {}  # Registry of agent providers
+        self.index = AdvisoryIndex(self.bus)
 
     def register_provider(self, name: str, provider):
         """Register an agent provider (CrewAI, LangGraph, etc.)."""
@@ -67,6 +70,92 @@ class AdvisoryRouter:
             content_text=content_text,
         )
 
+        # Emit to EvidenceBus (PoE-logged)
+        envelope = self.bus.emit(
+            "AGENT_ADVISORY", self._content_score_payload(advisory_result, timestamp)
+        )
+
+        return envelope
+
+    def request_content_scores(
+        self,
+        items: List[Dict],
+        provider: str = "mock",
+        timestamp: int = 0,
+        timeout_ms: int = 10_000,
+        max_workers: int = 8,
+    ) -> Dict:
+        """
+        Request content scores for many items concurrently.
+
+        Provider calls run in a thread pool (providers are typically remote
+        agents, so calls are I/O bound). Items still running after
+        ``timeout_ms`` milliseconds, or whose provider raised, are reported
+        in ``errors`` and not logged. Successful advisories are emitted to
+        the EvidenceBus in item order with a single batched write, so the
+        evidence chain does not depend on completion order.
+
+        The pool is shut down with ``wait=False``: queued calls are
+        cancelled, but a provider call that has already started cannot be
+        interrupted and keeps running in its worker thread after this
+        method returns. Its result is discarded.
+
+        Args:
+            items: Dicts with content_id, content_type, content_text and an
+                optional provider overriding ``provider``
+            provider: Default agent provider
+            timestamp: Deterministic timestamp for every advisory
+            timeout_ms: Milliseconds allowed for the whole fan-out
+            max_workers: Concurrent provider calls
+
+        Returns:
+            {"envelopes": [...], "errors": [{"content_id", "error"}, ...]}
+        """
+        agent_providers = []
+        for item in items:
+            name = item.get("provider", provider)
+            agent_provider = self.providers.get(name)
+            if not agent_provider:
+                raise ValueError(f"Unknown provider: {name}")
+            agent_providers.append(agent_provider)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+        try:
+            futures = [
+                executor.submit(
+                    agent_provider.score_content,
+                    content_id=item["content_id"],
+                    content_type=item["content_type"],
+                    content_text=item["content_text"],
+                )
+                for item, agent_provider in zip(items, agent_providers)
+            ]
+            wait(futures, timeout=timeout_ms / 1000)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        events = []
+        errors = []
+        for item, future in zip(items, futures):
+            if not future.done() or future.cancelled():
+                errors.append({"content_id": item["content_id"], "error": "timeout"})
+                continue
+            if future.exception() is not None:
+                errors.append(
+                    {"content_id": item["content_id"], "error": str(future.exception())}
+                )
+                continue
+            events.append(
+                (
+                    "AGENT_ADVISORY",
+                    self._content_score_payload(future.result(), timestamp),
+                )
+            )
+
+        return {"envelopes": self.bus.emit_batch(events), "errors": errors}
+
+    @staticmethod
+    def _content_score_payload(advisory_result: Dict, timestamp: int) -> Dict:
         # Wrap in schema
         content_score = ContentScoreAdvisory(**advisory_result)
 
@@ -77,17 +166,10 @@ class AdvisoryRouter:
             timestamp=timestamp,
             related_events=[],  # Could link to original content event
         )
-
-        # Emit to EvidenceBus (PoE-logged)
-        envelope = self.bus.emit(
-            "AGENT_ADVISORY",
-            {
-                "advisory": advisory_event.model_dump(),
-                "timestamp": timestamp,
-            },
-        )
-
-        return envelope
+        return {
+            "advisory": advisory_event.model_dump(),
+            "timestamp": timestamp,
+        }
 
     def request_recommendation(
         self,
@@ -206,76 +288,19 @@ class AdvisoryRouter:
         """
         Get advisory history from EvidenceBus.
 
+        Served from the incremental advisory index, so filters see the whole
+        chain rather than a window of recent events.
+
         Args:
             entity_id: Optional filter by entity ID
             advisory_type: Optional filter by advisory type
-            limit: Max events to return
+            limit: Max events to return (the most recent matches, oldest first)
 
         Returns:
             List of advisory events
         """
-        all_events = self.bus.get_events(limit=limit * 2)
-
-        # Filter for AGENT_ADVISORY events
-        advisory_events = []
-        for e in all_events:
-            if (
-                isinstance(e, dict)
-                and e.get("event", {}).get("type") == "AGENT_ADVISORY"
-            ):
-                advisory_events.append(e)
-
-        # Apply filters
-        if entity_id or advisory_type:
-            filtered = []
-            for e in advisory_events:
-                if not isinstance(e, dict):
-                    continue
-
-                event_data = e.get("event", {})
-                if not isinstance(event_data, dict):
-                    continue
-
-                payload = event_data.get("payload", {})
-                if not isinstance(payload, dict):
-                    continue
-
-                advisory_data = payload.get("advisory", {})
-                if not isinstance(advisory_data, dict):
-                    continue
-
-                # Filter by type
-                if (
-                    advisory_type
-                    and advisory_data.get("advisory_type") != advisory_type
-                ):
-                    continue
-
-                # Filter by entity
-                if entity_id:
-                    # Check all possible entity ID fields
-                    content_score = advisory_data.get("content_score", {})
-                    recommendation = advisory_data.get("recommendation", {})
-                    risk_flag = advisory_data.get("risk_flag", {})
-
-                    if not (
-                        (
-                            isinstance(content_score, dict)
-                            and content_score.get("content_id") == entity_id
-                        )
-                        or (
-                            isinstance(recommendation, dict)
-                            and recommendation.get("entity_id") == entity_id
-                        )
-                        or (
-                            isinstance(risk_flag, dict)
-                            and risk_flag.get("entity_id") == entity_id
-                        )
-                    ):
-                        continue
-
-                filtered.append(e)
-
-            advisory_events = filtered
-
-        return advisory_events[:limit]
+        return self.index.query(
+            entity_id=entity_id or None,
+            advisory_type=advisory_type or None,
+            limit=limit,
+        )
@@ -0,0 +1,127 @@
+"""
+Revocation Store (v18.9 Multi-Worker)
+
+Shared, SQLite-backed session revocation list with an in-process bloom
+filter fast path. Every uvicorn worker opens the same database file; a
+worker only touches the database when the bloom filter reports a possible
+hit, or when another worker has committed new revocations.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+
+class BloomFilter:
+    """
+    Deterministic bloom filter over string keys.
+
+    Bit positions are derived from SHA-256 (not Python's randomized hash),
+    so every worker computes the same positions for the same session_id.
+    """
+
+    def __init__(self, capacity: int = 65536, num_hashes: int = 7) -> None:
+        # ~10 bits per expected entry keeps the false-positive rate near 1%
+        self._num_bits = max(64, capacity * 10)
+        self._num_hashes = num_hashes
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> List[int]:
+        digest = hashlib.sha256(key.encode()).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+
+class SQLiteRevocationStore:
+    """
+    Revocation list shared between processes through a SQLite file.
+
+    Rows are (session_id, revoked_at, expires_at); ``expires_at`` is indexed
+    so purging expired revocations is a range delete rather than a scan.
+    New rows are picked up incrementally by rowid high-water mark.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS revocations ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "session_id TEXT NOT NULL UNIQUE, "
+            "revoked_at REAL NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_revocations_expires ON revocations (expires_at)"
+        )
+
+    def add(self, session_id: str, revoked_at: float, expires_at: float) -> None:
+        """Insert or refresh a revocation."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO revocations (session_id, revoked_at, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET "
+                "revoked_at = excluded.revoked_at, expires_at = excluded.expires_at",
+                (session_id, revoked_at, expires_at),
+            )
+
+    def contains(self, session_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM revocations WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row is not None
+
+    def data_version(self) -> int:
+        """SQLite data_version; changes whenever another connection commits."""
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def changes_since(self, seq: int) -> List[Tuple[int, str, float]]:
+        """Rows with seq > ``seq`` as (seq, session_id, expires_at), in seq order."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT seq, session_id, expires_at FROM revocations WHERE seq > ? ORDER BY seq",
+                (seq,),
+            ).fetchall()
+
+    def purge_expired(self, now: float) -> int:
+        """Delete revocations whose expiry is before ``now``; returns rows removed."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM revocations WHERE expires_at < ?", (now,))
+            return cur.rowcount
+
+    def next_expiry(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(expires_at) FROM revocations").fetchone()
+        return row[0]
+
+    def session_ids(self) -> Iterable[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT session_id FROM revocations ORDER BY seq").fetchall()
+        return [r[0] for r in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM revocations").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -6,9 +6,12 @@ Tokens are self-contained and can be validated on any cluster node.
 """
 
 import hashlib
+import heapq
 import json
-from typing import Dict, Optional, TypedDict, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, TypedDict, Any
 
+from v15.auth.revocation_store import BloomFilter, SQLiteRevocationStore
 from v15.evidence.bus import EvidenceBus
 from v18.crypto.wallet_auth_crypto import wallet_auth_crypto
 from v18.crypto.ascon_adapter import AsconContext, AsconCiphertext
@@ -30,18 +33,47 @@ class SessionManager:
     - No server-side session storage required for validation
     - Tokens validated by any node with same key_id
     - Optional revocation list for early termination
+
+    REVOCATION:
+    - In-process: dict lookup plus a min-heap of expiry times, so cleanup
+      pops only what has expired (amortized O(log n)) instead of scanning
+    - Shared (revocation_store): SQLite file visible to every worker, with a
+      bloom filter fast path; the store is only queried on a bloom hit or
+      when another worker has committed new revocations
+
+    VALIDATION CACHE:
+    - Bounded LRU of sha256(token) -> claims, so repeat requests skip
+      Ascon decryption and JSON decoding; entries are dropped on
+      revocation and re-checked against expires_at on every hit
     """
 
     def __init__(
-        self, session_ttl_seconds: int = 3600 * 24, time_provider: Optional[Any] = None
+        self,
+        session_ttl_seconds: int = 3600 * 24,
+        time_provider: Optional[Any] = None,
+        revocation_store: Optional[SQLiteRevocationStore] = None,
+        token_cache_size: int = 4096,
     ) -> None:
         self._ttl = session_ttl_seconds
         # Optional revocation list (session_id -> revocation timestamp)
         # This allows early termination without breaking stateless validation
         self._revoked: Dict[str, float] = {}
+        # Min-heap of (revocation expiry, session_id); entries are lazily
+        # discarded if the session was re-revoked with a later expiry
+        self._revocation_heap: List[Tuple[float, str]] = []
         self._token_counter = 0  # For deterministic session IDs
         # Injectable time provider for testing; defaults to Zero-Sim (0.0)
         self._time_provider = time_provider
+        # Shared revocation store (multi-worker); None keeps revocations in-process
+        self._store = revocation_store
+        self._bloom = BloomFilter()
+        self._store_version: Optional[int] = None
+        self._store_seq = 0
+        self._next_purge_at: Optional[float] = None
+        # Validated-token cache: sha256(token) -> (session_id, claims)
+        self._token_cache_size = token_cache_size
+        self._token_cache: "OrderedDict[str, Tuple[str, SessionData]]" = OrderedDict()
+        self._token_cache_by_session: Dict[str, str] = {}
 
     def _get_current_time(self) -> float:
         """Get current time. Uses injectable provider or Zero-Sim default."""
@@ -120,6 +152,7 @@ class SessionManager:
         4. Check expiry
         5. Check revocation list (optional)
 
+        Steps 2-3 are skipped for tokens already in the validation cache.
         No server-side session lookup required.
         """
         self._cleanup_revocations()
@@ -135,9 +168,25 @@ class SessionManager:
             _, session_id, ct_hex, tag_hex = parts
 
             # Check revocation list first (fast path)
-            if session_id in self._revoked:
+            if self._is_revoked(session_id):
                 return None
 
+            # Previously validated token (cache keyed by token digest)
+            token_digest = hashlib.sha256(token.encode()).hexdigest()
+            cached = self._token_cache.get(token_digest)
+            if cached is not None:
+                session_data = cached[1]
+                if session_data["expires_at"] < self._get_current_time():
+                    self._evict_cached_session(session_id)
+                    return None
+                self._token_cache.move_to_end(token_digest)
+                return SessionData(
+                    wallet_address=session_data["wallet_address"],
+                    scopes=list(session_data["scopes"]),
+                    created_at=session_data["created_at"],
+                    expires_at=session_data["expires_at"],
+                )
+
             # Reconstruct context for decryption
             ctx = AsconContext(
                 node_id="tier-a-primary",
@@ -164,13 +213,21 @@ class SessionManager:
             if session_data["expires_at"] < current_time:
                 return None
 
-            # Return typed session data
-            return SessionData(
+            validated = SessionData(
                 wallet_address=session_data["wallet_address"],
                 scopes=session_data["scopes"],
                 created_at=session_data["created_at"],
                 expires_at=session_data["expires_at"],
             )
+            self._cache_validated_token(token_digest, session_id, validated)
+
+            # Return typed session data
+            return SessionData(
+                wallet_address=validated["wallet_address"],
+                scopes=list(validated["scopes"]),
+                created_at=validated["created_at"],
+                expires_at=validated["expires_at"],
+            )
 
         except (ValueError, KeyError, json.JSONDecodeError):
             # Decryption failed, invalid JSON, or missing required fields
@@ -195,8 +252,19 @@ class SessionManager:
         except IndexError:
             return False
 
+        self._evict_cached_session(session_id)
+
         # Add to revocation list with current timestamp
-        self._revoked[session_id] = self._get_current_time()
+        revoked_at = self._get_current_time()
+        expires_at = self._revocation_expiry(revoked_at)
+        if self._store is not None:
+            self._store.add(session_id, revoked_at, expires_at)
+            self._bloom.add(session_id)
+            if self._next_purge_at is None or expires_at < self._next_purge_at:
+                self._next_purge_at = expires_at
+        else:
+            self._revoked[session_id] = revoked_at
+            heapq.heappush(self._revocation_heap, (expires_at, session_id))
 
         EvidenceBus.emit(
             "AUTH_LOGOUT",
@@ -207,18 +275,81 @@ class SessionManager:
         )
         return True
 
+    def _cache_validated_token(
+        self, token_digest: str, session_id: str, session_data: SessionData
+    ) -> None:
+        """Remember a validated token, evicting the least recently used entry."""
+        if self._token_cache_size <= 0:
+            return
+        self._evict_cached_session(session_id)
+        self._token_cache[token_digest] = (session_id, session_data)
+        self._token_cache_by_session[session_id] = token_digest
+        while len(self._token_cache) > self._token_cache_size:
+            _, (evicted_session, _) = self._token_cache.popitem(last=False)
+            del self._token_cache_by_session[evicted_session]
+
+    def _evict_cached_session(self, session_id: str) -> None:
+        """Drop any cached validation for a session (revocation or expiry)."""
+        token_digest = self._token_cache_by_session.pop(session_id, None)
+        if token_digest is not None:
+            self._token_cache.pop(token_digest, None)
+
+    def _revocation_expiry(self, revoked_at: float) -> float:
+        """Revocations are kept for the longest possible TTL (2x) after revocation."""
+        return revoked_at + (self._ttl * 2)
+
+    def _is_revoked(self, session_id: str) -> bool:
+        """Check the revocation list; shared stores are consulted only on a bloom hit."""
+        if self._store is None:
+            return session_id in self._revoked
+        self._sync_shared_revocations()
+        if session_id not in self._bloom:
+            return False
+        return self._store.contains(session_id)
+
+    def _sync_shared_revocations(self) -> None:
+        """Pull revocations committed by other workers into the bloom filter."""
+        version = self._store.data_version()
+        if version == self._store_version:
+            return
+        self._store_version = version
+        for seq, session_id, expires_at in self._store.changes_since(self._store_seq):
+            self._bloom.add(session_id)
+            self._store_seq = seq
+            if self._next_purge_at is None or expires_at < self._next_purge_at:
+                self._next_purge_at = expires_at
+
     def _cleanup_revocations(self) -> None:
         """
         Remove expired entries from revocation list.
 
         Once a token has expired naturally, we don't need to keep it
-        in the revocation list anymore.
+        in the revocation list anymore. Only entries whose expiry has
+        passed are touched (heap pops / indexed range delete).
         """
         now = self._get_current_time()
-        # Remove revocations older than the longest possible TTL
-        cutoff = now - (self._ttl * 2)
-        expired = [
-            sid for sid, revoked_at in self._revoked.items() if revoked_at < cutoff
-        ]
-        for sid in expired:
-            del self._revoked[sid]
+        if self._store is not None:
+            self._cleanup_shared_revocations(now)
+            return
+        heap = self._revocation_heap
+        while heap and heap[0][0] < now:
+            expires_at, sid = heapq.heappop(heap)
+            revoked_at = self._revoked.get(sid)
+            if revoked_at is not None and self._revocation_expiry(revoked_at) == expires_at:
+                del self._revoked[sid]
+
+    def _cleanup_shared_revocations(self, now: float) -> None:
+        """Purge expired shared revocations and rebuild the bloom filter."""
+        if self._next_purge_at is None or self._next_purge_at >= now:
+            return
+        self._store.purge_expired(now)
+        session_ids = self._store.session_ids()
+        self._bloom = BloomFilter(capacity=max(65536, len(session_ids) * 2))
+        for session_id in session_ids:
+            self._bloom.add(session_id)
+        # Purge at most once per TTL/4 bucket; entries past their revocation
+        # expiry are harmless until then because the tokens themselves expired
+        next_expiry = self._store.next_expiry()
+        self._next_purge_at = (
+            None if next_expiry is None else max(next_expiry, now + self._ttl / 4)
+        )
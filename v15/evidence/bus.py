@@ -9,7 +9,8 @@ Zero-Sim Compliant:
 
 import hashlib
 import json
-from typing import Any, Dict
+import os
+from typing import Any, Dict, List, Optional, Tuple
 from v15.crypto.adapter import sign_poe
 
 
@@ -27,6 +28,32 @@ class EvidenceBus:
         """
         Emit an event to the Evidence Chain.
         """
+        envelope = cls._seal(event_type, payload)
+
+        # 8. Persist (Dev/MOCKQPC Mode)
+        with open(cls._log_file, "a") as f:
+            f.write(json.dumps(envelope) + "\n")
+
+        return envelope
+
+    @classmethod
+    def emit_batch(
+        cls, events: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Emit several (event_type, payload) events in order with one log write.
+
+        The chain is identical to calling emit() for each event in turn.
+        """
+        envelopes = [cls._seal(event_type, payload) for event_type, payload in events]
+        if envelopes:
+            with open(cls._log_file, "a") as f:
+                f.write("".join(json.dumps(envelope) + "\n" for envelope in envelopes))
+        return envelopes
+
+    @classmethod
+    def _seal(cls, event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Hash, sign and chain one event; returns its envelope."""
         ts = payload.get("timestamp", 0)
 
         # 2. Construct Canonical Event
@@ -53,18 +80,12 @@ class EvidenceBus:
         cls._chain_tip = event_hash
 
         # 7. Construct Final Envelope
-        envelope = {
+        return {
             "event": event,
             "hash": event_hash,
             "signature": signature.hex(),
         }
 
-        # 8. Persist (Dev/MOCKQPC Mode)
-        with open(cls._log_file, "a") as f:
-            f.write(json.dumps(envelope) + "\n")
-
-        return envelope
-
     @classmethod
     def get_tip(cls) -> str:
         return cls._chain_tip
@@ -81,3 +102,58 @@ class EvidenceBus:
         except FileNotFoundError:
             return []
         return events[-limit:]
+
+    @classmethod
+    def read_events_since(
+        cls, offset: int = 0, log_file: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Read complete events appended after byte ``offset`` of the chain log.
+
+        Returns (events, new_offset); pass new_offset back to continue
+        tailing. A partially written last line is left for the next call.
+        """
+        events = []
+        try:
+            with open(log_file or cls._log_file, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], 0
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if line.strip():
+                events.append(json.loads(line))
+        return events, offset + end
+
+
+class EvidenceLogTail:
+    """
+    Cursor over the chain log for read models built from bus events.
+
+    Follows ``bus._log_file`` from the last byte offset consumed. If the bus
+    is pointed at another log, or the log shrinks, reading starts over from
+    the beginning and ``read_new`` reports a restart so the caller can drop
+    whatever it derived from the old log.
+    """
+
+    def __init__(self, bus=EvidenceBus):
+        self.bus = bus
+        self.log_file: Optional[str] = None
+        self.offset = 0
+
+    def read_new(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """Return (events appended since the last call, restarted)."""
+        log_file = self.bus._log_file
+        try:
+            size = os.path.getsize(log_file)
+        except OSError:
+            size = 0
+        restarted = log_file != self.log_file or size < self.offset
+        if restarted:
+            self.log_file = log_file
+            self.offset = 0
+        if size == self.offset:
+            return [], restarted
+        events, self.offset = self.bus.read_events_since(self.offset, log_file)
+        return events, restarted
@@ -0,0 +1,146 @@
+"""
+Tests for the incremental advisory index and batched content scoring
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from v15.evidence.bus import EvidenceBus
+from v15.agents import AdvisoryIndex, AdvisoryRouter, MockAgentProvider
+
+
+@pytest.fixture
+def chain_log():
+    original_log = EvidenceBus._log_file
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".jsonl") as f:
+        EvidenceBus._log_file = f.name
+    EvidenceBus._chain_tip = "0" * 64
+    try:
+        yield f.name
+    finally:
+        EvidenceBus._log_file = original_log
+        if os.path.exists(f.name):
+            os.unlink(f.name)
+
+
+def _router(**providers):
+    router = AdvisoryRouter()
+    router.register_provider("mock", MockAgentProvider())
+    for name, provider in providers.items():
+        router.register_provider(name, provider)
+    return router
+
+
+class SlowProvider(MockAgentProvider):
+    """Provider whose calls sleep; tracks peak concurrency."""
+
+    def __init__(self, delay, hang_on=()):
+        super().__init__("slow")
+        self.delay = delay
+        self.hang_on = set(hang_on)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def score_content(self, content_id, content_type, content_text):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(1.0 if content_id in self.hang_on else self.delay)
+            if content_id == "broken":
+                raise RuntimeError("provider error")
+            return super().score_content(content_id, content_type, content_text)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_filtered_history_finds_old_matches(chain_log):
+    router = _router()
+    router.request_content_score("post_old", "post", "first post", timestamp=1)
+    for i in range(50):
+        EvidenceBus.emit("OTHER_EVENT", {"timestamp": i})
+        router.request_recommendation(f"bounty_{i}", "bounty", {}, timestamp=i)
+    history = router.get_advisory_history(entity_id="post_old", limit=5)
+    assert [e["event"]["payload"]["advisory"]["content_score"]["content_id"] for e in history] == ["post_old"]
+    recent = router.get_advisory_history(advisory_type="recommendation", limit=3)
+    assert [e["event"]["payload"]["advisory"]["recommendation"]["entity_id"] for e in recent] == ["bounty_47", "bounty_48", "bounty_49"]
+    assert router.get_advisory_history(entity_id="bounty_3", advisory_type="content_score") == []
+
+
+def test_index_tails_the_log_incrementally(chain_log):
+    router = _router()
+    index = AdvisoryIndex()
+    router.request_content_score("a", "post", "alpha", timestamp=1)
+    assert index.refresh() == 1
+    assert index.refresh() == 0
+    with open(chain_log, "a") as f:
+        f.write('{"event": {"type": "AGENT_ADVIS')
+    assert index.refresh() == 0
+    with open(chain_log, "w") as f:
+        f.write("")
+    router.request_risk_assessment("u", "user", {}, timestamp=2)
+    assert index.refresh() == 1
+    assert len(index) == 1
+    assert index.query(entity_id="u")[0]["event"]["payload"]["advisory"]["advisory_type"] == "risk_flag"
+
+
+def test_emit_batch_matches_sequential_emit(chain_log):
+    events = [("E", {"n": i, "timestamp": i}) for i in range(5)]
+    batched = EvidenceBus.emit_batch(events)
+    with open(chain_log) as f:
+        logged = [json.loads(line) for line in f]
+    EvidenceBus._chain_tip = "0" * 64
+    sequential = [EvidenceBus.emit(t, p) for t, p in events]
+    assert [e["hash"] for e in batched] == [e["hash"] for e in sequential]
+    assert logged == batched
+
+
+def test_batch_scores_concurrent_ordered_and_bounded(chain_log):
+    slow = SlowProvider(0.05, hang_on={"stuck"})
+    router = _router(slow=slow)
+    items = [{"content_id": f"post_{i}", "content_type": "post", "content_text": f"text {i}"} for i in range(8)]
+    items.insert(3, {"content_id": "stuck", "content_type": "post", "content_text": "x"})
+    items.insert(5, {"content_id": "broken", "content_type": "post", "content_text": "x"})
+    items.append({"content_id": "via_mock", "content_type": "post", "content_text": "m", "provider": "mock"})
+    result = router.request_content_scores(items, provider="slow", timestamp=7, timeout_ms=500)
+    ids = [e["event"]["payload"]["advisory"]["content_score"]["content_id"] for e in result["envelopes"]]
+    assert ids == [f"post_{i}" for i in range(8)] + ["via_mock"]
+    assert {e["content_id"]: e["error"] for e in result["errors"]} == {"stuck": "timeout", "broken": "provider error"}
+    assert slow.peak > 1
+    for prev, env in zip(result["envelopes"], result["envelopes"][1:]):
+        assert env["event"]["prev_hash"] == prev["hash"]
+    assert len(router.get_advisory_history(advisory_type="content_score")) == 9
+
+
+def test_batch_scores_reject_unknown_provider(chain_log):
+    with pytest.raises(ValueError):
+        _router().request_content_scores([{"content_id": "a", "content_type": "post", "content_text": "t", "provider": "nope"}])
+
+
+@pytest.mark.performance
+def test_advisory_history_benchmark(chain_log):
+    """Filtered history over a 20k-event chain: full parse vs index."""
+    router = _router()
+    EvidenceBus.emit_batch(
+        [("AGENT_ADVISORY", router._content_score_payload(MockAgentProvider().score_content(f"post_{i}", "post", f"text {i}"), i)) for i in range(20000)]
+    )
+    start = time.perf_counter()
+    router.get_advisory_history(entity_id="post_10")
+    build = time.perf_counter() - start
+    router.request_content_score("post_10", "post", "again", timestamp=1)
+    start = time.perf_counter()
+    for _ in range(100):
+        history = router.get_advisory_history(entity_id="post_10")
+    indexed = (time.perf_counter() - start) / 100
+    start = time.perf_counter()
+    EvidenceBus.get_events(limit=200)
+    parse = time.perf_counter() - start
+    print(f"\n20k advisories: index build {build * 1000:.1f} ms, indexed query {indexed * 1000:.3f} ms, get_events parse {parse * 1000:.1f} ms")
+    assert len(history) == 2
@@ -0,0 +1,198 @@
+"""
+Tests for the segmented, append-only governance index
+"""
+
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+from v15.tools import governance_index_manager as gim
+from v15.tools.governance_index_manager import (
+    GovernanceIndexManager,
+    LegacyIndexError,
+    migrate_index,
+)
+
+# Frozen 1.0 index: the first 12 entries of evidence/governance_index.json
+LEGACY_INDEX = os.path.join(
+    os.path.dirname(__file__), "fixtures", "governance_index_v1.json"
+)
+
+
+def _artifact(i, scope="VIRAL_POOL_CAP"):
+    return {
+        "artifact_id": f"GOV-{i:03d}-EXEC-00",
+        "governance_scope": {"epoch": 1, "cycle": i, "parameter_key": scope},
+        "execution_phase": "EXECUTION",
+        "proof_hash": f"sha3_512:{i:0128x}",
+    }
+
+
+def _legacy_entry_hash(entry):
+    """Entry hash exactly as the 1.0 single-file manager computed it."""
+    body = {k: v for k, v in entry.items() if k != "this_entry_hash"}
+    return gim._sha3_512(
+        json.dumps(body, sort_keys=True, separators=(",", ":")).encode()
+    )
+
+
+@pytest.fixture
+def index_file(tmp_path):
+    return str(tmp_path / "governance_index.json")
+
+
+class TestGovernanceIndexManager:
+    def test_append_scope_and_verify(self, index_file):
+        manager = GovernanceIndexManager(index_file)
+        heads = [
+            manager.add_entry(_artifact(i, "A" if i % 2 else "B")) for i in range(6)
+        ]
+        assert [e["cycle"] for e in manager.get_by_scope("A")] == [1, 3, 5]
+        assert manager.get_by_scope("C") == []
+        reopened = GovernanceIndexManager(index_file)
+        entries = reopened.get_by_scope("B")
+        assert [e["this_entry_hash"] for e in entries] == heads[0::2]
+        assert all(_legacy_entry_hash(e) == e["this_entry_hash"] for e in entries)
+        assert entries[0]["previous_entry_hash"] == gim._sha3_512(b"GENESIS_QFS_V15")
+        assert reopened.verify_chain()
+        with open(index_file) as f:
+            head = json.load(f)
+        assert head["chain_head_hash"] == heads[-1] and head["total_entries"] == 6
+        assert head["verified_checkpoint"]["sequence_number"] == 6
+
+    def test_sees_entries_from_other_instance(self, index_file):
+        first = GovernanceIndexManager(index_file)
+        second = GovernanceIndexManager(index_file)
+        first.add_entry(_artifact(1))
+        head = second.add_entry(_artifact(2))
+        assert [e["sequence_number"] for e in first.get_by_scope("VIRAL_POOL_CAP")] == [
+            1,
+            2,
+        ]
+        assert first.verify_chain(full=True)
+        assert second.get_by_scope("VIRAL_POOL_CAP")[-1]["this_entry_hash"] == head
+
+    def test_uncommitted_tail_is_overwritten(self, index_file):
+        manager = GovernanceIndexManager(index_file)
+        manager.add_entry(_artifact(1))
+        with open(manager.entries_path, "ab") as f:
+            f.write(b'{"scope": "VIRAL_POOL_CAP", "sequence_n')
+        reopened = GovernanceIndexManager(index_file)
+        assert len(reopened.get_by_scope("VIRAL_POOL_CAP")) == 1
+        reopened.add_entry(_artifact(2))
+        assert GovernanceIndexManager(index_file).verify_chain(full=True)
+
+    def test_incremental_verify_resumes_from_checkpoint(self, index_file):
+        manager = GovernanceIndexManager(index_file)
+        for i in range(3):
+            manager.add_entry(_artifact(i))
+        assert manager.verify_chain()
+        with open(manager.entries_path, "rb") as f:
+            data = f.read()
+        with open(manager.entries_path, "wb") as f:
+            f.write(data.replace(b'"cycle":1', b'"cycle":7'))
+        assert manager.verify_chain()
+        assert not manager.verify_chain(full=True)
+        with open(manager.entries_path, "wb") as f:
+            f.write(data)
+        manager.add_entry(_artifact(3))
+        with open(manager.entries_path, "rb") as f:
+            data = f.read()
+        with open(manager.entries_path, "wb") as f:
+            f.write(data.replace(b'"cycle":3', b'"cycle":8'))
+        assert not manager.verify_chain()
+
+
+class TestMigration:
+    def test_legacy_index_migrates_with_identical_hashes(self, tmp_path):
+        index_file = str(tmp_path / "governance_index.json")
+        shutil.copy(LEGACY_INDEX, index_file)
+        with open(index_file) as f:
+            legacy = json.load(f)
+
+        assert migrate_index(index_file) == legacy["total_entries"]
+        assert migrate_index(index_file) == 0
+        assert (tmp_path / "governance_index.v1.json").exists()
+
+        manager = GovernanceIndexManager(index_file)
+        assert manager.verify_chain(full=True)
+        assert manager.get_by_scope("VIRAL_POOL_CAP") == [
+            e for e in legacy["entries"] if e["scope"] == "VIRAL_POOL_CAP"
+        ]
+        head = manager.add_entry(_artifact(999))
+        entry = manager.get_by_scope("VIRAL_POOL_CAP")[-1]
+        assert entry["previous_entry_hash"] == legacy["chain_head_hash"]
+        assert entry["sequence_number"] == legacy["total_entries"] + 1
+        assert _legacy_entry_hash(entry) == head
+        assert manager.verify_chain(full=True)
+
+    def test_legacy_index_is_read_only_until_migrated(self, tmp_path):
+        index_file = str(tmp_path / "governance_index.json")
+        shutil.copy(LEGACY_INDEX, index_file)
+        with open(index_file) as f:
+            legacy = json.load(f)
+
+        manager = GovernanceIndexManager(index_file)
+        assert manager.read_only
+        assert manager.verify_chain(full=True)
+        assert manager.get_by_scope("VIRAL_POOL_CAP") == legacy["entries"]
+        with pytest.raises(LegacyIndexError):
+            manager.add_entry(_artifact(999))
+        assert sorted(os.listdir(tmp_path)) == ["governance_index.json"]
+        with open(index_file) as f:
+            assert json.load(f) == legacy
+
+        migrate_index(index_file)
+        manager = GovernanceIndexManager(index_file)
+        assert not manager.read_only
+        manager.add_entry(_artifact(999))
+        assert manager.verify_chain(full=True)
+
+
+@pytest.mark.performance
+def test_append_cost_stays_flat(index_file):
+    """Per-append cost at the start and end of a QFS_GOV_INDEX_BENCH_ENTRIES build."""
+    total = int(os.environ.get("QFS_GOV_INDEX_BENCH_ENTRIES", "5000"))
+    manager = GovernanceIndexManager(index_file)
+    timings = []
+    start = time.perf_counter()
+    for i in range(total):
+        t0 = time.perf_counter()
+        manager.add_entry(_artifact(i, f"SCOPE_{i % 10}"))
+        timings.append(time.perf_counter() - t0)
+    build = time.perf_counter() - start
+    window = max(1, total // 10)
+    early = sum(timings[:window]) / window
+    late = sum(timings[-window:]) / window
+    start = time.perf_counter()
+    assert manager.verify_chain()
+    first_verify = time.perf_counter() - start
+    manager.add_entry(_artifact(total))
+    start = time.perf_counter()
+    assert manager.verify_chain()
+    incremental = time.perf_counter() - start
+
+    # One 1.0-format append at this size: load, append, rewrite the whole file
+    with open(manager.entries_path) as f:
+        legacy = {"entries": [json.loads(line) for line in f]}
+    legacy_path = index_file + ".legacy"
+    with open(legacy_path, "w") as f:
+        json.dump(legacy, f, indent=2, sort_keys=True)
+    start = time.perf_counter()
+    with open(legacy_path) as f:
+        legacy = json.load(f)
+    legacy["entries"].append(legacy["entries"][-1])
+    with open(legacy_path, "w") as f:
+        json.dump(legacy, f, indent=2, sort_keys=True)
+    legacy_append = time.perf_counter() - start
+
+    print(
+        f"\n{total} entries built in {build:.2f} s; append {early * 1e3:.2f} ms early, "
+        f"{late * 1e3:.2f} ms late (1.0 format at this size: {legacy_append * 1e3:.1f} ms); "
+        f"verify {first_verify * 1e3:.1f} ms full, {incremental * 1e3:.2f} ms incremental"
+    )
+    assert late < early * 3 + 0.002
+    assert incremental * 10 < first_verify
@@ -1,62 +1,221 @@
 """
 Governance Index Manager for v15.3 PoE
 Manages the append-only, hash-chained index of governance execution proofs.
+
+Storage layout (index version 2.0):
+- ``<index>.entries.jsonl``: append-only log, one canonical JSON entry per line
+- ``<index>.json``: small head file (chain head, entry count, committed byte
+  length of the log, verified checkpoint), replaced atomically on every write
+
+The head file is the commit point: log bytes past ``entries_bytes`` belong to
+an interrupted write and are overwritten by the next append. Entry hashes are
+computed exactly as in the 1.0 single-file format. 1.0 index files are opened
+read-only until converted with ``migrate_governance_index.py`` (``migrate_index``).
 """
 
 import json
 import hashlib
+import logging
+import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+INDEX_VERSION = "2.0"
+GENESIS_SEED = b"GENESIS_QFS_V15"
+
+logger = logging.getLogger(__name__)
+
+
+class LegacyIndexError(RuntimeError):
+    """Write attempted on a 1.0 index that has not been migrated."""
+
+
+def _sha3_512(data: bytes) -> str:
+    """Generate SHA3-512 hash."""
+    h = hashlib.sha3_512()
+    h.update(data)
+    return f"sha3_512:{h.hexdigest()}"
+
+
+def _canonical_serialize(data: Any) -> str:
+    """Canonical JSON serialization."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _timestamp() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def entries_path_for(index_path: Path) -> Path:
+    """Path of the append-only entry log that belongs to a head file."""
+    return index_path.with_name(index_path.stem + ".entries.jsonl")
+
+
+def write_head(index_path: Path, head: Dict[str, Any]):
+    """Write the head file atomically (temp file, fsync, rename)."""
+    temp_path = index_path.with_suffix(".tmp")
+    with open(temp_path, "w") as f:
+        json.dump(head, f, indent=2, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    temp_path.replace(index_path)
+
+
+def migrate_index(index_file: str, backup: bool = True) -> int:
+    """
+    Convert a 1.0 single-file governance index to the segmented 2.0 layout.
+
+    Entries are copied verbatim (hashes are not recomputed), so the chain and
+    head hash are unchanged. With ``backup`` the original file is kept as
+    ``<index>.v1.json``.
+
+    Returns:
+        Number of migrated entries; 0 if the index is already 2.0.
+
+    Raises:
+        ValueError: If the file is not a governance index
+    """
+    index_path = Path(index_file)
+    with open(index_path, "r") as f:
+        legacy = json.load(f)
+    if legacy.get("index_version") == INDEX_VERSION:
+        return 0
+    if not isinstance(legacy.get("entries"), list):
+        raise ValueError(f"{index_path} is not a governance index")
+
+    entries_path = entries_path_for(index_path)
+    with open(entries_path, "wb") as f:
+        for entry in legacy["entries"]:
+            f.write((_canonical_serialize(entry) + "\n").encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+        entries_bytes = f.tell()
+
+    if backup:
+        backup_path = index_path.with_name(index_path.stem + ".v1.json")
+        with open(backup_path, "w") as f:
+            json.dump(legacy, f, indent=2, sort_keys=True)
+
+    write_head(
+        index_path,
+        {
+            "index_version": INDEX_VERSION,
+            "chain_start_hash": legacy["chain_start_hash"],
+            "chain_head_hash": legacy["chain_head_hash"],
+            "total_entries": legacy["total_entries"],
+            "last_updated": legacy.get("last_updated", _timestamp()),
+            "entries_file": entries_path.name,
+            "entries_bytes": entries_bytes,
+            "verified_checkpoint": {
+                "sequence_number": 0,
+                "entry_hash": legacy["chain_start_hash"],
+                "offset": 0,
+            },
+        },
+    )
+    return len(legacy["entries"])
+
 
 class GovernanceIndexManager:
     """
     Manages the hash-chained governance index.
     Ensures integrity and append-only semantics for PoE artifacts.
+
+    Appends cost O(1) file work (one log line plus the head file), scope
+    lookups read only the matching lines through a per-scope offset index,
+    and verify_chain resumes from the last verified checkpoint.
+
+    A 1.0 index file is opened read-only: lookups and verification work on
+    the in-memory entries and add_entry raises LegacyIndexError until the file
+    is migrated with migrate_governance_index.py.
     """
 
     def __init__(self, index_file: str = "evidence/governance_index.json"):
         self.index_path = Path(index_file)
+        self.entries_path = entries_path_for(self.index_path)
         self.max_entries_per_file = 1000  # For future pagination support
+        self._scope_offsets: Dict[str, List[int]] = {}
+        self._indexed_bytes = 0
+        self._legacy: Optional[Dict[str, Any]] = None
         self._ensure_index_exists()
+        if self._legacy is None:
+            self._sync()
+
+    @property
+    def read_only(self) -> bool:
+        """True while the index is an unmigrated 1.0 file."""
+        return self._legacy is not None
 
     def _ensure_index_exists(self):
-        """Create initial index file if it doesn't exist."""
+        """Create initial index files if they don't exist; detect 1.0 indexes."""
         if not self.index_path.exists():
             self.index_path.parent.mkdir(parents=True, exist_ok=True)
-            initial_index = {
-                "index_version": "1.0",
-                "chain_start_hash": self._sha3_512(b"GENESIS_QFS_V15"),
-                "entries": [],
-                "chain_head_hash": self._sha3_512(b"GENESIS_QFS_V15"),
-                "total_entries": 0,
-                "last_updated": datetime.utcnow().isoformat() + "Z",
-            }
-            self._save_index(initial_index)
+            genesis_hash = self._sha3_512(GENESIS_SEED)
+            self.entries_path.touch()
+            self._save_head(
+                {
+                    "index_version": INDEX_VERSION,
+                    "chain_start_hash": genesis_hash,
+                    "chain_head_hash": genesis_hash,
+                    "total_entries": 0,
+                    "last_updated": _timestamp(),
+                    "entries_file": self.entries_path.name,
+                    "entries_bytes": 0,
+                    "verified_checkpoint": {
+                        "sequence_number": 0,
+                        "entry_hash": genesis_hash,
+                        "offset": 0,
+                    },
+                }
+            )
+        else:
+            head = self._load_head()
+            if head.get("index_version") != INDEX_VERSION:
+                logger.warning(
+                    "Governance index %s is in the 1.0 format and is opened "
+                    "read-only; run v15/tools/migrate_governance_index.py "
+                    "--index %s to enable appends",
+                    self.index_path,
+                    self.index_path,
+                )
+                self._legacy = head
 
     def _sha3_512(self, data: bytes) -> str:
         """Generate SHA3-512 hash."""
-        h = hashlib.sha3_512()
-        h.update(data)
-        return f"sha3_512:{h.hexdigest()}"
+        return _sha3_512(data)
 
     def _canonical_serialize(self, data: Any) -> str:
         """Canonical JSON serialization."""
-        return json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return _canonical_serialize(data)
 
-    def _load_index(self) -> Dict[str, Any]:
-        """Load the current index."""
+    def _load_head(self) -> Dict[str, Any]:
+        """Load the current head file."""
         with open(self.index_path, "r") as f:
             return json.load(f)
 
-    def _save_index(self, index_data: Dict[str, Any]):
-        """Save the index data atomically."""
-        # Write to temp file then rename to ensure atomicity
-        temp_path = self.index_path.with_suffix(".tmp")
-        with open(temp_path, "w") as f:
-            json.dump(index_data, f, indent=2, sort_keys=True)
-        temp_path.replace(self.index_path)
+    def _save_head(self, head: Dict[str, Any]):
+        """Save the head file atomically."""
+        write_head(self.index_path, head)
+        self._head = head
+
+    def _sync(self):
+        """Reload the head and index entries committed since the last sync."""
+        self._head = self._load_head()
+        committed = self._head["entries_bytes"]
+        if committed < self._indexed_bytes:
+            self._scope_offsets = {}
+            self._indexed_bytes = 0
+        if committed == self._indexed_bytes:
+            return
+        with open(self.entries_path, "rb") as f:
+            f.seek(self._indexed_bytes)
+            offset = self._indexed_bytes
+            for line in f.read(committed - offset).splitlines(keepends=True):
+                scope = json.loads(line)["scope"]
+                self._scope_offsets.setdefault(scope, []).append(offset)
+                offset += len(line)
+        self._indexed_bytes = committed
 
     def add_entry(self, artifact: Dict[str, Any]) -> str:
         """
@@ -68,11 +227,20 @@ class GovernanceIndexManager:
 
         Returns:
             The new chain head hash.
+
+        Raises:
+            LegacyIndexError: If the index is an unmigrated 1.0 file
         """
-        index = self._load_index()
+        if self._legacy is not None:
+            raise LegacyIndexError(
+                f"Governance index {self.index_path} is in the 1.0 format; "
+                "migrate it with v15/tools/migrate_governance_index.py"
+            )
+        self._sync()
+        head = self._head
 
-        previous_head = index["chain_head_hash"]
-        sequence_number = index["total_entries"] + 1
+        previous_head = head["chain_head_hash"]
+        sequence_number = head["total_entries"] + 1
 
         # Create index entry structure
         entry = {
@@ -84,7 +252,7 @@ class GovernanceIndexManager:
             "phase": artifact["execution_phase"],
             "proof_hash": artifact["proof_hash"],
             "previous_entry_hash": previous_head,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _timestamp(),
             "retrieval_path": f"evidence/poe_artifacts/{artifact['artifact_id']}.json",
         }
 
@@ -92,24 +260,83 @@ class GovernanceIndexManager:
         entry_content_hash = self._sha3_512(self._canonical_serialize(entry).encode())
         entry["this_entry_hash"] = entry_content_hash
 
-        # Update index state
-        index["entries"].append(entry)
-        index["chain_head_hash"] = entry_content_hash
-        index["total_entries"] = sequence_number
-        index["last_updated"] = datetime.utcnow().isoformat() + "Z"
+        # Append after the committed bytes, dropping any uncommitted tail
+        offset = head["entries_bytes"]
+        line = (self._canonical_serialize(entry) + "\n").encode("utf-8")
+        with open(self.entries_path, "r+b") as f:
+            f.seek(offset)
+            f.truncate()
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
 
-        self._save_index(index)
+        # Commit by replacing the head
+        self._save_head(
+            dict(
+                head,
+                chain_head_hash=entry_content_hash,
+                total_entries=sequence_number,
+                last_updated=_timestamp(),
+                entries_bytes=offset + len(line),
+            )
+        )
+        self._scope_offsets.setdefault(entry["scope"], []).append(offset)
+        self._indexed_bytes = offset + len(line)
         return entry_content_hash
 
-    def verify_chain(self) -> bool:
+    def verify_chain(self, full: bool = False) -> bool:
         """
-        Verify the complete integrity of the hash chain.
+        Verify the integrity of the hash chain.
+
+        Entries up to the persisted verified checkpoint are trusted unless
+        ``full`` is set; a successful run moves the checkpoint to the head.
+        A read-only 1.0 index is always verified in full.
         Returns True if valid, False otherwise.
         """
-        index = self._load_index()
-        current_hash = index["chain_start_hash"]
+        if self._legacy is not None:
+            return self._verify_entries(
+                self._legacy["entries"],
+                self._legacy["chain_start_hash"],
+                self._legacy["chain_head_hash"],
+            )
+        self._sync()
+        head = self._head
+        checkpoint = head["verified_checkpoint"]
+        if full:
+            checkpoint = {
+                "sequence_number": 0,
+                "entry_hash": head["chain_start_hash"],
+                "offset": 0,
+            }
+        offset = checkpoint["offset"]
+
+        with open(self.entries_path, "rb") as f:
+            f.seek(offset)
+            data = f.read(head["entries_bytes"] - offset)
+
+        if not self._verify_entries(
+            (json.loads(line) for line in data.splitlines()),
+            checkpoint["entry_hash"],
+            head["chain_head_hash"],
+        ):
+            return False
 
-        for entry in index["entries"]:
+        if head["verified_checkpoint"]["offset"] != head["entries_bytes"]:
+            self._save_head(
+                dict(
+                    head,
+                    verified_checkpoint={
+                        "sequence_number": head["total_entries"],
+                        "entry_hash": head["chain_head_hash"],
+                        "offset": head["entries_bytes"],
+                    },
+                )
+            )
+        return True
+
+    def _verify_entries(self, entries, current_hash: str, head_hash: str) -> bool:
+        """Check links and hashes of ``entries`` following ``current_hash``."""
+        for entry in entries:
             # 1. Check link to previous
             if entry["previous_entry_hash"] != current_hash:
                 print(
@@ -133,16 +360,25 @@ class GovernanceIndexManager:
             current_hash = stored_hash
 
         # 3. Verify head matches last entry
-        if current_hash != index["chain_head_hash"]:
+        if current_hash != head_hash:
             print("Chain Head Mismatch")
             return False
-
         return True
 
     def get_by_scope(self, parameter_key: str) -> List[Dict[str, Any]]:
         """Retrieve all entries for a specific parameter."""
-        index = self._load_index()
-        return [e for e in index["entries"] if e["scope"] == parameter_key]
+        if self._legacy is not None:
+            return [e for e in self._legacy["entries"] if e["scope"] == parameter_key]
+        self._sync()
+        offsets = self._scope_offsets.get(parameter_key, [])
+        if not offsets:
+            return []
+        entries = []
+        with open(self.entries_path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                entries.append(json.loads(f.readline()))
+        return entries
 
 
 # Global instance pattern
@@ -0,0 +1,47 @@
+"""
+Governance Index Migration Tool for QFS v15.3
+Converts a 1.0 single-file governance index (all entries inside
+governance_index.json) to the segmented 2.0 layout: an append-only
+entries log plus a small head file. Entry and head hashes are unchanged;
+the migrated chain is fully re-verified before the tool reports success.
+"""
+
+import argparse
+import sys
+
+from v15.tools.governance_index_manager import GovernanceIndexManager, migrate_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate QFS Governance Index")
+    parser.add_argument(
+        "--index",
+        default="evidence/governance_index.json",
+        help="Path of the governance index head file",
+    )
+    parser.add_argument(
+        "--no-backup",
+        action="store_true",
+        help="Do not keep the 1.0 file as <index>.v1.json",
+    )
+    args = parser.parse_args()
+
+    try:
+        migrated = migrate_index(args.index, backup=not args.no_backup)
+    except (OSError, ValueError) as e:
+        print(f"❌ Migration Failed: {e}")
+        sys.exit(1)
+
+    if migrated == 0:
+        print(f"Index {args.index} is already in the segmented format.")
+    else:
+        print(f"Migrated {migrated} entries from {args.index}")
+
+    if not GovernanceIndexManager(args.index).verify_chain(full=True):
+        print("❌ Migrated chain failed verification")
+        sys.exit(1)
+    print("✅ Chain verified")
+
+
+if __name__ == "__main__":
+    main()
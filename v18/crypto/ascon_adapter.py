@@ -71,6 +71,17 @@ class IAsconAdapter:
             self.emit_callback("ASYNC_CRYPTO_EVENT", event)
 
 
+def _xor_keystream(data: bytes, stream_key: bytes) -> bytes:
+    """XOR data with the repeating stream_key as one big-integer operation."""
+    if not data:
+        return b""
+    repeats = -(-len(data) // len(stream_key))
+    keystream = (stream_key * repeats)[: len(data)]
+    return (
+        int.from_bytes(data, "big") ^ int.from_bytes(keystream, "big")
+    ).to_bytes(len(data), "big")
+
+
 class MockAsconAdapter(IAsconAdapter):
     """
     A deterministic mock implementation of Ascon using SHA3-256 for simulation.
@@ -99,9 +110,7 @@ class MockAsconAdapter(IAsconAdapter):
         stream_key = hashlib.sha3_256(key + nonce).digest()
 
         # Simple XOR stream
-        cipher_bytes = bytearray()
-        for i in range(len(plaintext)):
-            cipher_bytes.append(plaintext[i] ^ stream_key[i % len(stream_key)])
+        cipher_bytes = _xor_keystream(plaintext, stream_key)
 
         tag_h = hashlib.sha3_256()
         tag_h.update(plaintext)
@@ -126,9 +135,7 @@ class MockAsconAdapter(IAsconAdapter):
         stream_key = hashlib.sha3_256(key + nonce).digest()
 
         cipher_bytes = bytes.fromhex(ciphertext.ciphertext_hex)
-        plaintext = bytearray()
-        for i in range(len(cipher_bytes)):
-            plaintext.append(cipher_bytes[i] ^ stream_key[i % len(stream_key)])
+        plaintext = _xor_keystream(cipher_bytes, stream_key)
 
         # Verify tag
         tag_h = hashlib.sha3_256()
@@ -141,7 +148,7 @@ class MockAsconAdapter(IAsconAdapter):
             raise ValueError("Ascon AEAD authentication failed - Tag mismatch")
 
         self._log_event("AEAD_DECRYPT", context, ciphertext.tag_hex)
-        return bytes(plaintext)
+        return plaintext
 
     def ascon_hash(self, context: AsconContext, message: bytes) -> AsconDigest:
         h = hashlib.sha3_256()
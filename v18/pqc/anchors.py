@@ -1,7 +1,8 @@
 import hashlib
-from typing import List, Dict, Any, Protocol
+from typing import List, Dict, Any, Optional, Protocol
 from abc import abstractmethod
 from v15.crypto.adapter import sign_poe, verify_poe
+from v18.pqc.merkle import MerkleAccumulator, leaf_hash, verify_inclusion_path
 
 
 class IBatchAnchorService(Protocol):
@@ -23,41 +24,158 @@ class IBatchAnchorService(Protocol):
         ...
 
 
+ROOT_VERSION_MERKLE = "merkle-sha3-256-v1"
+ROOT_VERSION_LEGACY = "concat-sha3-256"
+
+
+def legacy_batch_root(event_hashes: List[str]) -> bytes:
+    """Pre-Merkle root: SHA3-256 over the concatenated event hashes."""
+    return hashlib.sha3_256("".join(event_hashes).encode()).digest()
+
+
+def tree_head_digest(tree_size: int, root: bytes) -> bytes:
+    """Digest signed for a Merkle anchor: binds the root to its tree size."""
+    return hashlib.sha3_256(
+        b"QFS-V18-ANCHOR-STH" + tree_size.to_bytes(8, "big") + root
+    ).digest()
+
+
 class PQCBatchAnchorService:
     """
     Tier A Batch Anchor Service.
     Produces a single PQC-grounded signature for a segment of the EvidenceBus.
-    """
 
-    def create_batch_signature(self, event_hashes: List[str]) -> Dict[str, Any]:
-        """
-        Produce a deterministic batch signature.
-        Uses a Merkle-root approximation for the segment.
-        """
-        # 1. Compute Batch Root (Deterministic)
-        # We sort to ensure order-independence if needed, but EvidenceBus is ordered.
-        # However, for batch anchoring, we follow the log order.
-        combined = "".join(event_hashes).encode()
-        batch_root = hashlib.sha3_256(combined).digest()
+    Batch roots are SHA3-256 Merkle roots (see ``v18.pqc.merkle``) unless the
+    legacy concatenation root is requested via ``root_version``. The service
+    also keeps an append-only accumulator over every event passed to
+    ``anchor_segment``, so anchoring a new segment only hashes the new events
+    and any anchored event has an inclusion proof against a signed root.
+    """
 
-        # 2. Sign using PQC Adapter (Environment-Aware)
-        signature = sign_poe(batch_root)
+    def __init__(self):
+        self._log = MerkleAccumulator()
+        self._latest_anchor: Optional[Dict[str, Any]] = None
 
+    def _sign_root(
+        self, root: bytes, tree_size: int, root_version: str
+    ) -> Dict[str, Any]:
+        if root_version == ROOT_VERSION_LEGACY:
+            signature = sign_poe(root)
+        else:
+            signature = sign_poe(tree_head_digest(tree_size, root))
         return {
             "pqc_signature": signature.hex(),
             "algorithm": "v18-Dilithium-Anchor",
-            "batch_root": batch_root.hex(),
-            "event_count": len(event_hashes),
+            "batch_root": root.hex(),
+            "event_count": tree_size,
             "status": "anchored",
+            "root_version": root_version,
         }
 
+    @staticmethod
+    def _root(event_hashes: List[str], root_version: str) -> bytes:
+        if root_version == ROOT_VERSION_LEGACY:
+            return legacy_batch_root(event_hashes)
+        if root_version != ROOT_VERSION_MERKLE:
+            raise ValueError(f"Unknown anchor root version: {root_version}")
+        return MerkleAccumulator([h.encode() for h in event_hashes]).root()
+
+    def create_batch_signature(
+        self, event_hashes: List[str], root_version: str = ROOT_VERSION_MERKLE
+    ) -> Dict[str, Any]:
+        """
+        Produce a deterministic batch signature over a standalone segment.
+
+        Args:
+            event_hashes: Event hashes in log order
+            root_version: ROOT_VERSION_MERKLE (default) or ROOT_VERSION_LEGACY
+        """
+        # The batch follows the EvidenceBus log order; it is not sorted.
+        root = self._root(event_hashes, root_version)
+        return self._sign_root(root, len(event_hashes), root_version)
+
     def verify_batch_signature(
-        self, event_hashes: List[str], signature_hex: str
+        self,
+        event_hashes: List[str],
+        signature_hex: str,
+        root_version: str = ROOT_VERSION_MERKLE,
     ) -> bool:
         """Verify the anchor signature against the event list."""
-        combined = "".join(event_hashes).encode()
-        batch_root = hashlib.sha3_256(combined).digest()
-        return verify_poe(batch_root, bytes.fromhex(signature_hex))
+        root = self._root(event_hashes, root_version)
+        if root_version == ROOT_VERSION_LEGACY:
+            return verify_poe(root, bytes.fromhex(signature_hex))
+        return verify_poe(
+            tree_head_digest(len(event_hashes), root), bytes.fromhex(signature_hex)
+        )
+
+    def anchor_segment(self, event_hashes: List[str]) -> Dict[str, Any]:
+        """
+        Append a segment to the anchored log and sign the new log root.
+
+        Only the new events are hashed (O(log n) node hashes per event); the
+        anchor covers every event anchored so far.
+        """
+        segment_start = len(self._log)
+        self._log.extend([h.encode() for h in event_hashes])
+        anchor = self._sign_root(self._log.root(), len(self._log), ROOT_VERSION_MERKLE)
+        anchor["segment_start"] = segment_start
+        self._latest_anchor = anchor
+        return anchor
+
+    def get_inclusion_proof(
+        self, event_hash: str, anchor: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Inclusion proof for an anchored event against a signed root.
+
+        Args:
+            event_hash: Event hash passed to anchor_segment
+            anchor: Anchor to prove against (default: the latest one)
+
+        Raises:
+            ValueError: If the event is not covered by the anchor
+        """
+        anchor = anchor or self._latest_anchor
+        leaf_index = self._log.index_of(event_hash.encode())
+        if anchor is None or leaf_index is None or leaf_index >= anchor["event_count"]:
+            raise ValueError(f"Event {event_hash} is not covered by an anchor")
+        tree_size = anchor["event_count"]
+        path = self._log.inclusion_path(leaf_index, tree_size)
+        return {
+            "event_hash": event_hash,
+            "leaf_index": leaf_index,
+            "tree_size": tree_size,
+            "path": [node.hex() for node in path],
+            "batch_root": anchor["batch_root"],
+        }
+
+    @staticmethod
+    def verify_inclusion(
+        event_hash: str, proof: Dict[str, Any], anchor: Dict[str, Any]
+    ) -> bool:
+        """
+        Check one event against a signed Merkle anchor, without the segment.
+
+        Verifies the anchor signature over (tree size, root), then that the
+        proof's audit path leads from the event's leaf to that root.
+        """
+        if anchor.get("root_version") != ROOT_VERSION_MERKLE:
+            return False
+        if proof.get("tree_size") != anchor["event_count"]:
+            return False
+        root = bytes.fromhex(anchor["batch_root"])
+        if not verify_poe(
+            tree_head_digest(anchor["event_count"], root),
+            bytes.fromhex(anchor["pqc_signature"]),
+        ):
+            return False
+        return verify_inclusion_path(
+            leaf_hash(event_hash.encode()),
+            proof["leaf_index"],
+            proof["tree_size"],
+            [bytes.fromhex(node) for node in proof["path"]],
+            root,
+        )
 
 
 class MockBatchAnchorService:
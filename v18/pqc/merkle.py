@@ -0,0 +1,145 @@
+"""
+Append-only SHA3-256 Merkle accumulator for EvidenceBus anchoring.
+
+Tree shape and proofs follow RFC 6962 / RFC 9162 (Certificate Transparency):
+leaves are ``SHA3-256(0x00 || data)`` and interior nodes
+``SHA3-256(0x01 || left || right)``, so a leaf can never be passed off as a
+node. Every complete (perfect) subtree hash is kept per level; appending a
+leaf completes at most log2(n) of them, and the root of any prefix of the log
+is a fold over at most log2(n) stored subtrees.
+"""
+
+import hashlib
+from typing import Dict, List, Optional
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+
+def leaf_hash(data: bytes) -> bytes:
+    """Domain-separated hash of one leaf."""
+    return hashlib.sha3_256(LEAF_PREFIX + data).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Domain-separated hash of an interior node."""
+    return hashlib.sha3_256(NODE_PREFIX + left + right).digest()
+
+
+def empty_root() -> bytes:
+    """Root of the empty tree (hash of the empty string, as in RFC 6962)."""
+    return hashlib.sha3_256(b"").digest()
+
+
+def verify_inclusion_path(
+    leaf: bytes, leaf_index: int, tree_size: int, path: List[bytes], root: bytes
+) -> bool:
+    """
+    Check that ``leaf`` (a leaf hash) sits at ``leaf_index`` in the tree of
+    ``tree_size`` leaves whose root is ``root`` (RFC 9162, 2.1.3.2).
+    """
+    if leaf_index < 0 or leaf_index >= tree_size:
+        return False
+    fn, sn, r = leaf_index, tree_size - 1, leaf
+    for p in path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r == root
+
+
+class MerkleAccumulator:
+    """
+    Append-only Merkle tree over a growing sequence of leaves.
+
+    ``_levels[h][i]`` is the hash of the perfect subtree covering leaves
+    ``[i * 2**h, (i + 1) * 2**h)``; subtrees never change once complete, so
+    roots and inclusion proofs are available for every earlier tree size.
+    """
+
+    def __init__(self, leaves: Optional[List[bytes]] = None):
+        self._levels: List[List[bytes]] = [[]]
+        self._positions: Dict[bytes, int] = {}
+        for data in leaves or []:
+            self.append(data)
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    def append(self, data: bytes) -> int:
+        """Add a leaf; returns its index. Costs O(log n) node hashes at most."""
+        index = len(self._levels[0])
+        self._positions.setdefault(data, index)
+        node = leaf_hash(data)
+        level = 0
+        while True:
+            nodes = self._levels[level]
+            nodes.append(node)
+            if len(nodes) % 2:
+                return index
+            node = node_hash(nodes[-2], nodes[-1])
+            level += 1
+            if level == len(self._levels):
+                self._levels.append([])
+
+    def extend(self, leaves: List[bytes]):
+        """Append leaves in order."""
+        for data in leaves:
+            self.append(data)
+
+    def index_of(self, data: bytes) -> Optional[int]:
+        """Index of the first leaf holding ``data``, if any."""
+        return self._positions.get(data)
+
+    def _subtree(self, start: int, end: int) -> bytes:
+        """
+        Hash of leaves ``[start, end)`` where ``start`` is aligned to the
+        largest power of two not exceeding ``end - start`` (true for every
+        subtree in the RFC 6962 shape).
+        """
+        peaks = []
+        while start < end:
+            height = (end - start).bit_length() - 1
+            peaks.append(self._levels[height][start >> height])
+            start += 1 << height
+        node = peaks.pop()
+        while peaks:
+            node = node_hash(peaks.pop(), node)
+        return node
+
+    def root(self, tree_size: Optional[int] = None) -> bytes:
+        """Root of the first ``tree_size`` leaves (default: all)."""
+        size = len(self) if tree_size is None else tree_size
+        if size < 0 or size > len(self):
+            raise ValueError(f"Tree size {size} out of range (0..{len(self)})")
+        if size == 0:
+            return empty_root()
+        return self._subtree(0, size)
+
+    def inclusion_path(
+        self, leaf_index: int, tree_size: Optional[int] = None
+    ) -> List[bytes]:
+        """Audit path for ``leaf_index`` in the first ``tree_size`` leaves."""
+        size = len(self) if tree_size is None else tree_size
+        if size > len(self) or not 0 <= leaf_index < size:
+            raise ValueError(f"Leaf {leaf_index} not in tree of size {size}")
+        path = []
+        start, end = 0, size
+        while end - start > 1:
+            split = 1 << ((end - start - 1).bit_length() - 1)
+            if leaf_index < start + split:
+                path.append(self._subtree(start + split, end))
+                end = start + split
+            else:
+                path.append(self._subtree(start, start + split))
+                start += split
+        path.reverse()
+        return path
@@ -1,3 +1,4 @@
+import hashlib
 import pytest
 from v18.crypto.ascon_adapter import AsconContext, MockAsconAdapter
 
@@ -103,3 +104,21 @@ def test_ascon_decrypt_fail_on_wrong_ad():
 
     with pytest.raises(ValueError, match="Tag mismatch"):
         adapter.ascon_aead_decrypt(ctx, res, b"wrong ad", key)
+
+
+def test_ascon_keystream_matches_bytewise_xor():
+    adapter = MockAsconAdapter()
+    ctx = AsconContext(
+        node_id="node1", channel_id="wallet_session", evidence_seq=0, key_id="v1"
+    )
+    key = b"0123456789abcdef"
+    stream_key = hashlib.sha3_256(key + adapter._derive_nonce(ctx)).digest()
+
+    for length in (0, 1, 31, 32, 33, 200):
+        plaintext = bytes((i * 7) % 256 for i in range(length))
+        expected = bytes(
+            plaintext[i] ^ stream_key[i % len(stream_key)] for i in range(length)
+        )
+        res = adapter.ascon_aead_encrypt(ctx, plaintext, b"ad", key)
+        assert res.ciphertext_hex == expected.hex()
+        assert adapter.ascon_aead_decrypt(ctx, res, b"ad", key) == plaintext
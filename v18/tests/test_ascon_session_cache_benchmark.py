@@ -0,0 +1,125 @@
+"""
+Benchmark: Ascon session validation throughput (auth dependency hot path)
+
+require_auth spends its time in SessionManager.validate_session. This
+compares requests/sec with the validated-token cache disabled (every
+request decrypts and decodes claims) against the default cache, both for
+validate_session directly and through the require_auth dependency.
+
+Run directly for a larger sample:
+    python -m v18.tests.test_ascon_session_cache_benchmark
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from v15.auth.session_manager import SessionManager
+
+
+def _requests_per_second(manager: SessionManager, tokens: list, requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(requests):
+        assert manager.validate_session(tokens[i % len(tokens)]) is not None
+    return requests / (time.perf_counter() - start)
+
+
+def _auth_requests_per_second(
+    require_auth, headers: list, requests: int
+) -> float:
+    async def serve() -> float:
+        start = time.perf_counter()
+        for i in range(requests):
+            assert (await require_auth(headers[i % len(headers)]))["wallet_address"]
+        return requests / (time.perf_counter() - start)
+
+    return asyncio.run(serve())
+
+
+def _bench_tokens() -> list:
+    # Each token comes from its own manager so it validates with evidence_seq 0
+    return [
+        SessionManager(session_ttl_seconds=3600).create_session(f"0xBENCH{i}", ["read"])
+        for i in range(16)
+    ]
+
+
+def run_benchmark(requests: int = 2000) -> dict:
+    tokens = _bench_tokens()
+    cold = SessionManager(session_ttl_seconds=3600, token_cache_size=0)
+    warm = SessionManager(session_ttl_seconds=3600)
+    return {
+        "uncached_rps": _requests_per_second(cold, tokens, requests),
+        "cached_rps": _requests_per_second(warm, tokens, requests),
+    }
+
+
+def run_require_auth_benchmark(dependencies, requests: int = 2000) -> dict:
+    """Same comparison through require_auth (``dependencies`` is the API module)."""
+    headers = [f"Bearer {token}" for token in _bench_tokens()]
+    results = {}
+    original = dependencies.session_manager
+    try:
+        for name, cache_size in (("uncached_rps", 0), ("cached_rps", 4096)):
+            dependencies.session_manager = SessionManager(
+                session_ttl_seconds=3600, token_cache_size=cache_size
+            )
+            results[name] = _auth_requests_per_second(
+                dependencies.require_auth, headers, requests
+            )
+    finally:
+        dependencies.session_manager = original
+    return results
+
+
+@pytest.fixture
+def dependencies(monkeypatch):
+    module = pytest.importorskip("v13.ATLAS.src.api.dependencies")
+    monkeypatch.setattr(
+        module, "session_manager", SessionManager(session_ttl_seconds=3600)
+    )
+    return module
+
+
+def test_require_auth_uses_validated_session(dependencies):
+    from fastapi import HTTPException
+
+    token = dependencies.session_manager.create_session("0xAUTH", ["read"])
+    header = f"Bearer {token}"
+    first = asyncio.run(dependencies.require_auth(header))
+    assert first["wallet_address"] == "0xAUTH"
+    assert asyncio.run(dependencies.require_auth(header)) == first
+    for bad in (None, token, "Bearer ascon1.bogus.token.tag"):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(dependencies.require_auth(bad))
+        assert exc.value.status_code == 401
+    dependencies.session_manager.revoke_session(token)
+    with pytest.raises(HTTPException):
+        asyncio.run(dependencies.require_auth(header))
+
+
+@pytest.mark.performance
+def test_require_auth_cache_throughput(dependencies):
+    results = run_require_auth_benchmark(dependencies, requests=500)
+    print(
+        f"\nrequire_auth uncached: {results['uncached_rps']:.0f} req/s, "
+        f"cached: {results['cached_rps']:.0f} req/s"
+    )
+    assert results["cached_rps"] > results["uncached_rps"]
+
+
+@pytest.mark.performance
+def test_validated_token_cache_throughput():
+    results = run_benchmark(requests=500)
+    print(
+        f"\nuncached: {results['uncached_rps']:.0f} req/s, "
+        f"cached: {results['cached_rps']:.0f} req/s"
+    )
+    assert results["cached_rps"] > results["uncached_rps"]
+
+
+if __name__ == "__main__":
+    results = run_benchmark(requests=20000)
+    print(f"uncached: {results['uncached_rps']:.0f} req/s")
+    print(f"cached:   {results['cached_rps']:.0f} req/s")
@@ -288,5 +288,108 @@ class TestAsconSessionDeterminism:
         assert session_data is not None, "Deterministic context must allow decryption"
 
 
+class TestAsconSessionRevocationIndex:
+    """Test heap-based revocation expiry and the shared revocation store."""
+
+    def test_rerevoked_session_survives_stale_heap_entry(self):
+        """A re-revocation must not be dropped by the earlier heap entry."""
+        current_test_time = [0.0]
+        manager = SessionManager(
+            session_ttl_seconds=1, time_provider=lambda: current_test_time[0]
+        )
+        token = manager.create_session("0xREREVOKE", ["test"])
+        manager.revoke_session(token)
+
+        current_test_time[0] = 1.5
+        manager.revoke_session(token)
+
+        # First entry (expiry 2.0) is stale; second (expiry 3.5) must survive
+        current_test_time[0] = 2.5
+        manager.validate_session(token)
+        assert len(manager._revoked) == 1
+
+        current_test_time[0] = 4.0
+        manager.validate_session(token)
+        assert len(manager._revoked) == 0
+
+    def test_shared_store_revocation_visible_to_other_worker(self, tmp_path):
+        """Revocations on one worker must be rejected by another worker."""
+        from v15.auth.revocation_store import SQLiteRevocationStore
+
+        db_path = str(tmp_path / "revocations.db")
+        worker_a = SessionManager(
+            session_ttl_seconds=3600, revocation_store=SQLiteRevocationStore(db_path)
+        )
+        worker_b = SessionManager(
+            session_ttl_seconds=3600, revocation_store=SQLiteRevocationStore(db_path)
+        )
+        token = worker_a.create_session("0xSHARED", ["test"])
+        other = worker_b.create_session("0xOTHER", ["test"])
+        assert worker_b.validate_session(token) is not None
+
+        worker_a.revoke_session(token)
+
+        assert worker_a.validate_session(token) is None
+        assert worker_b.validate_session(token) is None
+        assert worker_b.validate_session(other) is not None
+
+    def test_shared_store_purges_expired_revocations(self, tmp_path):
+        """Expired shared revocations are purged and dropped from the bloom filter."""
+        from v15.auth.revocation_store import SQLiteRevocationStore
+
+        current_test_time = [0.0]
+        store = SQLiteRevocationStore(str(tmp_path / "revocations.db"))
+        manager = SessionManager(
+            session_ttl_seconds=1,
+            time_provider=lambda: current_test_time[0],
+            revocation_store=store,
+        )
+        tokens = [manager.create_session(f"0xWALLET{i}", ["test"]) for i in range(3)]
+        for token in tokens:
+            manager.revoke_session(token)
+        assert len(store) == 3
+
+        current_test_time[0] = 3.0
+        manager.validate_session(tokens[0])
+        assert len(store) == 0
+        assert tokens[0].split(".")[1] not in manager._bloom
+
+
+class TestAsconSessionValidationCache:
+    """Test the validated-token cache honours revocation, expiry and bounds."""
+
+    def test_cached_token_rejected_after_revocation_and_expiry(self):
+        current_test_time = [0.0]
+        manager = SessionManager(
+            session_ttl_seconds=10, time_provider=lambda: current_test_time[0]
+        )
+        token = manager.create_session("0xCACHED", ["read"])
+        first = manager.validate_session(token)
+        first["scopes"].append("mutated")
+        assert manager.validate_session(token)["scopes"] == ["read"]
+        assert len(manager._token_cache) == 1
+
+        current_test_time[0] = 11.0
+        assert manager.validate_session(token) is None
+        assert len(manager._token_cache) == 0
+
+        current_test_time[0] = 0.0
+        assert manager.validate_session(token) is not None
+        manager.revoke_session(token)
+        assert len(manager._token_cache) == 0
+        assert manager.validate_session(token) is None
+
+    def test_cache_is_bounded(self):
+        manager = SessionManager(session_ttl_seconds=3600, token_cache_size=2)
+        tokens = [
+            SessionManager(session_ttl_seconds=3600).create_session(f"0xLRU{i}", ["r"])
+            for i in range(3)
+        ]
+        for token in tokens:
+            assert manager.validate_session(token) is not None
+        assert len(manager._token_cache) == 2
+        assert len(manager._token_cache_by_session) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -1,5 +1,20 @@
+import hashlib
 import os
-from v18.pqc.anchors import PQCBatchAnchorService
+import time
+
+import pytest
+
+from v18.pqc.anchors import (
+    ROOT_VERSION_LEGACY,
+    ROOT_VERSION_MERKLE,
+    PQCBatchAnchorService,
+)
+from v18.pqc.merkle import (
+    MerkleAccumulator,
+    leaf_hash,
+    node_hash,
+    verify_inclusion_path,
+)
 
 
 def test_anchor_generation_and_verification():
@@ -36,3 +51,113 @@ def test_anchor_determinism():
 
     assert anchor1["pqc_signature"] == anchor2["pqc_signature"]
     assert anchor1["batch_root"] == anchor2["batch_root"]
+
+
+def _reference_root(leaves):
+    """RFC 6962 Merkle tree hash, computed recursively."""
+    if len(leaves) == 1:
+        return leaf_hash(leaves[0])
+    split = 1 << ((len(leaves) - 1).bit_length() - 1)
+    return node_hash(
+        _reference_root(leaves[:split]), _reference_root(leaves[split:])
+    )
+
+
+def test_merkle_accumulator_matches_reference_tree():
+    """Incremental roots and audit paths match the recursive RFC 6962 tree."""
+    leaves = [f"event_{i}".encode() for i in range(40)]
+    accumulator = MerkleAccumulator()
+    for size, leaf in enumerate(leaves, start=1):
+        accumulator.append(leaf)
+        assert accumulator.root() == _reference_root(leaves[:size])
+    for size in (1, 2, 7, 32, 40):
+        root = accumulator.root(size)
+        for index in range(size):
+            path = accumulator.inclusion_path(index, size)
+            leaf = leaf_hash(leaves[index])
+            assert verify_inclusion_path(leaf, index, size, path, root)
+            forged = node_hash(b"", b"")
+            assert not verify_inclusion_path(forged, index, size, path, root)
+
+
+def test_legacy_root_version():
+    """The pre-Merkle concatenation root stays available behind root_version."""
+    os.environ["MOCKQPC_ENABLED"] = "true"
+    service = PQCBatchAnchorService()
+    hashes = ["hash1", "hash2", "hash3"]
+
+    legacy = service.create_batch_signature(hashes, root_version=ROOT_VERSION_LEGACY)
+    merkle = service.create_batch_signature(hashes)
+
+    assert legacy["root_version"] == ROOT_VERSION_LEGACY
+    assert merkle["root_version"] == ROOT_VERSION_MERKLE
+    assert legacy["batch_root"] == hashlib.sha3_256(b"hash1hash2hash3").hexdigest()
+    assert merkle["batch_root"] != legacy["batch_root"]
+    assert service.verify_batch_signature(
+        hashes, legacy["pqc_signature"], root_version=ROOT_VERSION_LEGACY
+    )
+    assert not service.verify_batch_signature(hashes, legacy["pqc_signature"])
+
+
+def test_incremental_anchor_and_inclusion_proof():
+    """Segments extend one log; single events verify against a signed root."""
+    os.environ["MOCKQPC_ENABLED"] = "true"
+    service = PQCBatchAnchorService()
+    first = [f"ev_{i}" for i in range(5)]
+    second = [f"ev_{i}" for i in range(5, 12)]
+
+    anchor1 = service.anchor_segment(first)
+    anchor2 = service.anchor_segment(second)
+
+    assert (anchor2["segment_start"], anchor2["event_count"]) == (5, 12)
+    assert anchor2 == dict(
+        service.create_batch_signature(first + second), segment_start=5
+    )
+    proof = service.get_inclusion_proof("ev_3")
+    assert service.verify_inclusion("ev_3", proof, anchor2)
+    assert not service.verify_inclusion("ev_4", proof, anchor2)
+    old_proof = service.get_inclusion_proof("ev_3", anchor1)
+    assert service.verify_inclusion("ev_3", old_proof, anchor1)
+    assert not service.verify_inclusion("ev_3", old_proof, anchor2)
+
+    forged = dict(anchor2, batch_root=anchor1["batch_root"])
+    assert not service.verify_inclusion("ev_3", old_proof, forged)
+    with pytest.raises(ValueError):
+        service.get_inclusion_proof("ev_9", anchor1)
+
+
+@pytest.mark.performance
+def test_incremental_anchoring_benchmark():
+    """Anchoring 1k-event segments: legacy full rehash versus the Merkle frontier."""
+    os.environ["MOCKQPC_ENABLED"] = "true"
+    segments, segment_size = 100, 1000
+    events = [
+        hashlib.sha3_256(str(i).encode()).hexdigest()
+        for i in range(segments * segment_size)
+    ]
+    service = PQCBatchAnchorService()
+
+    start = time.perf_counter()
+    for s in range(1, segments + 1):
+        service.create_batch_signature(
+            events[: s * segment_size], root_version=ROOT_VERSION_LEGACY
+        )
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for s in range(segments):
+        segment = events[s * segment_size : (s + 1) * segment_size]
+        anchor = service.anchor_segment(segment)
+    merkle_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    proof = service.get_inclusion_proof(events[12345])
+    assert service.verify_inclusion(events[12345], proof, anchor)
+    proof_elapsed = time.perf_counter() - start
+    print(
+        f"\n{segments} segments x {segment_size} events: "
+        f"legacy rehash {legacy_elapsed * 1e3:.0f} ms, "
+        f"merkle frontier {merkle_elapsed * 1e3:.0f} ms; "
+        f"proof of {len(proof['path'])} nodes "
+        f"+ verify {proof_elapsed * 1e6:.0f} us"
+    )